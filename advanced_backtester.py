@@ -5,7 +5,6 @@ Advanced Backtester - Run 40 strategies across 10 coins in parallel
 import asyncio
 import json
 import multiprocessing as mp
-import pickle
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
@@ -15,6 +14,7 @@ from tqdm import tqdm
 from data_fetcher import HistoricalDataFetcher, TEST_SYMBOLS
 from backtest_engine import BacktestEngine, BacktestResult
 from metrics_calculator import MetricsCalculator, PerformanceMetrics
+from src.bitget_trading.candle_store import open_candle_store
 
 
 def run_single_backtest(args: tuple) -> PerformanceMetrics:
@@ -72,15 +72,14 @@ class AdvancedBacktester:
         # Remove MATICUSDT if present (it was removed from exchange)
         symbols = [s for s in symbols if s != "MATICUSDT"]
         
+        store = open_candle_store(str(self.data_dir))
         for symbol in symbols:
             # Try to load from cache
-            cache_files = list(self.data_dir.glob(f"{symbol}_*.pkl"))
-            if cache_files:
-                cache_file = cache_files[0]  # Use first match
-                with open(cache_file, 'rb') as f:
-                    df = pickle.load(f)
-                    data[symbol] = df
-                    print(f"  ✅ {symbol}: {len(df)} candles")
+            timeframes = store.timeframes(symbol)
+            if timeframes:
+                df = store.load_frame(symbol, timeframes[0])  # Use first match
+                data[symbol] = df
+                print(f"  ✅ {symbol}: {len(df)} candles")
             else:
                 print(f"  ⚠️ {symbol}: No cached data found")
         
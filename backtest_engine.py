@@ -8,6 +8,11 @@ from typing import Dict, List, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from src.bitget_trading.indicator_cache import FrameIndicators, IndicatorCache, uncached
+
+# Signal encoding used by the whole-series mode
+SIGNAL_SIDES = {1: "long", -1: "short", 0: "neutral"}
+
 
 @dataclass
 class Trade:
@@ -62,16 +67,112 @@ class BacktestResult:
         return (self.final_capital - self.initial_capital) / self.initial_capital * 100
 
 
+def momentum_indicator_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Strategy-independent inputs of the momentum signal, for every bar at once.
+
+    Values at idx equal what ``BacktestEngine.calculate_signal(df, idx)``
+    computes from the 21 bars ending at idx (zero before bar 20).
+    """
+    n = len(df)
+    names = ("sma_10", "sma_20", "volume_avg_10", "returns_5", "returns_10", "returns_20", "rsi")
+    columns = {name: np.zeros(n) for name in names}
+    if n <= 20:
+        return columns
+
+    # Row k of each window = the 21 bars ending at idx = k + 20
+    prices = np.lib.stride_tricks.sliding_window_view(df['close'].to_numpy(dtype=float), 21)
+    volumes = np.lib.stride_tricks.sliding_window_view(df['volume'].to_numpy(dtype=float), 21)
+    current_price = prices[:, -1]
+
+    columns["sma_10"][20:] = prices[:, -10:].mean(axis=1)
+    columns["sma_20"][20:] = prices[:, -20:].mean(axis=1)
+    columns["volume_avg_10"][20:] = volumes[:, -10:].mean(axis=1)
+    columns["returns_5"][20:] = current_price / prices[:, -6] - 1
+    columns["returns_10"][20:] = current_price / prices[:, -11] - 1
+    columns["returns_20"][20:] = current_price / prices[:, -20] - 1
+
+    # Simplified RSI
+    changes = np.diff(prices[:, -14:], axis=1)
+    up = changes > 0
+    down = changes < 0
+    gains = np.where(up.any(axis=1), np.where(up, changes, 0.0).sum(axis=1), 0.0001)
+    losses = np.where(down.any(axis=1), np.abs(np.where(down, changes, 0.0).sum(axis=1)), 0.0001)
+    columns["rsi"][20:] = 100 - (100 / (1 + gains / losses))
+    return columns
+
+
+def momentum_signals(
+    df: pd.DataFrame,
+    columns: Dict[str, np.ndarray],
+    volume_ratio: float,
+    confluence_required: int,
+    entry_threshold: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Combine cached momentum columns with one strategy's thresholds.
+
+    Returns:
+        (directions, scores): directions is +1 (long), -1 (short) or 0 (neutral)
+    """
+    n = len(df)
+    directions = np.zeros(n, dtype=np.int8)
+    scores = np.zeros(n)
+    if n <= 20:
+        return directions, scores
+
+    current_price = df['close'].to_numpy(dtype=float)[20:]
+    current_volume = df['volume'].to_numpy(dtype=float)[20:]
+    sma_10 = columns["sma_10"][20:]
+    sma_20 = columns["sma_20"][20:]
+    rsi = columns["rsi"][20:]
+    returns_5 = columns["returns_5"][20:]
+    returns_10 = columns["returns_10"][20:]
+    returns_20 = columns["returns_20"][20:]
+
+    volume_confirmed = current_volume > columns["volume_avg_10"][20:] * volume_ratio
+    bullish_signals = (
+        ((current_price > sma_10) & (sma_10 > sma_20)).astype(int)
+        + (rsi < 40)
+        + (volume_confirmed & (returns_5 > 0))
+        + (returns_5 > 0.01)
+        + (returns_10 > 0.02)
+        + (returns_20 > 0.03)
+    )
+    bearish_signals = (
+        ((current_price < sma_10) & (sma_10 < sma_20)).astype(int)
+        + (rsi > 60)
+        + (volume_confirmed & ~(returns_5 > 0))
+        + (returns_5 < -0.01)
+        + (returns_10 < -0.02)
+        + (returns_20 < -0.03)
+    )
+
+    is_long = bullish_signals >= confluence_required
+    is_short = ~is_long & (bearish_signals >= confluence_required)
+    window_scores = np.where(is_long, bullish_signals * 0.5, np.where(is_short, bearish_signals * 0.5, 0.0))
+    window_directions = np.where(is_long, 1, np.where(is_short, -1, 0))
+    window_directions[window_scores < entry_threshold] = 0
+
+    directions[20:] = window_directions
+    scores[20:] = window_scores
+    return directions, scores
+
+
 class BacktestEngine:
     """
     Simplified backtest engine that simulates trading based on price momentum and strategy parameters.
     
     This is a FAST backtester optimized for testing many strategy variations.
+    Signals are computed for the whole series up front; with an
+    ``IndicatorCache`` the indicator columns are shared by every strategy
+    run on the same data.
     """
     
-    def __init__(self, strategy: Dict[str, Any]):
+    def __init__(self, strategy: Dict[str, Any], indicator_cache: IndicatorCache | None = None):
         """Initialize the backtest engine with a strategy configuration."""
         self.strategy = strategy
+        self.indicator_cache = indicator_cache
         self.entry_threshold = strategy["entry_threshold"]
         self.stop_loss_pct = strategy["stop_loss_pct"]  # Capital %
         self.take_profit_pct = strategy["take_profit_pct"]  # Capital %
@@ -181,26 +282,73 @@ class BacktestEngine:
         
         return direction, score
     
-    def run_backtest(self, df: pd.DataFrame, symbol: str, initial_capital: float = 50.0) -> BacktestResult:
+    def has_custom_signal(self) -> bool:
+        """Whether ``calculate_signal`` was replaced (instance or subclass) without a matching ``calculate_signals``."""
+        if "calculate_signal" in vars(self):
+            return True
+        cls = type(self)
+        return (
+            cls.calculate_signal is not BacktestEngine.calculate_signal
+            and cls.calculate_signals is BacktestEngine.calculate_signals
+        )
+    
+    def indicators_for(self, df: pd.DataFrame, symbol: str) -> FrameIndicators:
+        """Indicator access for one series (cached if the engine has a cache)."""
+        if self.indicator_cache is None:
+            return uncached(df)
+        return self.indicator_cache.for_frame(df, symbol)
+    
+    def calculate_signals(self, df: pd.DataFrame, indicators: FrameIndicators | None = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Signal of every bar at once; same values as ``calculate_signal(df, idx)``.
+        
+        Returns:
+            (directions, scores): directions is +1 (long), -1 (short) or 0 (neutral)
+        """
+        indicators = indicators if indicators is not None else uncached(df)
+        columns = indicators.get("momentum", {"window": 21}, momentum_indicator_columns)
+        return momentum_signals(df, columns, self.volume_ratio, self.confluence_required, self.entry_threshold)
+    
+    def run_backtest(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        initial_capital: float = 50.0,
+        indicators: FrameIndicators | None = None,
+    ) -> BacktestResult:
         """
         Run backtest on historical data.
         
+        Signals come from ``calculate_signals`` for the whole series, unless
+        ``calculate_signal`` was replaced on the instance or in a subclass, in
+        which case it is called bar by bar.
+        
         Args:
             df: DataFrame with OHLCV data
             symbol: Trading pair symbol
             initial_capital: Starting capital in USD
+            indicators: Indicator access for df (default: from the engine's cache)
             
         Returns:
             BacktestResult object with all trades and metrics
         """
+        if self.has_custom_signal():
+            # calculate_signals only knows the built-in rules
+            signal_at = self.calculate_signal
+        else:
+            directions, scores = self.calculate_signals(df, indicators or self.indicators_for(df, symbol))
+            signal_at = lambda df, idx: (SIGNAL_SIDES[directions[idx]], scores[idx])
+        timestamps = df['timestamp'].to_numpy().astype(np.int64).tolist()
+        closes = df['close'].to_numpy(dtype=float).tolist()
+        
         capital = initial_capital
         position = None  # Current position: {side, entry_price, entry_idx, size_usd, peak_price}
         trades = []
         equity_curve = []
         
         for idx in range(len(df)):
-            timestamp = int(df.iloc[idx]['timestamp'])
-            current_price = float(df.iloc[idx]['close'])
+            timestamp = timestamps[idx]
+            current_price = closes[idx]
             
             # Record equity
             if position:
@@ -269,7 +417,7 @@ class BacktestEngine:
                             exit_reason = "tp"
                 
                 # Check for opposite signal (momentum reversal)
-                signal_direction, signal_score = self.calculate_signal(df, idx)
+                signal_direction, signal_score = signal_at(df, idx)
                 if signal_direction == ("short" if side == "long" else "long"):
                     if signal_score >= self.entry_threshold * 1.5:  # Strong opposite signal
                         exit_reason = "reversal"
@@ -292,7 +440,7 @@ class BacktestEngine:
                     net_pnl_pct = (net_pnl_usd / size_usd) * 100
                     
                     trade = Trade(
-                        entry_time=df.iloc[position['entry_idx']]['timestamp'],
+                        entry_time=timestamps[position['entry_idx']],
                         exit_time=timestamp,
                         entry_price=entry_price,
                         exit_price=current_price,
@@ -308,7 +456,7 @@ class BacktestEngine:
             
             # Check for entry if no position
             if not position and capital > 0:
-                signal_direction, signal_score = self.calculate_signal(df, idx)
+                signal_direction, signal_score = signal_at(df, idx)
                 
                 if signal_direction in ["long", "short"]:
                     # Calculate position size
@@ -325,7 +473,7 @@ class BacktestEngine:
         
         # Close any remaining position at end
         if position:
-            current_price = float(df.iloc[-1]['close'])
+            current_price = closes[-1]
             entry_price = position['entry_price']
             side = position['side']
             size_usd = position['size_usd']
@@ -348,8 +496,8 @@ class BacktestEngine:
             capital += net_pnl_usd
             
             trade = Trade(
-                entry_time=df.iloc[position['entry_idx']]['timestamp'],
-                exit_time=int(df.iloc[-1]['timestamp']),
+                entry_time=timestamps[position['entry_idx']],
+                exit_time=timestamps[-1],
                 entry_price=entry_price,
                 exit_price=current_price,
                 side=side,
@@ -17,6 +17,9 @@ from datetime import datetime
 from pathlib import Path
 import warnings
 
+from backtest_engine import momentum_indicator_columns, momentum_signals
+from src.bitget_trading.indicator_cache import FrameIndicators, IndicatorCache, uncached
+
 warnings.filterwarnings('ignore')
 
 # Try to import LightGBM for strategy 160
@@ -27,6 +30,50 @@ except ImportError:
     LIGHTGBM_AVAILABLE = False
     print("⚠️ LightGBM not available, strategy 160 will use ADX fallback")
 
+# Signal encoding used by the whole-series (vectorized) mode
+SIGNAL_CODES = {"long": 1, "short": -1, "neutral": 0}
+SIGNAL_SIDES = {1: "long", -1: "short", 0: "neutral"}
+
+
+def holy_grail_adx_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Indicator columns of the Holy Grail ADX signal for every bar.
+
+    Rolling windows only look back, so full-series columns equal the per-bar
+    values computed on df.iloc[:idx+1].
+    """
+    from ml_feature_engineering import add_adx, add_sma, add_volume_features
+
+    features = add_volume_features(add_sma(add_adx(df.copy(), period=14), periods=[20]))
+
+    def latest(column: str, default: float) -> np.ndarray:
+        # Per-bar path: value at idx, or default while the column is all-NaN so far
+        values = features[column].to_numpy(dtype=float)
+        seen = np.maximum.accumulate(~np.isnan(values))
+        return np.where(seen, values, default)
+
+    return {
+        'adx': latest('adx', 0.0),
+        'plus_di': latest('plus_di', 0.0),
+        'minus_di': latest('minus_di', 0.0),
+        'sma_20_distance': latest('sma_20_distance', 0.0),
+        'volume_ratio_20': latest('volume_ratio_20', 1.0),
+    }
+
+
+def ml_feature_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Numeric ``calculate_all_features`` columns plus ``__row__`` (bar position of each NaN-free row)."""
+    from ml_feature_engineering import calculate_all_features
+
+    features = calculate_all_features(df.copy())
+    columns = {
+        name: features[name].to_numpy()
+        for name in features.columns
+        if pd.api.types.is_numeric_dtype(features[name])
+    }
+    columns["__row__"] = df.index.get_indexer(features.index)
+    return columns
+
 
 @dataclass
 class Trade:
@@ -109,9 +156,10 @@ class MultiPositionBacktestEngine:
     - Position queue management
     """
     
-    def __init__(self, strategy: Dict[str, Any]):
+    def __init__(self, strategy: Dict[str, Any], indicator_cache: Optional[IndicatorCache] = None):
         """Initialize the backtest engine with a strategy configuration."""
         self.strategy = strategy
+        self.indicator_cache = indicator_cache
         self.entry_threshold = strategy["entry_threshold"]
         self.stop_loss_pct = strategy["stop_loss_pct"]  # Capital %
         self.take_profit_pct = strategy["take_profit_pct"]  # Capital %
@@ -665,11 +713,382 @@ class MultiPositionBacktestEngine:
         # Fallback to ADX strategy
         return self._calculate_signal_holy_grail_adx(df, idx)
     
+    def has_custom_signal(self) -> bool:
+        """Whether ``calculate_signal`` was replaced (instance or subclass) without a matching ``calculate_signals``."""
+        if "calculate_signal" in vars(self):
+            return True
+        cls = type(self)
+        return (
+            cls.calculate_signal is not MultiPositionBacktestEngine.calculate_signal
+            and cls.calculate_signals is MultiPositionBacktestEngine.calculate_signals
+        )
+    
+    def indicators_for(self, df: pd.DataFrame, symbol: str) -> FrameIndicators:
+        """Indicator access for one series (cached if the engine has a cache)."""
+        if self.indicator_cache is None:
+            return uncached(df)
+        return self.indicator_cache.for_frame(df, symbol)
+
+    def calculate_signals(self, df: pd.DataFrame, indicators: Optional[FrameIndicators] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate the signal of every bar at once (whole-series mode).
+
+        Produces the same values as calling ``calculate_signal(df, idx)`` for
+        each idx, but computes every indicator column once per series instead
+        of once per bar (and, through an ``IndicatorCache``, once per data set
+        instead of once per strategy).
+
+        Args:
+            df: DataFrame with OHLCV data
+            indicators: Indicator access for df (default: computed directly)
+
+        Returns:
+            (directions, scores): directions is +1 (long), -1 (short) or 0 (neutral)
+        """
+        strategy_id = self.strategy.get("id", 0)
+        indicators = indicators if indicators is not None else uncached(df)
+
+        if strategy_id == 46:
+            return self._calculate_signals_holy_grail_adx(df, indicators)
+        if strategy_id == 160:
+            return self._calculate_signals_holy_grail_lightgbm(df, indicators)
+
+        columns = indicators.get("momentum", {"window": 21}, momentum_indicator_columns)
+        return momentum_signals(df, columns, self.volume_ratio, self.confluence_required, self.entry_threshold)
+
+    def _calculate_signals_holy_grail_adx(self, df: pd.DataFrame, indicators: FrameIndicators) -> Tuple[np.ndarray, np.ndarray]:
+        """Whole-series version of ``_calculate_signal_holy_grail_adx``."""
+        n = len(df)
+        directions = np.zeros(n, dtype=np.int8)
+        scores = np.zeros(n)
+        if n <= 30:
+            return directions, scores
+
+        try:
+            import ml_feature_engineering  # noqa: F401
+        except ImportError:
+            # Same fallback as the per-bar path, just without the speed-up
+            for idx in range(30, n):
+                direction, scores[idx] = self._calculate_signal_holy_grail_adx(df, idx)
+                directions[idx] = SIGNAL_CODES[direction]
+            return directions, scores
+
+        columns = indicators.get("holy_grail_adx", {"adx": 14, "sma": 20}, holy_grail_adx_columns)
+        adx = columns['adx']
+        plus_di = columns['plus_di']
+        minus_di = columns['minus_di']
+        sma_dist = columns['sma_20_distance']
+        volume_ratio = columns['volume_ratio_20']
+
+        close = df['close'].to_numpy(dtype=float)
+        returns_5 = np.zeros(n)
+        returns_5[5:] = close[5:] / close[:-5] - 1
+
+        trending = adx > 20
+        bullish_signals = (
+            3 * (trending & (plus_di > minus_di) & (returns_5 > 0))
+            + ((np.abs(sma_dist) > 0.005) & (sma_dist > 0) & (returns_5 > 0))
+            + ((volume_ratio >= 1.2) & (returns_5 > 0))
+            + (returns_5 > 0.003)
+            + ((plus_di > minus_di) & trending)
+        )
+        bearish_signals = (
+            3 * (trending & (minus_di > plus_di) & (returns_5 < 0))
+            + ((np.abs(sma_dist) > 0.005) & (sma_dist < 0) & (returns_5 < 0))
+            + ((volume_ratio >= 1.2) & (returns_5 < 0))
+            + (returns_5 < -0.003)
+            + ((minus_di > plus_di) & trending)
+        )
+
+        min_confluence = max(2, self.confluence_required - 1)
+        is_long = bullish_signals >= min_confluence
+        is_short = ~is_long & (bearish_signals >= min_confluence)
+        all_scores = np.where(
+            is_long,
+            np.minimum(1.0, bullish_signals * 0.25),
+            np.where(is_short, np.minimum(1.0, bearish_signals * 0.25), 0.0),
+        )
+        all_directions = np.where(is_long, 1, np.where(is_short, -1, 0))
+
+        effective_threshold = max(0.6, self.entry_threshold - 0.2)
+        all_directions[all_scores < effective_threshold] = 0
+        # No signal without a usable ADX reading (or before 30 bars)
+        usable = ~np.isnan(adx) & (adx != 0)
+        usable[:30] = False
+
+        directions[usable] = all_directions[usable]
+        scores[usable] = all_scores[usable]
+        return directions, scores
+
+    def _calculate_signals_holy_grail_lightgbm(self, df: pd.DataFrame, indicators: FrameIndicators) -> Tuple[np.ndarray, np.ndarray]:
+        """Whole-series version of ``_calculate_signal_holy_grail_lightgbm`` (one batched predict)."""
+        directions, scores = self._calculate_signals_holy_grail_adx(df, indicators)
+        n = len(df)
+        if self.lgbm_model is None or not self.lgbm_features or n <= 50:
+            return directions, scores
+
+        try:
+            # The per-bar path uses the last NaN-free feature row at or before idx
+            columns = indicators.get("ml_features", None, ml_feature_columns)
+            rows = columns["__row__"]
+            all_features = pd.DataFrame(
+                {name: values for name, values in columns.items() if name != "__row__"},
+                index=df.index[rows],
+            )
+            if len(all_features) == 0:
+                return directions, scores
+
+            available = [f for f in self.lgbm_features if f in all_features.columns]
+            if len(available) < len(self.lgbm_features) * 0.7:
+                return directions, scores
+            for feat in self.lgbm_features:
+                if feat not in all_features.columns:
+                    all_features[feat] = 0.0
+
+            num_iteration = getattr(self.lgbm_model, 'best_iteration', None)
+            probs = self.lgbm_model.predict(all_features[self.lgbm_features].values, num_iteration=num_iteration)
+        except Exception:
+            return directions, scores
+
+        if probs.ndim > 1 and probs.shape[1] == 2:
+            lgbm_scores = probs[:, 1]
+            lgbm_longs = probs[:, 1] > 0.5
+        elif probs.ndim > 1:
+            if probs.shape[1] != 3:
+                return directions, scores
+            lgbm_scores = np.maximum(probs[:, 1], probs[:, 2])
+            lgbm_longs = probs[:, 1] > probs[:, 2]
+        else:
+            lgbm_scores = probs.astype(float)
+            lgbm_longs = lgbm_scores > 0.5
+
+        # Map every bar to its latest NaN-free feature row (-1 = none yet)
+        positions = df.index.get_indexer(all_features.index)
+        row_for_bar = np.full(n, -1)
+        row_for_bar[positions] = np.arange(len(positions))
+        row_for_bar = np.maximum.accumulate(row_for_bar)
+
+        effective_threshold = max(0.6, self.entry_threshold - 0.2)
+        adx_directions, adx_scores = directions.copy(), scores.copy()
+        for idx in range(50, n):
+            row = row_for_bar[idx]
+            if row < 0:
+                continue
+
+            lgbm_score = float(lgbm_scores[row])
+            lgbm_direction = 1 if lgbm_longs[row] else -1
+            adx_direction, adx_score = adx_directions[idx], adx_scores[idx]
+
+            if lgbm_direction == adx_direction and adx_score > 0:
+                combined_score = (lgbm_score * 0.7) + (adx_score * 0.3)
+                if combined_score >= effective_threshold:
+                    directions[idx], scores[idx] = lgbm_direction, combined_score
+            elif lgbm_score > 0.65:
+                if lgbm_score >= effective_threshold:
+                    directions[idx], scores[idx] = lgbm_direction, lgbm_score
+            # else: ADX signal stands (also covers the "strong ADX" branch)
+
+        return directions, scores
+
+    def _slippage_from_volume(self, volume: np.ndarray, idx: int, size_usd: float) -> float:
+        """``estimate_slippage`` on a raw volume array."""
+        if idx < 20:
+            return self.high_volume_slippage
+
+        recent_volume = volume[max(0, idx - 20):idx].mean()
+        volume_ratio = volume[idx] / (recent_volume + 1e-10)
+        base_slippage = self.high_volume_slippage if volume_ratio > 1.5 else self.low_volume_slippage
+        size_factor = min(size_usd / 10000, 2.0)
+
+        return base_slippage * size_factor
+
+    def run_backtest_vectorized(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        initial_capital: float = 50.0,
+        indicators: Optional[FrameIndicators] = None,
+    ) -> BacktestResult:
+        """
+        Whole-series backtest: signals are precomputed once per series and
+        only the position/exit state machine runs bar by bar over numpy arrays.
+
+        Produces the same result as ``run_backtest`` without its O(n²)
+        per-bar indicator recomputation. An engine whose ``calculate_signal``
+        was replaced on the instance or in a subclass runs the per-bar loop
+        instead, since
+        ``calculate_signals`` only knows the built-in strategy rules.
+
+        Args:
+            df: DataFrame with OHLCV data
+            symbol: Trading pair symbol
+            initial_capital: Starting capital in USD
+            indicators: Indicator access for df (default: from the engine's cache)
+
+        Returns:
+            BacktestResult object with all trades and metrics
+        """
+        if self.has_custom_signal():
+            return self.run_backtest(df, symbol, initial_capital)
+
+        directions, scores = self.calculate_signals(df, indicators or self.indicators_for(df, symbol))
+        timestamps = df['timestamp'].to_numpy().astype(np.int64).tolist()
+        closes = df['close'].to_numpy(dtype=float).tolist()
+        volume = df['volume'].to_numpy(dtype=float)
+        signal_sides = [SIGNAL_SIDES[d] for d in directions.tolist()]
+        scores = scores.tolist()
+
+        leverage = self.leverage
+        stop_move = self.stop_loss_pct / leverage
+        tp_move = self.take_profit_pct / leverage
+        reversal_threshold = self.entry_threshold * 1.5
+
+        capital = initial_capital
+        positions: List[Position] = []
+        trades = []
+        equity_curve = []
+        max_concurrent = 0
+        correlation_violations = 0
+        total_slippage = 0.0
+
+        def close_position(pos: Position, idx: int, exit_price: float, exit_reason: str) -> float:
+            nonlocal capital, total_slippage
+
+            if pos.side == "long":
+                price_change = (exit_price / pos.entry_price - 1)
+            else:
+                price_change = (pos.entry_price / exit_price - 1)
+
+            slippage = self._slippage_from_volume(volume, idx, pos.size_usd)
+            slippage_cost = pos.size_usd * leverage * slippage
+            total_slippage += slippage_cost
+
+            pnl_usd = price_change * pos.size_usd * leverage
+            fee_usd = pos.size_usd * leverage * self.fee_per_trade
+            net_pnl_usd = pnl_usd - fee_usd - slippage_cost
+
+            trades.append(
+                Trade(
+                    entry_time=pos.entry_time,
+                    exit_time=timestamps[idx],
+                    entry_price=pos.entry_price,
+                    exit_price=exit_price,
+                    side=pos.side,
+                    size_usd=pos.size_usd,
+                    leverage=leverage,
+                    pnl_usd=net_pnl_usd,
+                    pnl_pct=(net_pnl_usd / pos.size_usd) * 100,
+                    exit_reason=exit_reason,
+                    slippage_cost=slippage_cost,
+                )
+            )
+            capital += net_pnl_usd
+            return net_pnl_usd
+
+        for idx in range(len(closes)):
+            timestamp = timestamps[idx]
+            current_price = closes[idx]
+            signal_side = signal_sides[idx]
+            signal_score = scores[idx]
+
+            total_unrealized_pnl = 0.0
+            for pos in positions:
+                if pos.side == "long":
+                    unrealized = (current_price / pos.entry_price - 1) * pos.size_usd * pos.leverage
+                else:
+                    unrealized = (pos.entry_price / current_price - 1) * pos.size_usd * pos.leverage
+                total_unrealized_pnl += unrealized
+
+            equity_curve.append((timestamp, capital + total_unrealized_pnl))
+            max_concurrent = max(max_concurrent, len(positions))
+
+            # Exits (same rules and order as run_backtest)
+            remaining = []
+            for pos in positions:
+                exit_reason = None
+                if pos.side == "long":
+                    if current_price > pos.peak_price:
+                        pos.peak_price = current_price
+                    if current_price <= pos.entry_price * (1 - stop_move):
+                        exit_reason = "sl"
+                    elif current_price >= pos.entry_price * (1 + tp_move):
+                        trailing_stop = pos.peak_price * (1 - self.trailing_callback)
+                        exit_reason = "tp_trailing" if current_price <= trailing_stop else "tp"
+                    opposite = "short"
+                else:
+                    if current_price < pos.peak_price:
+                        pos.peak_price = current_price
+                    if current_price >= pos.entry_price * (1 + stop_move):
+                        exit_reason = "sl"
+                    elif current_price <= pos.entry_price * (1 - tp_move):
+                        trailing_stop = pos.peak_price * (1 + self.trailing_callback)
+                        exit_reason = "tp_trailing" if current_price >= trailing_stop else "tp"
+                    opposite = "long"
+
+                if signal_side == opposite and signal_score >= reversal_threshold:
+                    exit_reason = "reversal"
+
+                if exit_reason:
+                    close_position(pos, idx, current_price, exit_reason)
+                else:
+                    remaining.append(pos)
+            positions = remaining
+
+            # Entries
+            if signal_side in ("long", "short"):
+                if self.can_open_position(positions, signal_side, capital):
+                    position_size_usd = capital * self.position_size_pct
+                    total_allocated = sum(p.size_usd for p in positions)
+                    available = capital - total_allocated
+                    position_size_usd = min(position_size_usd, available * 0.9)
+
+                    if position_size_usd > 0:
+                        slippage = self._slippage_from_volume(volume, idx, position_size_usd)
+                        slippage_cost = position_size_usd * leverage * slippage
+                        total_slippage += slippage_cost
+                        capital -= slippage_cost
+
+                        positions.append(
+                            Position(
+                                position_id=self.next_position_id,
+                                side=signal_side,
+                                entry_price=current_price,
+                                entry_time=timestamp,
+                                entry_idx=idx,
+                                size_usd=position_size_usd,
+                                peak_price=current_price,
+                                leverage=leverage,
+                            )
+                        )
+                        self.next_position_id += 1
+                elif len(positions) < self.max_positions:
+                    if self.calculate_correlation_risk(positions) > 0.8:
+                        correlation_violations += 1
+
+        # Close any remaining positions at end
+        last_idx = len(closes) - 1
+        for pos in positions:
+            close_position(pos, last_idx, closes[last_idx], "end")
+
+        return BacktestResult(
+            strategy_id=self.strategy['id'],
+            strategy_name=self.strategy['name'],
+            symbol=symbol,
+            initial_capital=initial_capital,
+            final_capital=capital,
+            trades=trades,
+            equity_curve=equity_curve,
+            max_concurrent_positions=max_concurrent,
+            correlation_violations=correlation_violations,
+            total_slippage_cost=total_slippage,
+        )
+
     def run_backtest(
         self,
         df: pd.DataFrame,
         symbol: str,
-        initial_capital: float = 50.0
+        initial_capital: float = 50.0,
+        vectorized: bool = False,
     ) -> BacktestResult:
         """
         Run backtest with multiple simultaneous positions.
@@ -678,10 +1097,14 @@ class MultiPositionBacktestEngine:
             df: DataFrame with OHLCV data
             symbol: Trading pair symbol
             initial_capital: Starting capital in USD
+            vectorized: Precompute all signals once (see run_backtest_vectorized)
             
         Returns:
             BacktestResult object with all trades and metrics
         """
+        if vectorized:
+            return self.run_backtest_vectorized(df, symbol, initial_capital)
+
         capital = initial_capital
         positions: List[Position] = []  # Active positions
         trades = []
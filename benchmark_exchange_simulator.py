@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark the REST client against the local exchange simulator.
+
+Usage:
+    python benchmark_exchange_simulator.py [requests] [concurrency] [latency_ms]
+
+Runs an ``ExchangeSimulator`` HTTP server on localhost with ``latency_ms``
+per request and measures, through ``BitgetRestClient`` (aiohttp transport):
+
+- throughput: ``requests`` ticker GETs with ``concurrency`` in flight
+  (server-side rate limits off)
+- order round trip: market order + order detail, one after another,
+  alternating open and reduce-only close
+- rate limiting: a burst of ticker GETs against Bitget's per-group limits,
+  with the client-side limiter on and off; reports 429s seen
+  by the server, failed calls and time to drain the burst
+"""
+
+import asyncio
+import sys
+import time
+
+import numpy as np
+
+from src.bitget_trading.bitget_rest import BitgetRestClient
+from src.bitget_trading.exchange_simulator import ExchangeSimulator
+from src.bitget_trading.logger import setup_logging
+from src.bitget_trading.rate_limiter import DEFAULT_GROUP_LIMITS, BitgetRateLimiter
+
+logger = setup_logging()
+
+SYMBOL = "BTCUSDT"
+TICKER = {
+    "symbol": SYMBOL, "last_price": 65000.1, "bid_price": 65000.0, "ask_price": 65000.2,
+    "mark_price": 65000.1, "volume_24h": 12345.6, "quote_volume_24h": 802000000.0,
+}
+UNLIMITED = {group: (1e9, 1e9) for group in DEFAULT_GROUP_LIMITS}
+
+
+async def start_simulator(latency_ms: float, rate_limits: dict | None) -> ExchangeSimulator:
+    simulator = ExchangeSimulator(initial_balance=1_000_000.0, latency_ms=latency_ms, rate_limits=rate_limits)
+    simulator.apply_event(int(time.time() * 1000), SYMBOL, "ticker", dict(TICKER))
+    await simulator.start()
+    return simulator
+
+
+def make_client(simulator: ExchangeSimulator, concurrency: int, limits: dict) -> BitgetRestClient:
+    return BitgetRestClient(
+        "bench-key", "bench-secret", "bench-pass",
+        transport="aiohttp", pool_size=concurrency, pool_per_host=concurrency, keepalive_sec=30.0,
+        base_url=simulator.base_url, rate_limiter=BitgetRateLimiter(limits),
+    )
+
+
+def percentiles(latencies: list[float] | np.ndarray) -> tuple[float, float]:
+    return float(np.percentile(latencies, 50) * 1000), float(np.percentile(latencies, 99) * 1000)
+
+
+async def bench_throughput(n_requests: int, concurrency: int, latency_ms: float) -> dict:
+    simulator = await start_simulator(latency_ms, None)
+    client = make_client(simulator, concurrency, UNLIMITED)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = np.zeros(n_requests)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await client.get_ticker(SYMBOL)
+            latencies[i] = time.perf_counter() - start
+
+    try:
+        await asyncio.gather(*(one(i) for i in range(min(concurrency, n_requests))))
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(n_requests)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.close()
+        await simulator.stop()
+
+    p50, p99 = percentiles(latencies)
+    return {"rps": n_requests / elapsed, "p50_ms": p50, "p99_ms": p99}
+
+
+async def bench_order_round_trip(n_orders: int, latency_ms: float) -> dict:
+    simulator = await start_simulator(latency_ms, None)
+    client = make_client(simulator, 4, UNLIMITED)
+    latencies = []
+    try:
+        for i in range(n_orders):
+            start = time.perf_counter()
+            response = await client.place_order(SYMBOL, "buy" if i % 2 == 0 else "sell", 0.01, reduce_only=i % 2 == 1)
+            order = await client.get_order(SYMBOL, response["data"]["orderId"])
+            latencies.append(time.perf_counter() - start)
+            assert order["data"]["state"] == "filled"
+    finally:
+        await client.close()
+        await simulator.stop()
+
+    p50, p99 = percentiles(latencies)
+    return {"orders": n_orders, "fills": simulator.fills, "p50_ms": p50, "p99_ms": p99}
+
+
+async def bench_rate_limited(n_requests: int, latency_ms: float, use_limiter: bool) -> dict:
+    simulator = await start_simulator(latency_ms, DEFAULT_GROUP_LIMITS)
+    client = make_client(simulator, n_requests, DEFAULT_GROUP_LIMITS)
+    if not use_limiter:
+        client.rate_limiter = None  # Plain retries with backoff only
+    failures = 0
+
+    async def one() -> None:
+        nonlocal failures
+        try:
+            await client.get_ticker(SYMBOL)
+        except Exception:
+            failures += 1
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(n_requests)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.close()
+        await simulator.stop()
+
+    return {"seconds": elapsed, "rate_limited": simulator.rate_limited, "failures": failures}
+
+
+async def main() -> None:
+    n_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    latency_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+
+    throughput = await bench_throughput(n_requests, concurrency, latency_ms)
+    round_trip = await bench_order_round_trip(200, latency_ms)
+    burst = 100
+    limited = {
+        "client limiter": await bench_rate_limited(burst, latency_ms, True),
+        "no limiter": await bench_rate_limited(burst, latency_ms, False),
+    }
+
+    logger.info("=" * 80)
+    logger.info(f"EXCHANGE SIMULATOR BENCHMARK ({latency_ms:.0f}ms simulated latency)")
+    logger.info("=" * 80)
+    logger.info(
+        f"Ticker GETs:      {throughput['rps']:.0f} req/s ({n_requests} requests, {concurrency} in flight) | "
+        f"p50 {throughput['p50_ms']:.1f}ms | p99 {throughput['p99_ms']:.1f}ms"
+    )
+    logger.info(
+        f"Order round trip: {round_trip['orders']} place+detail ({round_trip['fills']} fills) | "
+        f"p50 {round_trip['p50_ms']:.1f}ms | p99 {round_trip['p99_ms']:.1f}ms"
+    )
+    for name, result in limited.items():
+        logger.info(
+            f"Burst of {burst} ({name}): {result['seconds']:.2f}s | "
+            f"{result['rate_limited']} x 429 | {result['failures']} failed calls"
+        )
+    logger.info("=" * 80)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
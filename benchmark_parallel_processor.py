@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark ParallelProcessor: sequential vs. per-call pool vs. persistent pool.
+
+Usage:
+    python benchmark_parallel_processor.py [workers]
+
+The "per-call pool" mode reproduces the previous implementation: a fresh
+ProcessPoolExecutor per call and one task per symbol with its prices pickled.
+The persistent pool publishes prices to shared memory once per round and
+dispatches chunks to warm workers.
+"""
+
+import multiprocessing as mp
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from src.bitget_trading.logger import setup_logging
+from src.bitget_trading.parallel_processor import ParallelProcessor, get_shared_prices
+from src.bitget_trading.technical_indicators import TechnicalIndicators
+
+logger = setup_logging()
+
+SYMBOL_COUNTS = [50, 300, 600]
+HISTORY_LENGTH = 3600  # 1 hour of 1s samples
+ROUNDS = 5
+
+_indicators = TechnicalIndicators()
+
+
+def indicator_features(prices: np.ndarray) -> dict[str, float]:
+    """Representative per-symbol workload (RSI, MACD, Bollinger, EMA)."""
+    macd = _indicators.calculate_macd(prices, fast_period=3, slow_period=7, signal_period=2)
+    bands = _indicators.calculate_bollinger_bands(prices, period=20, std_dev=2.0)
+    emas = _indicators.calculate_ema_crossovers(prices, fast_period=3, slow_period=7)
+    return {
+        "rsi": _indicators.calculate_rsi(prices, period=14),
+        "macd_histogram": macd["histogram"],
+        "bb_upper": bands["upper_band"],
+        "ema_bullish": float(emas["is_bullish"]),
+    }
+
+
+def shared_features(symbol: str) -> dict[str, float]:
+    """Task for the persistent pool: prices come from shared memory."""
+    return indicator_features(get_shared_prices(symbol))
+
+
+def _symbol_features(symbol: str, prices: np.ndarray) -> dict[str, float]:
+    return indicator_features(prices)
+
+
+def run_sequential(histories: dict[str, np.ndarray]) -> dict[str, dict[str, float]]:
+    return {symbol: indicator_features(prices) for symbol, prices in histories.items()}
+
+
+def run_per_call_pool(histories: dict[str, np.ndarray], workers: int) -> dict[str, dict[str, float]]:
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_symbol_features, symbol, prices): symbol
+            for symbol, prices in histories.items()
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
+def run_persistent_pool(
+    processor: ParallelProcessor, histories: dict[str, np.ndarray]
+) -> dict[str, dict[str, float]]:
+    processor.publish_prices(histories)
+    return processor.compute_features_parallel(list(histories), shared_features)
+
+
+def time_rounds(func, *args) -> float:
+    """Median wall time (ms) over ROUNDS calls."""
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
+def main() -> None:
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else mp.cpu_count()
+    rng = np.random.default_rng(42)
+    processor = ParallelProcessor(max_workers=workers)
+
+    rows = []
+    try:
+        for n_symbols in SYMBOL_COUNTS:
+            histories = {
+                f"SYM{i}USDT": 100 * np.exp(np.cumsum(rng.normal(0, 0.001, HISTORY_LENGTH)))
+                for i in range(n_symbols)
+            }
+
+            # Sanity check: all modes compute the same features
+            expected = run_sequential(histories)
+            assert run_persistent_pool(processor, histories) == expected
+
+            rows.append(
+                (
+                    n_symbols,
+                    time_rounds(run_sequential, histories),
+                    time_rounds(run_per_call_pool, histories, workers),
+                    time_rounds(run_persistent_pool, processor, histories),
+                )
+            )
+    finally:
+        processor.shutdown()
+
+    logger.info(f"ParallelProcessor benchmark ({workers} workers, {HISTORY_LENGTH} prices/symbol, median of {ROUNDS})")
+    logger.info(f"{'symbols':>8} {'sequential':>12} {'per-call pool':>14} {'persistent':>12}")
+    for n_symbols, sequential, per_call, persistent in rows:
+        logger.info(f"{n_symbols:>8} {sequential:>10.1f}ms {per_call:>12.1f}ms {persistent:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
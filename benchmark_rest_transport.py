@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark BitgetRestClient transports against a local stub server.
+
+Usage:
+    python benchmark_rest_transport.py [requests] [concurrency] [latency_ms]
+
+Starts an aiohttp stub of the Bitget REST API on localhost that answers every
+request with a ticker-sized JSON payload after ``latency_ms``, then fires
+``requests`` signed GETs through ``BitgetRestClient._request`` with
+``concurrency`` in flight for each transport ("requests" = blocking session in
+the default thread pool, "aiohttp" = native asyncio with a keep-alive pool).
+Reports throughput and p50/p99 latency.
+"""
+
+import asyncio
+import sys
+import time
+
+import numpy as np
+from aiohttp import web
+
+from src.bitget_trading.bitget_rest import BitgetRestClient
+from src.bitget_trading.logger import setup_logging
+
+logger = setup_logging()
+
+TRANSPORTS = ["requests", "aiohttp"]
+TICKER_PAYLOAD = {
+    "code": "00000",
+    "msg": "success",
+    "data": [{
+        "symbol": "BTCUSDT", "lastPr": "65000.1", "bidPr": "65000.0", "askPr": "65000.2",
+        "bidSz": "1.2", "askSz": "0.8", "high24h": "66000", "low24h": "64000",
+        "baseVolume": "12345.6", "quoteVolume": "802000000", "fundingRate": "0.0001",
+        "ts": "1700000000000",
+    }],
+}
+
+
+async def start_stub_server(latency_ms: float) -> web.AppRunner:
+    async def handler(request: web.Request) -> web.Response:
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        return web.json_response(TICKER_PAYLOAD)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+async def run_transport(transport: str, base_url: str, n_requests: int, concurrency: int) -> dict:
+    client = BitgetRestClient(
+        "bench-key", "bench-secret", "bench-pass",
+        transport=transport, pool_size=concurrency, pool_per_host=concurrency, keepalive_sec=30.0,
+        base_url=base_url,
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = np.zeros(n_requests)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await client._request("GET", "/api/v2/mix/market/ticker",
+                                  params={"symbol": "BTCUSDT", "productType": "USDT-FUTURES"})
+            latencies[i] = time.perf_counter() - start
+
+    try:
+        # Warm up connections (and the thread pool) before timing
+        await asyncio.gather(*(one(i) for i in range(min(concurrency, n_requests))))
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(n_requests)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.close()
+
+    return {
+        "rps": n_requests / elapsed,
+        "p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "p99_ms": float(np.percentile(latencies, 99) * 1000),
+    }
+
+
+async def main() -> None:
+    n_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    latency_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+
+    runner = await start_stub_server(latency_ms)
+    port = runner.addresses[0][1]
+    base_url = f"http://127.0.0.1:{port}"
+
+    results = {}
+    try:
+        for transport in TRANSPORTS:
+            results[transport] = await run_transport(transport, base_url, n_requests, concurrency)
+    finally:
+        await runner.cleanup()
+
+    logger.info(
+        f"REST transport benchmark ({n_requests} requests, {concurrency} in flight, "
+        f"{latency_ms:.0f}ms stub latency)"
+    )
+    logger.info(f"{'transport':>10} {'req/s':>10} {'p50':>10} {'p99':>10}")
+    for transport, result in results.items():
+        logger.info(
+            f"{transport:>10} {result['rps']:>10.0f} {result['p50_ms']:>8.1f}ms {result['p99_ms']:>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
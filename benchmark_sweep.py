@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark the backtest sweep: per-task pickled DataFrames vs. sweep_runner.
+
+Usage:
+    python benchmark_sweep.py [strategies] [symbols] [bars] [workers]
+
+The "pickled" mode reproduces the previous pipeline: an mp.Pool with one task
+per (strategy, symbol) carrying the symbol's DataFrame, results collected at
+the end. The sweep mode runs the same grid through ``run_sweep`` (shared-memory
+candles, shared indicator cache, streamed columnar results). Candles are
+synthetic, so no data download is needed. Reports backtests/second.
+"""
+
+import multiprocessing as mp
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from backtest_engine import BacktestEngine
+from metrics_calculator import MetricsCalculator
+from sweep_runner import run_sweep
+
+
+def synthetic_candles(seed: int, bars: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 10 * np.exp(np.cumsum(rng.normal(0, 0.004, bars)))
+    spread = np.abs(rng.normal(0, 0.002, bars)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": 1_700_000_000_000 + 3_600_000 * np.arange(bars),
+            "open": np.r_[close[0], close[:-1]],
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.lognormal(8, 1, bars),
+        }
+    )
+
+
+def synthetic_strategies(count: int) -> list[dict]:
+    rng = np.random.default_rng(0)
+    return [
+        {
+            "id": i,
+            "name": f"bench_{i}",
+            "entry_threshold": float(rng.uniform(0.8, 1.6)),
+            "stop_loss_pct": float(rng.uniform(0.3, 0.6)),
+            "take_profit_pct": float(rng.uniform(0.2, 1.0)),
+            "trailing_callback": 0.02,
+            "volume_ratio": float(rng.uniform(1.2, 2.0)),
+            "confluence_required": int(rng.integers(2, 4)),
+            "position_size_pct": 0.1,
+            "leverage": 25,
+            "max_positions": 10,
+        }
+        for i in range(count)
+    ]
+
+
+def _pickled_task(args: tuple) -> dict:
+    strategy, symbol, df = args
+    result = BacktestEngine(strategy).run_backtest(df, symbol, initial_capital=50.0)
+    return {"symbol": symbol, "roi": MetricsCalculator.calculate_all_metrics(result).total_roi_pct}
+
+
+def run_pickled(strategies: list[dict], frames: dict[str, pd.DataFrame], workers: int) -> int:
+    tasks = [(strategy, symbol, df) for strategy in strategies for symbol, df in frames.items()]
+    with mp.Pool(workers) as pool:
+        return len(pool.map(_pickled_task, tasks))
+
+
+def main() -> None:
+    n_strategies = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    n_symbols = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    bars = int(sys.argv[3]) if len(sys.argv) > 3 else 720
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else mp.cpu_count()
+
+    strategies = synthetic_strategies(n_strategies)
+    frames = {f"SYM{i:03d}USDT": synthetic_candles(i, bars) for i in range(n_symbols)}
+    total = n_strategies * n_symbols
+
+    print("=" * 80)
+    print(f"📊 SWEEP BENCHMARK: {n_strategies} strategies x {n_symbols} symbols x {bars} bars, {workers} workers")
+    print("=" * 80)
+
+    started = time.perf_counter()
+    run_pickled(strategies, frames, workers)
+    pickled_seconds = time.perf_counter() - started
+    print(f"pickled DataFrame per task: {pickled_seconds:7.2f}s  {total / pickled_seconds:8.1f} backtests/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        summary = run_sweep(
+            strategies, frames, f"{tmp}/results", workers=workers, indicator_root=f"{tmp}/indicators", verbose=False
+        )
+        print(f"sweep_runner (cold cache):  {summary.seconds:7.2f}s  {summary.backtests_per_second:8.1f} backtests/s")
+
+        warm = run_sweep(
+            strategies, frames, f"{tmp}/results_warm", workers=workers, indicator_root=f"{tmp}/indicators", verbose=False
+        )
+        print(f"sweep_runner (warm cache):  {warm.seconds:7.2f}s  {warm.backtests_per_second:8.1f} backtests/s")
+
+    print(f"\nSpeedup (cold): {pickled_seconds / summary.seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from src.bitget_trading.bitget_ws import BitgetWebSocketClient
 from src.bitget_trading.config import get_config
 from src.bitget_trading.features import MicrostructureFeatures
 from src.bitget_trading.logger import setup_logging
+from src.bitget_trading.order_book import OrderBook
 
 logger = setup_logging()
 
@@ -46,8 +47,8 @@ async def collect_data(duration_minutes: int = 60) -> pd.DataFrame:
     def on_ticker(ticker: dict) -> None:
         feature_engine.update_ticker(ticker)
     
-    def on_orderbook(orderbook: dict) -> None:
-        feature_engine.update_orderbook(orderbook)
+    def on_book(book: OrderBook) -> None:
+        feature_engine.update_book(book)
         
         # Compute features
         features = feature_engine.compute_features()
@@ -58,7 +59,7 @@ async def collect_data(duration_minutes: int = 60) -> pd.DataFrame:
                 logger.info(f"collected_{len(features_list)}_samples")
     
     ws_client.on_ticker = on_ticker
-    ws_client.on_orderbook = on_orderbook
+    ws_client.on_book = on_book
     
     # Start collection
     logger.info(f"collecting_data_for_{duration_minutes}_minutes")
@@ -4,7 +4,6 @@ Fetches real OHLCV data from Bitget API with caching and rate limit handling.
 """
 
 import asyncio
-import pickle
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -13,7 +12,9 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 from src.bitget_trading.bitget_rest import BitgetRestClient
+from src.bitget_trading.candle_store import open_candle_store
 from src.bitget_trading.config import TradingConfig
+from src.bitget_trading.history_downloader import HistoryDownloader
 
 # Load ALL 338 symbols from the full Bitget universe
 try:
@@ -32,6 +33,8 @@ class HistoricalDataFetcher:
         """Initialize the data fetcher."""
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        # Columnar, memory-mapped candles (legacy *.pkl files are imported once)
+        self.store = open_candle_store(cache_dir)
         self.config = TradingConfig()
         self.rest_client = BitgetRestClient(
             api_key=self.config.bitget_api_key,
@@ -39,19 +42,21 @@ class HistoricalDataFetcher:
             passphrase=self.config.bitget_passphrase,
             sandbox=False,  # Use real API for historical data
         )
+        self.downloader = HistoryDownloader(self.rest_client, self.store)
     
-    def _get_cache_path(self, symbol: str, timeframe: str, days: int) -> Path:
-        """Get cache file path for a symbol/timeframe/duration."""
-        return self.cache_dir / f"{symbol}_{timeframe}_{days}d.pkl"
-    
-    def _is_cache_valid(self, cache_path: Path, max_age_hours: int = 24) -> bool:
-        """Check if cached data is still valid."""
-        if not cache_path.exists():
+    def _is_cache_valid(self, symbol: str, timeframe: str, max_age_hours: int = 24) -> bool:
+        """Check if the stored series is still valid."""
+        info = self.store.info(symbol, timeframe)
+        if info is None or not info["rows"]:
             return False
         
-        cache_age = time.time() - cache_path.stat().st_mtime
+        cache_age = time.time() - info["updated_at"]
         return cache_age < max_age_hours * 3600
     
+    def _load_cached(self, symbol: str, timeframe: str, days: int) -> pd.DataFrame:
+        """Last `days` days of the stored series."""
+        return self.store.load_recent(symbol, timeframe, days)
+    
     async def fetch_candles(
         self,
         symbol: str,
@@ -71,110 +76,26 @@ class HistoricalDataFetcher:
         Returns:
             DataFrame with columns: timestamp, open, high, low, close, volume
         """
-        cache_path = self._get_cache_path(symbol, timeframe, days)
-        
         # Try to load from cache
-        if use_cache and self._is_cache_valid(cache_path):
+        if use_cache and self._is_cache_valid(symbol, timeframe):
             print(f"📦 Loading {symbol} {timeframe} from cache...")
-            with open(cache_path, 'rb') as f:
-                return pickle.load(f)
+            return self._load_cached(symbol, timeframe, days)
         
         print(f"🌐 Fetching {symbol} {timeframe} from Bitget API ({days} days requested)...")
         
-        # Bitget API returns max 200 candles per request
-        # For 30 days, we need to make multiple requests
-        # Calculate how many requests needed
-        all_candles = []
-        
-        # Calculate candles needed for requested days
-        if timeframe == "1m":
-            candles_per_day = 1440  # 24 * 60
-        elif timeframe == "5m":
-            candles_per_day = 288  # 24 * 12
-        elif timeframe == "15m":
-            candles_per_day = 96  # 24 * 4
-        elif timeframe == "1H":
-            candles_per_day = 24
-        elif timeframe == "4H":
-            candles_per_day = 6
-        elif timeframe == "1D":
-            candles_per_day = 1
-        else:
-            candles_per_day = 24  # Default to 1H
-        
-        total_candles_needed = days * candles_per_day
-        requests_needed = (total_candles_needed + 199) // 200  # Round up
-        
-        print(f"  📊 Need {total_candles_needed} candles ({days} days), making {requests_needed} requests...")
-        
-        try:
-            # Make multiple requests to get enough historical data
-            for i in range(requests_needed):
-                # Calculate end time for this request (most recent first)
-                # Each request gets 200 candles, going backwards in time
-                response = await self.rest_client.get_historical_candles(
-                    symbol=symbol,
-                    granularity=timeframe,
-                    limit=200,  # Max available per request
-                )
-                
-                if response.get("code") == "00000" and "data" in response:
-                    candles = response["data"]
-                    if candles:
-                        # Add new candles (avoid duplicates)
-                        existing_timestamps = {c[0] for c in all_candles}
-                        new_candles = [c for c in candles if c[0] not in existing_timestamps]
-                        all_candles.extend(new_candles)
-                        print(f"  ✅ Request {i+1}/{requests_needed}: Fetched {len(new_candles)} new candles (total: {len(all_candles)})")
-                        
-                        # If we got fewer than 200, we've reached the end of available data
-                        if len(candles) < 200:
-                            print(f"  ℹ️ Reached end of available historical data")
-                            break
-                    else:
-                        print(f"  ⚠️ No data in response {i+1}")
-                        break
-                else:
-                    print(f"  ❌ API Error in request {i+1}: {response.get('msg', 'Unknown error')}")
-                    break
-                
-                # Small delay between requests to avoid rate limiting
-                if i < requests_needed - 1:
-                    await asyncio.sleep(0.1)
-                
-        except Exception as e:
-            print(f"  ❌ Exception: {e}")
-        
-        if all_candles:
-            print(f"✅ Total: {len(all_candles)} candles for {symbol}")
+        # Only missing bars are requested (resume from the last stored bar, backfill gaps),
+        # in concurrent 200-candle windows paced by the shared rate limiter
+        result = await self.downloader.download(symbol, timeframe, days, full=not use_cache)
+        print(
+            f"  ✅ {result.requests} requests ({result.failed} failed): "
+            f"{result.new_bars} new candles, {result.rows} stored"
+        )
         
-        # Convert to DataFrame
-        if not all_candles:
+        if not self.store.info(symbol, timeframe) or not result.rows:
             print(f"❌ No data fetched for {symbol}")
             return pd.DataFrame()
         
-        df = pd.DataFrame([
-            {
-                "timestamp": int(c[0]),
-                "open": float(c[1]),
-                "high": float(c[2]),
-                "low": float(c[3]),
-                "close": float(c[4]),
-                "volume": float(c[5]),
-            }
-            for c in all_candles
-        ])
-        
-        # Sort by timestamp and remove duplicates
-        df = df.sort_values("timestamp").drop_duplicates(subset="timestamp")
-        df = df.reset_index(drop=True)
-        
-        # Cache the data
-        with open(cache_path, 'wb') as f:
-            pickle.dump(df, f)
-        print(f"💾 Cached data to {cache_path}")
-        
-        return df
+        return self._load_cached(symbol, timeframe, days)
     
     async def fetch_all_symbols(
         self,
@@ -200,10 +121,13 @@ class HistoricalDataFetcher:
         
         data = {}
         
-        for i, symbol in enumerate(symbols, 1):
+        # All symbols download concurrently; the downloader bounds requests in flight
+        frames = await asyncio.gather(
+            *(self.fetch_candles(symbol, timeframe, days, use_cache) for symbol in symbols)
+        )
+        
+        for i, (symbol, df) in enumerate(zip(symbols, frames), 1):
             print(f"\n[{i}/{len(symbols)}] Processing {symbol}...")
-            df = await self.fetch_candles(symbol, timeframe, days, use_cache)
-            
             if not df.empty:
                 data[symbol] = df
                 print(f"  ✅ {symbol}: {len(df)} candles ({df['timestamp'].min()} to {df['timestamp'].max()})")
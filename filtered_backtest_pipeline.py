@@ -8,13 +8,29 @@ import asyncio
 from pathlib import Path
 from typing import List, Dict, Set
 from datetime import datetime
-from backtest_engine import BacktestEngine
-from metrics_calculator import MetricsCalculator
 from data_fetcher import HistoricalDataFetcher
-import multiprocessing as mp
-from functools import partial
+from src.bitget_trading.candle_store import open_candle_store
+from sweep_runner import load_results, run_sweep
 import os
 
+# Metrics kept per token in the detailed results file
+RESULT_COLUMNS = [
+    'total_trades',
+    'win_rate_pct',
+    'total_roi_pct',
+    'roi_per_day_pct',
+    'roi_per_week_pct',
+    'roi_per_month_pct',
+    'sharpe_ratio',
+    'sortino_ratio',
+    'max_drawdown_pct',
+    'profit_factor',
+    'trades_per_day',
+    'trades_per_hour',
+    'final_capital',
+]
+
+
 def identify_profitable_tokens(detailed_metrics_file: str, strategy_id: int, min_roi_pct: float = 0.0) -> List[str]:
     """
     Identify tokens that meet the minimum ROI threshold for a specific strategy.
@@ -39,90 +55,24 @@ def identify_profitable_tokens(detailed_metrics_file: str, strategy_id: int, min
     return sorted(profitable_tokens)
 
 
-def run_single_backtest(args):
-    """Worker function for parallel backtesting."""
-    strategy_path, symbol, data_dict = args
-    
-    try:
-        # Load strategy
-        with open(strategy_path, 'r') as f:
-            strategy = json.load(f)
-        
-        # Get data for this symbol
-        if symbol not in data_dict:
-            return None
-        
-        df = data_dict[symbol]
-        if df is None or len(df) < 50:
-            return None
-        
-        # Run backtest
-        engine = BacktestEngine(strategy)
-        result = engine.run_backtest(df, symbol, initial_capital=50.0)
-        
-        # Calculate metrics
-        perf_metrics = MetricsCalculator.calculate_all_metrics(result)
-        
-        # Convert to dict format
-        metrics = {
-            'total_trades': perf_metrics.total_trades,
-            'win_rate_pct': perf_metrics.win_rate_pct,
-            'total_roi_pct': perf_metrics.total_roi_pct,
-            'roi_per_day_pct': perf_metrics.roi_per_day_pct,
-            'roi_per_week_pct': perf_metrics.roi_per_week_pct,
-            'roi_per_month_pct': perf_metrics.roi_per_month_pct,
-            'sharpe_ratio': perf_metrics.sharpe_ratio,
-            'sortino_ratio': perf_metrics.sortino_ratio,
-            'max_drawdown_pct': perf_metrics.max_drawdown_pct,
-            'profit_factor': perf_metrics.profit_factor,
-            'trades_per_day': perf_metrics.trades_per_day,
-            'trades_per_hour': perf_metrics.trades_per_hour,
-            'final_capital': perf_metrics.final_capital
-        }
-        
-        # Add metadata
-        metrics['strategy_id'] = strategy['id']
-        metrics['strategy_name'] = strategy['name']
-        metrics['symbol'] = symbol
-        
-        return metrics
-    except Exception as e:
-        print(f"❌ Error backtesting {symbol}: {e}")
-        return None
-
-
-async def load_cached_data(symbols: List[str]) -> Dict[str, any]:
-    """Load cached data for specified symbols."""
-    import pickle
-    cache_dir = Path("backtest_data")
+async def load_cached_data(symbols: List[str]) -> Dict[str, Dict[str, any]]:
+    """Load cached data for specified symbols, grouped by the timeframe loaded ({timeframe: {symbol: df}})."""
+    store = open_candle_store("backtest_data")
     data_dict = {}
     
     print(f"📊 Loading cached data for {len(symbols)} tokens...")
     
     for symbol in symbols:
-        # Try different cache file formats
-        cache_patterns = [
-            cache_dir / f"{symbol}_1H_30d.pkl",
-            cache_dir / f"{symbol}_1m_30d.pkl",
-            cache_dir / f"{symbol}_1H.pkl",
-        ]
-        
-        loaded = False
-        for cache_file in cache_patterns:
-            if cache_file.exists():
-                try:
-                    with open(cache_file, 'rb') as f:
-                        df = pickle.load(f)
-                    data_dict[symbol] = df
-                    loaded = True
-                    break
-                except Exception as e:
-                    continue
-        
-        if not loaded:
+        # Preferred timeframes, in order
+        for timeframe in ("1H", "1m"):
+            df = store.load_recent(symbol, timeframe, days=30)
+            if not df.empty:
+                data_dict.setdefault(timeframe, {})[symbol] = df
+                break
+        else:
             print(f"⚠️ No cached data for {symbol}")
     
-    print(f"✅ Loaded {len(data_dict)} datasets")
+    print(f"✅ Loaded {sum(len(frames) for frames in data_dict.values())} datasets")
     return data_dict
 
 
@@ -204,18 +154,31 @@ async def run_filtered_backtest(strategy_path: str, symbols: List[str], test_nam
         print("❌ No data available!")
         return None
     
-    # Prepare arguments for parallel processing
-    args = [(strategy_path, symbol, data_dict) for symbol in symbols if symbol in data_dict]
-    
-    # Run backtests in parallel
-    print(f"🔥 Running {len(args)} backtests in parallel...")
-    num_workers = min(10, os.cpu_count())
-    
-    with mp.Pool(num_workers) as pool:
-        results = pool.map(run_single_backtest, args)
-    
-    # Filter out None results
-    results = [r for r in results if r is not None]
+    with open(strategy_path, 'r') as f:
+        strategy = json.load(f)
+    
+    # Run backtests in parallel (candles shared with the workers, results streamed to disk),
+    # one sweep per timeframe so results and indicator cache keys carry the real timeframe
+    results = []
+    for timeframe, frames in data_dict.items():
+        print(f"🔥 Running {len(frames)} {timeframe} backtests in parallel...")
+        sweep = run_sweep(
+            [strategy],
+            frames,
+            f"backtest_results/{test_name}_sweep_{timestamp}_{timeframe}",
+            timeframe=timeframe,
+            workers=min(10, os.cpu_count()),
+        )
+        results.extend(
+            {
+                **{column: row[column] for column in RESULT_COLUMNS},
+                'strategy_id': row['strategy_id'],
+                'strategy_name': row['strategy_name'],
+                'symbol': row['symbol'],
+                'timeframe': timeframe,
+            }
+            for row in load_results(sweep.path).to_dict('records')
+        )
     
     if not results:
         print("❌ No successful backtests!")
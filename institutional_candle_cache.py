@@ -0,0 +1,184 @@
+"""
+Institutional Candle Cache
+Per-symbol 5m candle store: seeded once, then extended with delta fetches or
+candle WebSocket pushes. The 15m resample is updated from the first changed
+bucket only, and indicator frames are recomputed only when a symbol's bars change.
+"""
+
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from institutional_indicators import InstitutionalIndicators
+
+# Bitget candle rows: [timestamp, open, high, low, close, volume, quote_volume]
+CANDLE_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'quote_volume']
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+OHLCV_AGG = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+
+
+def candles_to_frame(rows: Sequence[Sequence]) -> Optional[pd.DataFrame]:
+    """
+    Convert raw Bitget candle rows to a timestamp-indexed OHLCV DataFrame.
+
+    Rows may arrive newest-first and overlap between pages; the result is
+    sorted by timestamp with the last copy of each bar kept.
+    """
+    if not rows:
+        return None
+
+    df = pd.DataFrame([list(row)[:len(CANDLE_COLUMNS)] for row in rows], columns=CANDLE_COLUMNS)
+    df['timestamp'] = pd.to_datetime(pd.to_numeric(df['timestamp'], errors='coerce'), unit='ms')
+    df = df.sort_values('timestamp')
+
+    # Set timestamp as index (required for indicators)
+    df = df.set_index('timestamp')
+    df = df[~df.index.duplicated(keep='last')]
+
+    # Convert to numeric
+    for col in OHLCV_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+
+    return df
+
+
+class CandleCache:
+    """In-memory 5m candles, 15m resample and indicator frames per symbol"""
+
+    def __init__(self, indicators: InstitutionalIndicators, max_bars: int = 2000,
+                 trim_slack: int = 288, resample_rule: str = '15min'):
+        """
+        Args:
+            indicators: Indicator calculator shared with the trader
+            max_bars: 5m bars kept per symbol (2000 ~= 7 days)
+            trim_slack: Extra bars tolerated before trimming back to max_bars,
+                so the window start (and with it the 15m buckets) moves once a
+                day instead of on every new bar
+            resample_rule: Higher timeframe used for regime classification
+        """
+        self.indicators = indicators
+        self.max_bars = max_bars
+        self.trim_slack = trim_slack
+        self.resample_rule = resample_rule
+
+        self._bars: Dict[str, pd.DataFrame] = {}
+        self._bars_htf: Dict[str, pd.DataFrame] = {}
+        # symbol -> (5m with indicators, 15m with indicators); dropped when bars change
+        self._indicator_frames: Dict[str, Tuple[pd.DataFrame, pd.DataFrame]] = {}
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._bars
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._bars)
+
+    def bars(self, symbol: str) -> Optional[pd.DataFrame]:
+        """Cached 5m OHLCV bars (oldest first)"""
+        return self._bars.get(symbol)
+
+    def last_timestamp(self, symbol: str) -> Optional[pd.Timestamp]:
+        """Open time of the newest cached bar"""
+        bars = self._bars.get(symbol)
+        if bars is None or bars.empty:
+            return None
+        return bars.index[-1]
+
+    def last_bar(self, symbol: str) -> Optional[Dict]:
+        """Newest cached bar as a dict of OHLCV values"""
+        bars = self._bars.get(symbol)
+        if bars is None or bars.empty:
+            return None
+        return bars[OHLCV_COLUMNS].iloc[-1].to_dict()
+
+    def seed(self, symbol: str, df: pd.DataFrame):
+        """Replace the history of a symbol (e.g. from a paginated REST fetch)"""
+        bars = df.iloc[-self.max_bars:]
+        self._bars[symbol] = bars
+        self._bars_htf[symbol] = self._resample(bars)
+        self._indicator_frames.pop(symbol, None)
+
+    def update(self, symbol: str, df: Optional[pd.DataFrame]) -> int:
+        """
+        Merge newer (or revised) bars into the cache.
+
+        Bars already cached with identical OHLCV values are ignored, so
+        re-fetching the in-progress bar only counts when it moved.
+
+        Returns:
+            Number of bars added or changed
+        """
+        if df is None or df.empty:
+            return 0
+
+        cached = self._bars.get(symbol)
+        if cached is None:
+            self.seed(symbol, df)
+            return len(self._bars[symbol])
+
+        common = df.index.intersection(cached.index)
+        revised = common[(df.loc[common, OHLCV_COLUMNS] != cached.loc[common, OHLCV_COLUMNS]).any(axis=1)]
+        changed = revised.union(df.index.difference(cached.index))
+        if len(changed) == 0:
+            return 0
+
+        first_changed = changed.min()
+        bars = pd.concat([cached[~cached.index.isin(df.index)], df]).sort_index()
+
+        if len(bars) > self.max_bars + self.trim_slack:
+            # Window start moves: the first 15m bucket changes, rebuild it all
+            bars = bars.iloc[-self.max_bars:]
+            self._bars_htf[symbol] = self._resample(bars)
+        else:
+            # Only buckets from the first changed bar onward can differ
+            bucket_start = first_changed.floor(self.resample_rule)
+            htf = self._bars_htf[symbol]
+            self._bars_htf[symbol] = pd.concat([
+                htf[htf.index < bucket_start],
+                self._resample(bars[bars.index >= bucket_start]),
+            ])
+
+        self._bars[symbol] = bars
+        self._indicator_frames.pop(symbol, None)
+        return len(changed)
+
+    def apply_ws_candles(self, symbol: str, rows: Sequence[Sequence]) -> int:
+        """
+        Merge rows pushed on the ``candle5m`` WebSocket channel.
+
+        Pushes for symbols that were never seeded are ignored: a handful of
+        live bars is not enough history for the indicators.
+        """
+        if symbol not in self._bars:
+            return 0
+        return self.update(symbol, candles_to_frame(rows))
+
+    def indicator_frames(self, symbol: str) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+        """
+        5m and 15m frames with all indicators.
+
+        Computed on first use after the bars changed and reused until the next
+        change. Callers must treat the frames as read-only.
+        """
+        frames = self._indicator_frames.get(symbol)
+        if frames is not None:
+            return frames
+
+        bars = self._bars.get(symbol)
+        if bars is None or bars.empty:
+            return None, None
+
+        frames = (
+            self.indicators.calculate_all_indicators(bars, timeframe='5m'),
+            self.indicators.calculate_all_indicators(self._bars_htf[symbol], timeframe='15m'),
+        )
+        self._indicator_frames[symbol] = frames
+        return frames
+
+    def drop(self, symbol: str):
+        """Forget a symbol"""
+        self._bars.pop(symbol, None)
+        self._bars_htf.pop(symbol, None)
+        self._indicator_frames.pop(symbol, None)
+
+    def _resample(self, bars: pd.DataFrame) -> pd.DataFrame:
+        return bars[OHLCV_COLUMNS].resample(self.resample_rule).agg(OHLCV_AGG).dropna()
@@ -54,31 +54,24 @@ class InstitutionalIndicators:
             df['datetime'] = df.index
         
         # Extract date for grouping
-        df['date'] = df['datetime'].dt.date
+        df['date'] = df['datetime'].dt.normalize()
         
         # Calculate typical price
         df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
         df['tp_volume'] = df['typical_price'] * df['volume']
         
-        # Calculate VWAP per day
-        vwap_values = []
-        sigma_values = []
+        # Calculate VWAP per day (cumulative sums restart at every date)
+        by_date = df.groupby('date', sort=False)
+        cum_tp_vol = by_date['tp_volume'].cumsum()
+        cum_vol = by_date['volume'].cumsum()
+        vwap = cum_tp_vol / cum_vol
         
-        for date, group in df.groupby('date'):
-            cum_tp_vol = group['tp_volume'].cumsum()
-            cum_vol = group['volume'].cumsum()
-            vwap = cum_tp_vol / cum_vol
-            
-            # Calculate standard deviation
-            squared_diff = (group['typical_price'] - vwap) ** 2
-            variance = (squared_diff * group['volume']).cumsum() / cum_vol
-            sigma = np.sqrt(variance)
-            
-            vwap_values.extend(vwap.values)
-            sigma_values.extend(sigma.values)
+        # Calculate standard deviation
+        squared_diff = (df['typical_price'] - vwap) ** 2
+        variance = (squared_diff * df['volume']).groupby(df['date'], sort=False).cumsum() / cum_vol
         
-        df['vwap'] = vwap_values
-        df['vwap_sigma'] = sigma_values
+        df['vwap'] = vwap.values
+        df['vwap_sigma'] = np.sqrt(variance).values
         df['vwap_upper'] = df['vwap'] + df['vwap_sigma']
         df['vwap_lower'] = df['vwap'] - df['vwap_sigma']
         
@@ -106,11 +99,15 @@ class InstitutionalIndicators:
         # Calculate BB width
         df['bb_width'] = (df['bb_upper'] - df['bb_lower']) / df['bb_middle']
         
-        # Calculate BB width percentile over lookback period
-        df['bb_width_pct'] = df['bb_width'].rolling(lookback).apply(
-            lambda x: (x.iloc[-1] <= x).sum() / len(x) * 100 if len(x) > 0 else 50,
-            raw=False
-        )
+        # Calculate BB width percentile over lookback period: share of the
+        # window at or above the latest width (NaN until a full window exists)
+        width = df['bb_width'].to_numpy(dtype=float)
+        width_pct = np.full(len(width), np.nan)
+        if len(width) >= lookback:
+            windows = np.lib.stride_tricks.sliding_window_view(width, lookback)
+            rank = (windows >= windows[:, -1:]).sum(axis=1) / lookback * 100
+            width_pct[lookback - 1:] = np.where(np.isnan(windows).any(axis=1), np.nan, rank)
+        df['bb_width_pct'] = width_pct
         
         return df[['bb_upper', 'bb_middle', 'bb_lower', 'bb_width', 'bb_width_pct']]
     
@@ -288,25 +285,30 @@ class InstitutionalIndicators:
         upper_band = hl_avg + (multiplier * atr)
         lower_band = hl_avg - (multiplier * atr)
         
-        # Initialize
-        supertrend = pd.Series(index=df.index, dtype=float)
-        direction = pd.Series(index=df.index, dtype=int)
+        # Walk the bands on plain arrays (pandas scalar access is too slow per bar)
+        close = df['close'].to_numpy(dtype=float)
+        upper = upper_band.to_numpy(dtype=float)
+        lower = lower_band.to_numpy(dtype=float)
+        supertrend_values = np.empty(len(df))
+        direction_values = np.empty(len(df))
         
         for i in range(len(df)):
             if i == 0:
-                supertrend.iloc[i] = lower_band.iloc[i]
-                direction.iloc[i] = 1
+                supertrend_values[i] = lower[i]
+                direction_values[i] = 1
                 continue
             
-            # Calculate final bands
-            if df['close'].iloc[i-1] <= supertrend.iloc[i-1]:
-                # Downtrend
-                supertrend.iloc[i] = min(upper_band.iloc[i], supertrend.iloc[i-1]) if upper_band.iloc[i] < supertrend.iloc[i-1] else upper_band.iloc[i]
-                direction.iloc[i] = -1 if df['close'].iloc[i] <= supertrend.iloc[i] else 1
+            if close[i-1] <= supertrend_values[i-1]:
+                # Downtrend: follow the upper band
+                supertrend_values[i] = upper[i]
+                direction_values[i] = -1 if close[i] <= supertrend_values[i] else 1
             else:
-                # Uptrend
-                supertrend.iloc[i] = max(lower_band.iloc[i], supertrend.iloc[i-1]) if lower_band.iloc[i] > supertrend.iloc[i-1] else lower_band.iloc[i]
-                direction.iloc[i] = 1 if df['close'].iloc[i] >= supertrend.iloc[i] else -1
+                # Uptrend: follow the lower band
+                supertrend_values[i] = lower[i]
+                direction_values[i] = 1 if close[i] >= supertrend_values[i] else -1
+        
+        supertrend = pd.Series(supertrend_values, index=df.index)
+        direction = pd.Series(direction_values, index=df.index)
         
         result = pd.DataFrame({
             'supertrend': supertrend,
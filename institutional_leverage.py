@@ -45,11 +45,11 @@ class LeverageManager:
             return self.leverage_cache[symbol]
         
         try:
-            # Fetch from API
-            symbol_info = await self.rest_client.get_symbol_info(symbol)
+            # Indexed lookup in the client's contract catalog (one bulk download for all symbols)
+            spec = await self.rest_client.get_contract_spec(symbol)
             
-            if symbol_info and 'maxLeverage' in symbol_info:
-                max_leverage = int(symbol_info['maxLeverage'])
+            if spec is not None:
+                max_leverage = spec.max_leverage
                 self.leverage_cache[symbol] = max_leverage
                 logger.debug(f"📊 {symbol}: Max leverage = {max_leverage}x")
                 return max_leverage
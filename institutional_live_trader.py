@@ -18,6 +18,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from bitget_trading.bitget_rest import BitgetRestClient
 from institutional_indicators import InstitutionalIndicators
+from institutional_candle_cache import CandleCache, candles_to_frame
 from institutional_universe import UniverseFilter, RegimeClassifier, MarketData
 from institutional_risk import RiskManager
 from institutional_strategies import LSVRStrategy, VWAPMRStrategy, TrendStrategy, TradeSignal
@@ -90,6 +91,10 @@ class InstitutionalLiveTrader:
         # Symbol data cache
         self.symbol_data_cache: Dict[str, Dict] = {}
         
+        # 5m candle cache: seeded once per symbol, then extended with delta fetches
+        self.candle_cache = CandleCache(self.indicators, max_bars=2000)
+        self.candle_fetch_concurrency = self.scheduling_config.get('candle_fetch_concurrency', 10)
+        
         # Load symbol buckets
         self.symbol_buckets: Dict[str, List[str]] = {}
         bucket_file = Path('symbol_buckets.json')
@@ -292,32 +297,75 @@ class InstitutionalLiveTrader:
                     if i == 0:
                         return None
                     break
-                
-                # Small delay between requests to avoid rate limit
-                if i < requests_needed - 1:
-                    await asyncio.sleep(0.3)  # Increased delay to avoid connection issues
-            
-            if all_candles:
-                # Convert to DataFrame
-                df = pd.DataFrame(all_candles, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume', 'quote_volume'])
-                df['timestamp'] = pd.to_datetime(pd.to_numeric(df['timestamp'], errors='coerce'), unit='ms')
-                df = df.sort_values('timestamp')
-                
-                # Set timestamp as index (required for indicators)
-                df = df.set_index('timestamp')
-                
-                # Convert to numeric
-                for col in ['open', 'high', 'low', 'close', 'volume']:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-                
-                return df
             
-            return None
+            return candles_to_frame(all_candles)
         
         except Exception as e:
             logger.error(f"❌ Error fetching candles for {symbol}: {e}")
             return None
     
+    async def refresh_candles(self, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        Bring the cached 5m candles of a symbol up to date.
+        
+        The first call seeds the cache with 7 days of history; later calls
+        fetch a single page starting at the newest cached bar (which is
+        re-fetched because it may still be in progress). If the gap is longer
+        than one page the symbol is re-seeded.
+        
+        Returns:
+            Cached 5m bars, or None if no data is available
+        """
+        last_timestamp = self.candle_cache.last_timestamp(symbol)
+        if last_timestamp is None:
+            df = await self.fetch_candles(symbol, timeframe='5m', days=7)
+            if df is not None:
+                self.candle_cache.seed(symbol, df)
+            return self.candle_cache.bars(symbol)
+        
+        try:
+            response = await self.rest_client._request(
+                'GET',
+                '/api/v2/mix/market/candles',
+                params={
+                    'symbol': symbol,
+                    'productType': 'USDT-FUTURES',
+                    'granularity': '5m',
+                    'startTime': str(int(last_timestamp.timestamp() * 1000)),
+                    'limit': '200'
+                }
+            )
+        except Exception as e:
+            logger.debug(f"⚠️ Delta candle fetch failed for {symbol}: {e}")
+            return self.candle_cache.bars(symbol)
+        
+        if response.get('code') != '00000':
+            return self.candle_cache.bars(symbol)
+        
+        candles = response.get('data') or []
+        if len(candles) >= 200:
+            # Gap longer than one page (e.g. after a restart) - re-seed
+            df = await self.fetch_candles(symbol, timeframe='5m', days=7)
+            if df is not None:
+                self.candle_cache.seed(symbol, df)
+        else:
+            self.candle_cache.update(symbol, candles_to_frame(candles))
+        
+        return self.candle_cache.bars(symbol)
+    
+    async def refresh_candle_cache(self, symbols: List[str]):
+        """Refresh cached candles for many symbols concurrently"""
+        semaphore = asyncio.Semaphore(self.candle_fetch_concurrency)
+        
+        async def _refresh(symbol: str):
+            async with semaphore:
+                try:
+                    await self.refresh_candles(symbol)
+                except Exception as e:
+                    logger.debug(f"⚠️ Candle refresh failed for {symbol}: {e}")
+        
+        await asyncio.gather(*(_refresh(symbol) for symbol in symbols))
+    
     async def get_account_equity(self) -> float:
         """Get total account equity in USDT"""
         try:
@@ -876,11 +924,10 @@ class InstitutionalLiveTrader:
                     # Get exit indicators
                     exit_indicators = {}
                     try:
-                        df_5m = await self.fetch_candles(position.symbol, timeframe='5m', days=1)
-                        df_15m = df_5m.resample('15min').agg({
-                            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
-                        }).dropna() if df_5m is not None else pd.DataFrame()
-                        df_15m = self.indicators.calculate_all_indicators(df_15m, timeframe='15m') if not df_15m.empty else pd.DataFrame()
+                        await self.refresh_candles(position.symbol)
+                        df_5m, df_15m = self.candle_cache.indicator_frames(position.symbol)
+                        if df_5m is None:
+                            df_5m, df_15m = pd.DataFrame(), pd.DataFrame()
                         
                         if 'adx' in df_15m.columns and len(df_15m) > 0:
                             exit_indicators['adx'] = float(df_15m['adx'].iloc[-1]) if not pd.isna(df_15m['adx'].iloc[-1]) else None
@@ -972,17 +1019,18 @@ class InstitutionalLiveTrader:
                         peak_price=peak_price
                     )
                 
-                # Get latest bar for tripwire checks
-                df = await self.fetch_candles(symbol, timeframe='5m', days=1)
-                if df is None or len(df) == 0:
+                # Get latest bar for tripwire checks (delta fetch into the candle cache)
+                await self.refresh_candles(symbol)
+                last_bar = self.candle_cache.last_bar(symbol)
+                if last_bar is None:
                     continue
                 
                 current_bar = {
-                    'open': df['open'].iloc[-1],
-                    'high': df['high'].iloc[-1],
-                    'low': df['low'].iloc[-1],
-                    'close': df['close'].iloc[-1],
-                    'atr': df.get('atr', pd.Series([0])).iloc[-1] if 'atr' in df.columns else 0
+                    'open': last_bar['open'],
+                    'high': last_bar['high'],
+                    'low': last_bar['low'],
+                    'close': last_bar['close'],
+                    'atr': 0
                 }
                 
                 # Check tripwires
@@ -1224,14 +1272,17 @@ class InstitutionalLiveTrader:
         
         stats = {'checked': 0, 'gates_failed': 0, 'data_failed': 0, 'no_signal': 0, 'signals_found': 0}
         
+        # Bring the candle cache up to date for every symbol we could trade
+        # (first scan seeds 7 days per symbol, later scans fetch one page each)
+        refresh_start = datetime.now()
+        eligible = [symbol for symbol in symbols if await self.can_open_position(symbol, 'any')]
+        await self.refresh_candle_cache(eligible)
+        logger.debug(f"  Candle cache refreshed for {len(eligible)} symbols in {(datetime.now() - refresh_start).total_seconds():.1f}s")
+        
         for symbol in symbols:
             try:
                 stats['checked'] += 1
                 
-                # Small delay between symbols to avoid overwhelming API
-                if stats['checked'] > 1:
-                    await asyncio.sleep(0.1)  # 100ms delay between symbols
-                
                 # Check if can open position
                 if not await self.can_open_position(symbol, 'any'):
                     continue
@@ -1246,22 +1297,16 @@ class InstitutionalLiveTrader:
                 logger.debug(f"  ⚠️  {symbol}: Skipping gates (testing mode)")
                 
                 # Get data (enough for 15m resampling and EMA200)
-                # Fetch 7 days = ~2000 5m bars = 280 15m bars (enough for EMA200)
-                df_5m = await self.fetch_candles(symbol, timeframe='5m', days=7)  # ~2000 bars
-                if df_5m is None or len(df_5m) < 500:
+                # Cache holds ~7 days = ~2000 5m bars = 280 15m bars (enough for EMA200)
+                bars = self.candle_cache.bars(symbol)
+                if bars is None or len(bars) < 500:
                     stats['data_failed'] += 1
                     if stats['data_failed'] <= 3:  # Log first 3 failures
-                        logger.debug(f"  ⚠️  {symbol}: Insufficient data ({0 if df_5m is None else len(df_5m)} bars)")
+                        logger.debug(f"  ⚠️  {symbol}: Insufficient data ({0 if bars is None else len(bars)} bars)")
                     continue
                 
-                # Calculate indicators
-                df_5m = self.indicators.calculate_all_indicators(df_5m, timeframe='5m')
-                
-                # Get 15m for regime
-                df_15m = df_5m.resample('15min').agg({
-                    'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
-                }).dropna()
-                df_15m = self.indicators.calculate_all_indicators(df_15m, timeframe='15m')
+                # Indicators on 5m and the 15m resample (recomputed only if the bars changed)
+                df_5m, df_15m = self.candle_cache.indicator_frames(symbol)
                 
                 # Classify regime
                 bucket = self.universe_filter.get_bucket(symbol)
@@ -2106,6 +2151,7 @@ class InstitutionalLiveTrader:
                 logger.error(f"❌ Error in main loop: {e}", exc_info=True)
                 await asyncio.sleep(10)  # Wait before retrying
         
+        self.trade_tracker.close()  # Write queued trade records
         logger.info("✅ Live trading stopped")
 
 
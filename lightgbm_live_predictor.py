@@ -8,12 +8,40 @@ Optimized for short-term trading (1-10 minutes) with high win rate.
 import lightgbm as lgb
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import json
 from datetime import datetime
 
-from ml_feature_engineering import calculate_all_features, get_feature_list
+from ml_feature_engineering import calculate_all_features, calculate_latest_features, get_feature_list
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Candle history of one symbol: a DataFrame (as passed to predict) or the raw
+# candle dicts kept by SymbolState (candles_1m / candles_5m)
+CandleHistory = Union[pd.DataFrame, Sequence[dict]]
+
+
+@dataclass
+class BatchPrediction:
+    """Predictions for many symbols; arrays are aligned with ``symbols``."""
+
+    symbols: List[str]
+    direction: np.ndarray  # "long", "short" or "neutral"
+    confidence: np.ndarray
+    probability: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def get(self, symbol: str) -> Tuple[str, float, float]:
+        """(direction, confidence, probability) of one symbol, like ``predict``."""
+        try:
+            i = self.symbols.index(symbol)
+        except ValueError:
+            return "neutral", 0.0, 0.0
+        return str(self.direction[i]), float(self.confidence[i]), float(self.probability[i])
 
 
 class LightGBMLivePredictor:
@@ -30,6 +58,8 @@ class LightGBMLivePredictor:
         self.features: Dict[str, list] = {}
         self.metadata: Dict[str, dict] = {}
         self.loaded_symbols = set()
+        # symbol -> (candle history key, latest feature row) for predict_batch
+        self._latest_features: Dict[str, Tuple[tuple, Dict[str, float]]] = {}
         
     def load_model(self, symbol: str) -> bool:
         """
@@ -174,6 +204,142 @@ class LightGBMLivePredictor:
             traceback.print_exc()
             return "neutral", 0.0, 0.0
     
+    def predict_batch(
+        self,
+        histories: Dict[str, CandleHistory],
+        confidence_threshold: float = 0.65
+    ) -> BatchPrediction:
+        """
+        Predict many symbols at once.
+
+        Only the features of the last candle are computed per symbol, and
+        reused while the candle history is unchanged. Symbols that share a
+        model and feature schema are stacked into one matrix, so there is one
+        ``Booster.predict`` call per model instead of one per symbol. Results
+        match ``predict`` symbol for symbol.
+
+        Args:
+            histories: Symbol -> OHLCV DataFrame or list of candle dicts
+            confidence_threshold: Minimum confidence to return a signal
+
+        Returns:
+            BatchPrediction in the order of ``histories`` (symbols without a
+            model or enough history are neutral with zero confidence)
+        """
+        symbols = list(histories)
+        direction = np.full(len(symbols), "neutral", dtype=object)
+        confidence = np.zeros(len(symbols))
+        probability = np.zeros(len(symbols))
+
+        # (model id, feature schema) -> (model, features, [(position, row)])
+        groups: Dict[tuple, Tuple[lgb.Booster, list, list]] = {}
+        for i, symbol in enumerate(symbols):
+            if symbol not in self.loaded_symbols and not self.load_model(symbol):
+                continue
+            model = self.models.get(symbol)
+            if model is None:
+                continue
+
+            expected_features = self.features.get(symbol, get_feature_list())
+            try:
+                row = self._latest_feature_row(symbol, histories[symbol], expected_features)
+            except Exception as e:
+                print(f"⚠️ Error computing features for {symbol}: {e}")
+                continue
+            if row is None:
+                continue
+
+            key = (id(model), tuple(expected_features))
+            if key not in groups:
+                groups[key] = (model, expected_features, [])
+            groups[key][2].append((i, row))
+
+        for model, _, rows in groups.values():
+            positions = np.array([position for position, _ in rows])
+            X = np.array([row for _, row in rows], dtype=np.float64)
+            try:
+                prob = np.asarray(model.predict(
+                    X, num_iteration=model.best_iteration if hasattr(model, 'best_iteration') else None
+                ))
+            except Exception as e:
+                print(f"⚠️ Error predicting batch of {len(rows)} symbols: {e}")
+                continue
+
+            # Binary classification: column 1 (or the single output) = P(LONG)
+            if prob.ndim > 1:
+                prob_long = prob[:, 1] if prob.shape[1] > 1 else prob[:, 0]
+            else:
+                prob_long = prob
+
+            is_long = prob_long > 0.5
+            conf = np.where(is_long, prob_long, 1.0 - prob_long)
+            confidence[positions] = conf
+            probability[positions] = conf
+            direction[positions] = np.where(
+                conf < confidence_threshold, "neutral", np.where(is_long, "long", "short")
+            )
+
+        return BatchPrediction(symbols, direction, confidence, probability)
+
+    def _latest_feature_row(
+        self,
+        symbol: str,
+        history: CandleHistory,
+        expected_features: list
+    ) -> Optional[List[float]]:
+        """
+        Model input row for the last candle of ``history``, in feature order.
+
+        Features come from ``calculate_latest_features`` (cached per symbol
+        until the history changes); when the last candle would be dropped for
+        NaNs, the full ``calculate_all_features`` pass is used instead, exactly
+        as in ``predict``. Returns None when no row survives.
+        """
+        if isinstance(history, pd.DataFrame):
+            n = len(history)
+            if n == 0:
+                return None
+            columns = {name: history[name].to_numpy(dtype=np.float64) for name in OHLCV_COLUMNS}
+            index_value = history.index[-1]
+            first_label = history['timestamp'].iloc[0] if 'timestamp' in history else history.index[0]
+            last_raw = history.iloc[-1].to_dict()
+        else:
+            n = len(history)
+            if n == 0:
+                return None
+            columns = {
+                name: np.fromiter((candle[name] for candle in history), dtype=np.float64, count=n)
+                for name in OHLCV_COLUMNS
+            }
+            index_value = n - 1
+            first_label = history[0].get('timestamp')
+            last_raw = dict(history[-1])
+
+        key = (n, first_label, index_value, last_raw.get('timestamp'),
+               *(columns[name][-1] for name in OHLCV_COLUMNS))
+        cached = self._latest_features.get(symbol)
+        if cached is not None and cached[0] == key:
+            latest = cached[1]
+        else:
+            latest = calculate_latest_features(
+                columns['open'], columns['high'], columns['low'], columns['close'], columns['volume'],
+                index_value=index_value,
+            )
+            if latest is None:
+                df = history if isinstance(history, pd.DataFrame) else pd.DataFrame(list(history))
+                df_features = calculate_all_features(df.copy())
+                if len(df_features) == 0:
+                    return None
+                latest = df_features.iloc[-1].to_dict()
+                last_raw = {}
+            self._latest_features[symbol] = (key, latest)
+
+        # Features missing from the computed row fall back to the raw candle, then 0
+        return [
+            latest[feat] if feat in latest else last_raw.get(feat, 0.0)
+            for feat in expected_features
+        ]
+
     def get_model_info(self, symbol: str) -> Optional[dict]:
         """Get model metadata for a symbol."""
         if symbol in self.metadata:
@@ -16,25 +16,32 @@ LIVE TRADING SYSTEM for Bitget USDT-M Futures.
 import asyncio
 import os
 import sys
+import time
 from datetime import datetime
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from src.bitget_trading.account_stream import AccountStream
 from src.bitget_trading.backtest_service import BacktestService
 from src.bitget_trading.bitget_rest import BitgetRestClient
 from src.bitget_trading.config import get_config
 from src.bitget_trading.cross_sectional_ranker import CrossSectionalRanker
 from src.bitget_trading.dynamic_params import DynamicParams
 from src.bitget_trading.enhanced_ranker import EnhancedRanker
+from src.bitget_trading.event_scheduler import EventScheduler
 from src.bitget_trading.logger import setup_logging
+from src.bitget_trading.market_data_hub import MarketDataHub
 from src.bitget_trading.multi_symbol_state import MultiSymbolStateManager
 from src.bitget_trading.position_manager import PositionManager
+from src.bitget_trading.rate_limiter import PRIORITY_NORMAL
 from src.bitget_trading.loss_tracker import LossTracker, TradeRecord
 from src.bitget_trading.regime_detector import RegimeDetector
+from src.bitget_trading.state_snapshot import StateSnapshotStore
 from src.bitget_trading.symbol_filter import SymbolFilter
 from src.bitget_trading.universe import UniverseManager
+from src.bitget_trading.leverage_bootstrap import LeverageBootstrap
 from src.bitget_trading.leverage_cache import LeverageCache
 from holy_grail_strategy import HolyGrailStrategy
 from lightgbm_live_predictor import get_predictor, LightGBMLivePredictor
@@ -70,14 +77,29 @@ class LiveTrader:
 
         # Components (sandbox=False for production API)
         self.rest_client = BitgetRestClient(api_key, secret_key, passphrase, sandbox=False)
-        self.universe_manager = UniverseManager()
+        # One contract catalog (snapshot + TTL refresh) shared by order rounding and the universe
+        self.universe_manager = UniverseManager(contract_catalog=self.rest_client.contract_catalog)
         self.state_manager = MultiSymbolStateManager()
         self.simple_ranker = CrossSectionalRanker()  # WORKING paper trading ranker
         self.enhanced_ranker = EnhancedRanker()  # Enhanced ranker (use when data accumulated)
-        self.position_manager = PositionManager()  # Position persistence + trailing stops
-        self.loss_tracker = LossTracker()  # Comprehensive loss analysis
+        self.position_manager = PositionManager(  # Position persistence (write-behind) + trailing stops
+            flush_interval_ms=get_config().position_flush_interval_ms
+        )
+        self.position_persister: asyncio.Task[None] | None = None  # Background snapshot writer (started in run())
+        self.loss_tracker = LossTracker(  # Comprehensive loss analysis (journal written in the background)
+            fsync=get_config().trade_journal_fsync,
+            max_bytes=int(get_config().trade_journal_max_mb * 1024 * 1024),
+        )
         self.regime_detector = RegimeDetector()  # Market regime detection
         self.leverage_cache = LeverageCache()  # Cache to avoid redundant leverage API calls
+        self.leverage_bootstrap = LeverageBootstrap(
+            self.rest_client,
+            self.leverage_cache,
+            self.leverage,
+            concurrency=get_config().leverage_bootstrap_concurrency,
+        )
+        self.market_data_hub: MarketDataHub | None = None  # WebSocket ticker/book stream (started in run())
+        self.account_stream: AccountStream | None = None  # Private orders/positions/account mirror (live mode, started in run())
         self.use_enhanced = False  # Start with simple, upgrade to enhanced after data accumulates
         
         # 🎯 HOLY GRAIL STRATEGY INTEGRATION
@@ -102,6 +124,15 @@ class LiveTrader:
         
         # 🚀 NEW: Backtesting and performance tracking
         self.config = get_config()
+        self.event_scheduler = EventScheduler(
+            rank_min_interval_sec=self.config.event_rank_min_interval_sec,
+            rank_max_interval_sec=self.config.event_rank_max_interval_sec,
+            max_pending=self.config.event_max_pending_symbols,
+        )
+        # Warm start: per-symbol state snapshot (written periodically and on shutdown)
+        self.state_snapshots: StateSnapshotStore | None = (
+            StateSnapshotStore(self.config.state_snapshot_dir) if self.config.state_snapshot_enabled else None
+        )
         self.backtest_service: BacktestService | None = None
         self.symbol_filter: SymbolFilter | None = None
         self.dynamic_params: DynamicParams | None = None
@@ -261,6 +292,38 @@ class LiveTrader:
             logger.error(f"❌ Balance check failed: {e}")
             return False
 
+    def _account_stream_synced(self) -> bool:
+        return self.account_stream is not None and self.account_stream.synced
+
+    async def get_account_data(self) -> dict[str, Any] | None:
+        """USDT futures account (available, frozen, unrealizedPL, equity): private stream mirror, else REST."""
+        if self._account_stream_synced():
+            return self.account_stream.account
+        balance = await self.rest_client.get_account_balance()
+        if balance and balance.get("code") == "00000":
+            return (balance.get("data") or [{}])[0]
+        return None
+
+    async def get_exchange_positions(self, symbol: str) -> list[dict[str, Any]]:
+        """Exchange positions of a symbol: private stream mirror, else REST."""
+        if self._account_stream_synced():
+            return self.account_stream.get_positions(symbol)
+        return await self.rest_client.get_positions(symbol)
+
+    async def get_all_exchange_positions(self) -> list[dict[str, Any]]:
+        """All exchange positions: private stream mirror, else REST."""
+        if self._account_stream_synced():
+            return self.account_stream.get_all_positions()
+        return await self.rest_client.get_all_positions()
+
+    async def wait_for_fill(self, symbol: str, order_id: str | None) -> None:
+        """Wait for a new order's fill: until pushed by the private stream, else a fixed 3s for REST to catch up."""
+        if self._account_stream_synced():
+            filled = await self.account_stream.wait_for_fill(symbol, order_id, self.config.ws_fill_timeout_sec)
+            if filled or self._account_stream_synced():
+                return
+        await asyncio.sleep(3.0)
+
     async def fetch_current_positions(self) -> None:
         """
         Fetch current positions from exchange and SYNC with saved positions.
@@ -320,6 +383,10 @@ class LiveTrader:
             return True
         else:
             # Real trading
+            if not self.leverage_bootstrap.is_ready(symbol):
+                # Startup leverage calls still in flight for this symbol - trade it once they land
+                logger.debug(f"⏳ [LEVERAGE BOOTSTRAP] {symbol}: leverage not configured yet - skipping entry")
+                return False
             try:
                 # Set isolated margin mode first
                 try:
@@ -333,6 +400,7 @@ class LiveTrader:
                 # 🚨 CRITICAL: Set leverage to 25x for both sides (MUST BE SET!)
                 # 🚀 OPTIMIZATION: Check cache first to avoid retrying failed tokens!
                 leverage_set_success = False
+                leverage_changed = False  # True only if leverage was changed via API just now
                 for hold_side in ["long", "short"]:
                     try:
                         # Check cache first - if already set or failed, skip API call!
@@ -366,6 +434,7 @@ class LiveTrader:
                             # Cache success
                             self.leverage_cache.mark_set(symbol, self.leverage, hold_side)
                             leverage_set_success = True
+                            leverage_changed = True
                         else:
                             error_code = response.get('code', 'unknown')
                             error_msg = response.get('msg', 'Unknown error')
@@ -424,7 +493,8 @@ class LiveTrader:
                         # Don't pass silently - log the error!
                 
                 # 🚨 CRITICAL: Wait 1 second after setting leverage to ensure it's applied
-                if leverage_set_success:
+                # (cached/bootstrapped leverage was applied long ago - no wait)
+                if leverage_set_success and leverage_changed:
                     await asyncio.sleep(1.0)
                     logger.info(f"⏳ [LEVERAGE WAIT] {symbol}: Waited 1s after setting leverage to ensure it's applied")
                 
@@ -559,8 +629,9 @@ class LiveTrader:
                             # The calculated size might not match the actual filled size
                             # This prevents "Insufficient position" errors (code 43023)
                             # Market orders should fill instantly, but position query might lag
-                            # Increased wait time to ensure position is fully available on exchange
-                            await asyncio.sleep(3.0)  # Wait 3 seconds for market order to fill and position to update
+                            # Private stream: returns as soon as the fill and position are pushed,
+                            # otherwise waits 3s so the REST position query below sees the fill
+                            await self.wait_for_fill(symbol, order_id)
                             
                             # Query actual position from exchange with retry
                             # Sometimes the position query returns 0 or wrong size immediately after fill
@@ -569,7 +640,7 @@ class LiveTrader:
                             retry_delay = 1.0
                             for attempt in range(max_retries):
                                 try:
-                                    positions = await self.rest_client.get_positions(symbol)
+                                    positions = await self.get_exchange_positions(symbol)
                                     if positions:
                                         pos = positions[0]
                                         # 🚨 CRITICAL: Log FULL position response to debug "partial SL" issue
@@ -998,7 +1069,7 @@ class LiveTrader:
                                     )
                                     # Try to query position one more time
                                     try:
-                                        positions = await self.rest_client.get_positions(symbol)
+                                        positions = await self.get_exchange_positions(symbol)
                                         if positions:
                                             pos = positions[0]
                                             total_size = pos.get("total") or pos.get("size") or pos.get("available")
@@ -1329,7 +1400,7 @@ class LiveTrader:
                                     if position:
                                         position.metadata["stop_loss_order_id"] = sl_order_id
                                         position.metadata["stop_loss_price"] = stop_loss_price
-                                        self.position_manager.save_positions()
+                                        self.position_manager.persist_position(symbol)
                                         logger.info(
                                             f"💾 [STOP-LOSS STORED] {symbol} | "
                                             f"Order ID {sl_order_id} stored in position metadata for verification"
@@ -1367,7 +1438,7 @@ class LiveTrader:
                                     # Note: actual_leverage may not be accessible here, so re-fetch position or use fallback
                                     # Try to get actual leverage from position if available, otherwise use self.leverage
                                     try:
-                                        retry_positions = await self.rest_client.get_positions(symbol)
+                                        retry_positions = await self.get_exchange_positions(symbol)
                                         retry_actual_leverage = int(retry_positions[0].get("leverage", self.leverage)) if retry_positions and retry_positions[0].get("leverage") else self.leverage
                                     except Exception:
                                         retry_actual_leverage = self.leverage  # Fallback to requested leverage
@@ -1523,7 +1594,7 @@ class LiveTrader:
                     
                     # Get current market structure
                     state = self.state_manager.get_state(symbol)
-                    prices = np.array([p for _, p in state.price_history]) if state and state.price_history else np.array([])
+                    prices = state.history.prices() if state else np.array([])
                     exit_structure = "unknown"
                     if len(prices) >= 30:
                         from src.bitget_trading.pro_trader_indicators import ProTraderIndicators
@@ -1654,31 +1725,43 @@ class LiveTrader:
 
         return False
 
-    async def manage_positions(self) -> None:
+    async def manage_positions(self, symbols: set[str] | None = None) -> None:
         """
         Manage existing positions with TRAILING STOPS.
         
         OPTIMIZED: Sync with exchange every 5 seconds (not every 200ms!)
         Exchange-side TP/SL handles instant execution, so less frequent sync is fine.
+        
+        Args:
+            symbols: Only evaluate exits for positions in these symbols (None = all positions)
         """
-        # SYNC WITH EXCHANGE: Check what's actually open (but not EVERY iteration - too slow!)
-        # Sync every 5 seconds (100 iterations @ 50ms = 5s)
-        sync_count = getattr(self, '_sync_count', 0)
-        self._sync_count = sync_count + 1
+        # SYNC WITH EXCHANGE: Check what's actually open (but not EVERY call - too slow!)
+        # Sync every 5 seconds (time-based: the event-driven loop has no fixed iteration rate)
+        now_mono = time.monotonic()
+        last_sync = getattr(self, '_last_position_sync', 0.0)
         
-        if not self.paper_mode and sync_count % 100 == 0:
+        # With a synced private stream the mirror is always current: check every call, no REST
+        stream_synced = self._account_stream_synced()
+        if not self.paper_mode and (stream_synced or now_mono - last_sync >= 5.0):
             try:
-                endpoint = "/api/v2/mix/position/all-position"
-                params = {"productType": "USDT-FUTURES", "marginCoin": "USDT"}
-                response = await self.rest_client._request("GET", endpoint, params=params)
-                
-                exchange_open_symbols = set()
-                if response.get("code") == "00000" and "data" in response:
-                    for pos in response.get("data", []):
-                        symbol = pos.get("symbol")
-                        total = float(pos.get("total", 0))
-                        if symbol and total > 0:
-                            exchange_open_symbols.add(symbol)
+                if stream_synced:
+                    # Symbols with a resting entry order count as open until it fills or is canceled
+                    exchange_open_symbols = set(self.account_stream.positions) | {
+                        order.get("symbol") for order in self.account_stream.open_orders.values()
+                    }
+                else:
+                    self._last_position_sync = now_mono
+                    endpoint = "/api/v2/mix/position/all-position"
+                    params = {"productType": "USDT-FUTURES", "marginCoin": "USDT"}
+                    response = await self.rest_client._request("GET", endpoint, params=params)
+
+                    exchange_open_symbols = set()
+                    if response.get("code") == "00000" and "data" in response:
+                        for pos in response.get("data", []):
+                            symbol = pos.get("symbol")
+                            total = float(pos.get("total", 0))
+                            if symbol and total > 0:
+                                exchange_open_symbols.add(symbol)
                 
                 # Remove positions from tracking if not on exchange anymore
                 for symbol in list(self.position_manager.positions.keys()):
@@ -1773,15 +1856,15 @@ class LiveTrader:
         
         # 🚨 ROOT CAUSE FIX: Verify stop-loss orders are active and re-place if missing!
         # This fixes the SAPIENUSDT issue (-42% loss) - stop-loss orders can be silently cancelled!
-        # Check every 20 iterations (1 second @ 50ms interval) to verify stop-loss orders
+        # Check every second to verify stop-loss orders
         from datetime import datetime
         current_time = datetime.now()
         
-        verification_count = getattr(self, '_sl_verification_count', 0)
-        self._sl_verification_count = verification_count + 1
+        last_verification = getattr(self, '_last_sl_verification', 0.0)
         
-        # Verify stop-loss orders every 20 iterations (1 second)
-        if verification_count % 20 == 0:
+        # Verify stop-loss orders every 1 second
+        if now_mono - last_verification >= 1.0:
+            self._last_sl_verification = now_mono
             for symbol, position in list(self.position_manager.positions.items()):
                 try:
                     # Get stored stop-loss order ID from position metadata
@@ -1853,7 +1936,7 @@ class LiveTrader:
                                     # Update position metadata with new order ID
                                     position.metadata["stop_loss_order_id"] = sl_order_id_new
                                     position.metadata["stop_loss_price"] = sl_price_new
-                                    self.position_manager.save_positions()
+                                    self.position_manager.persist_position(symbol)
                                     logger.info(
                                         f"✅ [STOP-LOSS RE-PLACED] {symbol} | "
                                         f"New order ID: {sl_order_id_new} | "
@@ -1963,14 +2046,17 @@ class LiveTrader:
         
         # Now check exit conditions for remaining positions
         positions_checked = 0
-        positions_to_check = list(self.position_manager.positions.keys())
+        positions_to_check = [
+            sym for sym in self.position_manager.positions
+            if symbols is None or sym in symbols
+        ]
         
-        # Log position status every 100 checks (5 seconds @ 50ms interval)
-        check_count = getattr(self, '_position_check_count', 0)
-        self._position_check_count = check_count + 1
+        # Log position status every 5 seconds
+        last_status_log = getattr(self, '_last_position_status_log', 0.0)
         
         if positions_to_check:
-            if check_count % 100 == 0:
+            if now_mono - last_status_log >= 5.0:
+                self._last_position_status_log = now_mono
                 # Detailed status every 5 seconds
                 logger.info(f"🔍 Monitoring {len(positions_to_check)} positions for exits...")
                 for sym in positions_to_check:
@@ -2460,7 +2546,7 @@ class LiveTrader:
                 # This prevents entering longs during downtrends and shorts during uptrends
                 try:
                     # Get recent price history (last 10-15 seconds for trend confirmation)
-                    recent_prices = [p for _, p in list(state.price_history)[-15:]] if state.price_history else []
+                    recent_prices = state.history.prices(15)
                     if len(recent_prices) >= 3:
                         # Check short-term momentum (last 3 prices = ~3-5 seconds)
                         short_term_change = ((recent_prices[-1] - recent_prices[-3]) / recent_prices[-3]) * 100 if len(recent_prices) >= 3 else 0
@@ -2525,7 +2611,7 @@ class LiveTrader:
                 # 🚀 PHASE 1: PULLBACK DETECTION - Wait for retracements instead of entering at peaks!
                 # This is CRITICAL to avoid buying tops and selling bottoms
                 try:
-                    prices_for_pullback = [p for _, p in list(state.price_history)[-50:]] if state.price_history else []
+                    prices_for_pullback = state.history.prices(50)
                     if len(prices_for_pullback) >= 20:
                         prices_arr = np.array(prices_for_pullback)
                         is_pullback, pullback_pct, trend = self.indicators.detect_pullback(prices_arr, lookback=10)
@@ -2565,7 +2651,7 @@ class LiveTrader:
                 
                 # 🚀 PHASE 2: VELOCITY FILTER - Skip if price moved too fast (parabolic move)
                 try:
-                    prices_for_velocity = [p for _, p in list(state.price_history)[-10:]] if state.price_history else []
+                    prices_for_velocity = state.history.prices(10)
                     if len(prices_for_velocity) >= 6:
                         prices_arr = np.array(prices_for_velocity)
                         should_skip, velocity_pct = self.indicators.check_velocity_filter(prices_arr, window=6)
@@ -2581,7 +2667,7 @@ class LiveTrader:
                 
                 # 🚀 PHASE 3: VWAP DISTANCE CHECK - Skip if too far from VWAP (mean reversion expected)
                 try:
-                    prices_for_vwap = [p for _, p in list(state.price_history)[-20:]] if state.price_history else []
+                    prices_for_vwap = state.history.prices(20)
                     volumes_for_vwap = [state.features.get("volume", 1000) for _ in range(min(20, len(prices_for_vwap)))]
                     
                     if len(prices_for_vwap) >= 20:
@@ -2602,9 +2688,8 @@ class LiveTrader:
                 # This ensures each trade gets 10% of TOTAL capital, not just remaining available balance
                 # After first trade, available decreases but equity stays the same (includes locked margin)
                 try:
-                    balance = await self.rest_client.get_account_balance()
-                    if balance and balance.get("code") == "00000":
-                        data = balance.get("data", [{}])[0]
+                    data = await self.get_account_data()
+                    if data is not None:
                         available_balance = float(data.get("available", 0))
                         frozen = float(data.get("frozen", 0))
                         unrealized_pnl = float(data.get("unrealizedPL", 0))
@@ -2612,18 +2697,13 @@ class LiveTrader:
                         # 🚨 CRITICAL FIX: Bitget's "equity" field doesn't correctly sum all locked margin!
                         # We MUST fetch all positions and sum their marginSize to get true total equity
                         
-                        # Fetch all positions to get locked margin
-                        all_positions_endpoint = "/api/v2/mix/position/all-position"
-                        all_positions_params = {"productType": "USDT-FUTURES", "marginCoin": "USDT"}
-                        positions_response = await self.rest_client._request("GET", all_positions_endpoint, params=all_positions_params)
-                        
+                        # Sum locked margin over all positions
                         total_margin_locked = 0.0
-                        if positions_response.get("code") == "00000" and "data" in positions_response:
-                            for pos in positions_response.get("data", []):
-                                # Only count positions with actual size (filter out closed positions)
-                                if float(pos.get("total", 0)) > 0:
-                                    margin_size = float(pos.get("marginSize", 0))
-                                    total_margin_locked += margin_size
+                        for pos in await self.get_all_exchange_positions():
+                            # Only count positions with actual size (filter out closed positions)
+                            if float(pos.get("total", 0)) > 0:
+                                margin_size = float(pos.get("marginSize", 0))
+                                total_margin_locked += margin_size
                         
                         # Calculate TRUE total equity: available + locked margin + frozen + unrealized PnL
                         total_equity = available_balance + total_margin_locked + frozen + unrealized_pnl
@@ -2711,9 +2791,8 @@ class LiveTrader:
                 # 🚨 CRITICAL: Final margin check after applying multipliers!
                 # Re-check available balance to ensure we maintain minimum margin
                 try:
-                    balance = await self.rest_client.get_account_balance()
-                    if balance and balance.get("code") == "00000":
-                        data = balance.get("data", [{}])[0]
+                    data = await self.get_account_data()
+                    if data is not None:
                         available_balance = float(data.get("available", 0))
                         total_equity = float(data.get("equity", 0)) or self.equity
                         
@@ -2791,7 +2870,7 @@ class LiveTrader:
                     features = state.compute_features() if state else {}
                     
                     # Calculate technical indicators for saving
-                    prices = np.array([p for _, p in state.price_history]) if state and state.price_history else np.array([])
+                    prices = state.history.prices() if state else np.array([])
                     entry_indicators = {}
                     
                     if len(prices) >= 20:
@@ -2907,6 +2986,8 @@ class LiveTrader:
         ranked = []
         confidence_threshold = 0.65  # 65% minimum confidence for signal
         
+        # Collect candle histories first, then predict every symbol in one batch
+        histories = {}
         for symbol in symbols:
             # Check if model is available
             if not self.lightgbm_predictor.is_model_available(symbol):
@@ -2917,40 +2998,30 @@ class LiveTrader:
                 continue
             
             # Get historical candles (prefer 5m for LightGBM training)
-            candles_5m = list(state.candles_5m) if hasattr(state, 'candles_5m') else []
-            if not candles_5m or len(candles_5m) < 200:  # Need enough history for features
+            candles = state.candles_5m if hasattr(state, 'candles_5m') else []
+            if len(candles) < 200:  # Need enough history for features
                 # Try 1m candles if 5m not available
-                candles_1m = list(state.candles_1m) if hasattr(state, 'candles_1m') else []
-                if not candles_1m or len(candles_1m) < 200:
+                candles = state.candles_1m if hasattr(state, 'candles_1m') else []
+                if len(candles) < 200:
                     continue
-                candles = candles_1m
-            else:
-                candles = candles_5m
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(candles)
-            if len(df) < 200:  # Need enough history for feature calculation
-                continue
-            
-            # Ensure DataFrame has required columns
-            required_cols = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            if not all(col in df.columns for col in required_cols):
-                # Try to reconstruct from candles format
-                if len(candles) > 0 and isinstance(candles[0], dict):
-                    df = pd.DataFrame(candles)
-                else:
-                    continue
-            
-            # Make LightGBM prediction
-            direction, confidence, probability = self.lightgbm_predictor.predict(
-                symbol=symbol,
-                df=df,
-                confidence_threshold=confidence_threshold
-            )
             
+            histories[symbol] = candles
+        
+        predictions = self.lightgbm_predictor.predict_batch(
+            histories,
+            confidence_threshold=confidence_threshold
+        )
+        
+        for symbol, direction, confidence, probability in zip(
+            predictions.symbols, predictions.direction, predictions.confidence, predictions.probability
+        ):
             if direction == "neutral":
                 continue
             
+            confidence = float(confidence)
+            probability = float(probability)
+            state = self.state_manager.get_state(symbol)
+            
             # Get current price
             if not state.last_price or state.last_price <= 0:
                 continue
@@ -3058,104 +3129,82 @@ class LiveTrader:
 
     async def trading_loop(self) -> None:
         """
-        HOLD-AND-FILL trading loop (NO REBALANCING!):
-        - HYPER-FAST: Check exits every 5ms (0.005s) - TP/SL/trailing only - 10x FASTER!
-        - INSTANT ENTRY: Check for new entries every 0.1s (100ms) when slots available - PLACE TRADES IMMEDIATELY!
+        EVENT-DRIVEN HOLD-AND-FILL trading loop (NO REBALANCING!):
+        - IDLE: Sleeps until market data arrives (hub marks symbols dirty) or the cadence elapses - no busy-polling
+        - EXITS: TP/SL/trailing checked only for positions whose symbol just changed (all positions every cadence)
+        - ENTRIES: Ranking triggered by new data (at most every rank_min_interval) or the cadence when slots are free
         
         KEY: Hold winners until TP/SL hit. No churning = minimal fees!
         """
         iteration = 0
-        last_entry_check_time = datetime.now()
-        entry_check_interval_sec = 0.01  # Check for new entries every 0.01 seconds (10ms - HYPER-FAST SIGNAL RESPONSE!)
-        position_check_interval_sec = 0.005  # Check exits every 0.005 seconds (5ms - HYPER FAST! 10x faster!)
+        scheduler = self.event_scheduler
 
-        logger.info("🚀 [TRADING LOOP] Starting trading loop...")
-        logger.info(f"   Entry check interval: {entry_check_interval_sec}s")
-        logger.info(f"   Position check interval: {position_check_interval_sec}s")
+        logger.info("🚀 [TRADING LOOP] Starting event-driven trading loop...")
+        logger.info(f"   Ranking: on new data (min {scheduler.rank_min_interval_sec}s apart), cadence {scheduler.rank_max_interval_sec}s")
         logger.info(f"   Max positions: {self.max_positions}")
         logger.info(f"   Current positions: {len(self.position_manager.positions)}")
 
-        # Rate limit ticker fetching to avoid 429 errors
-        last_ticker_fetch = datetime.now()
-        ticker_fetch_interval_sec = 1.0  # Fetch tickers every 1 second (not every 5ms!)
+        # Rate limit REST ticker fallback to avoid 429 errors - UniverseManager.fetch_tickers
+        # bypasses the REST client's rate limiter, so it must be throttled here
+        last_ticker_fetch = 0.0
+        ticker_fetch_interval_sec = 1.0  # Only used while the WebSocket hub is down
+
+        # Evaluate every restored position on the first wake-up
+        scheduler.request_full_check()
 
         while self.running:
             try:
-                # ALWAYS: Update market data and check positions (FAST LOOP)
-                # But rate-limit ticker fetching to avoid 429 errors
-                time_since_ticker_fetch = (datetime.now() - last_ticker_fetch).total_seconds()
-                if time_since_ticker_fetch >= ticker_fetch_interval_sec:
+                # Sleep until new market data (or the cadence) - zero CPU while idle
+                batch = await scheduler.next_batch()
+
+                # WebSocket hub pushes ticker/book updates straight into state; REST polling
+                # (rate-limited to avoid 429 errors) is only the fallback when the hub is down
+                hub_live = self.market_data_hub is not None and self.market_data_hub.is_live(
+                    self.config.ws_max_silence_sec
+                )
+                if not hub_live and time.monotonic() - last_ticker_fetch >= ticker_fetch_interval_sec:
+                    last_ticker_fetch = time.monotonic()
                     try:
                         ticker_dict = await self.universe_manager.fetch_tickers()
-                        last_ticker_fetch = datetime.now()
-                        # Cache ticker data for next iteration
-                        self._cached_tickers = ticker_dict
                     except Exception as e:
-                        logger.warning(f"⚠️ [TICKER FETCH ERROR] {e} - Using cached data")
-                        # Use cached ticker data if fetch fails
-                        ticker_dict = getattr(self, '_cached_tickers', {})
-                        if not ticker_dict:
-                            logger.warning("⚠️ [TICKER FETCH] No cached data available, skipping this iteration")
-                            await asyncio.sleep(position_check_interval_sec)
-                            continue
-                else:
-                    # Use cached ticker data if available
-                    ticker_dict = getattr(self, '_cached_tickers', {})
-                    if not ticker_dict:
-                        # No cached data yet, wait a bit
-                        await asyncio.sleep(position_check_interval_sec)
-                        continue
-                if ticker_dict:
+                        logger.warning(f"⚠️ [TICKER FETCH ERROR] {e} - Using last known prices")
+                        ticker_dict = {}
+
                     for symbol, ticker in ticker_dict.items():
                         if symbol not in self.symbols:
                             continue
-                        
+
+                        # Order books keep their last streamed state (no synthetic depth)
                         self.state_manager.update_ticker(symbol, ticker)
-                        
-                        # Simulate order book
-                        mid = ticker.get("last_price", 0)
-                        if mid > 0:
-                            spread = mid * 0.0005  # 5 bps estimate
-                            self.state_manager.update_orderbook(symbol, {
-                                "bids": [[mid - spread/2, 1000], [mid - spread, 500]],
-                                "asks": [[mid + spread/2, 1000], [mid + spread, 500]],
-                            })
-
-                # ALWAYS: Manage existing positions (stop-loss, take-profit, trailing)
-                await self.manage_positions()
-
-                # ALWAYS: Update equity with latest prices
+                        batch.symbols.add(symbol)
+
+                # Manage existing positions (stop-loss, take-profit, trailing) - only changed symbols
+                await self.manage_positions(None if batch.full_check else batch.symbols)
+
+                # Update equity with latest prices
                 total_unrealized_pnl = self.position_manager.get_total_unrealized_pnl()
                 self.equity = self.initial_equity + total_unrealized_pnl
                 pnl_pct = ((self.equity - self.initial_equity) / self.initial_equity) * 100
 
                 # Daily loss limit check removed - let positions use full SL (25%)
 
-                # 🚀 HYPER-FAST ENTRY: Check for new entries IMMEDIATELY when slots available (NO WAITING!)
-                # This ensures we place trades as soon as signals come in
                 available_slots = self.max_positions - len(self.position_manager.positions)
-                time_since_entry_check = (datetime.now() - last_entry_check_time).total_seconds()
-                should_check_entries = time_since_entry_check >= entry_check_interval_sec  # Still track for logging
-
-                # Debug logging every 200 iterations (1 second) to show bot is active
-                loop_count = getattr(self, '_loop_count', 0)
-                self._loop_count = loop_count + 1
-                if loop_count % 200 == 0:  # Every 1 second (200 * 0.005s = 1s)
-                    logger.info(  # Changed to info so it shows up
-                        f"💓 [HEARTBEAT] Loop iteration {loop_count} | "
-                        f"Available slots: {available_slots} | "
-                        f"Time since entry check: {time_since_entry_check:.1f}s | "
-                        f"Should check: {should_check_entries} | "
+
+                # Heartbeat once per cadence to show bot is active
+                if batch.full_check:
+                    latency = scheduler.get_latency_stats()
+                    logger.info(
+                        f"💓 [HEARTBEAT] Available slots: {available_slots} | "
                         f"Positions: {len(self.position_manager.positions)}/{self.max_positions} | "
-                        f"Equity: ${self.equity:.2f} ({pnl_pct:+.2f}%)"
+                        f"Equity: ${self.equity:.2f} ({pnl_pct:+.2f}%) | "
+                        f"Events: {scheduler.events_received} ({scheduler.events_coalesced} coalesced) | "
+                        f"Tick->decision p50/p99: {latency['p50_ms']:.1f}/{latency['p99_ms']:.1f}ms"
                     )
 
-                # 🚀 HYPER-FAST ENTRY: Check immediately when slots available (don't wait for interval)
-                # Always check if slots available (remove interval wait for maximum speed)
-                if available_slots > 0:
+                # 🚀 ENTRY: Rank on fresh data when slots are available
+                if available_slots > 0 and batch.rank_due:
                     iteration += 1
-                    last_entry_check_time = datetime.now()
-                    
+
                     logger.info(f"\n{'='*70}")
                     logger.info(f"[ENTRY CHECK #{iteration}] Looking for {available_slots} new positions")
                     logger.info(f"[PROGRESS] Ranking {len(self.symbols)} symbols...")
@@ -3213,27 +3262,8 @@ class LiveTrader:
                         f"Total Trades: {len(self.trades)} | Unrealized PnL: ${total_unrealized_pnl:.2f}"
                     )
                     logger.info(f"{'='*70}\n")
-                else:
-                    # Just log quick status - every 20th check (100ms @ 5ms interval = 1 second)
-                    check_count = getattr(self, '_check_count', 0)
-                    self._check_count = check_count + 1
-                    
-                    if check_count % 200 == 0:  # Every 1 second (200 * 5ms)
-                        if len(self.position_manager.positions) > 0:
-                            logger.info(
-                                f"[Monitor] Equity: ${self.equity:.2f} ({pnl_pct:+.2f}%) | "
-                                f"Positions: {len(self.position_manager.positions)}/{self.max_positions} | "
-                                f"Next entry check: {entry_check_interval_sec - time_since_entry_check:.0f}s"
-                            )
-                        else:
-                            # No positions - show time until next search
-                            logger.info(
-                                f"[Waiting] No positions | Equity: ${self.equity:.2f} ({pnl_pct:+.2f}%) | "
-                                f"Next entry search: {entry_check_interval_sec - time_since_entry_check:.0f}s"
-                            )
 
-                # Wait before next position check
-                await asyncio.sleep(position_check_interval_sec)
+                scheduler.record_decision(batch)
 
             except KeyboardInterrupt:
                 logger.info("⚠️  Keyboard interrupt - shutting down gracefully...")
@@ -3246,6 +3276,74 @@ class LiveTrader:
                 logger.error(traceback.format_exc())
                 await asyncio.sleep(5)
 
+    async def _backfill_snapshot_gap(self, restored_since: dict[str, float], snapshot_time: float) -> set[str]:
+        """
+        Bring snapshot-restored symbols up to date with one 1m candle request each.
+
+        1m candles covering the gap (plus the 15m bucket the snapshot was taken
+        in) are spliced into the candle buffers, which re-aggregates 5m/15m,
+        and their closes are appended to the price history.
+
+        Returns:
+            Symbols that could not be back-filled (need a full history download)
+        """
+        gap_sec = time.time() - snapshot_time
+        limit = int(gap_sec // 60) + 17
+        if limit > 200:
+            # Gap longer than one page of 1m candles
+            return set(restored_since)
+
+        logger.info(f"⚡ [WARM START] Back-filling {gap_sec:.0f}s gap for {len(restored_since)} symbols...")
+
+        async def backfill(symbol: str) -> bool:
+            try:
+                response = await self.rest_client.get_historical_candles(
+                    symbol, "1m", limit, priority=PRIORITY_NORMAL
+                )
+                if not isinstance(response, dict) or response.get("code") != "00000":
+                    return False
+                candles = [
+                    {
+                        "timestamp": int(candle[0]),
+                        "open": float(candle[1]),
+                        "high": float(candle[2]),
+                        "low": float(candle[3]),
+                        "close": float(candle[4]),
+                        "volume": float(candle[5]) if len(candle) > 5 else 0.0,
+                    }
+                    for candle in reversed(response.get("data") or [])
+                ]
+                if not candles:
+                    return False
+                since = restored_since[symbol]
+                for candle in candles:
+                    if candle["timestamp"] / 1000 > since:
+                        self.state_manager.add_price_point(symbol, candle["close"], candle["timestamp"], candle["volume"])
+                self.state_manager.get_state(symbol).backfill_candles(candles)
+                return True
+            except Exception as e:
+                logger.warning(f"⚠️  Could not back-fill {symbol}: {e}")
+                return False
+
+        results = await asyncio.gather(*(backfill(symbol) for symbol in restored_since))
+        failed = {symbol for symbol, ok in zip(restored_since, results) if not ok}
+        logger.info(
+            f"✅ [WARM START] {len(restored_since) - len(failed)} symbols back-filled, "
+            f"{len(failed)} need a full history download"
+        )
+        return failed
+
+    async def _state_snapshot_loop(self) -> None:
+        """Write a state snapshot every STATE_SNAPSHOT_INTERVAL_SEC."""
+        while self.running:
+            await asyncio.sleep(self.config.state_snapshot_interval_sec)
+            try:
+                # Copy on the loop (consistent state), write to disk off the loop
+                snapshot = self.state_snapshots.capture(self.state_manager)
+                await asyncio.to_thread(self.state_snapshots.write, snapshot)
+            except Exception as e:
+                logger.error(f"❌ [STATE SNAPSHOT] Failed to save: {e}")
+
     async def run(self) -> None:
         """Run the live trader."""
         logger.info("=" * 70)
@@ -3301,6 +3399,12 @@ class LiveTrader:
         logger.info(f"✅ Cancelled {tpsl_cancelled} TP/SL orders + {pending_cancelled} pending orders")
         logger.info("✅ Exchange-side TP/SL ENABLED (STOP-MARKET). Bot-side 5ms checks as backup.")
 
+        # Contract specs: served from the on-disk snapshot, refreshed in the background
+        await self.rest_client.contract_catalog.ensure_loaded()
+        asyncio.create_task(self.rest_client.contract_catalog.run_refresh_loop())
+        # Position snapshots are written off the hot path
+        self.position_persister = asyncio.create_task(self.position_manager.run_persister())
+
         # Discover universe
         logger.info("🔍 Discovering tradable symbols...")
         all_symbols = await self.universe_manager.get_tradeable_universe()
@@ -3317,94 +3421,30 @@ class LiveTrader:
             logger.info(f"✅ Using ALL {len(self.symbols)} symbols (maximum opportunities!)")
         
         # 🚨 CRITICAL: Set leverage to 25x for ALL symbols at startup (300+ tokens!)
-        # ✨ BUT use cache to avoid redundant API calls (leverage persists on Bitget!)
+        # ✨ Only the pairs not already known to be set (cache, open positions, max leverage
+        # from the contract catalog) are sent, concurrently and in the background:
+        # symbols that are already configured can trade immediately
         logger.info(f"🔧 [STARTUP] Checking leverage for {len(self.symbols)} symbols (using cache)...")
-        leverage_set_count = 0
-        leverage_cached_count = 0
-        leverage_failed_count = 0
         try:
-            # Set leverage for ALL symbols (not just top 50!) - but use cache to skip already-set ones
-            for i, symbol in enumerate(self.symbols, 1):
-                for hold_side in ["long", "short"]:
-                    try:
-                        # Check cache first - if already set, skip API call!
-                        if self.leverage_cache.is_set(symbol, self.leverage, hold_side):
-                            leverage_cached_count += 1
-                            if i <= 5:  # Log first 5 cached ones
-                                logger.debug(f"💾 [CACHE HIT] {symbol} {hold_side}: {self.leverage}x already set")
-                            continue
-                        
-                        # Not in cache or expired - set leverage via API
-                        response = await self.rest_client.set_leverage(
-                            symbol=symbol,
-                            leverage=self.leverage,
-                            hold_side=hold_side,
-                        )
-                        if response.get("code") == "00000":
-                            leverage_set_count += 1
-                            # Update cache with success
-                            self.leverage_cache.mark_set(symbol, self.leverage, hold_side)
-                            if i <= 10 or i % 50 == 0:  # Log first 10 and every 50th
-                                logger.info(f"✅ [STARTUP] {symbol} {hold_side}: {self.leverage}x ({i}/{len(self.symbols)})")
-                        else:
-                            leverage_failed_count += 1
-                            error_code = response.get('code', 'unknown')
-                            error_msg = response.get('msg', 'Unknown')
-                            
-                            # 🚨 CRITICAL: Mark as failed in cache to prevent retrying!
-                            # Check if it's a "not supported" error (e.g., 40797 = max leverage exceeded)
-                            if error_code in ["40797", "40798"] or "maximum settable leverage" in error_msg.lower() or "not supported" in error_msg.lower():
-                                self.leverage_cache.mark_failed(symbol, self.leverage, hold_side, error_code)
-                                if i <= 10:  # Log failures for first 10
-                                    logger.warning(
-                                        f"🚫 [STARTUP] {symbol} {hold_side}: Leverage {self.leverage}x not supported by Bitget | "
-                                        f"Code: {error_code} | Cached to skip future attempts"
-                                    )
-                            else:
-                                # Other error - don't cache as failed (might be temporary)
-                                if i <= 10:  # Log failures for first 10
-                                    logger.warning(
-                                        f"⚠️ [STARTUP] {symbol} {hold_side}: Failed to set {self.leverage}x | "
-                                        f"Code: {error_code} | Msg: {error_msg}"
-                                    )
-                    except Exception as e:
-                        leverage_failed_count += 1
-                        error_str = str(e)
-                        error_repr = repr(e)
-                        # 🚨 CRITICAL: Check if it's a "not supported" error in the exception message
-                        is_not_supported = (
-                            "40797" in error_str or "40798" in error_str or
-                            "40797" in error_repr or "40798" in error_repr or
-                            "maximum settable leverage" in error_str.lower() or
-                            "exceeded the maximum" in error_str.lower() or
-                            "maximum settable leverage" in error_repr.lower() or
-                            "exceeded the maximum" in error_repr.lower()
-                        )
-                        
-                        if is_not_supported:
-                            # Cache as failed to prevent retrying
-                            self.leverage_cache.mark_failed(symbol, self.leverage, hold_side, "40797")
-                            if i <= 10:  # Log failures for first 10
-                                logger.warning(
-                                    f"🚫 [STARTUP] {symbol} {hold_side}: Leverage {self.leverage}x not supported (from exception) | "
-                                    f"Cached to skip future attempts"
-                                )
-                        else:
-                            # Don't cache exceptions as failures (might be network issues)
-                            if i <= 10:  # Log errors for first 10
-                                logger.warning(f"⚠️ [STARTUP] {symbol} {hold_side}: Error setting leverage: {e}")
-            
-            # Save cache to disk
-            self.leverage_cache.save()
-            
-            logger.info(
-                f"✅ [STARTUP] Leverage check complete: {leverage_set_count} set via API, "
-                f"{leverage_cached_count} from cache, {leverage_failed_count} failed "
-                f"(out of {len(self.symbols) * 2} total)"
-            )
+            await self.leverage_bootstrap.start(self.symbols)
         except Exception as e:
             logger.error(f"❌ [STARTUP] Failed to set leverage at startup: {e}")
 
+        # ⚡ WARM START: restore per-symbol state from the last snapshot (before live ticks arrive)
+        snapshot_time: float | None = None
+        restored_since: dict[str, float] = {}
+        if self.state_snapshots is not None:
+            snapshot_time = self.state_snapshots.load(
+                self.state_manager,
+                max_age_sec=self.config.state_snapshot_max_age_sec,
+                symbols=self.symbols,
+            )
+            if snapshot_time is not None:
+                for symbol in self.symbols:
+                    state = self.state_manager.get_state(symbol)
+                    if state is not None:
+                        restored_since[symbol] = state.history.last_timestamp or snapshot_time
+
         # Initialize state with current market data
         logger.info("📊 Fetching initial market data...")
         ticker_dict = await self.universe_manager.fetch_tickers()
@@ -3416,26 +3456,26 @@ class LiveTrader:
             self.state_manager.add_symbol(symbol)
             
             self.state_manager.update_ticker(symbol, ticker)
-            
-            # Simulate order book (same as paper trading)
-            mid = ticker.get("last_price", 0)
-            if mid > 0:
-                spread = mid * 0.0005  # 5 bps estimate
-                self.state_manager.update_orderbook(symbol, {
-                    "bids": [[mid - spread/2, 1000], [mid - spread, 500]],
-                    "asks": [[mid + spread/2, 1000], [mid + spread, 500]],
-                })
         
+        # Restored symbols only need the gap since the snapshot
+        cold_symbols = self.symbols
+        if restored_since:
+            failed = await self._backfill_snapshot_gap(restored_since, snapshot_time)
+            cold_symbols = [s for s in self.symbols if s not in restored_since or s in failed]
+
         # 🚀 INSTANT DATA LOADING using Bitget's historical candles API!
         # Fetch MULTIPLE TIMEFRAMES for better multi-timeframe analysis
         logger.info("⚡ INSTANT DATA LOADING - Fetching MULTIPLE timeframes from Bitget API...")
         logger.info(f"   🎯 Loading 1m, 5m, 15m candles per symbol (MORE DATA!)")
-        logger.info(f"   💪 Processing %d symbols in parallel...", len(self.symbols))
+        logger.info(f"   💪 Processing %d symbols in parallel...", len(cold_symbols))
 
         # Fetch historical candles for all symbols in parallel
         async def fetch_and_store(symbol: str, timeframe: str):
             try:
-                response = await self.rest_client.get_historical_candles(symbol, timeframe, 200)
+                # Startup warm-up: don't queue behind bulk history downloads
+                response = await self.rest_client.get_historical_candles(
+                    symbol, timeframe, 200, priority=PRIORITY_NORMAL
+                )
                 if not isinstance(response, dict) or response.get("code") != "00000":
                     logger.warning(
                         f"⚠️  History fetch failed for {symbol} ({timeframe}): "
@@ -3470,14 +3510,14 @@ class LiveTrader:
                 logger.warning(f"⚠️  Could not fetch history for {symbol} ({timeframe}): {e}")
 
         batch_size = 10  # Process 10 symbols concurrently for faster loading
-        total_batches = (len(self.symbols) + batch_size - 1) // batch_size
+        total_batches = (len(cold_symbols) + batch_size - 1) // batch_size
         timeframes = ["1m", "5m", "15m"]
         
-        total_symbols = len(self.symbols)
+        total_symbols = len(cold_symbols)
         completed_symbols = 0
 
-        for i in range(0, len(self.symbols), batch_size):
-            batch_symbols = self.symbols[i : i + batch_size]
+        for i in range(0, len(cold_symbols), batch_size):
+            batch_symbols = cold_symbols[i : i + batch_size]
             logger.info(
                 f"   🚚 Starting batch {(i // batch_size) + 1}/{total_batches}: "
                 f"{len(batch_symbols)} symbols"
@@ -3509,6 +3549,31 @@ class LiveTrader:
             )
             
         logger.info("✅ All historical data loaded successfully!")
+
+        if self.state_snapshots is not None:
+            asyncio.create_task(self._state_snapshot_loop())
+
+        # 📡 Stream live tickers/books over shared WebSocket connections (replaces 1s REST polling)
+        if self.config.ws_market_data_enabled and self.symbols:
+            self.market_data_hub = MarketDataHub(
+                state_manager=self.state_manager,
+                symbols=self.symbols,
+                channels=("ticker", self.config.ws_book_channel),
+                max_channels_per_connection=self.config.ws_max_channels_per_connection,
+                book_levels=self.config.order_book_max_levels,
+            )
+            self.market_data_hub.on_update = self.event_scheduler.mark_dirty
+            await self.market_data_hub.start()
+            logger.info(
+                f"📡 [MARKET DATA] Streaming {len(self.symbols)} symbols over "
+                f"{len(self.market_data_hub.shards)} WebSocket connections"
+            )
+
+        # 🔐 Orders/positions/plan orders/account over the private stream (replaces REST polling)
+        if not self.paper_mode and self.config.ws_private_enabled:
+            self.account_stream = AccountStream(self.rest_client)
+            await self.account_stream.start()
+            logger.info("🔐 [ACCOUNT STREAM] Mirroring orders, positions and account over the private WebSocket")
         
         # 🚀 NEW: Start backtesting service (if enabled)
         if self.backtest_service and self.backtest_service.scheduler:
@@ -3527,6 +3592,15 @@ class LiveTrader:
 
         # Cleanup
         logger.info("\n🛑 Shutting down...")
+        if self.market_data_hub:
+            await self.market_data_hub.stop()
+        if self.account_stream:
+            await self.account_stream.stop()
+        if self.state_snapshots is not None:
+            try:
+                self.state_snapshots.save(self.state_manager)
+            except Exception as e:
+                logger.error(f"❌ [STATE SNAPSHOT] Failed to save on shutdown: {e}")
 
         # Final report
         logger.info("\n" + "=" * 70)
@@ -3541,8 +3615,14 @@ class LiveTrader:
         logger.info(f"Final Positions: {len(self.position_manager.positions)}")
         logger.info("=" * 70)
         
-        # Save final positions
-        self.position_manager.save_positions()
+        # Save final positions (stopping the persister flushes them) and queued trade records
+        if self.position_persister is not None:
+            self.position_persister.cancel()
+            await asyncio.gather(self.position_persister, return_exceptions=True)
+            self.position_persister = None
+        else:
+            self.position_manager.save_positions()
+        self.loss_tracker.close()
 
 
 
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Replay historical market data through the unmodified LiveTrader (paper mode).
+
+Usage:
+    python replay_live_trader.py --symbols BTCUSDT ETHUSDT --start 2025-06-01 --hours 24
+    python replay_live_trader.py --source ticks --start 2025-06-01 --hours 1 --speed 60
+
+The trader's state manager, ranking (LightGBM / Holy Grail / EnhancedRanker),
+``manage_positions`` and ``execute_trades`` run as in production; only the
+edges are swapped: market data comes from a ``MarketReplay`` (cached 1m
+candles or a ``TickRecorder`` archive) instead of the WebSocket hub, REST
+calls go to an in-process ``ReplayExchange``, and ``time``/``datetime`` in
+the trading modules follow the replay clock. Without ``--speed`` the replay
+runs as fast as the trading loop keeps up.
+
+Candles are loaded once at warm-up (as live startup does) and not refreshed.
+Paper closes book nothing in the trader, so realized PnL is computed here
+from the close price and size, net of taker fees on both legs.
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+
+import live_trade
+from live_trade import LiveTrader
+from src.bitget_trading import event_scheduler, loss_tracker, multi_symbol_state, position_manager
+from src.bitget_trading.candle_store import open_candle_store
+from src.bitget_trading.config import get_config
+from src.bitget_trading.loss_tracker import LossTracker
+from src.bitget_trading.market_replay import MarketReplay, ReplayClock, ReplayExchange, candle_events, tick_events
+from src.bitget_trading.position_manager import PositionManager
+from src.bitget_trading.rate_limiter import PRIORITY_NORMAL
+
+# Modules whose time.time()/time.monotonic()/datetime.now() follow the replay clock
+CLOCKED_MODULES = (live_trade, event_scheduler, position_manager, multi_symbol_state, loss_tracker)
+WARMUP_TIMEFRAMES = ("1m", "5m", "15m")
+RANKERS = ("lightgbm", "holy_grail", "enhanced")
+
+
+@dataclass
+class ReplayReport:
+    symbols: int
+    replayed_seconds: float
+    wall_seconds: float
+    events: int
+    decisions: int
+    trades: list[dict[str, Any]] = field(default_factory=list)
+    realized_pnl: float = 0.0
+    fees: float = 0.0
+    unrealized_pnl: float = 0.0
+    equity: float = 0.0
+    latencies_ms: list[float] = field(default_factory=list)
+
+    @property
+    def speedup(self) -> float:
+        return self.replayed_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        return sum(t["net_pnl"] > 0 for t in self.trades) / len(self.trades) if self.trades else 0.0
+
+    def latency(self, percentile: float) -> float:
+        return float(np.percentile(self.latencies_ms, percentile)) if self.latencies_ms else 0.0
+
+    def print_summary(self) -> None:
+        print("=" * 80)
+        print("REPLAY REPORT")
+        print("=" * 80)
+        print(f"Symbols:            {self.symbols}")
+        print(f"Replayed:           {self.replayed_seconds / 3600:.2f}h in {self.wall_seconds:.1f}s ({self.speedup:,.0f}x real time)")
+        print(f"Events / decisions: {self.events:,} / {self.decisions:,}")
+        print(f"Trades:             {len(self.trades)} (win rate {self.win_rate:.1%})")
+        print(f"Realized PnL:       ${self.realized_pnl:+.2f} (fees ${self.fees:.2f})")
+        print(f"Unrealized PnL:     ${self.unrealized_pnl:+.2f}")
+        print(f"Final equity:       ${self.equity:.2f}")
+        print(
+            f"Tick->decision:     p50 {self.latency(50):.2f}ms | p99 {self.latency(99):.2f}ms | "
+            f"max {max(self.latencies_ms, default=0.0):.2f}ms (wall clock)"
+        )
+        print("=" * 80)
+
+    def write_trades(self, path: str) -> None:
+        if not self.trades:
+            return
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(self.trades[0]))
+            writer.writeheader()
+            writer.writerows(self.trades)
+
+
+async def warm_up(trader: LiveTrader, symbols: list[str]) -> None:
+    """Load startup candles through the exchange the way ``LiveTrader.run`` does."""
+    for symbol in symbols:
+        trader.state_manager.add_symbol(symbol)
+        state = trader.state_manager.get_state(symbol)
+        for timeframe in WARMUP_TIMEFRAMES:
+            response = await trader.rest_client.get_historical_candles(symbol, timeframe, 200, priority=PRIORITY_NORMAL)
+            for candle in reversed(response.get("data") or []):
+                timestamp, price, volume = int(candle[0]), float(candle[4]), float(candle[5])
+                trader.state_manager.add_price_point(symbol, price, timestamp, volume)
+                state.add_candle(timeframe, {
+                    "timestamp": timestamp,
+                    "open": float(candle[1]),
+                    "high": float(candle[2]),
+                    "low": float(candle[3]),
+                    "close": price,
+                    "volume": volume,
+                })
+
+
+async def replay_live_trader(
+    symbols: list[str],
+    start_ms: int,
+    end_ms: int,
+    source: str = "candles",
+    data_dir: str = "backtest_data",
+    tick_dir: str = "data/ticks",
+    speed: float | None = None,
+    step_ms: int = 1000,
+    ranker: str = "lightgbm",
+    initial_capital: float = 50.0,
+    work_dir: str | None = None,
+) -> ReplayReport:
+    """
+    Run ``LiveTrader.trading_loop`` over a historical window.
+
+    Args:
+        symbols: Symbols to replay and trade
+        start_ms, end_ms: Replay window (ms)
+        source: "candles" (1m candle store) or "ticks" (TickRecorder archive)
+        data_dir: Candle store directory (also serves warm-up candles)
+        tick_dir: Tick archive directory
+        speed: Replay seconds per wall second (None = as fast as possible)
+        step_ms: Replay time between trading loop wake-ups
+        ranker: "lightgbm", "holy_grail" or "enhanced" (EnhancedRanker only)
+        initial_capital: Paper account balance
+        work_dir: Directory for the replay's positions/trade journal (default: temp dir)
+    """
+    work_dir = work_dir or tempfile.mkdtemp(prefix="replay_")
+    store = open_candle_store(data_dir)
+    clock = ReplayClock(start_ms)
+    fee_rate = get_config().taker_fee
+
+    with clock.install(*CLOCKED_MODULES):
+        trader = LiveTrader("replay", "replay", "replay", initial_capital=initial_capital, paper_mode=True)
+        trader.position_manager = PositionManager(save_path=os.path.join(work_dir, "positions.json"))
+        trader.loss_tracker.close()
+        trader.loss_tracker = LossTracker(log_file=os.path.join(work_dir, "trades_detailed.jsonl"))
+        trader.state_snapshots = None
+        trader.backtest_service = None
+        if ranker != "lightgbm":
+            trader.use_lightgbm = False
+        if ranker == "enhanced":
+            trader.use_holy_grail = False
+        trader.symbols = list(symbols)
+        scheduler = trader.event_scheduler
+
+        if source == "ticks":
+            events = tick_events(tick_dir, symbols, start_ms, end_ms)
+        else:
+            events = candle_events(store, symbols, start_ms, end_ms)
+        replay = MarketReplay(trader.state_manager, events, clock, scheduler=scheduler, speed=speed, step_ms=step_ms)
+        exchange = ReplayExchange(replay, store, trader.position_manager, initial_balance=initial_capital)
+        trader.rest_client = exchange
+        trader.market_data_hub = replay
+        replay.on_update = scheduler.mark_dirty
+
+        await warm_up(trader, symbols)
+
+        # Realized PnL per close (paper closes only drop the position)
+        trades: list[dict[str, Any]] = []
+        paper_close = trader.close_position
+
+        async def close_position(symbol: str, exit_reason: str = "MANUAL") -> bool:
+            position = trader.position_manager.get_position(symbol)
+            closed = await paper_close(symbol, exit_reason)
+            if closed and position is not None:
+                state = trader.state_manager.get_state(symbol)
+                exit_price = state.last_price if state and state.last_price > 0 else position.entry_price
+                direction = 1 if position.side == "long" else -1
+                gross = (exit_price - position.entry_price) * position.size * direction
+                fees = (position.entry_price + exit_price) * position.size * fee_rate
+                exchange.settle(gross - fees)
+                trades.append({
+                    "symbol": symbol,
+                    "side": position.side,
+                    "entry_time": position.entry_time,
+                    "exit_time": datetime.fromtimestamp(clock.time(), timezone.utc).isoformat(),
+                    "entry_price": position.entry_price,
+                    "exit_price": exit_price,
+                    "size": position.size,
+                    "gross_pnl": gross,
+                    "fees": fees,
+                    "net_pnl": gross - fees,
+                    "exit_reason": exit_reason,
+                })
+            return closed
+
+        trader.close_position = close_position
+
+        # Wall-clock tick->decision latency (the scheduler's own stats run on replay time)
+        latencies_ms: list[float] = []
+        decisions = 0
+        batch_delivered: list[float] = []
+        next_batch, record_decision = scheduler.next_batch, scheduler.record_decision
+
+        async def timed_next_batch():
+            batch = await next_batch()
+            delivered = [replay.delivered_at.pop(s) for s in batch.symbols if s in replay.delivered_at]
+            batch_delivered[:] = [min(delivered)] if delivered else []
+            return batch
+
+        def timed_record_decision(batch) -> None:
+            nonlocal decisions
+            record_decision(batch)
+            decisions += 1
+            if batch_delivered:
+                latencies_ms.append((time.perf_counter() - batch_delivered[0]) * 1000)
+
+        scheduler.next_batch = timed_next_batch
+        scheduler.record_decision = timed_record_decision
+
+        loop_task = asyncio.create_task(trader.trading_loop())
+        try:
+            await replay.run()
+        finally:
+            trader.running = False
+            loop_task.cancel()
+            try:
+                await loop_task
+            except asyncio.CancelledError:
+                pass
+            trader.loss_tracker.close()
+
+        unrealized = 0.0
+        for symbol, position in trader.position_manager.positions.items():
+            state = trader.state_manager.get_state(symbol)
+            if state and state.last_price > 0:
+                direction = 1 if position.side == "long" else -1
+                unrealized += (state.last_price - position.entry_price) * position.size * direction
+
+    return ReplayReport(
+        symbols=len(symbols),
+        replayed_seconds=replay.replayed_seconds,
+        wall_seconds=replay.wall_seconds,
+        events=replay.events_applied,
+        decisions=decisions,
+        trades=trades,
+        realized_pnl=sum(t["net_pnl"] for t in trades),
+        fees=sum(t["fees"] for t in trades),
+        unrealized_pnl=unrealized,
+        equity=exchange.balance + unrealized,
+        latencies_ms=latencies_ms,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay historical data through LiveTrader (paper mode)")
+    parser.add_argument("--symbols", nargs="+", help="Symbols (default: every symbol with 1m candles)")
+    parser.add_argument("--start", required=True, help="Start date/time (ISO, UTC)")
+    parser.add_argument("--hours", type=float, default=24.0, help="Replay window length")
+    parser.add_argument("--source", choices=("candles", "ticks"), default="candles")
+    parser.add_argument("--data-dir", default="backtest_data", help="Candle store directory")
+    parser.add_argument("--tick-dir", default="data/ticks", help="Tick archive directory")
+    parser.add_argument("--speed", type=float, default=None, help="Replay seconds per wall second (default: max)")
+    parser.add_argument("--step-ms", type=int, default=1000, help="Replay time between loop wake-ups")
+    parser.add_argument("--ranker", choices=RANKERS, default="lightgbm")
+    parser.add_argument("--capital", type=float, default=50.0, help="Initial paper balance")
+    parser.add_argument("--trades-csv", default="replay_trades.csv", help="Where to write closed trades")
+    args = parser.parse_args()
+
+    start = datetime.fromisoformat(args.start)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    start_ms = int(start.timestamp() * 1000)
+    end_ms = start_ms + int(args.hours * 3_600_000) - 1
+    symbols = args.symbols or open_candle_store(args.data_dir).symbols("1m")
+    if not symbols:
+        print(f"No 1m candles in {args.data_dir} - nothing to replay")
+        sys.exit(1)
+
+    print("=" * 80)
+    print(f"REPLAY: {len(symbols)} symbols | {start.isoformat()} + {args.hours:g}h | source={args.source} | "
+          f"ranker={args.ranker} | speed={'max' if args.speed is None else f'{args.speed:g}x'}")
+    print("=" * 80)
+
+    report = asyncio.run(replay_live_trader(
+        symbols, start_ms, end_ms,
+        source=args.source,
+        data_dir=args.data_dir,
+        tick_dir=args.tick_dir,
+        speed=args.speed,
+        step_ms=args.step_ms,
+        ranker=args.ranker,
+        initial_capital=args.capital,
+    ))
+    report.print_summary()
+    report.write_trades(args.trades_csv)
+    if report.trades:
+        print(f"Trades written to {args.trades_csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""Private Bitget WebSocket stream mirroring orders, positions, plan orders and account."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+import orjson
+import websockets
+
+from src.bitget_trading.bitget_rest import BitgetRestClient
+from src.bitget_trading.logger import get_logger
+
+logger = get_logger()
+
+PRIVATE_CHANNELS = ("account", "positions", "orders", "orders-algo")
+TERMINAL_ORDER_STATUSES = ("filled", "canceled", "cancelled")
+
+
+class AccountStream:
+    """
+    Local mirror of the account, kept current by Bitget's private channels.
+
+    One authenticated connection (login signed with
+    ``BitgetRestClient._sign_request``) subscribes to ``account``,
+    ``positions``, ``orders`` and ``orders-algo``. Pushes are folded into
+    dicts keyed by symbol / order id, so position, order and balance lookups
+    are O(1) and cost no REST budget. Position entries keep the REST
+    ``all-position`` field names (plus ``symbol``) so callers can use either
+    source.
+
+    The mirror is only authoritative while ``synced``: connected, logged in
+    and holding account and position snapshots. After a reconnect the
+    subscribe snapshots rebuild it; callers fall back to REST meanwhile.
+    """
+
+    WS_URL = "wss://ws.bitget.com/v2/ws/private"
+    PING_INTERVAL = 20  # seconds
+    RECV_TIMEOUT = 30.0  # seconds without any frame before forcing a reconnect
+    LOGIN_TIMEOUT = 10.0  # seconds
+    RECONNECT_BASE_DELAY = 1.0  # seconds
+    RECONNECT_MAX_DELAY = 30.0  # seconds
+    MAX_FINISHED_ORDERS = 1000  # filled/canceled orders kept for lookups
+
+    def __init__(
+        self,
+        rest_client: BitgetRestClient,
+        product_type: str = "USDT-FUTURES",
+        margin_coin: str = "USDT",
+    ) -> None:
+        """
+        Initialize account stream.
+
+        Args:
+            rest_client: Client whose credentials and request signing are used for login
+            product_type: Product type (default: "USDT-FUTURES")
+            margin_coin: Account whose balance is mirrored
+        """
+        self.rest_client = rest_client
+        self.product_type = product_type
+        self.margin_coin = margin_coin
+
+        self.should_run: bool = False
+        self.connected: bool = False
+        self._task: asyncio.Task[None] | None = None
+        self._snapshots: set[str] = set()  # channels with a push since the last (re)connect
+        self._updated = asyncio.Event()  # replaced after every push; wakes waiters
+
+        # Mirror
+        self.account: dict[str, Any] = {}
+        self.positions: dict[str, dict[str, Any]] = {}  # symbol -> position (REST field names)
+        self.open_orders: dict[str, dict[str, Any]] = {}  # orderId -> live order
+        self.finished_orders: OrderedDict[str, dict[str, Any]] = OrderedDict()  # orderId -> filled/canceled order
+        self.plan_orders: dict[str, dict[str, Any]] = {}  # orderId -> live plan order
+
+        # Callbacks (channel, entries) fired after the mirror is updated
+        self.on_update: Callable[[str, list[dict[str, Any]]], None] | None = None
+
+        # Stats
+        self.messages_received: int = 0
+        self.reconnects: int = 0
+        self.last_message_time: float = 0.0
+
+    # ---------------------------------------------------------------- queries
+
+    @property
+    def synced(self) -> bool:
+        """True while the mirror reflects the exchange (connected with account and position snapshots)."""
+        return self.connected and {"account", "positions"} <= self._snapshots
+
+    def get_position(self, symbol: str) -> dict[str, Any] | None:
+        return self.positions.get(symbol)
+
+    def get_positions(self, symbol: str) -> list[dict[str, Any]]:
+        """Positions of a symbol in ``BitgetRestClient.get_positions`` form."""
+        position = self.positions.get(symbol)
+        return [position] if position is not None else []
+
+    def get_all_positions(self) -> list[dict[str, Any]]:
+        return list(self.positions.values())
+
+    def get_order(self, order_id: str) -> dict[str, Any] | None:
+        return self.open_orders.get(order_id) or self.finished_orders.get(order_id)
+
+    def get_plan_orders(self, symbol: str, plan_types: tuple[str, ...] | None = None) -> list[dict[str, Any]]:
+        """Live plan orders (TP/SL, trailing) of a symbol, optionally of some plan types only."""
+        return [
+            order for order in self.plan_orders.values()
+            if order.get("symbol") == symbol and (plan_types is None or order.get("planType") in plan_types)
+        ]
+
+    @property
+    def available(self) -> float:
+        return float(self.account.get("available", 0))
+
+    @property
+    def equity(self) -> float:
+        return float(self.account.get("equity") or self.account.get("usdtEquity") or 0)
+
+    async def wait_for_fill(self, symbol: str, order_id: str | None, timeout: float) -> bool:
+        """
+        Wait until an order is done and its position shows up in the mirror.
+
+        Args:
+            symbol: Symbol of the order
+            order_id: Order to wait for (None = just wait for the position)
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if the order filled and the position is mirrored, False on
+            timeout or if the order was canceled
+        """
+        def done() -> bool:
+            if not self.connected:
+                return True  # caller falls back to REST
+            order = self.finished_orders.get(order_id) if order_id else None
+            if order_id and order is None:
+                return False
+            return (order is not None and order.get("status") != "filled") or symbol in self.positions
+
+        await self._wait(done, timeout)
+        order = self.finished_orders.get(order_id) if order_id else None
+        return symbol in self.positions and (order_id is None or (order is not None and order.get("status") == "filled"))
+
+    async def _wait(self, predicate: Callable[[], bool], timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self._updated.wait(), remaining)
+            except asyncio.TimeoutError:
+                return predicate()
+        return True
+
+    # ------------------------------------------------------------- connection
+
+    async def start(self) -> None:
+        """Start the background connection task."""
+        if self.should_run:
+            return
+        self.should_run = True
+        self._task = asyncio.create_task(self._run())
+        logger.info("account_stream_started", channels=list(PRIVATE_CHANNELS))
+
+    async def stop(self) -> None:
+        """Stop the connection task."""
+        self.should_run = False
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        logger.info("account_stream_stopped", messages_received=self.messages_received, reconnects=self.reconnects)
+
+    def _login_request(self) -> dict[str, Any]:
+        timestamp = str(int(time.time()))
+        sign = self.rest_client._sign_request(timestamp, "GET", "/user/verify")
+        return {
+            "op": "login",
+            "args": [{
+                "apiKey": self.rest_client.api_key,
+                "passphrase": self.rest_client.passphrase,
+                "timestamp": timestamp,
+                "sign": sign,
+            }],
+        }
+
+    def _subscribe_args(self) -> list[dict[str, str]]:
+        args = []
+        for channel in PRIVATE_CHANNELS:
+            arg = {"instType": self.product_type, "channel": channel}
+            arg["coin" if channel == "account" else "instId"] = "default"
+            args.append(arg)
+        return args
+
+    async def _login(self, ws: Any) -> None:
+        await ws.send(orjson.dumps(self._login_request()).decode())
+        deadline = time.monotonic() + self.LOGIN_TIMEOUT
+        while True:
+            message = await asyncio.wait_for(ws.recv(), timeout=max(deadline - time.monotonic(), 0.001))
+            if message == "pong":
+                continue
+            data = orjson.loads(message)
+            if data.get("event") == "login" and str(data.get("code", "0")) == "0":
+                return
+            if data.get("event") in ("login", "error"):
+                raise ConnectionError(f"Login failed: {data.get('code')} - {data.get('msg')}")
+
+    async def _run(self) -> None:
+        """Keep the private connection logged in and subscribed."""
+        delay = self.RECONNECT_BASE_DELAY
+
+        while self.should_run:
+            try:
+                async with websockets.connect(self.WS_URL, ping_interval=None) as ws:
+                    await self._login(ws)
+                    await ws.send(orjson.dumps({"op": "subscribe", "args": self._subscribe_args()}).decode())
+                    self._snapshots.clear()
+                    self.connected = True
+                    delay = self.RECONNECT_BASE_DELAY
+                    logger.info("account_stream_connected")
+
+                    ping_task = asyncio.create_task(self._ping_loop(ws))
+                    try:
+                        while self.should_run:
+                            message = await asyncio.wait_for(ws.recv(), timeout=self.RECV_TIMEOUT)
+                            self._handle_message(message)
+                    finally:
+                        ping_task.cancel()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("account_stream_disconnected", error=str(e))
+            finally:
+                self.connected = False
+                self._notify()
+
+            if self.should_run:
+                self.reconnects += 1
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+
+    async def _ping_loop(self, ws: Any) -> None:
+        while True:
+            await asyncio.sleep(self.PING_INTERVAL)
+            await ws.send("ping")
+
+    # --------------------------------------------------------------- pushes
+
+    def _handle_message(self, message: str | bytes) -> None:
+        """
+        Fold a raw private push into the mirror.
+
+        Args:
+            message: Raw message string
+        """
+        self.last_message_time = time.time()
+        if message == "pong":
+            return
+
+        try:
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            logger.debug("account_stream_unparseable_message", message=str(message)[:200])
+            return
+
+        event = data.get("event")
+        if event == "error":
+            logger.error("account_stream_subscription_error", code=data.get("code"), msg=data.get("msg"))
+            return
+        if event:
+            return
+
+        channel = (data.get("arg") or {}).get("channel")
+        entries = data.get("data")
+        if channel not in PRIVATE_CHANNELS or entries is None:
+            return
+
+        if channel == "account":
+            for entry in entries:
+                if entry.get("marginCoin", self.margin_coin).upper() == self.margin_coin:
+                    self.account = entry
+        elif channel == "positions":
+            # Every positions push carries the full set of open positions
+            self.positions = {
+                entry["symbol"]: entry
+                for entry in map(_with_symbol, entries)
+                if float(entry.get("total", 0)) > 0
+            }
+        elif channel == "orders":
+            for entry in map(_with_symbol, entries):
+                self._update_order(entry)
+        else:
+            for entry in map(_with_symbol, entries):
+                if entry.get("status", "live") in ("live", "not_trigger"):
+                    self.plan_orders[entry["orderId"]] = entry
+                else:
+                    self.plan_orders.pop(entry["orderId"], None)
+
+        self._snapshots.add(channel)
+        self.messages_received += 1
+        self._notify()
+        if self.on_update:
+            self.on_update(channel, entries)
+
+    def _update_order(self, order: dict[str, Any]) -> None:
+        order_id = order["orderId"]
+        if order.get("status") in TERMINAL_ORDER_STATUSES:
+            self.open_orders.pop(order_id, None)
+            self.finished_orders[order_id] = order
+            self.finished_orders.move_to_end(order_id)
+            while len(self.finished_orders) > self.MAX_FINISHED_ORDERS:
+                self.finished_orders.popitem(last=False)
+        else:
+            self.open_orders[order_id] = order
+
+    def _notify(self) -> None:
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+
+def _with_symbol(entry: dict[str, Any]) -> dict[str, Any]:
+    """Private pushes name the symbol ``instId``; the REST responses call it ``symbol``."""
+    if "symbol" not in entry:
+        entry = {**entry, "symbol": entry.get("instId")}
+    return entry
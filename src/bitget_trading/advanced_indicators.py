@@ -5,6 +5,14 @@ from collections import deque
 from typing import Deque
 
 from src.bitget_trading.logger import get_logger
+from src.bitget_trading.ring_buffer import PriceRingBuffer
+from src.bitget_trading.streaming_indicators import (
+    RollingVWAP,
+    RollingWindowStats,
+    StreamingEMA,
+    StreamingMACD,
+    StreamingRSI,
+)
 
 logger = get_logger()
 
@@ -23,25 +31,33 @@ class AdvancedIndicators:
     - Price action patterns
     - Liquidity sweep detection
     - Tick momentum
+    
+    RSI, MACD, Bollinger, EMA and VWAP are maintained incrementally in
+    ``update()`` (O(1) per tick); the ``compute_*`` methods read cached state.
+    Parameters not registered up front are seeded once from history on first use.
     """
     
-    def __init__(self) -> None:
-        """Initialize advanced indicators."""
-        # Price history for indicator calculation
-        self.prices: Deque[float] = deque(maxlen=3600)  # 1 hour at 1Hz
-        self.volumes: Deque[float] = deque(maxlen=3600)
-        self.timestamps: Deque[float] = deque(maxlen=3600)
+    def __init__(self, history: PriceRingBuffer | None = None) -> None:
+        """
+        Initialize advanced indicators.
         
-        # Order book history for flow analysis
-        self.bid_volumes: Deque[float] = deque(maxlen=300)
-        self.ask_volumes: Deque[float] = deque(maxlen=300)
+        Args:
+            history: Ring buffer to append samples to (shared with ``SymbolState``);
+                a private 3600-sample buffer is created when omitted
+        """
+        # Price/volume/order-book history for indicator calculation (1 hour at 1Hz)
+        self.history = history if history is not None else PriceRingBuffer(3600)
         
         # Tick data for microstructure
         self.up_ticks: Deque[float] = deque(maxlen=100)
         self.down_ticks: Deque[float] = deque(maxlen=100)
         
-        # EMA caches (for efficiency)
-        self.ema_cache: dict[int, float] = {}
+        # Streaming indicator state (updated in update(), read by compute_*)
+        self.rsi: dict[int, StreamingRSI] = {p: StreamingRSI(p) for p in (2, 5, 15, 30)}
+        self.macd: dict[tuple[int, int, int], StreamingMACD] = {(3, 7, 2): StreamingMACD(3, 7, 2)}
+        self.emas: dict[int, StreamingEMA] = {p: StreamingEMA(p) for p in (3, 5, 7, 10, 15, 30)}
+        self.bollinger: dict[int, RollingWindowStats] = {20: RollingWindowStats(20)}
+        self.vwap: dict[int, RollingVWAP] = {300: RollingVWAP(300)}
     
     def update(
         self,
@@ -61,25 +77,30 @@ class AdvancedIndicators:
             bid_volume: Bid side volume
             ask_volume: Ask side volume
         """
-        self.prices.append(price)
-        self.volumes.append(volume)
-        self.timestamps.append(timestamp)
-        
-        if bid_volume > 0:
-            self.bid_volumes.append(bid_volume)
-        if ask_volume > 0:
-            self.ask_volumes.append(ask_volume)
+        prev_price = self.history.last_price if self.history else None
+        self.history.append(timestamp, price, volume, bid_volume, ask_volume)
+        
+        for rsi in self.rsi.values():
+            rsi.update(price)
+        for macd in self.macd.values():
+            macd.update(price)
+        for ema in self.emas.values():
+            ema.update(price)
+        for stats in self.bollinger.values():
+            stats.update(price)
+        for vwap in self.vwap.values():
+            vwap.update(price, volume)
         
         # Track tick direction
-        if len(self.prices) >= 2:
-            if price > self.prices[-2]:
+        if prev_price is not None:
+            if price > prev_price:
                 self.up_ticks.append(timestamp)
-            elif price < self.prices[-2]:
+            elif price < prev_price:
                 self.down_ticks.append(timestamp)
     
     def compute_rsi(self, period: int = 14) -> float:
         """
-        Compute RSI (Relative Strength Index).
+        Compute RSI (Relative Strength Index) with Wilder smoothing.
         
         RSI = 100 - (100 / (1 + RS))
         RS = Average Gain / Average Loss
@@ -90,30 +111,13 @@ class AdvancedIndicators:
         Returns:
             RSI value (0-100)
         """
-        if len(self.prices) < period + 1:
-            return 50.0  # Neutral
-        
-        prices = np.array(list(self.prices))
-        deltas = np.diff(prices)
+        rsi = self.rsi.get(period)
+        if rsi is None:
+            rsi = self.rsi[period] = StreamingRSI(period)
+            for price in self.history.prices():
+                rsi.update(price)
         
-        # Separate gains and losses
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        # Use EMA for smoothing (faster than SMA)
-        if len(gains) < period:
-            return 50.0
-        
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
-        
-        if avg_loss == 0:
-            return 100.0 if avg_gain > 0 else 50.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
+        return rsi.value
     
     def compute_macd(
         self, fast: int = 3, slow: int = 7, signal: int = 2
@@ -126,40 +130,19 @@ class AdvancedIndicators:
         Args:
             fast: Fast EMA period
             slow: Slow EMA period
-            signal: Signal line period
+            signal: Signal line period (EMA of the MACD line)
         
         Returns:
             (macd_line, signal_line, histogram)
         """
-        if len(self.prices) < slow + signal:
-            return 0.0, 0.0, 0.0
-        
-        prices = np.array(list(self.prices))
-        
-        # Compute EMAs
-        ema_fast = self._compute_ema(prices, fast)
-        ema_slow = self._compute_ema(prices, slow)
-        
-        # MACD line
-        macd_line = ema_fast - ema_slow
-        
-        # Signal line (EMA of MACD)
-        if len(self.prices) < slow + signal:
-            return macd_line, 0.0, macd_line
-        
-        # Get recent MACD values for signal line
-        macd_values = []
-        for i in range(signal, 0, -1):
-            if len(prices) >= slow + i:
-                ema_f = self._compute_ema(prices[:-i] if i > 1 else prices, fast)
-                ema_s = self._compute_ema(prices[:-i] if i > 1 else prices, slow)
-                macd_values.append(ema_f - ema_s)
-        macd_values.append(macd_line)
-        
-        signal_line = np.mean(macd_values[-signal:])
-        histogram = macd_line - signal_line
-        
-        return macd_line, signal_line, histogram
+        key = (fast, slow, signal)
+        macd = self.macd.get(key)
+        if macd is None:
+            macd = self.macd[key] = StreamingMACD(fast, slow, signal)
+            for price in self.history.prices():
+                macd.update(price)
+        
+        return macd.value
     
     def compute_bollinger_bands(
         self, period: int = 20, std_dev: float = 2.0
@@ -174,15 +157,18 @@ class AdvancedIndicators:
         Returns:
             (upper_band, middle_band, lower_band)
         """
-        if len(self.prices) < period:
-            price = list(self.prices)[-1] if self.prices else 0.0
+        if len(self.history) < period:
+            price = self.history.last_price
             return price, price, price
         
-        prices = np.array(list(self.prices))
-        recent = prices[-period:]
+        stats = self.bollinger.get(period)
+        if stats is None:
+            stats = self.bollinger[period] = RollingWindowStats(period)
+            for price in self.history.prices(period):
+                stats.update(price)
         
-        middle = np.mean(recent)
-        std = np.std(recent)
+        middle = stats.mean
+        std = stats.std
         
         upper = middle + (std_dev * std)
         lower = middle - (std_dev * std)
@@ -202,17 +188,15 @@ class AdvancedIndicators:
                 "10/30": (ema10, ema30, signal),
             }
         """
-        if len(self.prices) < 30:
+        if len(self.history) < 30:
             return {}
         
-        prices = np.array(list(self.prices))
-        
         result = {}
         pairs = [(3, 7), (5, 15), (10, 30)]
         
         for fast, slow in pairs:
-            ema_fast = self._compute_ema(prices, fast)
-            ema_slow = self._compute_ema(prices, slow)
+            ema_fast = self.emas[fast].value
+            ema_slow = self.emas[slow].value
             
             # Determine signal
             diff_pct = (ema_fast - ema_slow) / ema_slow
@@ -237,28 +221,13 @@ class AdvancedIndicators:
         Returns:
             (vwap, deviation_pct)
         """
-        if len(self.prices) < 2 or len(self.volumes) < 2:
-            return 0.0, 0.0
-        
-        prices = np.array(list(self.prices))
-        volumes = np.array(list(self.volumes))
-        
-        # Use recent period
-        n = min(period, len(prices))
-        recent_prices = prices[-n:]
-        recent_volumes = volumes[-n:]
-        
-        # VWAP = sum(price * volume) / sum(volume)
-        if recent_volumes.sum() == 0:
-            return prices[-1], 0.0
-        
-        vwap = np.sum(recent_prices * recent_volumes) / np.sum(recent_volumes)
-        
-        # Deviation from VWAP
-        current_price = prices[-1]
-        deviation_pct = (current_price - vwap) / vwap
+        vwap = self.vwap.get(period)
+        if vwap is None:
+            vwap = self.vwap[period] = RollingVWAP(period)
+            for price, volume in zip(self.history.prices(period), self.history.volumes(period)):
+                vwap.update(price, volume)
         
-        return vwap, deviation_pct
+        return vwap.value
     
     def compute_order_flow_imbalance(self) -> float:
         """
@@ -269,12 +238,12 @@ class AdvancedIndicators:
         Returns:
             Flow imbalance (-1 to 1, positive = buying pressure)
         """
-        if len(self.bid_volumes) < 2 or len(self.ask_volumes) < 2:
+        if len(self.history) < 2:
             return 0.0
         
         # Recent 30 data points
-        bid_vol = np.array(list(self.bid_volumes)[-30:])
-        ask_vol = np.array(list(self.ask_volumes)[-30:])
+        bid_vol = self.history.bid_volumes(30)
+        ask_vol = self.history.ask_volumes(30)
         
         total_bid = np.sum(bid_vol)
         total_ask = np.sum(ask_vol)
@@ -295,11 +264,10 @@ class AdvancedIndicators:
             (pattern_name, confidence)
             Patterns: "uptrend", "downtrend", "double_top", "double_bottom", "neutral"
         """
-        if len(self.prices) < 30:
+        if len(self.history) < 30:
             return "neutral", 0.0
         
-        prices = np.array(list(self.prices))
-        recent = prices[-30:]
+        recent = self.history.prices(30)
         
         # Detect trend using linear regression
         x = np.arange(len(recent))
@@ -347,14 +315,13 @@ class AdvancedIndicators:
         Returns:
             (is_sweep, direction)  # direction: "up" or "down"
         """
-        if len(self.prices) < 10 or len(self.volumes) < 10:
+        if len(self.history) < 10:
             return False, "none"
         
-        prices = np.array(list(self.prices))
-        volumes = np.array(list(self.volumes))
+        volumes = self.history.volumes(30)
         
         # Check last 5 seconds
-        recent_prices = prices[-5:]
+        recent_prices = self.history.prices(5)
         recent_volumes = volumes[-5:]
         
         # 1. Check for sharp spike
@@ -367,13 +334,13 @@ class AdvancedIndicators:
             # Up spike then down
             if recent_prices[-3] < recent_prices[-2] and recent_prices[-2] > recent_prices[-1]:
                 # 3. Check volume surge
-                avg_volume = np.mean(volumes[-30:])
+                avg_volume = np.mean(volumes)
                 if recent_volumes[-2] > avg_volume * 1.5:  # 50% above average
                     return True, "up"
             
             # Down spike then up
             if recent_prices[-3] > recent_prices[-2] and recent_prices[-2] < recent_prices[-1]:
-                avg_volume = np.mean(volumes[-30:])
+                avg_volume = np.mean(volumes)
                 if recent_volumes[-2] > avg_volume * 1.5:
                     return True, "down"
         
@@ -390,7 +357,7 @@ class AdvancedIndicators:
             return 0.0
         
         # Count recent ticks (last 30 seconds)
-        current_time = self.timestamps[-1] if self.timestamps else 0
+        current_time = self.history.last_timestamp
         cutoff_time = current_time - 30
         
         up_count = sum(1 for t in self.up_ticks if t >= cutoff_time)
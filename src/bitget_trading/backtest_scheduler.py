@@ -153,13 +153,10 @@ class BacktestScheduler:
                 for symbol in batch
             ]
             
+            # History requests go through the shared REST rate limiter at bulk
+            # priority, so no fixed delay between batches is needed
             batch_results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            # 🚀 RATE LIMITING: Add delay between batches to avoid 429 errors
-            # Wait 1 second between batches to slow down backtesting (never hit rate limits)
-            if batch_idx < len(batches) - 1:  # Don't wait after last batch
-                await asyncio.sleep(1.0)
-            
             # Process results
             for symbol, result in zip(batch, batch_results):
                 if isinstance(result, Exception):
@@ -7,6 +7,7 @@ import time
 from hashlib import sha256
 from typing import Any
 
+import aiohttp
 import orjson
 import ssl
 import os
@@ -37,7 +38,9 @@ try:
 except ImportError:
     CERTIFI_CA_BUNDLE = None
 
+from .contract_catalog import ContractCatalog, ContractSpec
 from .logger import get_logger
+from .rate_limiter import PRIORITY_BULK, BitgetRateLimiter, get_rate_limiter
 
 logger = get_logger()
 
@@ -53,6 +56,9 @@ class BitgetRestClient:
 
     BASE_URL = "https://api.bitget.com"
     SANDBOX_URL = "https://demo.bitget.com"  # Bitget sandbox
+    TRANSPORTS = ("requests", "aiohttp")
+    CONNECT_TIMEOUT = 20  # seconds
+    READ_TIMEOUT = 40  # seconds
 
     def __init__(
         self,
@@ -60,21 +66,81 @@ class BitgetRestClient:
         api_secret: str,
         passphrase: str,
         sandbox: bool = True,
+        transport: str | None = None,
+        pool_size: int | None = None,
+        pool_per_host: int | None = None,
+        keepalive_sec: float | None = None,
+        base_url: str | None = None,
+        rate_limiter: BitgetRateLimiter | None = None,
+        contract_catalog: ContractCatalog | None = None,
     ) -> None:
         """
         Initialize REST client.
 
+        Transport settings default to the REST_* values of TradingConfig.
+
         Args:
             api_key: Bitget API key
             api_secret: Bitget API secret
             passphrase: Bitget passphrase
             sandbox: Use sandbox environment
+            transport: "requests" (blocking session in a thread) or "aiohttp"
+                (native asyncio with a keep-alive connection pool)
+            pool_size: Max open connections (aiohttp)
+            pool_per_host: Max concurrent connections per host (aiohttp)
+            keepalive_sec: Idle time before a pooled connection is closed (aiohttp)
+            base_url: Override the API host (e.g. a local stub server)
+            rate_limiter: Client-side limiter (default: the process-wide one,
+                unless REST_RATE_LIMIT_ENABLED is off)
+            contract_catalog: Contract specs index (default: one fetched through
+                this client, snapshotted to CONTRACT_CATALOG_PATH)
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.passphrase = passphrase
-        self.base_url = self.SANDBOX_URL if sandbox else self.BASE_URL
-        
+        self.base_url = base_url or (self.SANDBOX_URL if sandbox else self.BASE_URL)
+
+        if (
+            transport is None or pool_size is None or pool_per_host is None
+            or keepalive_sec is None or rate_limiter is None or contract_catalog is None
+        ):
+            from .config import get_config
+
+            config = get_config()
+            transport = transport or config.rest_transport
+            pool_size = pool_size or config.rest_pool_size
+            pool_per_host = pool_per_host or config.rest_pool_per_host
+            keepalive_sec = keepalive_sec or config.rest_keepalive_sec
+            if rate_limiter is None and config.rest_rate_limit_enabled:
+                rate_limiter = get_rate_limiter()
+            if contract_catalog is None:
+                contract_catalog = ContractCatalog(
+                    self._fetch_contracts,
+                    snapshot_path=config.contract_catalog_path or None,
+                    ttl_sec=config.contract_catalog_ttl_sec,
+                )
+        self.rate_limiter = rate_limiter
+        self.contract_catalog = contract_catalog
+
+        if transport not in self.TRANSPORTS:
+            raise ValueError(f"Unknown REST transport {transport!r} (expected one of {self.TRANSPORTS})")
+        self.transport = transport
+        self.pool_size = pool_size
+        self.pool_per_host = pool_per_host
+        self.keepalive_sec = keepalive_sec
+        self._http_session: aiohttp.ClientSession | None = None
+
+        if transport == "aiohttp":
+            # Session is created lazily: it must belong to the running event loop
+            self.session = None
+            logger.info(
+                "rest_transport_aiohttp",
+                pool_size=pool_size,
+                pool_per_host=pool_per_host,
+                keepalive_sec=keepalive_sec,
+            )
+            return
+
         # Use requests Session with SSL verification completely disabled
         self.session = requests.Session()
         self.session.verify = False
@@ -131,27 +197,88 @@ class BitgetRestClient:
 
         return signature
 
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Shared aiohttp session with a keep-alive connection pool."""
+        if self._http_session is None or self._http_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_per_host,
+                keepalive_timeout=self.keepalive_sec,
+                ttl_dns_cache=300,
+                ssl=False,  # Same as the requests path: no certificate verification
+            )
+            self._http_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.CONNECT_TIMEOUT,
+                    sock_read=self.READ_TIMEOUT,
+                ),
+            )
+        return self._http_session
+
+    async def close(self) -> None:
+        """Close pooled connections (aiohttp transport)."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: str,
+    ) -> tuple[int, str]:
+        """
+        Send one HTTP request on the configured transport.
+
+        Returns:
+            (status code, response text)
+        """
+        data = body.encode('utf-8') if body else None
+
+        if self.transport == "aiohttp":
+            session = await self._get_http_session()
+            async with session.request(method, url, headers=headers, data=data) as response:
+                return response.status, await response.text()
+
+        # Use requests Session with SSL verification disabled
+        # Run in thread pool to avoid blocking
+        response = await asyncio.to_thread(
+            self.session.request,
+            method,
+            url,
+            headers=headers,
+            data=data,
+            timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT),
+        )
+        return response.status_code, response.text
+
     async def _request(
         self,
         method: str,
         endpoint: str,
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
+        priority: int | None = None,
     ) -> dict[str, Any]:
         """
         Make authenticated HTTP request.
 
+        Every attempt first waits for the rate limiter and is signed just
+        before it is sent, so queueing never produces a stale timestamp.
+
         Args:
             method: HTTP method
             endpoint: API endpoint
             params: Query parameters
             data: Request body data
+            priority: Rate-limiter priority (default: by endpoint group;
+                pass PRIORITY_BULK for history downloads)
 
         Returns:
             Response JSON
         """
-        timestamp = str(int(time.time() * 1000))
-
         # Build request path
         request_path = endpoint
         if params:
@@ -163,54 +290,54 @@ class BitgetRestClient:
         if data:
             body = orjson.dumps(data).decode()
 
-        # Sign request
-        signature = self._sign_request(timestamp, method, request_path, body)
-
-        # Headers (passphrase is sent as plain text, NOT signed!)
-        headers = {
-            "Content-Type": "application/json",
-            "ACCESS-KEY": self.api_key,
-            "ACCESS-SIGN": signature,
-            "ACCESS-TIMESTAMP": timestamp,
-            "ACCESS-PASSPHRASE": self.passphrase,  # Plain text, not signed!
-        }
-
         # Make request with timeout settings
         url = self.base_url + request_path
 
-        # Use requests library wrapped in async - more reliable SSL bypass on macOS
         max_retries = 3
         last_error = None
         
         for attempt in range(max_retries):
             try:
-                # Use requests Session with SSL verification disabled
-                # Run in thread pool to avoid blocking
-                response = await asyncio.to_thread(
-                    self.session.request,
-                    method,
-                    url,
-                    headers=headers,
-                    data=body.encode('utf-8') if body else None,
-                    timeout=(20, 40),  # (connect, read) timeouts
-                )
-                
-                response_text = response.text
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(endpoint, priority)
+
+                # Sign request
+                timestamp = str(int(time.time() * 1000))
+                signature = self._sign_request(timestamp, method, request_path, body)
+
+                # Headers (passphrase is sent as plain text, NOT signed!)
+                headers = {
+                    "Content-Type": "application/json",
+                    "ACCESS-KEY": self.api_key,
+                    "ACCESS-SIGN": signature,
+                    "ACCESS-TIMESTAMP": timestamp,
+                    "ACCESS-PASSPHRASE": self.passphrase,  # Plain text, not signed!
+                }
 
-                if response.status_code != 200:
+                status_code, response_text = await self._send(method, url, headers, body)
+
+                if status_code == 429 and self.rate_limiter is not None:
+                    # Limiter backs off (and slows the whole endpoint group) before the retry
+                    self.rate_limiter.record_rate_limited(endpoint)
+                    if attempt < max_retries - 1:
+                        continue
+                elif status_code == 200 and self.rate_limiter is not None:
+                    self.rate_limiter.record_success(endpoint)
+
+                if status_code != 200:
                     logger.error(
                         "api_request_failed",
-                        status=response.status_code,
+                        status=status_code,
                         response=response_text[:200],
                     )
                     # Don't retry on 4xx client errors
-                    if 400 <= response.status_code < 500:
-                        raise Exception(f"API error: {response.status_code} - {response_text}")
+                    if 400 <= status_code < 500:
+                        raise Exception(f"API error: {status_code} - {response_text}")
                     # Retry on 5xx server errors
-                    raise Exception(f"API error: {response.status_code} - {response_text}")
+                    raise Exception(f"API error: {status_code} - {response_text}")
 
                 return orjson.loads(response_text)
-            except (TimeoutError, requests.exceptions.ConnectionError, requests.exceptions.RequestException, ConnectionError) as e:
+            except (TimeoutError, requests.exceptions.ConnectionError, requests.exceptions.RequestException, aiohttp.ClientError, ConnectionError) as e:
                 last_error = e
                 error_msg = str(e)
                 # Log the actual error type and message
@@ -251,10 +378,10 @@ class BitgetRestClient:
         logger.debug("account_balance_fetched", response=response)
         return response
 
-    async def get_positions(
-        self, symbol: str, product_type: str = "USDT-FUTURES"
+    async def get_all_positions(
+        self, product_type: str = "USDT-FUTURES"
     ) -> list[dict[str, Any]]:
-        """Get open positions."""
+        """Get all open positions (including their leverage and margin mode)."""
         endpoint = "/api/v2/mix/position/all-position"
         params = {
             "productType": product_type,
@@ -264,12 +391,42 @@ class BitgetRestClient:
         response = await self._request("GET", endpoint, params=params)
 
         if response.get("code") == "00000" and "data" in response:
-            positions = response["data"]
-            # Filter for specific symbol
-            return [p for p in positions if p.get("symbol") == symbol]
+            return response["data"] or []
 
         return []
+
+    async def get_positions(
+        self, symbol: str, product_type: str = "USDT-FUTURES"
+    ) -> list[dict[str, Any]]:
+        """Get open positions."""
+        positions = await self.get_all_positions(product_type)
+        # Filter for specific symbol
+        return [p for p in positions if p.get("symbol") == symbol]
     
+    async def _fetch_contracts(self, product_type: str) -> list[dict[str, Any]]:
+        """Download the full contract list (ContractCatalog fetcher)."""
+        endpoint = "/api/v2/mix/market/contracts"
+        params = {"productType": product_type}
+        response = await self._request("GET", endpoint, params=params)
+        if response.get("code") != "00000":
+            raise Exception(f"API error: {response.get('code')} - {response.get('msg')}")
+        return response.get("data") or []
+
+    async def get_contract_spec(
+        self, symbol: str, product_type: str = "USDT-FUTURES"
+    ) -> ContractSpec | None:
+        """
+        Get typed contract rules (precision, min size, max leverage) for a symbol.
+
+        Served from the contract catalog; the full list is only downloaded
+        when the catalog is empty or stale.
+        """
+        try:
+            return await self.contract_catalog.get(symbol, product_type)
+        except Exception as e:
+            logger.error(f"❌ Error fetching symbol info for {symbol}: {e}")
+            return None
+
     async def get_symbol_info(
         self, symbol: str, product_type: str = "USDT-FUTURES"
     ) -> dict[str, Any]:
@@ -281,41 +438,13 @@ class BitgetRestClient:
             product_type: Product type
         
         Returns:
-            Dict with symbol info including maxLeverage
+            Raw contract dict (including maxLeverage), empty if the symbol is unknown
         """
-        endpoint = "/api/v2/mix/market/contracts"
-        params = {
-            "productType": product_type.lower().replace("_", "-"),
-        }
-        
-        try:
-            response = await self._request("GET", endpoint, params=params)
-            
-            if response.get("code") == "00000" and "data" in response:
-                contracts = response["data"]
-                
-                # Log first contract for debugging
-                if contracts and len(contracts) > 0:
-                    logger.debug(f"📋 Sample contract format: {list(contracts[0].keys())}")
-                
-                for contract in contracts:
-                    # Try multiple possible key names for symbol
-                    contract_symbol = contract.get("symbol") or contract.get("symbolName") or contract.get("baseCoin", "") + contract.get("quoteCoin", "")
-                    
-                    if contract_symbol == symbol:
-                        max_lev = contract.get("maxLeverage") or contract.get("leverage") or "25"
-                        logger.debug(f"✅ Found {symbol}: maxLeverage={max_lev}")
-                        return contract
-                
-                # Symbol not found - log available symbols for debugging
-                available = [c.get("symbol", "?") for c in contracts[:5]]
-                logger.warning(f"⚠️ {symbol} not found in {len(contracts)} contracts. Sample: {available}")
-            else:
-                logger.error(f"❌ API error: {response.get('code')} - {response.get('msg')}")
-        except Exception as e:
-            logger.error(f"❌ Error fetching symbol info for {symbol}: {e}")
-        
-        return {}
+        spec = await self.get_contract_spec(symbol, product_type)
+        if spec is None:
+            logger.warning(f"⚠️ {symbol} not found in contract catalog")
+            return {}
+        return spec.raw
 
     async def set_leverage(
         self,
@@ -779,15 +908,16 @@ class BitgetRestClient:
         except Exception:
             return round(float(val), 4)
 
-    def _get_tick_size(self, price_end_step: float | None, price_places: int | None) -> float:
-        """Calculate tick size for price adjustments."""
-        if price_end_step and price_end_step > 0:
-            return float(price_end_step)
-        places = int(price_places) if price_places is not None else 4
-        return 10 ** (-places)
+    def _round_price(self, price: float | None, spec: ContractSpec | None) -> float | None:
+        """Round price to the contract tick (decimal places only if the contract is unknown)."""
+        if price is None:
+            return None
+        if spec is None:
+            return self._round_to_precision(price, None)
+        return spec.round_price(price)
 
     def _validate_trigger_price(
-        self, trigger: float, current_price: float, hold_side: str, price_places: int | None
+        self, trigger: float, current_price: float, hold_side: str, spec: ContractSpec | None
     ) -> float:
         """Validate and adjust trigger price to be on correct side of current price."""
         api_side = "buy" if hold_side == "long" else "sell"
@@ -799,7 +929,7 @@ class BitgetRestClient:
             # SHORT: TP must be BELOW, SL must be ABOVE
             if trigger >= current_price:
                 trigger = current_price * 0.999
-        return self._round_to_precision(trigger, price_places) or trigger
+        return self._round_price(trigger, spec) or trigger
 
     async def _post_plan_with_retry(
         self, endpoint: str, data: dict[str, str], symbol: str, order_type: str, max_retries: int = 3
@@ -875,44 +1005,24 @@ class BitgetRestClient:
 
         # Fetch symbol contract info for correct size/price scales
         volume_places = None
-        price_places = None
-        price_end_step: float | None = None
-        try:
-            contract = await self.get_symbol_info(symbol, product_type="USDT-FUTURES")
-            if contract:
-                # Bitget uses 'volumePlace' for size decimals, 'pricePlace' for price decimals
-                if contract.get("volumePlace") is not None:
-                    try:
-                        volume_places = int(contract.get("volumePlace"))
-                    except Exception:
-                        volume_places = None
-                if contract.get("pricePlace") is not None:
-                    try:
-                        price_places = int(contract.get("pricePlace"))
-                    except Exception:
-                        price_places = None
-                # priceEndStep is the minimum tick size
-                if contract.get("priceEndStep") is not None:
-                    try:
-                        price_end_step = float(contract.get("priceEndStep"))
-                    except Exception:
-                        price_end_step = None
-        except Exception:
-            pass
+        spec = await self.get_contract_spec(symbol, product_type="USDT-FUTURES")
+        if spec is not None:
+            # Bitget uses 'volumePlace' for size decimals
+            volume_places = spec.volume_place
 
         # Determine size precision
-        if size_precision is None:
-            if volume_places is not None:
-                size_precision = max(0, int(volume_places))
-            else:
+        if size_precision is None and spec is not None:
+            rounded_size = spec.round_size(size)
+        else:
+            if size_precision is None:
                 # Fallback: infer from value
                 size_str = f"{size:.10f}".rstrip('0').rstrip('.')
                 size_precision = len(size_str.split('.')[1]) if '.' in size_str else 0
-        rounded_size = round(size, size_precision)
+            rounded_size = round(size, size_precision)
 
-        # Round trigger prices using helper method
-        stop_loss_price = self._round_to_precision(stop_loss_price, price_places)
-        take_profit_price = self._round_to_precision(take_profit_price, price_places)
+        # Round trigger prices to the contract tick
+        stop_loss_price = self._round_price(stop_loss_price, spec)
+        take_profit_price = self._round_price(take_profit_price, spec)
 
         api_hold_side = "buy" if hold_side == "long" else "sell"
         logger.info(f"🔍 [TP/SL] {symbol} | {hold_side} | size={rounded_size} | SL={stop_loss_price} | TP={take_profit_price}")
@@ -963,7 +1073,7 @@ class BitgetRestClient:
                                 trig = cur_px * 1.001
                             elif hold == "sell" and trig >= cur_px:
                                 trig = cur_px * 0.999
-                            trig = self._round_to_precision(trig, price_places) or trig
+                            trig = self._round_price(trig, spec) or trig
                             data["triggerPrice"] = str(trig)
                             logger.info(f"🔧 [TP ADJUST] {symbol} | {order_type} | trigger={trig} (cur={cur_px})")
                             response = await self._request("POST", endpoint, data=data)
@@ -1099,7 +1209,7 @@ class BitgetRestClient:
                         trig_sl = cur_px * 0.999
                     elif api_hold_side == "sell" and trig_sl <= cur_px:
                         trig_sl = cur_px * 1.001
-                    trig_sl = self._round_to_precision(trig_sl, price_places) or trig_sl
+                    trig_sl = self._round_price(trig_sl, spec) or trig_sl
                     sl_data["triggerPrice"] = str(trig_sl)
                     logger.info(f"🔧 [SL ADJUST] {symbol} | trigger={trig_sl}")
             except Exception:
@@ -1181,7 +1291,7 @@ class BitgetRestClient:
             # For RECOVERED positions, Bitget API requires size parameter (error 40019 if missing)
             # Sending size = full position size makes it apply to entire position
             # Round TP price to correct price precision
-            take_profit_price = self._round_to_precision(take_profit_price, price_places)
+            take_profit_price = self._round_price(take_profit_price, spec)
             tp_data: dict[str, str] = {
                 "symbol": symbol,
                 "productType": product_type,  # "usdt-futures" (lowercase)
@@ -1207,7 +1317,7 @@ class BitgetRestClient:
                         trig_tp = cur_px * 0.999
                         adjusted = True
                     if adjusted:
-                        trig_tp = self._round_to_precision(trig_tp, price_places) or trig_tp
+                        trig_tp = self._round_price(trig_tp, spec) or trig_tp
                         tp_data["triggerPrice"] = str(trig_tp)
                         logger.warning(f"🔧 [TP ADJUST] {symbol} | {take_profit_price} → {trig_tp} (cur={cur_px})")
             except Exception:
@@ -1317,18 +1427,24 @@ class BitgetRestClient:
         """
         endpoint = "/api/v2/mix/order/place-tpsl-order"
 
+        # Fetch contract for tick/size step
+        spec = await self.get_contract_spec(symbol, product_type="USDT-FUTURES")
+
         # Round size to correct precision
         # 🚨 CRITICAL: Must preserve all significant digits to avoid rounding to 0!
-        if size_precision is None:
-            # Convert to string and count decimal places
-            size_str = f"{size:.10f}".rstrip('0').rstrip('.')
-            if '.' in size_str:
-                size_precision = len(size_str.split('.')[1])
-            else:
-                size_precision = 0
-            # Ensure at least the precision needed to represent the number
-            size_precision = max(size_precision, 0)
-        rounded_size = round(size, size_precision)
+        if size_precision is None and spec is not None:
+            rounded_size = spec.round_size(size)
+        else:
+            if size_precision is None:
+                # Convert to string and count decimal places
+                size_str = f"{size:.10f}".rstrip('0').rstrip('.')
+                if '.' in size_str:
+                    size_precision = len(size_str.split('.')[1])
+                else:
+                    size_precision = 0
+                # Ensure at least the precision needed to represent the number
+                size_precision = max(size_precision, 0)
+            rounded_size = round(size, size_precision)
 
         # Convert "long"/"short" to "buy"/"sell" for one-way mode
         api_hold_side = "buy" if hold_side == "long" else "sell"
@@ -1337,25 +1453,6 @@ class BitgetRestClient:
         # Convert decimal to percentage: 0.015 → "1.50", 0.02 → "2.00", 0.001 → "0.10"
         formatted_range_rate = f"{range_rate * 100:.2f}"  # Convert to percentage and format to 2 decimal places
 
-        # Try to fetch contract for tick/precision
-        price_places = None
-        price_end_step = None
-        try:
-            contract = await self.get_symbol_info(symbol, product_type="USDT-FUTURES")
-            if contract:
-                if contract.get("pricePlace") is not None:
-                    try:
-                        price_places = int(contract.get("pricePlace"))
-                    except Exception:
-                        price_places = None
-                if contract.get("priceEndStep") is not None:
-                    try:
-                        price_end_step = float(contract.get("priceEndStep"))
-                    except Exception:
-                        price_end_step = None
-        except Exception:
-            pass
-
         try:
             cur_px = await self._get_current_market_price(symbol)
             if cur_px:
@@ -1365,7 +1462,7 @@ class BitgetRestClient:
                 elif api_hold_side == "sell" and trigger_price >= cur_px:
                     trigger_price = cur_px * 0.999
                 if trigger_price != original_trigger:
-                    trigger_price = self._round_to_precision(trigger_price, price_places) or trigger_price
+                    trigger_price = self._round_price(trigger_price, spec) or trigger_price
                     logger.warning(f"🔧 [TRAILING ADJUST] {symbol} | {original_trigger} → {trigger_price} (cur={cur_px})")
         except Exception:
             pass
@@ -1503,7 +1600,7 @@ class BitgetRestClient:
                             ref_px = None
                     if ref_px:
                         # adjust trigger according to side:
-                        tick = 10 ** (-(price_places if price_places is not None else 4))
+                        tick = spec.tick_size if spec is not None else 10 ** -4
                         if api_hold_side == "buy":
                             # activation must be >= current
                             if trigger_price < ref_px:
@@ -1512,7 +1609,7 @@ class BitgetRestClient:
                             # activation must be <= current
                             if trigger_price > ref_px:
                                 trigger_price = ref_px - tick
-                        trigger_price = _round_price_local(trigger_price)
+                        trigger_price = self._round_price(trigger_price, spec) or trigger_price
                         data["triggerPrice"] = str(trigger_price)
                         logger.info(
                             f"🔧 [TRAILING TRIGGER AUTO-ADJUST] {symbol} | new activation={trigger_price} (ref={ref_px})"
@@ -1604,39 +1701,20 @@ class BitgetRestClient:
         callback_str = f"{callback_ratio * 100:.2f}"
         
         # Fetch contract to determine volume/price places
-        volume_places = None
-        price_places = None
-        try:
-            contract = await self.get_symbol_info(symbol, product_type=product_type)
-            if contract:
-                if contract.get("volumePlace") is not None:
-                    try:
-                        volume_places = int(contract.get("volumePlace"))
-                    except Exception:
-                        volume_places = None
-                if contract.get("pricePlace") is not None:
-                    try:
-                        price_places = int(contract.get("pricePlace"))
-                    except Exception:
-                        price_places = None
-        except Exception:
-            pass
+        spec = await self.get_contract_spec(symbol, product_type=product_type)
 
         # Round size to correct precision
-        if size_precision is None:
-            if volume_places is not None:
-                size_precision = max(0, int(volume_places))
-            else:
+        if size_precision is None and spec is not None:
+            rounded_size = spec.round_size(size)
+        else:
+            if size_precision is None:
                 size_str = f"{size:.10f}".rstrip('0').rstrip('.')
                 size_precision = len(size_str.split('.')[1]) if '.' in size_str else 0
-        rounded_size = round(size, size_precision)
+            rounded_size = round(size, size_precision)
 
-        # Round trigger price to price precision
-        if price_places is not None:
-            try:
-                trigger_price = round(float(trigger_price), int(price_places))
-            except Exception:
-                trigger_price = round(float(trigger_price), 4)
+        # Round trigger price to the contract tick
+        if spec is not None:
+            trigger_price = spec.round_price(float(trigger_price))
         
         # Side to CLOSE the position (opposite of held position)
         side = "sell" if hold_side == "long" else "buy"
@@ -1740,6 +1818,10 @@ class BitgetRestClient:
         granularity: str = "1m",  # 1m, 3m, 5m, 15m, 30m, 1H, 4H, 1D
         limit: int = 200,  # Max 200 per request
         product_type: str = "USDT-FUTURES",
+        priority: int | None = PRIORITY_BULK,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        history: bool = False,
     ) -> dict[str, Any]:
         """
         Get historical candlestick data (INSTANT data loading!).
@@ -1752,19 +1834,27 @@ class BitgetRestClient:
             granularity: Candle interval (1m, 3m, 5m, 15m, 30m, 1H, 4H, 1D)
             limit: Number of candles to fetch (max 200)
             product_type: Product type
+            priority: Rate-limiter priority (history downloads yield to live traffic)
+            start_time: Window start in ms (inclusive)
+            end_time: Window end in ms (the newest `limit` candles up to here are returned)
+            history: Use the history-candles endpoint (closed bars further back)
 
         Returns:
             Response with candle data [timestamp, open, high, low, close, volume, ...]
         """
-        endpoint = "/api/v2/mix/market/candles"
+        endpoint = "/api/v2/mix/market/history-candles" if history else "/api/v2/mix/market/candles"
         params = {
             "symbol": symbol,
             "productType": product_type,
             "granularity": granularity,
             "limit": str(limit),
         }
+        if start_time is not None:
+            params["startTime"] = str(start_time)
+        if end_time is not None:
+            params["endTime"] = str(end_time)
 
-        response = await self._request("GET", endpoint, params=params)
+        response = await self._request("GET", endpoint, params=params, priority=priority)
 
         logger.info(
             "fetched_historical_candles",
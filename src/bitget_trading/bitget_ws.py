@@ -10,10 +10,55 @@ import websockets
 from websockets.client import WebSocketClientProtocol
 
 from src.bitget_trading.logger import get_logger
+from src.bitget_trading.order_book import OrderBook, OrderBookEngine
 
 logger = get_logger()
 
 
+def parse_ticker(ticker: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a raw Bitget v2 ``ticker`` push into the internal ticker format.
+    
+    Args:
+        ticker: Single entry of the ticker channel ``data`` array
+    
+    Returns:
+        Ticker dict with the keys understood by ``SymbolState.update_ticker``
+    """
+    return {
+        "symbol": ticker.get("instId"),
+        "last_price": float(ticker.get("lastPr", 0)),
+        "bid_price": float(ticker.get("bidPr", 0)),
+        "ask_price": float(ticker.get("askPr", 0)),
+        "mark_price": float(ticker.get("markPrice", 0)),
+        "index_price": float(ticker.get("indexPrice", 0)),
+        "funding_rate": float(ticker.get("fundingRate", 0)),
+        "next_funding_time": int(ticker.get("nextFundingTime", 0)),
+        "volume_24h": float(ticker.get("baseVolume", 0)),
+        "quote_volume_24h": float(ticker.get("quoteVolume", 0)),
+        "open_interest": float(ticker.get("openInterest", 0)),
+        "timestamp": int(ticker.get("ts", 0)),
+    }
+
+
+def parse_orderbook(book: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a raw Bitget v2 ``books*`` push into the internal order book format.
+    
+    Args:
+        book: Single entry of the books channel ``data`` array
+    
+    Returns:
+        Order book dict with float ``[price, size]`` levels
+    """
+    return {
+        "bids": [[float(p), float(s)] for p, s in book.get("bids", [])],
+        "asks": [[float(p), float(s)] for p, s in book.get("asks", [])],
+        "timestamp": int(book.get("ts", 0)),
+        "checksum": book.get("checksum"),
+    }
+
+
 class BitgetWebSocketClient:
     """
     Bitget WebSocket client for USDT-M futures market data.
@@ -54,6 +99,7 @@ class BitgetWebSocketClient:
             "asks": [],
             "timestamp": 0,
         }
+        self.order_books = OrderBookEngine()
         
         # Message queue for processing
         self.message_queue: Deque[dict[str, Any]] = deque(maxlen=1000)
@@ -61,6 +107,7 @@ class BitgetWebSocketClient:
         # Callbacks
         self.on_ticker: Callable[[dict[str, Any]], None] | None = None
         self.on_orderbook: Callable[[dict[str, Any]], None] | None = None
+        self.on_book: Callable[[OrderBook], None] | None = None
         
         # Stats
         self.last_ping: float = 0
@@ -164,7 +211,7 @@ class BitgetWebSocketClient:
                 if channel == "ticker":
                     await self._handle_ticker(payload)
                 elif channel.startswith("books"):
-                    await self._handle_orderbook(payload)
+                    await self._handle_orderbook(payload, data.get("action", "snapshot"))
             
             self.messages_received += 1
             
@@ -181,23 +228,8 @@ class BitgetWebSocketClient:
         if not data:
             return
         
-        ticker = data[0]
-        
         # Update ticker storage
-        self.ticker_data = {
-            "symbol": ticker.get("instId"),
-            "last_price": float(ticker.get("lastPr", 0)),
-            "bid_price": float(ticker.get("bidPr", 0)),
-            "ask_price": float(ticker.get("askPr", 0)),
-            "mark_price": float(ticker.get("markPrice", 0)),
-            "index_price": float(ticker.get("indexPrice", 0)),
-            "funding_rate": float(ticker.get("fundingRate", 0)),
-            "next_funding_time": int(ticker.get("nextFundingTime", 0)),
-            "volume_24h": float(ticker.get("baseVolume", 0)),
-            "quote_volume_24h": float(ticker.get("quoteVolume", 0)),
-            "open_interest": float(ticker.get("openInterest", 0)),
-            "timestamp": int(ticker.get("ts", 0)),
-        }
+        self.ticker_data = parse_ticker(data[0])
         
         # Call callback if set
         if self.on_ticker:
@@ -210,29 +242,26 @@ class BitgetWebSocketClient:
             ask=self.ticker_data["ask_price"],
         )
 
-    async def _handle_orderbook(self, data: list[dict[str, Any]]) -> None:
+    async def _handle_orderbook(self, data: list[dict[str, Any]], action: str = "snapshot") -> None:
         """
         Handle order book data.
         
         Args:
             data: Order book data array
+            action: Push action ("snapshot" or "update")
         """
         if not data:
             return
         
-        book = data[0]
-        
         # Update orderbook storage
-        self.orderbook = {
-            "bids": [[float(p), float(s)] for p, s in book.get("bids", [])],
-            "asks": [[float(p), float(s)] for p, s in book.get("asks", [])],
-            "timestamp": int(book.get("ts", 0)),
-            "checksum": book.get("checksum"),
-        }
+        self.orderbook = parse_orderbook(data[0])
+        book = self.order_books.apply(self.symbol, action, data[0])
         
-        # Call callback if set
+        # Call callbacks if set
         if self.on_orderbook:
             self.on_orderbook(self.orderbook)
+        if self.on_book and book is not None:
+            self.on_book(book)
         
         logger.debug(
             "orderbook_updated",
@@ -0,0 +1,415 @@
+"""Columnar, memory-mapped store for historical candles."""
+
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+import pandas as pd
+
+from src.bitget_trading.logger import get_logger
+
+logger = get_logger()
+
+MAGIC = b"BGCANDL1"
+HEADER_WORDS = 8  # magic, n_rows, capacity, reserved...
+COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+DTYPES = {"timestamp": np.dtype("<i8"), **{c: np.dtype("<f8") for c in COLUMNS[1:]}}
+MIN_CAPACITY = 1024
+DAY_MS = 86_400_000
+
+# Legacy cache names: {symbol}_{tf}_{days}d.pkl, {symbol}_{tf}_{n}.pkl, {symbol}_{tf}.pkl
+LEGACY_PICKLE_RE = re.compile(r"^(?P<symbol>[A-Z0-9]+)_(?P<timeframe>\d+[mHDWM])(?:_\d+d?)?\.pkl$")
+
+
+def _capacity_for(n_rows: int) -> int:
+    """Room to append ~50% more bars before the file has to be rewritten."""
+    return max(MIN_CAPACITY, n_rows + n_rows // 2)
+
+
+class CandleStore:
+    """
+    One columnar file per symbol/timeframe plus a JSON catalog.
+
+    File layout (``{symbol}_{timeframe}.candles``): a 64-byte header (magic,
+    row count, capacity) followed by one fixed-size block per column
+    (timestamp int64, open/high/low/close/volume float64). Files are
+    memory-mapped read-only, so loading is a few syscalls and every process
+    reading the same symbol shares the OS page cache instead of holding its
+    own unpickled DataFrame.
+
+    New bars are written in place into the spare capacity and committed by
+    updating the row count last. Only when the capacity is exhausted (or
+    history is inserted before the stored tail) is the file rewritten, via
+    tmp + ``os.replace``.
+
+    ``catalog.json`` indexes every series (rows, first/last timestamp,
+    update time). A store has a single writer; any number of readers.
+    """
+
+    CATALOG_FILE = "catalog.json"
+
+    def __init__(self, root: str = "backtest_data") -> None:
+        """
+        Initialize candle store.
+
+        Args:
+            root: Store directory (shared with the legacy pickle cache)
+        """
+        self.root = Path(root)
+        self._maps: dict[str, tuple[int, np.memmap]] = {}  # key -> (inode, mapping)
+        self._catalog: dict[str, Any] | None = None
+        self._catalog_mtime = 0
+        self._defer_catalog = False
+
+    # ------------------------------------------------------------------ catalog
+
+    @staticmethod
+    def key(symbol: str, timeframe: str) -> str:
+        return f"{symbol}_{timeframe}"
+
+    def path(self, symbol: str, timeframe: str) -> Path:
+        return self.root / f"{self.key(symbol, timeframe)}.candles"
+
+    @property
+    def catalog(self) -> dict[str, Any]:
+        """Catalog contents, reloaded if another process rewrote it."""
+        return self._load_catalog()
+
+    def _load_catalog(self) -> dict[str, Any]:
+        catalog_file = self.root / self.CATALOG_FILE
+        try:
+            mtime = catalog_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = 0
+        if self._catalog is None or (mtime != self._catalog_mtime and not self._defer_catalog):
+            if mtime:
+                with open(catalog_file, "r") as f:
+                    self._catalog = json.load(f)
+            else:
+                self._catalog = {"version": 1, "series": {}, "imported": {}}
+            self._catalog_mtime = mtime
+        return self._catalog
+
+    def _save_catalog(self) -> None:
+        if self._defer_catalog:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        catalog_file = self.root / self.CATALOG_FILE
+        tmp_file = catalog_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(self.catalog, f, separators=(",", ":"))
+        os.replace(tmp_file, catalog_file)
+        self._catalog_mtime = catalog_file.stat().st_mtime_ns
+
+    @contextmanager
+    def bulk(self) -> Iterator["CandleStore"]:
+        """Batch many writes: the catalog is saved once at the end."""
+        self._load_catalog()  # load before deferring
+        self._defer_catalog = True
+        try:
+            yield self
+        finally:
+            self._defer_catalog = False
+            self._save_catalog()
+
+    def _index(self, symbol: str, timeframe: str, timestamps: np.ndarray) -> None:
+        entry = self.catalog["series"].setdefault(self.key(symbol, timeframe), {})
+        entry.update({
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "rows": int(len(timestamps)),
+            "start": int(timestamps[0]) if len(timestamps) else None,
+            "end": int(timestamps[-1]) if len(timestamps) else None,
+            "updated_at": time.time(),
+        })
+        self._save_catalog()
+
+    def set_meta(self, symbol: str, timeframe: str, **fields: Any) -> None:
+        """Attach extra fields to a stored series' catalog entry (e.g. download bookkeeping)."""
+        entry = self.catalog["series"].get(self.key(symbol, timeframe))
+        if entry is None:
+            return
+        entry.update(fields)
+        self._save_catalog()
+
+    def info(self, symbol: str, timeframe: str) -> dict[str, Any] | None:
+        """Catalog entry (rows, start/end ms, updated_at) or None."""
+        return self.catalog["series"].get(self.key(symbol, timeframe))
+
+    def series(self, timeframe: str | None = None) -> list[dict[str, Any]]:
+        """All catalog entries, optionally for one timeframe."""
+        entries = self.catalog["series"].values()
+        return [e for e in entries if timeframe is None or e["timeframe"] == timeframe]
+
+    def symbols(self, timeframe: str) -> list[str]:
+        """Symbols stored for a timeframe."""
+        return sorted(e["symbol"] for e in self.series(timeframe))
+
+    def timeframes(self, symbol: str) -> list[str]:
+        """Timeframes stored for a symbol."""
+        return sorted(e["timeframe"] for e in self.catalog["series"].values() if e["symbol"] == symbol)
+
+    # ------------------------------------------------------------------- files
+
+    def _map(self, symbol: str, timeframe: str, writable: bool = False) -> np.memmap | None:
+        """Memory-map a series file as int64 words (cached until the file is replaced)."""
+        path = self.path(symbol, timeframe)
+        try:
+            inode = path.stat().st_ino
+        except FileNotFoundError:
+            return None
+        key = self.key(symbol, timeframe)
+        cached = self._maps.get(key)
+        if cached is not None and cached[0] == inode and (not writable or cached[1].mode == "r+"):
+            return cached[1]
+
+        words = np.memmap(path, dtype="<i8", mode="r+" if writable else "r")
+        if words[:1].tobytes() != MAGIC:
+            raise ValueError(f"{path} is not a candle store file")
+        self._maps[key] = (inode, words)
+        return words
+
+    @staticmethod
+    def _columns(words: np.memmap, n_rows: int | None = None) -> dict[str, np.ndarray]:
+        capacity = int(words[2])
+        n = int(words[1]) if n_rows is None else n_rows
+        columns = {}
+        for i, name in enumerate(COLUMNS):
+            start = HEADER_WORDS + i * capacity
+            block = words[start : start + n]
+            columns[name] = block if name == "timestamp" else block.view(DTYPES[name])
+        return columns
+
+    def _write_file(self, symbol: str, timeframe: str, columns: dict[str, np.ndarray]) -> None:
+        """Write a complete series file with spare capacity (atomic replace)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        n_rows = len(columns["timestamp"])
+        capacity = _capacity_for(n_rows)
+        header = np.zeros(HEADER_WORDS, dtype="<i8")
+        header[0] = np.frombuffer(MAGIC, dtype="<i8")[0]
+        header[1] = n_rows
+        header[2] = capacity
+
+        path = self.path(symbol, timeframe)
+        tmp_path = path.with_suffix(".candles.tmp")
+        padding = bytes(8 * (capacity - n_rows))
+        with open(tmp_path, "wb") as f:
+            f.write(header.tobytes())
+            for name in COLUMNS:
+                f.write(np.ascontiguousarray(columns[name], dtype=DTYPES[name]).tobytes())
+                f.write(padding)
+        os.replace(tmp_path, path)
+        self._maps.pop(self.key(symbol, timeframe), None)
+
+    # ------------------------------------------------------------------ writes
+
+    @staticmethod
+    def _normalize(candles: pd.DataFrame | dict[str, Any]) -> dict[str, np.ndarray]:
+        """Columns sorted by timestamp, duplicate timestamps resolved to the last one."""
+        columns = {name: np.asarray(candles[name], dtype=DTYPES[name]) for name in COLUMNS}
+        timestamps = columns["timestamp"]
+        order = np.argsort(timestamps, kind="stable")
+        # Keep the last occurrence of each timestamp
+        sorted_ts = timestamps[order]
+        keep = np.append(sorted_ts[1:] != sorted_ts[:-1], True) if len(sorted_ts) else np.ones(0, bool)
+        return {name: col[order][keep] for name, col in columns.items()}
+
+    def write(self, symbol: str, timeframe: str, candles: pd.DataFrame | dict[str, Any]) -> int:
+        """
+        Replace a series.
+
+        Args:
+            symbol: Trading pair
+            timeframe: Candle timeframe ("1m", "5m", "1H", ...)
+            candles: DataFrame/mapping with timestamp, open, high, low, close, volume
+
+        Returns:
+            Rows stored
+        """
+        columns = self._normalize(candles)
+        self._write_file(symbol, timeframe, columns)
+        self._index(symbol, timeframe, columns["timestamp"])
+        return len(columns["timestamp"])
+
+    def append(self, symbol: str, timeframe: str, candles: pd.DataFrame | dict[str, Any]) -> int:
+        """
+        Merge new bars into a series (bars with a known timestamp are replaced).
+
+        Bars at or after the stored tail are written in place; anything else
+        (older bars, or no spare capacity) rewrites the file.
+
+        Returns:
+            Rows stored after the merge
+        """
+        new = self._normalize(candles)
+        if not len(new["timestamp"]):
+            info = self.info(symbol, timeframe)
+            return info["rows"] if info else 0
+
+        words = self._map(symbol, timeframe, writable=True)
+        if words is None:
+            return self.write(symbol, timeframe, new)
+
+        old = self._columns(words)
+        old_ts = old["timestamp"]
+        pos = int(np.searchsorted(old_ts, new["timestamp"][0]))
+        tail = old_ts[pos:]
+        n_rows = pos + len(new["timestamp"])
+        in_place = n_rows <= int(words[2]) and np.isin(tail, new["timestamp"]).all()
+
+        if in_place:
+            # Data first, row count last: readers never see a half-written bar
+            target = self._columns(words, n_rows)
+            for name in COLUMNS:
+                target[name][pos:] = new[name]
+            words.flush()
+            words[1] = n_rows
+            words.flush()
+            timestamps = target["timestamp"]
+        else:
+            merged = {name: np.concatenate([old[name], new[name]]) for name in COLUMNS}
+            self._maps.pop(self.key(symbol, timeframe), None)
+            del words, old, tail
+            columns = self._normalize(merged)
+            self._write_file(symbol, timeframe, columns)
+            timestamps = columns["timestamp"]
+            n_rows = len(timestamps)
+
+        self._index(symbol, timeframe, timestamps)
+        return n_rows
+
+    # ------------------------------------------------------------------- reads
+
+    def load_arrays(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ms: int | None = None,
+        end_ms: int | None = None,
+    ) -> dict[str, np.ndarray] | None:
+        """
+        Zero-copy column views for a time window.
+
+        Args:
+            symbol: Trading pair
+            timeframe: Candle timeframe
+            start_ms: First timestamp to include (default: series start)
+            end_ms: Last timestamp to include (default: series end)
+
+        Returns:
+            Read-only arrays keyed by column name, or None if not stored
+        """
+        words = self._map(symbol, timeframe)
+        if words is None:
+            return None
+        columns = self._columns(words)
+        timestamps = columns["timestamp"]
+        lo = 0 if start_ms is None else int(np.searchsorted(timestamps, start_ms, side="left"))
+        hi = len(timestamps) if end_ms is None else int(np.searchsorted(timestamps, end_ms, side="right"))
+        return {name: col[lo:hi] for name, col in columns.items()}
+
+    def load_frame(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ms: int | None = None,
+        end_ms: int | None = None,
+    ) -> pd.DataFrame:
+        """Window as a DataFrame (same columns as the old pickles; empty if not stored)."""
+        arrays = self.load_arrays(symbol, timeframe, start_ms, end_ms)
+        if arrays is None:
+            return pd.DataFrame(columns=list(COLUMNS))
+        return pd.DataFrame({name: np.array(col) for name, col in arrays.items()})
+
+    def load_recent(self, symbol: str, timeframe: str, days: float) -> pd.DataFrame:
+        """Last ``days`` days of the stored series (the old ``*_{days}d.pkl`` window)."""
+        entry = self.info(symbol, timeframe)
+        if entry is None or entry["end"] is None:
+            return pd.DataFrame(columns=list(COLUMNS))
+        return self.load_frame(symbol, timeframe, start_ms=entry["end"] - int(days * DAY_MS))
+
+    def load_many(
+        self,
+        symbols: list[str],
+        timeframe: str,
+        start_ms: int | None = None,
+        end_ms: int | None = None,
+        as_frame: bool = True,
+    ) -> dict[str, Any]:
+        """Load several symbols; missing ones are left out."""
+        data = {}
+        for symbol in symbols:
+            arrays = self.load_arrays(symbol, timeframe, start_ms, end_ms)
+            if arrays is None:
+                continue
+            data[symbol] = (
+                pd.DataFrame({name: np.array(col) for name, col in arrays.items()}) if as_frame else arrays
+            )
+        return data
+
+    # --------------------------------------------------------------- migration
+
+    def import_pickles(self, cache_dir: str | None = None) -> int:
+        """
+        Import legacy ``{symbol}_{tf}_{days}d.pkl`` DataFrames not imported yet.
+
+        Several pickles of the same symbol/timeframe are merged into one
+        series. Cheap to call repeatedly: already imported files are skipped.
+
+        Returns:
+            Number of pickle files imported
+        """
+        source = Path(cache_dir) if cache_dir is not None else self.root
+        if not source.exists():
+            return 0
+        imported = self.catalog.setdefault("imported", {})
+        pending = []
+        for pkl in sorted(source.glob("*.pkl")):
+            match = LEGACY_PICKLE_RE.match(pkl.name)
+            if match is None:
+                continue
+            mtime = pkl.stat().st_mtime
+            if imported.get(pkl.name) == mtime:
+                continue
+            pending.append((pkl, match["symbol"], match["timeframe"], mtime))
+        if not pending:
+            return 0
+
+        count = 0
+        with self.bulk():
+            for pkl, symbol, timeframe, mtime in pending:
+                try:
+                    df = pd.read_pickle(pkl)
+                    if len(df):
+                        self.append(symbol, timeframe, df)
+                    imported[pkl.name] = mtime
+                    count += 1
+                except Exception as e:
+                    logger.warning(f"⚠️ [CANDLE STORE] Could not import {pkl.name}: {e}")
+        logger.info(f"📦 [CANDLE STORE] Imported {count} legacy pickles into {self.root}")
+        return count
+
+
+def open_candle_store(root: str = "backtest_data") -> CandleStore:
+    """Store at ``root``, with any legacy pickles in that directory imported."""
+    store = CandleStore(root)
+    store.import_pickles()
+    return store
+
+
+if __name__ == "__main__":
+    import sys
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else "backtest_data"
+    started = time.perf_counter()
+    store = open_candle_store(directory)
+    logger.info(
+        f"✅ [CANDLE STORE] {len(store.series())} series in {store.root} "
+        f"({time.perf_counter() - started:.2f}s, "
+        f"{sum(e['rows'] for e in store.series()):,} candles)"
+    )
@@ -1,8 +1,10 @@
 """Configuration for Bitget trading system."""
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src.bitget_trading.order_book import CHECKSUM_LEVELS
+
 
 class TradingConfig(BaseSettings):
     """Trading configuration with type validation."""
@@ -47,6 +49,41 @@ class TradingConfig(BaseSettings):
     orderbook_levels: int = Field(default=5, ge=1, le=20)
     feature_interval_ms: int = Field(default=1000, ge=100, le=5000)
     
+    # Streaming Market Data (WebSocket hub replacing REST ticker polling)
+    ws_market_data_enabled: bool = Field(default=True, alias="WS_MARKET_DATA_ENABLED")
+    ws_max_channels_per_connection: int = Field(default=100, ge=1, le=1000, alias="WS_MAX_CHANNELS_PER_CONNECTION")
+    ws_max_silence_sec: float = Field(default=5.0, gt=0, alias="WS_MAX_SILENCE_SEC")  # Fall back to REST after this
+    ws_book_channel: str = Field(default="books", alias="WS_BOOK_CHANNEL")  # "books" (incremental + checksum), "books15"/"books5" (snapshots)
+    order_book_max_levels: int = Field(default=200, ge=5, le=1000, alias="ORDER_BOOK_MAX_LEVELS")  # Levels kept per side/symbol
+    ws_private_enabled: bool = Field(default=True, alias="WS_PRIVATE_ENABLED")  # Orders/positions/account over the private stream
+    ws_fill_timeout_sec: float = Field(default=3.0, gt=0, alias="WS_FILL_TIMEOUT_SEC")  # Max wait for a pushed fill before polling REST
+    
+    # Event-Driven Trading Loop
+    event_rank_min_interval_sec: float = Field(default=0.1, ge=0, alias="EVENT_RANK_MIN_INTERVAL_SEC")  # Min spacing of data-triggered rankings
+    event_rank_max_interval_sec: float = Field(default=1.0, gt=0, alias="EVENT_RANK_MAX_INTERVAL_SEC")  # Ranking/full exit sweep cadence without new data
+    event_max_pending_symbols: int = Field(default=5000, ge=1, alias="EVENT_MAX_PENDING_SYMBOLS")  # Backpressure: degrade to full sweep beyond this
+    
+    # REST Transport
+    rest_transport: str = Field(default="requests", alias="REST_TRANSPORT")  # "requests" (thread pool) or "aiohttp" (native asyncio)
+    rest_pool_size: int = Field(default=100, ge=1, alias="REST_POOL_SIZE")  # Max pooled connections (aiohttp)
+    rest_pool_per_host: int = Field(default=32, ge=1, alias="REST_POOL_PER_HOST")  # Max concurrent connections per host (aiohttp)
+    rest_keepalive_sec: float = Field(default=30.0, gt=0, alias="REST_KEEPALIVE_SEC")  # Idle keep-alive before closing (aiohttp)
+    rest_rate_limit_enabled: bool = Field(default=True, alias="REST_RATE_LIMIT_ENABLED")  # Shared client-side token buckets per endpoint group
+    contract_catalog_path: str = Field(default="contract_catalog.json", alias="CONTRACT_CATALOG_PATH")  # Contract specs snapshot ("" = memory only)
+    contract_catalog_ttl_sec: float = Field(default=3600.0, gt=0, alias="CONTRACT_CATALOG_TTL_SEC")  # Background refresh age of the contract catalog
+    leverage_bootstrap_concurrency: int = Field(default=8, ge=1, alias="LEVERAGE_BOOTSTRAP_CONCURRENCY")  # Startup set-leverage calls in flight
+    
+    # Warm Start (per-symbol state snapshot)
+    state_snapshot_enabled: bool = Field(default=True, alias="STATE_SNAPSHOT_ENABLED")
+    state_snapshot_dir: str = Field(default="data/state_snapshot", alias="STATE_SNAPSHOT_DIR")
+    state_snapshot_interval_sec: float = Field(default=300.0, gt=0, alias="STATE_SNAPSHOT_INTERVAL_SEC")  # Periodic write (plus one on shutdown)
+    state_snapshot_max_age_sec: float = Field(default=3600.0, gt=0, alias="STATE_SNAPSHOT_MAX_AGE_SEC")  # Older snapshots are ignored (full history download)
+    position_flush_interval_ms: float = Field(default=250.0, ge=0, alias="POSITION_FLUSH_INTERVAL_MS")  # Max delay before price-only position changes hit disk
+    
+    # Trade Journal
+    trade_journal_fsync: str = Field(default="batch", alias="TRADE_JOURNAL_FSYNC")  # "never", "batch" (every write batch) or "interval"
+    trade_journal_max_mb: float = Field(default=64.0, gt=0, alias="TRADE_JOURNAL_MAX_MB")  # Journal size that triggers rotation (also rotated daily)
+    
     # Exchange Parameters
     taker_fee: float = Field(default=0.0006)  # 0.06% Bitget taker
     maker_fee: float = Field(default=0.0002)  # 0.02% Bitget maker
@@ -90,6 +127,16 @@ class TradingConfig(BaseSettings):
     min_entry_score: float = Field(default=2.0, ge=1.0, le=5.0, alias="MIN_ENTRY_SCORE")  # Minimum score to enter trade (balanced: was 2.5)
     min_entry_score_short: float = Field(default=1.8, ge=1.0, le=5.0, alias="MIN_ENTRY_SCORE_SHORT")  # Slightly lower for shorts (was 2.0)
 
+    @model_validator(mode="after")
+    def _check_book_levels(self) -> "TradingConfig":
+        """A ``books`` feed is checksummed over the top 25 levels, so keep at least that many."""
+        if self.ws_book_channel == "books" and self.order_book_max_levels < CHECKSUM_LEVELS:
+            raise ValueError(
+                f"ORDER_BOOK_MAX_LEVELS must be >= {CHECKSUM_LEVELS} with WS_BOOK_CHANNEL=books "
+                f"(got {self.order_book_max_levels})"
+            )
+        return self
+
     def validate_credentials(self) -> bool:
         """Check if API credentials are set."""
         return bool(
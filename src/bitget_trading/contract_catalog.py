@@ -0,0 +1,266 @@
+"""Indexed catalog of Bitget contract specifications."""
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from decimal import ROUND_DOWN, Decimal
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from .logger import get_logger
+
+logger = get_logger()
+
+# Fetches the raw contract list for a product type (GET /api/v2/mix/market/contracts)
+ContractFetcher = Callable[[str], Awaitable[list[dict[str, Any]]]]
+
+
+def _to_float(value: Any, default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _to_int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass(frozen=True)
+class ContractSpec:
+    """Trading rules of one contract."""
+
+    symbol: str
+    base_coin: str
+    quote_coin: str
+    price_place: int  # Price decimals
+    price_end_step: float  # Last-digit step, e.g. 5 with price_place=2 -> 0.05 tick
+    volume_place: int  # Size decimals
+    size_multiplier: float  # Size step
+    min_trade_num: float  # Minimum order size (contracts)
+    max_leverage: int
+    status: str
+    raw: dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def from_api(cls, contract: dict[str, Any]) -> "ContractSpec":
+        """Build from one entry of the contracts endpoint."""
+        return cls(
+            symbol=contract.get("symbol", ""),
+            base_coin=contract.get("baseCoin", ""),
+            quote_coin=contract.get("quoteCoin", ""),
+            price_place=_to_int(contract.get("pricePlace"), 4),
+            # Missing/zero step -> 1: one unit of the last price decimal, i.e. plain decimal rounding
+            price_end_step=_to_float(contract.get("priceEndStep"), 0.0) or 1.0,
+            volume_place=_to_int(contract.get("volumePlace"), 4),
+            size_multiplier=_to_float(contract.get("sizeMultiplier"), 0.0),
+            min_trade_num=_to_float(contract.get("minTradeNum"), 0.0),
+            max_leverage=_to_int(contract.get("maxLeverage"), 125),
+            status=contract.get("symbolStatus", ""),
+            raw=contract,
+        )
+
+    @property
+    def is_active(self) -> bool:
+        return self.status == "normal"
+
+    @property
+    def tick_size(self) -> float:
+        """Minimum price increment."""
+        return self.price_end_step / 10 ** self.price_place
+
+    def round_price(self, price: float) -> float:
+        """Round a price to the nearest valid tick."""
+        ticks = round(price / self.tick_size)
+        return round(ticks * self.tick_size, self.price_place)
+
+    def round_size(self, size: float) -> float:
+        """Round a size down to the size step (never up, so it stays within the position)."""
+        quantum = Decimal(1).scaleb(-self.volume_place)
+        rounded = float(Decimal(str(size)).quantize(quantum, rounding=ROUND_DOWN))
+        if self.size_multiplier > 0:
+            step = Decimal(str(self.size_multiplier))
+            rounded = float((Decimal(str(rounded)) // step) * step)
+        return rounded
+
+    def as_info(self) -> dict[str, Any]:
+        """Legacy ``UniverseManager.contract_info`` layout."""
+        return {
+            "base_coin": self.base_coin,
+            "quote_coin": self.quote_coin,
+            "size_multiplier": self.size_multiplier,
+            "min_trade_num": self.min_trade_num,
+            "price_place": self.price_place,
+            "volume_place": self.volume_place,
+            "max_leverage": self.max_leverage,
+            "status": self.status,
+        }
+
+
+class ContractCatalog:
+    """
+    Contract specifications for all symbols, fetched in one bulk call.
+
+    Lookups are dict hits. The catalog is seeded from an on-disk snapshot at
+    startup, re-fetched in the background once older than ``ttl_sec`` (stale
+    entries keep being served meanwhile), and re-fetched early when a symbol
+    is missing, e.g. after a new listing.
+    """
+
+    def __init__(
+        self,
+        fetcher: ContractFetcher,
+        snapshot_path: str | None = "contract_catalog.json",
+        ttl_sec: float = 3600.0,
+        miss_refresh_sec: float = 60.0,
+    ) -> None:
+        """
+        Initialize contract catalog.
+
+        Args:
+            fetcher: Coroutine returning the raw contract list for a product type
+            snapshot_path: JSON snapshot for instant startup (None = memory only)
+            ttl_sec: Age after which the catalog is refreshed in the background
+            miss_refresh_sec: Minimum age before a lookup miss triggers a refresh
+        """
+        self.fetcher = fetcher
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.ttl_sec = ttl_sec
+        self.miss_refresh_sec = miss_refresh_sec
+
+        # product_type -> symbol -> spec
+        self._specs: dict[str, dict[str, ContractSpec]] = {}
+        self._fetched_at: dict[str, float] = {}  # wall-clock, survives restarts via the snapshot
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self.fetch_count: int = 0
+
+        self._load_snapshot()
+
+    @staticmethod
+    def _key(product_type: str) -> str:
+        return product_type.lower().replace("_", "-")
+
+    def _load_snapshot(self) -> None:
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return
+        try:
+            with open(self.snapshot_path, "r") as f:
+                snapshot = json.load(f)
+            for key, entry in snapshot.items():
+                self._index(key, entry["contracts"], entry["fetched_at"])
+            logger.info(
+                f"📂 [CONTRACTS] Loaded snapshot with "
+                f"{sum(len(specs) for specs in self._specs.values())} contracts from {self.snapshot_path}"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ [CONTRACTS] Failed to load snapshot: {e}")
+
+    def _save_snapshot(self) -> None:
+        if self.snapshot_path is None:
+            return
+        snapshot = {
+            key: {
+                "fetched_at": self._fetched_at[key],
+                "contracts": [spec.raw for spec in specs.values()],
+            }
+            for key, specs in self._specs.items()
+        }
+        tmp_path = self.snapshot_path.with_suffix(self.snapshot_path.suffix + ".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception as e:
+            logger.error(f"❌ [CONTRACTS] Failed to save snapshot: {e}")
+
+    def _index(self, key: str, contracts: list[dict[str, Any]], fetched_at: float) -> None:
+        specs = {}
+        for contract in contracts:
+            spec = ContractSpec.from_api(contract)
+            if spec.symbol:
+                specs[spec.symbol] = spec
+        self._specs[key] = specs
+        self._fetched_at[key] = fetched_at
+
+    def age(self, product_type: str = "USDT-FUTURES") -> float:
+        """Seconds since the last successful fetch (inf if never fetched)."""
+        fetched_at = self._fetched_at.get(self._key(product_type))
+        return float("inf") if fetched_at is None else time.time() - fetched_at
+
+    async def refresh(self, product_type: str = "USDT-FUTURES") -> bool:
+        """
+        Fetch the full contract list now.
+
+        Concurrent callers share one in-flight request.
+
+        Returns:
+            True if the catalog was updated
+        """
+        key = self._key(product_type)
+        task = self._refreshing.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._fetch(key))
+            self._refreshing[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: str) -> bool:
+        try:
+            contracts = await self.fetcher(key)
+        except Exception as e:
+            logger.error(f"❌ [CONTRACTS] Fetch failed for {key}: {e}")
+            return False
+        if not contracts:
+            logger.warning(f"⚠️ [CONTRACTS] Empty contract list for {key}, keeping previous catalog")
+            return False
+
+        self.fetch_count += 1
+        self._index(key, contracts, time.time())
+        self._save_snapshot()
+        logger.info("contracts_fetched", product_type=key, total_contracts=len(self._specs[key]))
+        return True
+
+    async def ensure_loaded(self, product_type: str = "USDT-FUTURES") -> None:
+        """Fetch if empty; schedule a background refresh if older than the TTL."""
+        key = self._key(product_type)
+        if key not in self._specs:
+            await self.refresh(product_type)
+        elif self.age(product_type) > self.ttl_sec:
+            task = self._refreshing.get(key)
+            if task is None or task.done():
+                self._refreshing[key] = asyncio.ensure_future(self._fetch(key))
+
+    async def get(self, symbol: str, product_type: str = "USDT-FUTURES") -> ContractSpec | None:
+        """
+        Spec of ``symbol``, fetching the catalog when needed.
+
+        Returns:
+            ContractSpec, or None if the exchange does not list the symbol
+        """
+        await self.ensure_loaded(product_type)
+        spec = self.get_cached(symbol, product_type)
+        if spec is None and self.age(product_type) > self.miss_refresh_sec:
+            # Possibly listed after the last fetch
+            await self.refresh(product_type)
+            spec = self.get_cached(symbol, product_type)
+        return spec
+
+    def get_cached(self, symbol: str, product_type: str = "USDT-FUTURES") -> ContractSpec | None:
+        """Spec of ``symbol`` from the current catalog, without any I/O."""
+        return self._specs.get(self._key(product_type), {}).get(symbol)
+
+    def specs(self, product_type: str = "USDT-FUTURES") -> dict[str, ContractSpec]:
+        """All cached specs of a product type (read-only)."""
+        return self._specs.get(self._key(product_type), {})
+
+    async def run_refresh_loop(self, product_type: str = "USDT-FUTURES") -> None:
+        """Refresh every ``ttl_sec`` until cancelled."""
+        while True:
+            await asyncio.sleep(max(0.0, self.ttl_sec - self.age(product_type)))
+            if self.age(product_type) >= self.ttl_sec and not await self.refresh(product_type):
+                # Keep serving the stale catalog, retry soon
+                await asyncio.sleep(min(self.ttl_sec, self.miss_refresh_sec))
@@ -2,6 +2,7 @@
 
 import numpy as np
 
+from src.bitget_trading.feature_matrix import FeatureMatrix
 from src.bitget_trading.logger import get_logger
 from src.bitget_trading.multi_symbol_state import MultiSymbolStateManager, SymbolState
 from src.bitget_trading.pro_trader_indicators import ProTraderIndicators, is_near_level
@@ -10,6 +11,38 @@ from src.bitget_trading.technical_indicators import TechnicalIndicators
 
 logger = get_logger()
 
+# Lookup tables for the vectorized screen (mirror check_multi_timeframe_confluence
+# and EnhancedRanker._check_entry_gates; regime order: trending, breakout, volatile, ranging)
+CONFLUENCE_RETURN_COLUMNS = (
+    "return_1s",
+    "return_3s",
+    "return_5s",
+    "return_10s",
+    "return_15s",
+    "return_30s",
+    "return_1min",
+)
+CONFLUENCE_TIMEFRAME_WEIGHTS = np.array([0.5, 0.7, 1.0, 1.3, 1.5, 2.0, 3.0])
+REGIME_CODES = {"trending": 0, "breakout": 1, "volatile": 2, "ranging": 3}
+REGIME_RANGING = REGIME_CODES["ranging"]
+REGIME_AGREEMENT_LONG = np.array([0.75, 0.75, 0.85, 0.75])
+REGIME_AGREEMENT_SHORT = np.array([0.60, 0.60, 0.70, 0.60])
+REGIME_MIN_CONFLUENCE_STRENGTH = np.array([0.0010, 0.0006, 0.0015, 0.0008])
+REGIME_MIN_FEE_MULTIPLIER = np.array([2.0, 1.5, 3.0, 2.0])
+
+SCREEN_REASONS = (
+    "passed",
+    "no_data",
+    "no_volume_confirmation",
+    "orderbook_conflict",
+    "insufficient_agreement",
+    "weak_confluence_for_regime",
+    "profit_below_fees",
+    "wide_spread",
+    "weak_momentum",
+)
+SCREEN_PASSED = 0
+
 
 class EnhancedRanker:
     """
@@ -131,6 +164,7 @@ class EnhancedRanker:
             orderbook_validated = True  # Auto-pass
         else:
             orderbook_threshold = 0.05  # 5% imbalance minimum for real data
+            orderbook_validated = False  # Real data must confirm direction
 
         # Weighted timeframe analysis
         weighted_sum_bullish = 0.0
@@ -334,11 +368,10 @@ class EnhancedRanker:
             (score, predicted_side, metadata)
         """
         # 🔥 STEP 1: Detect market regime FIRST (needed for adaptive confluence)
-        price_history = list(state.price_history)
         volatility = features.get("volatility_60s", 0.01)
         volume_ratio = features.get("volume_ratio", 1.0)
         regime = self.regime_detector.detect_regime(
-            price_history, volatility * 100, volume_ratio
+            state.history.prices(), volatility * 100, volume_ratio
         )
 
         # 🔥 STEP 2: Multi-timeframe confluence with 6-layer validation
@@ -366,6 +399,24 @@ class EnhancedRanker:
                 {"reason": reason, "confluence_metadata": confluence_metadata},
             )
 
+        # 🔥 STEPS 3-4 + spread/momentum filters (shared with the vectorized path)
+        rejection = self._check_entry_gates(regime, confluence_strength, features)
+        if rejection:
+            return 0.0, "neutral", rejection
+
+        return self._score_confirmed_signal(
+            state, features, regime, direction, confluence_strength, confluence_metadata
+        )
+
+    def _check_entry_gates(
+        self, regime: str, confluence_strength: float, features: dict[str, float]
+    ) -> dict | None:
+        """
+        Regime, fee, spread and momentum filters applied after confluence.
+
+        Returns:
+            Rejection metadata, or None if the signal passes
+        """
         # 🔥 STEP 3: ADAPTIVE confluence strength threshold (regime-aware)
         # Different regimes require different signal quality
         if regime == "trending":
@@ -382,16 +433,12 @@ class EnhancedRanker:
             min_confluence_strength = 0.0008  # 0.08% = 2.0% capital @ 25x
 
         if confluence_strength < min_confluence_strength:
-            return (
-                0.0,
-                "neutral",
-                {
-                    "reason": "weak_confluence_for_regime",
-                    "regime": regime,
-                    "strength": confluence_strength,
-                    "required": min_confluence_strength,
-                },
-            )
+            return {
+                "reason": "weak_confluence_for_regime",
+                "regime": regime,
+                "strength": confluence_strength,
+                "required": min_confluence_strength,
+            }
 
         # 🔥 STEP 4: FEE-ADJUSTED FILTER (adaptive per regime)
         leverage = 25  # From env
@@ -409,17 +456,44 @@ class EnhancedRanker:
         min_expected_return = fee_cost * min_fee_multiplier
 
         if expected_capital_return < min_expected_return:
-            return (
-                0.0,
-                "neutral",
-                {
-                    "reason": "profit_below_fees",
-                    "regime": regime,
-                    "expected": expected_capital_return,
-                    "required": min_expected_return,
-                },
-            )
+            return {
+                "reason": "profit_below_fees",
+                "regime": regime,
+                "expected": expected_capital_return,
+                "required": min_expected_return,
+            }
+
+        # Liquidity (STRICT: Need tight spreads for quality)
+        spread_bps = features.get("spread_bps", 100.0)
+        if spread_bps > 30.0:  # Skip if spread > 30 bps (want tighter spreads!)
+            return {"reason": "wide_spread"}
+
+        # Momentum threshold (STRICT: Need strong momentum!)
+        # For quality trades, need meaningful price movement
+        return_5s = features.get("return_5s", 0.0)
+        return_15s = features.get("return_15s", 0.0)
+        if (
+            abs(return_5s) < 0.0012 and abs(return_15s) < 0.0018
+        ):  # STRICTER: Need even stronger momentum!
+            return {"reason": "weak_momentum"}
+
+        return None
+
+    def _score_confirmed_signal(
+        self,
+        state: SymbolState,
+        features: dict[str, float],
+        regime: str,
+        direction: str,
+        confluence_strength: float,
+        confluence_metadata: dict,
+    ) -> tuple[float, str, dict]:
+        """
+        Indicator, bandit and trade-quality scoring for a signal that passed all gates.
 
+        Returns:
+            (score, predicted_side, metadata)
+        """
         # 🔥 STEP 5: Volume already validated in confluence check (Layer 2)
         # Extract for metadata and apply high-conviction boost
         volume_ratio = confluence_metadata.get("volume_ratio", 1.0)
@@ -450,20 +524,10 @@ class EnhancedRanker:
         else:
             volatility_score = 0.0
 
-        # 7. Liquidity score (STRICT: Need tight spreads for quality)
+        # 7. Liquidity score (spread already filtered in _check_entry_gates)
         spread_bps = features.get("spread_bps", 100.0)
-        if spread_bps > 30.0:  # Skip if spread > 30 bps (want tighter spreads!)
-            return 0.0, "neutral", {"reason": "wide_spread"}
         spread_score = max(0, 1 - spread_bps / 30.0)
 
-        # 8. Momentum threshold (STRICT: Need strong momentum!)
-        # For quality trades, need meaningful price movement
-        return_5s = features.get("return_5s", 0.0)
-        if (
-            abs(return_5s) < 0.0012 and abs(return_15s) < 0.0018
-        ):  # STRICTER: Need even stronger momentum!
-            return 0.0, "neutral", {"reason": "weak_momentum"}
-
         # 9. Funding rate bias (EXPLOIT FUNDING!)
         funding_rate = features.get("funding_rate", 0.0)
         funding_bias = 0.0
@@ -611,11 +675,7 @@ class EnhancedRanker:
                 indicator_scores_aggregated[key] /= total_timeframe_weight
         
         # Calculate Order Flow (use price history, not candles)
-        prices_history = (
-            np.array([p for _, p in state.price_history])
-            if state.price_history
-            else np.array([])
-        )
+        prices_history = state.history.prices()
         if len(prices_history) >= 20:
             volumes = features.get("volume_ratio", 1.0)
             if volumes > 0:
@@ -914,6 +974,165 @@ class EnhancedRanker:
 
         return final_score, direction, metadata
 
+    def screen_candidates(
+        self,
+        matrix: FeatureMatrix,
+        state_manager: MultiSymbolStateManager,
+    ) -> tuple[list[dict], dict[str, int]]:
+        """
+        Vectorized confluence and entry gates for every symbol at once.
+
+        Applies the rules of ``check_multi_timeframe_confluence`` and
+        ``_check_entry_gates`` as array operations over the feature matrix.
+        Regimes are only detected for symbols that pass the data and volume
+        gates, since the regime does not affect those.
+
+        Args:
+            matrix: Feature matrix from ``MultiSymbolStateManager.get_feature_matrix``
+            state_manager: State manager (price history for regime detection)
+
+        Returns:
+            (candidates, skip_counts): candidates carry symbol, regime, direction,
+            strength and confluence_metadata; skip_counts maps reason -> symbols
+        """
+        n = len(matrix)
+        if n == 0:
+            return [], {}
+
+        values = matrix.values
+        index = matrix.column_index
+
+        def column(name: str, default: float) -> np.ndarray:
+            data = values[:, index[name]]
+            return np.where(np.isnan(data), default, data)
+
+        returns = values[:, [index[name] for name in CONFLUENCE_RETURN_COLUMNS]]
+        available = ~np.isnan(returns) & (returns != 0)
+        returns = np.where(available, returns, 0.0)
+        n_available = available.sum(axis=1)
+
+        volume_ratio = column("volume_ratio", 1.0)
+        ob_imbalance = column("ob_imbalance", 0.0)
+        volatility = column("volatility_60s", 0.01)
+
+        reason = np.full(n, SCREEN_PASSED, dtype=np.int8)
+        reason[n_available == 0] = SCREEN_REASONS.index("no_data")
+        reason[(reason == SCREEN_PASSED) & (volume_ratio < 2.5)] = SCREEN_REASONS.index(
+            "no_volume_confirmation"
+        )
+
+        # Regime detection needs the price history, so it stays per symbol
+        regimes: dict[int, str] = {}
+        regime_code = np.full(n, REGIME_RANGING, dtype=np.intp)
+        for row in np.flatnonzero(reason == SCREEN_PASSED):
+            state = state_manager.get_state(matrix.symbols[row])
+            if state is None:
+                continue
+            regime = self.regime_detector.detect_regime(
+                state.history.prices(), float(volatility[row]) * 100, float(volume_ratio[row])
+            )
+            regimes[row] = regime
+            regime_code[row] = REGIME_CODES.get(regime, REGIME_RANGING)
+
+        # Layer 1: weighted timeframe agreement
+        weights = np.where(available, CONFLUENCE_TIMEFRAME_WEIGHTS, 0.0)
+        total_weight = weights.sum(axis=1)
+        bullish = available & (returns > 0.00005)
+        bearish = available & (returns < -0.00005)
+        bullish_count = bullish.sum(axis=1)
+        bearish_count = bearish.sum(axis=1)
+
+        safe_weight = np.where(total_weight > 0, total_weight, 1.0)
+        weighted_avg_bullish = np.where(bullish, returns * weights, 0.0).sum(axis=1) / safe_weight
+        weighted_avg_bearish = np.where(bearish, np.abs(returns) * weights, 0.0).sum(axis=1) / safe_weight
+
+        # Layer 4: regime-aware agreement thresholds
+        required_long = np.maximum(2, np.floor(n_available * REGIME_AGREEMENT_LONG[regime_code]))
+        required_short = np.maximum(2, np.floor(n_available * REGIME_AGREEMENT_SHORT[regime_code]))
+        strong_bearish = bearish_count >= np.floor(n_available * 0.60)
+
+        # Layer 6: momentum acceleration (first two vs last two available timeframes)
+        order = np.argsort(~available, axis=1, kind="stable")
+        compact = np.abs(np.take_along_axis(returns, order, axis=1))
+        rows = np.arange(n)
+        short_term_avg = (compact[:, 0] + compact[:, 1]) / 2
+        long_term_avg = (
+            compact[rows, np.maximum(n_available - 2, 0)] + compact[rows, np.maximum(n_available - 1, 0)]
+        ) / 2
+        accelerating = (n_available >= 3) & (long_term_avg > short_term_avg * 1.2)
+
+        # Layer 3: orderbook confirmation (flat book = simulated data, auto-pass)
+        simulated = np.abs(ob_imbalance) < 0.001
+        long_signal = bullish_count >= required_long
+        short_signal = ~long_signal & (bearish_count >= required_short)
+        long_confirmed = simulated | (ob_imbalance < -0.05)
+        short_confirmed = simulated | (ob_imbalance > 0.05) | (strong_bearish & (ob_imbalance > -0.1))
+
+        active = reason == SCREEN_PASSED
+        reason[active & ((long_signal & ~long_confirmed) | (short_signal & ~short_confirmed))] = (
+            SCREEN_REASONS.index("orderbook_conflict")
+        )
+        reason[active & ~long_signal & ~short_signal] = SCREEN_REASONS.index("insufficient_agreement")
+
+        strength = np.where(long_signal, weighted_avg_bullish, weighted_avg_bearish)
+        strength = np.where(accelerating, strength * 1.3, strength)
+
+        # Entry gates: regime strength, fees, spread, momentum
+        gates = (
+            ("weak_confluence_for_regime", strength < REGIME_MIN_CONFLUENCE_STRENGTH[regime_code]),
+            ("profit_below_fees", strength * 25 < 0.0004 * REGIME_MIN_FEE_MULTIPLIER[regime_code]),
+            ("wide_spread", column("spread_bps", 100.0) > 30.0),
+            (
+                "weak_momentum",
+                (np.abs(column("return_5s", 0.0)) < 0.0012) & (np.abs(column("return_15s", 0.0)) < 0.0018),
+            ),
+        )
+        for name, rejected in gates:
+            reason[(reason == SCREEN_PASSED) & rejected] = SCREEN_REASONS.index(name)
+
+        counts = np.bincount(reason, minlength=len(SCREEN_REASONS))
+        skip_counts = {
+            name: int(count) for name, count in zip(SCREEN_REASONS, counts) if name != "passed" and count
+        }
+
+        candidates = []
+        for row in np.flatnonzero(reason == SCREEN_PASSED):
+            symbol = matrix.symbols[row]
+            features = matrix.features[symbol]
+            is_long = bool(long_signal[row])
+            orderbook_confirmed = bool(
+                simulated[row] or (ob_imbalance[row] < -0.05 if is_long else ob_imbalance[row] > 0.05)
+            )
+            confluence_metadata = {
+                "volume_ratio": features.get("volume_ratio", 1.0),
+                "ob_imbalance": features.get("ob_imbalance", 0.0),
+                "momentum_accelerating": bool(accelerating[row]),
+                "regime": regimes[row],
+                "bullish_count": int(bullish_count[row]),
+                "bearish_count": int(bearish_count[row]),
+                "total_timeframes": int(n_available[row]),
+                "required_agreement_long": int(required_long[row]),
+                "required_agreement_short": int(required_short[row]),
+                "orderbook_confirmed": orderbook_confirmed,
+                "simulated_orderbook": bool(simulated[row]),
+            }
+            if accelerating[row]:
+                confluence_metadata["momentum_boost"] = True
+            if not is_long and strong_bearish[row] and not orderbook_confirmed:
+                confluence_metadata["confluence_override"] = True
+
+            candidates.append(
+                {
+                    "symbol": symbol,
+                    "regime": regimes[row],
+                    "direction": "long" if is_long else "short",
+                    "strength": float(strength[row]),
+                    "confluence_metadata": confluence_metadata,
+                }
+            )
+
+        return candidates, skip_counts
+
     def calculate_smart_position_size(
         self,
         base_size: float,
@@ -963,14 +1182,25 @@ class EnhancedRanker:
         self,
         state_manager: MultiSymbolStateManager,
         top_k: int = 10,
+        vectorized: bool = True,
     ) -> list[dict]:
         """
         Enhanced ranking with all improvements.
 
+        Args:
+            state_manager: State manager with all symbols
+            top_k: Maximum number of symbols returned
+            vectorized: Screen all symbols at once on the feature matrix and run
+                per-symbol scoring only for survivors (False = scalar path)
+
         Returns:
             List of dicts with symbol, score, side, metadata, position_size_multiplier
         """
-        all_features = state_manager.get_all_features()
+        if vectorized:
+            feature_matrix = state_manager.get_feature_matrix()
+            all_features = feature_matrix.features
+        else:
+            all_features = state_manager.get_all_features()
 
         logger.debug(f"🔍 Analyzing {len(all_features)} symbols for ranking")
 
@@ -998,16 +1228,35 @@ class EnhancedRanker:
             "not_A_grade": 0,
         }
 
-        for symbol, features in all_features.items():
-            state = state_manager.get_state(symbol)
-            if not state:
-                continue
+        scored_inputs: list[tuple[str, dict[str, float], tuple[float, str, dict]]] = []
+        if vectorized:
+            candidates, screened = self.screen_candidates(feature_matrix, state_manager)
+            for reason, count in screened.items():
+                skip_reasons[reason] = skip_reasons.get(reason, 0) + count
+
+            for candidate in candidates:
+                symbol = candidate["symbol"]
+                features = all_features[symbol]
+                result = self._score_confirmed_signal(
+                    state_manager.get_state(symbol),
+                    features,
+                    candidate["regime"],
+                    candidate["direction"],
+                    candidate["strength"],
+                    candidate["confluence_metadata"],
+                )
+                scored_inputs.append((symbol, features, result))
+        else:
+            for symbol, features in all_features.items():
+                state = state_manager.get_state(symbol)
+                if not state:
+                    continue
 
-            # Compute enhanced score
-            score, direction, metadata = self.compute_enhanced_score(
-                state, features, btc_return
-            )
+                # Compute enhanced score
+                result = self.compute_enhanced_score(state, features, btc_return)
+                scored_inputs.append((symbol, features, result))
 
+        for symbol, features, (score, direction, metadata) in scored_inputs:
             if score <= 0:
                 # Track why symbols are being skipped
                 reason = metadata.get("reason", "low_score")
@@ -0,0 +1,163 @@
+"""Event-driven scheduling of exit checks and ranking from market-data arrival."""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque
+
+import numpy as np
+
+from src.bitget_trading.logger import get_logger
+
+logger = get_logger()
+
+
+@dataclass
+class SchedulerBatch:
+    """Work handed to the trading loop for one wake-up."""
+
+    symbols: set[str] = field(default_factory=set)  # Symbols with new market data
+    full_check: bool = False  # Evaluate every position (cadence elapsed or queue overflow)
+    rank_due: bool = False  # Ranking may run in this iteration
+    oldest_event_time: float = 0.0  # monotonic time of the oldest coalesced update
+
+
+class EventScheduler:
+    """
+    Coalescing dirty-symbol queue that wakes the trading loop only when needed.
+
+    Market-data callbacks call ``mark_dirty``; the loop awaits ``next_batch``.
+    Repeated updates for the same symbol collapse into one entry, so a slow
+    consumer sees fewer, larger batches instead of an unbounded backlog. When
+    more than ``max_pending`` distinct symbols are waiting the queue is
+    dropped and the next batch is flagged as a full check.
+    """
+
+    def __init__(
+        self,
+        rank_min_interval_sec: float = 0.1,
+        rank_max_interval_sec: float = 1.0,
+        max_pending: int = 5000,
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            rank_min_interval_sec: Minimum spacing between data-triggered rankings
+            rank_max_interval_sec: Cadence for ranking/full checks without new data
+            max_pending: Distinct dirty symbols kept before degrading to a full check
+        """
+        self.rank_min_interval_sec = rank_min_interval_sec
+        self.rank_max_interval_sec = rank_max_interval_sec
+        self.max_pending = max_pending
+
+        self._pending: dict[str, float] = {}  # symbol -> first dirty time (monotonic)
+        self._full_requested: bool = False
+        self._data_since_rank: bool = False
+        self._wakeup = asyncio.Event()
+        self.busy: bool = False  # A batch has been handed out and not yet recorded
+
+        now = time.monotonic()
+        self._last_rank: float = now
+        self._last_full: float = now
+
+        # Stats
+        self.events_received: int = 0
+        self.events_coalesced: int = 0
+        self.overflows: int = 0
+        self.latencies_ms: Deque[float] = deque(maxlen=1000)
+
+    @property
+    def pending(self) -> int:
+        """Number of distinct symbols waiting to be processed."""
+        return len(self._pending)
+
+    def mark_dirty(self, symbol: str, channel: str = "ticker") -> None:
+        """
+        Record that new market data arrived for a symbol.
+
+        Args:
+            symbol: Updated symbol
+            channel: Source channel (unused, matches ``MarketDataHub.on_update``)
+        """
+        self.events_received += 1
+        self._data_since_rank = True
+
+        if symbol in self._pending:
+            self.events_coalesced += 1
+        elif len(self._pending) >= self.max_pending:
+            self.overflows += 1
+            self.request_full_check()
+            return
+        else:
+            self._pending[symbol] = time.monotonic()
+
+        self._wakeup.set()
+
+    def request_full_check(self) -> None:
+        """Ask for a full position sweep (and ranking) on the next wake-up."""
+        self._full_requested = True
+        self._data_since_rank = True
+        self._wakeup.set()
+
+    def wake(self) -> None:
+        """Re-evaluate the cadence now (for clocks that jump, e.g. market replay)."""
+        self._wakeup.set()
+
+    async def next_batch(self) -> SchedulerBatch:
+        """Sleep until data arrives or the cadence elapses, then drain the queue."""
+        while True:
+            now = time.monotonic()
+            until_cadence = self._last_full + self.rank_max_interval_sec - now
+            if self._pending or self._full_requested or until_cadence <= 0:
+                break
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=until_cadence)
+            except asyncio.TimeoutError:
+                pass
+
+        now = time.monotonic()
+        full_check = self._full_requested or now - self._last_full >= self.rank_max_interval_sec
+        rank_due = full_check or (
+            self._data_since_rank and now - self._last_rank >= self.rank_min_interval_sec
+        )
+
+        pending = self._pending
+        batch = SchedulerBatch(
+            symbols=set(pending),
+            full_check=full_check,
+            rank_due=rank_due,
+            oldest_event_time=min(pending.values()) if pending else now,
+        )
+
+        self._pending = {}
+        self._full_requested = False
+        if full_check:
+            self._last_full = now
+        if rank_due:
+            self._last_rank = now
+            self._data_since_rank = False
+
+        self.busy = True
+        return batch
+
+    def record_decision(self, batch: SchedulerBatch) -> None:
+        """Record tick-to-decision latency once a batch has been handled."""
+        self.busy = False
+        if batch.symbols:
+            self.latencies_ms.append((time.monotonic() - batch.oldest_event_time) * 1000)
+
+    def get_latency_stats(self) -> dict[str, float]:
+        """Tick-to-decision latency percentiles in milliseconds."""
+        if not self.latencies_ms:
+            return {"p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+
+        samples = np.fromiter(self.latencies_ms, dtype=float)
+        return {
+            "p50_ms": float(np.percentile(samples, 50)),
+            "p99_ms": float(np.percentile(samples, 99)),
+            "max_ms": float(samples.max()),
+        }
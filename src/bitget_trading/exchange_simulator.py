@@ -0,0 +1,1128 @@
+"""Local Bitget v2 mix exchange simulator (REST + public/private WebSocket) for offline load and latency tests."""
+
+import asyncio
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+from urllib.parse import parse_qsl, urlsplit
+
+import orjson
+from aiohttp import WSMsgType, web
+
+from src.bitget_trading.bitget_rest import BitgetRestClient
+from src.bitget_trading.candle_store import CandleStore
+from src.bitget_trading.logger import get_logger
+from src.bitget_trading.market_replay import ReplayClock, ReplayEvent, closed_candles
+from src.bitget_trading.order_book import OrderBookEngine
+from src.bitget_trading.rate_limiter import DEFAULT_GROUP_LIMITS, endpoint_group
+
+logger = get_logger()
+
+# Error codes follow Bitget where the bot branches on them
+ERR_PARAM = "40017"
+ERR_SIGN = "40009"
+ERR_NOT_FOUND = "40404"
+ERR_BALANCE = "40762"
+ERR_NO_ORDER = "40768"
+ERR_TRIGGER_PRICE = "40832"
+ERR_NO_POSITION = "22002"
+ERR_POST_ONLY = "43013"
+ERR_INSUFFICIENT_POSITION = "43023"
+ERR_RATE_LIMIT = "429"
+
+TPSL_PLAN_TYPES = ("pos_loss", "pos_profit", "loss_plan", "profit_plan", "moving_plan")
+WS_PUBLIC_PATH = "/v2/ws/public"
+WS_PRIVATE_PATH = "/v2/ws/private"
+PRIVATE_CHANNELS = ("account", "positions", "orders", "orders-algo")
+
+
+@dataclass
+class SimOrder:
+    order_id: str
+    client_oid: str
+    symbol: str
+    side: str  # "buy" or "sell"
+    order_type: str  # "market" or "limit"
+    size: float
+    price: float
+    reduce_only: bool
+    force: str
+    c_time: int
+    state: str = "live"  # live, filled, canceled
+    filled_size: float = 0.0
+    avg_price: float = 0.0
+    fee: float = 0.0
+    u_time: int = 0
+
+    def to_api(self) -> dict[str, Any]:
+        return {
+            "orderId": self.order_id,
+            "clientOid": self.client_oid,
+            "symbol": self.symbol,
+            "side": self.side,
+            "orderType": self.order_type,
+            "size": str(self.size),
+            "price": str(self.price) if self.price else "",
+            "priceAvg": str(self.avg_price) if self.filled_size else "",
+            "baseVolume": str(self.filled_size),
+            "fee": str(-self.fee),
+            "state": self.state,
+            "force": self.force,
+            "reduceOnly": "YES" if self.reduce_only else "NO",
+            "marginMode": "isolated",
+            "marginCoin": "USDT",
+            "posMode": "one_way_mode",
+            "cTime": str(self.c_time),
+            "uTime": str(self.u_time or self.c_time),
+        }
+
+    def to_push(self) -> dict[str, Any]:
+        """Entry of the private ``orders`` channel."""
+        return {
+            **self.to_api(),
+            "instId": self.symbol,
+            "status": self.state,
+            "accBaseVolume": str(self.filled_size),
+            "fillPrice": str(self.avg_price) if self.filled_size else "",
+        }
+
+
+@dataclass
+class SimPlanOrder:
+    order_id: str
+    client_oid: str
+    symbol: str
+    plan_type: str  # TPSL_PLAN_TYPES, "track_plan" or "normal_plan"
+    side: str  # order side on trigger ("sell" closes a long)
+    trigger_price: float
+    trigger_type: str  # "mark_price" or "market_price"
+    size: float | None  # None = whole position
+    c_time: int
+    callback: float = 0.0  # trailing callback as a fraction
+    order_type: str = "market"
+    price: float = 0.0
+    fire_above: bool = True  # normal_plan: trigger when price rises to (True) or falls to the trigger
+    activated: bool = False  # trailing: activation price reached
+    extreme: float = 0.0  # trailing: best price since activation
+    status: str = "live"  # live, executed, cancelled, fail_execute
+
+    def to_api(self) -> dict[str, Any]:
+        entry = {
+            "orderId": self.order_id,
+            "clientOid": self.client_oid,
+            "symbol": self.symbol,
+            "planType": self.plan_type,
+            "side": self.side,
+            "posSide": "long" if self.side == "sell" else "short",
+            "holdSide": "buy" if self.side == "sell" else "sell",
+            "triggerPrice": str(self.trigger_price),
+            "triggerType": self.trigger_type,
+            "size": "" if self.size is None else str(self.size),
+            "orderType": self.order_type,
+            "price": str(self.price) if self.price else "",
+            "planStatus": self.status,
+            "marginMode": "isolated",
+            "marginCoin": "USDT",
+            "cTime": str(self.c_time),
+        }
+        if self.plan_type == "track_plan":
+            entry["callbackRatio"] = f"{self.callback * 100:.2f}"
+        elif self.plan_type == "moving_plan":
+            entry["rangeRate"] = f"{self.callback * 100:.2f}"
+        return entry
+
+    def to_push(self) -> dict[str, Any]:
+        """Entry of the private ``orders-algo`` channel."""
+        return {**self.to_api(), "instId": self.symbol, "status": self.status}
+
+
+@dataclass
+class SimPosition:
+    symbol: str
+    side: str  # "long" or "short"
+    size: float
+    entry_price: float
+    leverage: int
+    c_time: int
+    u_time: int
+    achieved_profits: float = 0.0
+
+    @property
+    def direction(self) -> int:
+        return 1 if self.side == "long" else -1
+
+    @property
+    def margin(self) -> float:
+        return self.size * self.entry_price / self.leverage
+
+    def liquidation_price(self, maintenance_margin_rate: float) -> float:
+        return self.entry_price * (1 - self.direction * (1 / self.leverage - maintenance_margin_rate))
+
+    def unrealized(self, mark: float) -> float:
+        return (mark - self.entry_price) * self.size * self.direction
+
+
+class _RateWindow:
+    """Server-side token bucket: requests over the limit are rejected, not queued."""
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def try_take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class _WsClient:
+    """One WebSocket connection: subscriptions plus an ordered, optionally delayed send queue."""
+
+    def __init__(self, ws: web.WebSocketResponse, latency_sec: float) -> None:
+        self.ws = ws
+        self.latency_sec = latency_sec
+        self.subscriptions: set[tuple[str, str]] = set()
+        self.logged_in = False
+        self.queue: asyncio.Queue[tuple[float, str]] = asyncio.Queue()
+        self.sender = asyncio.create_task(self._send_loop())
+
+    def send(self, text: str) -> None:
+        self.queue.put_nowait((time.perf_counter() + self.latency_sec, text))
+
+    async def _send_loop(self) -> None:
+        while True:
+            due, text = await self.queue.get()
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self.ws.closed:
+                return
+            await self.ws.send_str(text)
+
+
+class ExchangeSimulator:
+    """
+    In-process model of the Bitget v2 USDT-M futures API the bot uses.
+
+    Market data (tickers, order books) is driven from replay events
+    (``candle_events``/``tick_events`` of ``market_replay``, or
+    ``apply_event`` directly); the simulator clock follows the event
+    timestamps. Every market update runs the matching engine:
+
+    - market orders fill against the current book (walking its levels; the
+      recorded liquidity itself is not consumed) or the ticker bid/ask
+    - limit orders fill when marketable (taker) or once the opposite side
+      trades through their price (maker); ``post_only`` orders that would
+      take are rejected
+    - TP/SL (``place-tpsl-order``) and plan orders (``place-plan-order``:
+      ``track_plan``, ``normal_plan``) trigger on mark or last price and
+      close the position at market; trailing orders track the best price
+      after activation
+    - isolated positions in one-way mode are liquidated when the mark
+      price crosses the liquidation price
+
+    Requests go through ``handle()``, either from ``LocalRestClient`` (no
+    sockets) or over HTTP once ``start()`` runs an aiohttp server, which
+    also serves the public WebSocket (``ticker`` and ``books*`` channels)
+    and the private one (login, then ``account``, ``positions``, ``orders``
+    and ``orders-algo``, pushed after every request or market update that
+    changed them).
+    Each request waits ``latency_ms`` (+ up to ``latency_jitter_ms``), and
+    requests over the per-group rate limits of ``rate_limiter`` (or a
+    ``reject_rate`` fraction of all requests) get HTTP 429.
+    """
+
+    def __init__(
+        self,
+        initial_balance: float = 1000.0,
+        default_leverage: int = 20,
+        taker_fee: float = 0.0006,
+        maker_fee: float = 0.0002,
+        maintenance_margin_rate: float = 0.004,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        ws_latency_ms: float = 0.0,
+        rate_limits: dict[str, tuple[float, float]] | None = DEFAULT_GROUP_LIMITS,
+        reject_rate: float = 0.0,
+        api_secret: str | None = None,
+        contracts: list[dict[str, Any]] | None = None,
+        candle_store: CandleStore | None = None,
+        clock: ReplayClock | None = None,
+        book_levels: int = 200,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize exchange simulator.
+
+        Args:
+            initial_balance: USDT wallet balance
+            default_leverage: Leverage of symbols without set-leverage
+            taker_fee, maker_fee: Fee rates
+            maintenance_margin_rate: Used for liquidation prices
+            latency_ms: Delay before every REST request is processed
+            latency_jitter_ms: Extra uniform random delay (0..jitter)
+            ws_latency_ms: Delay of every WebSocket push
+            rate_limits: Group -> (requests/s, burst) enforced with HTTP 429
+                (None = unlimited)
+            reject_rate: Fraction of requests answered with 429 regardless of load
+            api_secret: Verify request signatures with this secret (None = don't)
+            contracts: Raw contract list (default: generated from the symbols seen)
+            candle_store: Candles served by the candle endpoints (closed bars only)
+            clock: Simulation clock (default: one following the replayed events)
+            book_levels: Order book levels kept per side and symbol
+            seed: Random seed for jitter and 429 injection
+        """
+        self.balance = initial_balance
+        self.default_leverage = default_leverage
+        self.taker_fee = taker_fee
+        self.maker_fee = maker_fee
+        self.maintenance_margin_rate = maintenance_margin_rate
+        self.latency_sec = latency_ms / 1000
+        self.jitter_sec = latency_jitter_ms / 1000
+        self.ws_latency_sec = ws_latency_ms / 1000
+        self.reject_rate = reject_rate
+        self.api_secret = api_secret
+        self.contracts = contracts
+        self.candle_store = candle_store
+        self.clock = clock or ReplayClock(int(time.time() * 1000))
+        self.order_books = OrderBookEngine(max_levels=book_levels)
+        self._rng = random.Random(seed)
+        self._limits = {group: _RateWindow(*limit) for group, limit in (rate_limits or {}).items()}
+
+        self.tickers: dict[str, dict[str, Any]] = {}  # internal ticker format (parse_ticker)
+        self.positions: dict[str, SimPosition] = {}
+        self.leverage: dict[str, int] = {}
+        self.orders: dict[str, SimOrder] = {}
+        self.open_orders: dict[str, SimOrder] = {}  # resting limit orders
+        self.plan_orders: dict[str, SimPlanOrder] = {}  # live plan orders
+        self._ids = itertools.count(1_000_000_000_000)
+
+        self._routes: dict[tuple[str, str], Callable[[dict[str, Any]], Any]] = {
+            ("GET", "/api/v2/mix/market/ticker"): self._get_ticker,
+            ("GET", "/api/v2/mix/market/tickers"): self._get_tickers,
+            ("GET", "/api/v2/mix/market/current-fund-rate"): self._get_funding_rate,
+            ("GET", "/api/v2/mix/market/candles"): self._get_candles,
+            ("GET", "/api/v2/mix/market/history-candles"): self._get_candles,
+            ("GET", "/api/v2/mix/market/contracts"): self._get_contracts,
+            ("GET", "/api/v2/mix/account/accounts"): self._get_accounts,
+            ("POST", "/api/v2/mix/account/set-leverage"): self._set_leverage,
+            ("POST", "/api/v2/mix/account/set-margin-mode"): self._set_margin_mode,
+            ("GET", "/api/v2/mix/position/all-position"): self._get_positions,
+            ("POST", "/api/v2/mix/order/place-order"): self._place_order,
+            ("POST", "/api/v2/mix/order/cancel-order"): self._cancel_order,
+            ("GET", "/api/v2/mix/order/detail"): self._order_detail,
+            ("GET", "/api/v2/mix/order/orders-pending"): self._orders_pending,
+            ("POST", "/api/v2/mix/order/place-tpsl-order"): self._place_tpsl_order,
+            ("POST", "/api/v2/mix/order/place-plan-order"): self._place_plan_order,
+            ("POST", "/api/v2/mix/order/cancel-plan-order"): self._cancel_plan_order,
+            ("GET", "/api/v2/mix/order/orders-plan-pending"): self._orders_plan_pending,
+        }
+
+        # Server
+        self.base_url: str | None = None
+        self.ws_url: str | None = None
+        self.ws_private_url: str | None = None
+        self._runner: web.AppRunner | None = None
+        self._ws_clients: set[_WsClient] = set()
+        self._subscribers: dict[tuple[str, str], set[_WsClient]] = {}
+        self._dirty_orders: dict[str, SimOrder] = {}  # changed since the last private push
+        self._dirty_plans: dict[str, SimPlanOrder] = {}
+        self._positions_dirty: bool = False
+
+        # Stats
+        self.requests: dict[str, int] = {}
+        self.rate_limited: int = 0
+        self.fills: int = 0
+        self.liquidations: int = 0
+        self.events_applied: int = 0
+
+    # ----------------------------------------------------------- market data
+
+    def now_ms(self) -> int:
+        return self.clock.now_ms
+
+    def apply_event(self, ts: int, symbol: str, channel: str, payload: Any) -> None:
+        """Apply one replay event (ticker dict or (action, books push)) and run matching."""
+        self.clock.advance_to(ts)
+        if channel == "ticker":
+            self.tickers[symbol] = payload
+            self._publish_ticker(symbol)
+        else:
+            action, data = payload
+            if self.order_books.apply(symbol, action, data) is None:
+                return
+            self._publish_book(symbol, action, data)
+        self.events_applied += 1
+        self._match(symbol)
+        self._publish_private()
+
+    async def run_feed(self, events: Iterable[list[ReplayEvent]], speed: float | None = None, yield_every: int = 100) -> None:
+        """
+        Drive the simulator from replay events.
+
+        Args:
+            events: Chunks of time-ordered events
+            speed: Replay seconds per wall second (None = as fast as possible)
+            yield_every: Events between event-loop yields at full speed
+        """
+        started = time.perf_counter()
+        first_ts: int | None = None
+        for chunk in events:
+            for i, (ts, symbol, channel, payload) in enumerate(chunk):
+                if first_ts is None:
+                    first_ts = ts
+                if speed:
+                    delay = started + (ts - first_ts) / 1000 / speed - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif i % yield_every == 0:
+                    await asyncio.sleep(0)
+                self.apply_event(ts, symbol, channel, payload)
+
+    def _prices(self, symbol: str) -> tuple[float, float, float, float]:
+        """(bid, ask, last, mark) of a symbol (0.0 when unknown)."""
+        ticker = self.tickers.get(symbol, {})
+        book = self.order_books.get(symbol)
+        last = ticker.get("last_price", 0.0)
+        if book is not None and book.synced and book.best_bid > 0 and book.best_ask > 0:
+            bid, ask = book.best_bid, book.best_ask
+        else:
+            bid, ask = ticker.get("bid_price") or last, ticker.get("ask_price") or last
+        last = last or (bid + ask) / 2
+        return bid, ask, last, ticker.get("mark_price") or last
+
+    def _trigger_price(self, symbol: str, trigger_type: str) -> float:
+        _, _, last, mark = self._prices(symbol)
+        return mark if trigger_type == "mark_price" else last
+
+    # -------------------------------------------------------------- matching
+
+    def _match(self, symbol: str) -> None:
+        bid, ask, last, mark = self._prices(symbol)
+        if last <= 0:
+            return
+
+        for order in [o for o in self.open_orders.values() if o.symbol == symbol]:
+            if (order.side == "buy" and ask <= order.price) or (order.side == "sell" and bid >= order.price):
+                del self.open_orders[order.order_id]
+                self._fill(order, order.price, self.maker_fee)
+
+        for plan in [p for p in self.plan_orders.values() if p.symbol == symbol]:
+            if plan.order_id in self.plan_orders and self._plan_triggered(plan):
+                self._execute_plan(plan)
+
+        position = self.positions.get(symbol)
+        if position is not None:
+            liquidation = position.liquidation_price(self.maintenance_margin_rate)
+            if (mark - liquidation) * position.direction <= 0:
+                self._liquidate(position, liquidation)
+
+    def _sweep_price(self, symbol: str, side: str, size: float) -> float:
+        """Average fill price of a market order walking the book (no depletion)."""
+        bid, ask, _, _ = self._prices(symbol)
+        book = self.order_books.get(symbol)
+        if book is None or not book.synced:
+            return ask if side == "buy" else bid
+        levels = book.levels("ask" if side == "buy" else "bid", book.max_levels)
+        remaining, cost, price = size, 0.0, ask if side == "buy" else bid
+        for price, level_size in levels:
+            take = min(remaining, level_size)
+            cost += take * price
+            remaining -= take
+            if remaining <= 0:
+                break
+        cost += remaining * price  # beyond the kept depth: at the last level
+        return cost / size
+
+    def _fill(self, order: SimOrder, price: float, fee_rate: float) -> None:
+        """Fill an order completely and update the position and balance."""
+        self._dirty_orders[order.order_id] = order
+        size = order.size
+        position = self.positions.get(order.symbol)
+        if order.reduce_only:
+            closes = position is not None and (position.side == "long") == (order.side == "sell")
+            size = min(size, position.size) if closes else 0.0
+            if size <= 0:
+                order.state = "canceled"
+                order.u_time = self.now_ms()
+                return
+
+        fee = size * price * fee_rate
+        order.filled_size = size
+        order.avg_price = price
+        order.fee = fee
+        order.state = "filled"
+        order.u_time = self.now_ms()
+        self.balance -= fee
+        self.fills += 1
+        self._apply_fill(order.symbol, order.side, size, price)
+
+    def _apply_fill(self, symbol: str, side: str, size: float, price: float) -> None:
+        """Net a fill into the one-way position (open, add, reduce, close or flip)."""
+        now = self.now_ms()
+        direction = 1 if side == "buy" else -1
+        position = self.positions.get(symbol)
+        self._positions_dirty = True
+        if position is None:
+            self.positions[symbol] = SimPosition(
+                symbol, "long" if direction > 0 else "short", size, price,
+                self.leverage.get(symbol, self.default_leverage), now, now,
+            )
+            return
+
+        position.u_time = now
+        if position.direction == direction:
+            position.entry_price = (position.entry_price * position.size + price * size) / (position.size + size)
+            position.size += size
+            return
+
+        closed = min(size, position.size)
+        pnl = (price - position.entry_price) * closed * position.direction
+        self.balance += pnl
+        position.achieved_profits += pnl
+        position.size -= closed
+        if position.size <= 1e-12:
+            del self.positions[symbol]
+            self._cancel_position_plans(symbol)
+            if size > closed:
+                self._apply_fill(symbol, side, size - closed, price)
+
+    def _liquidate(self, position: SimPosition, price: float) -> None:
+        logger.info(f"💥 [EXCHANGE SIM] Liquidated {position.symbol} {position.side} {position.size} @ {price:.6g}")
+        self.liquidations += 1
+        self._apply_fill(position.symbol, "sell" if position.side == "long" else "buy", position.size, price)
+
+    def _cancel_position_plans(self, symbol: str) -> None:
+        """Position closed: its TP/SL orders go with it."""
+        for plan in [p for p in self.plan_orders.values() if p.symbol == symbol and p.plan_type in TPSL_PLAN_TYPES]:
+            plan.status = "cancelled"
+            del self.plan_orders[plan.order_id]
+            self._dirty_plans[plan.order_id] = plan
+
+    def _plan_triggered(self, plan: SimPlanOrder) -> bool:
+        price = self._trigger_price(plan.symbol, plan.trigger_type)
+        closes_long = plan.side == "sell"
+        if plan.plan_type in ("pos_loss", "loss_plan"):
+            return price <= plan.trigger_price if closes_long else price >= plan.trigger_price
+        if plan.plan_type in ("pos_profit", "profit_plan"):
+            return price >= plan.trigger_price if closes_long else price <= plan.trigger_price
+        if plan.plan_type in ("track_plan", "moving_plan"):
+            if not plan.activated:
+                reached = price >= plan.trigger_price if closes_long else price <= plan.trigger_price
+                if not reached:
+                    return False
+                plan.activated, plan.extreme = True, price
+            plan.extreme = max(plan.extreme, price) if closes_long else min(plan.extreme, price)
+            if closes_long:
+                return price <= plan.extreme * (1 - plan.callback)
+            return price >= plan.extreme * (1 + plan.callback)
+        return price >= plan.trigger_price if plan.fire_above else price <= plan.trigger_price
+
+    def _execute_plan(self, plan: SimPlanOrder) -> None:
+        del self.plan_orders[plan.order_id]
+        self._dirty_plans[plan.order_id] = plan
+        position = self.positions.get(plan.symbol)
+        reduce_only = plan.plan_type != "normal_plan"
+        if reduce_only and (position is None or (position.side == "long") != (plan.side == "sell")):
+            plan.status = "fail_execute"
+            return
+        plan.status = "executed"
+        size = plan.size if plan.size is not None else position.size
+        order = self._new_order(plan.symbol, plan.side, plan.order_type, size, plan.price, reduce_only, "gtc", "")
+        self._submit(order)
+
+    # ---------------------------------------------------------------- orders
+
+    def _new_order(
+        self, symbol: str, side: str, order_type: str, size: float, price: float, reduce_only: bool, force: str, client_oid: str
+    ) -> SimOrder:
+        order_id = str(next(self._ids))
+        order = SimOrder(order_id, client_oid or order_id, symbol, side, order_type, size, price, reduce_only, force, self.now_ms())
+        self.orders[order_id] = order
+        self._dirty_orders[order_id] = order
+        return order
+
+    def _submit(self, order: SimOrder) -> tuple[str, str] | None:
+        """Match or rest a new order. Returns (code, msg) if it is rejected."""
+        bid, ask, last, _ = self._prices(order.symbol)
+        if last <= 0:
+            order.state = "canceled"
+            return ERR_PARAM, f"No market data for {order.symbol}"
+
+        if order.order_type == "market":
+            self._fill(order, self._sweep_price(order.symbol, order.side, order.size), self.taker_fee)
+            return None
+
+        marketable = order.price >= ask if order.side == "buy" else order.price <= bid
+        if marketable and order.force == "post_only":
+            order.state = "canceled"
+            return ERR_POST_ONLY, "Post only order would take liquidity"
+        if marketable:
+            sweep = self._sweep_price(order.symbol, order.side, order.size)
+            self._fill(order, min(sweep, order.price) if order.side == "buy" else max(sweep, order.price), self.taker_fee)
+        else:
+            self.open_orders[order.order_id] = order
+        return None
+
+    def _required_margin(self, symbol: str, side: str, size: float, price: float, reduce_only: bool) -> float:
+        position = self.positions.get(symbol)
+        if reduce_only or (position is not None and (position.side == "long") != (side == "buy")):
+            return 0.0
+        return size * price / self.leverage.get(symbol, self.default_leverage)
+
+    # --------------------------------------------------------------- account
+
+    def account(self) -> dict[str, float]:
+        margin = sum(p.margin for p in self.positions.values())
+        frozen = sum(
+            o.size * o.price / self.leverage.get(o.symbol, self.default_leverage)
+            for o in self.open_orders.values()
+            if not o.reduce_only
+        )
+        unrealized = sum(p.unrealized(self._prices(p.symbol)[3]) for p in self.positions.values())
+        return {
+            "balance": self.balance,
+            "margin": margin,
+            "frozen": frozen,
+            "available": self.balance - margin - frozen,
+            "unrealized": unrealized,
+            "equity": self.balance + unrealized,
+        }
+
+    # ------------------------------------------------------------- REST API
+
+    async def handle(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any],
+        headers: dict[str, str] | None = None,
+        body: str = "",
+    ) -> tuple[int, dict[str, Any]]:
+        """
+        Process one REST request.
+
+        Args:
+            method: HTTP method
+            path: Request path with query string (as signed)
+            params: Query parameters (GET) or JSON body (POST)
+            headers: Request headers (signature checked if ``api_secret`` is set)
+            body: Raw body (as signed)
+
+        Returns:
+            (HTTP status, Bitget-style response)
+        """
+        delay = self.latency_sec + (self._rng.uniform(0, self.jitter_sec) if self.jitter_sec else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        endpoint = path.split("?", 1)[0]
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+
+        bucket = self._limits.get(endpoint_group(endpoint))
+        if (bucket is not None and not bucket.try_take()) or (self.reject_rate and self._rng.random() < self.reject_rate):
+            self.rate_limited += 1
+            return 429, self._error(ERR_RATE_LIMIT, "Too Many Requests")
+
+        if self.api_secret is not None:
+            headers = headers or {}
+            expected = BitgetRestClient._sign_request(self, headers.get("ACCESS-TIMESTAMP", ""), method, path, body)
+            if headers.get("ACCESS-SIGN") != expected:
+                return 400, self._error(ERR_SIGN, "sign signature error")
+
+        handler = self._routes.get((method.upper(), endpoint))
+        if handler is None:
+            return 404, self._error(ERR_NOT_FOUND, f"{method} {endpoint} is not simulated")
+        try:
+            result = handler(params)
+        except (KeyError, ValueError, TypeError) as e:
+            return 400, self._error(ERR_PARAM, f"Parameter verification failed: {e}")
+        finally:
+            self._publish_private()
+        if isinstance(result, tuple):
+            return 400, self._error(*result)
+        return 200, {"code": "00000", "msg": "success", "requestTime": self.now_ms(), "data": result}
+
+    def _error(self, code: str, msg: str) -> dict[str, Any]:
+        return {"code": code, "msg": msg, "requestTime": self.now_ms(), "data": None}
+
+    def _raw_ticker(self, symbol: str, id_key: str = "symbol") -> dict[str, Any]:
+        ticker = self.tickers[symbol]
+        bid, ask, last, mark = self._prices(symbol)
+        return {
+            id_key: symbol,
+            "lastPr": str(last),
+            "bidPr": str(bid),
+            "askPr": str(ask),
+            "markPrice": str(mark),
+            "indexPrice": str(ticker.get("index_price") or last),
+            "fundingRate": str(ticker.get("funding_rate", 0.0)),
+            "baseVolume": str(ticker.get("volume_24h", 0.0)),
+            "quoteVolume": str(ticker.get("quote_volume_24h", 0.0)),
+            "holdingAmount": str(ticker.get("open_interest", 0.0)),
+            "ts": str(ticker.get("timestamp") or self.now_ms()),
+        }
+
+    def _get_ticker(self, params: dict[str, Any]) -> Any:
+        symbol = params["symbol"]
+        if symbol not in self.tickers:
+            return ERR_PARAM, f"Unknown symbol {symbol}"
+        return [self._raw_ticker(symbol)]
+
+    def _get_tickers(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        return [self._raw_ticker(symbol) for symbol in self.tickers]
+
+    def _get_funding_rate(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        symbol = params["symbol"]
+        return [{"symbol": symbol, "fundingRate": str(self.tickers.get(symbol, {}).get("funding_rate", 0.0))}]
+
+    def _get_candles(self, params: dict[str, Any]) -> list[list[str]]:
+        if self.candle_store is None:
+            return []
+        return closed_candles(self.candle_store, params, self.now_ms())
+
+    def _get_contracts(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        if self.contracts is not None:
+            return self.contracts
+        contracts = []
+        for symbol in self.tickers:
+            price = self._prices(symbol)[2]
+            price_place = max(0, 5 - len(str(int(price)))) if price >= 1 else 8
+            contracts.append({
+                "symbol": symbol,
+                "baseCoin": symbol.removesuffix("USDT"),
+                "quoteCoin": "USDT",
+                "pricePlace": str(price_place),
+                "priceEndStep": "1",
+                "volumePlace": "4",
+                "sizeMultiplier": "0.0001",
+                "minTradeNum": "0.0001",
+                "minTradeUSDT": "5",
+                "maxLeverage": "125",
+                "minLever": "1",
+                "symbolStatus": "normal",
+            })
+        return contracts
+
+    def _get_accounts(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        account = self.account()
+        return [{
+            "marginCoin": "USDT",
+            "available": str(account["available"]),
+            "locked": str(account["margin"]),
+            "frozen": str(account["frozen"]),
+            "accountEquity": str(account["equity"]),
+            "usdtEquity": str(account["equity"]),
+            "equity": str(account["equity"]),
+            "unrealizedPL": str(account["unrealized"]),
+            "isolatedMaxAvailable": str(account["available"]),
+            "crossedMaxAvailable": str(account["available"]),
+            "maxTransferOut": str(account["available"]),
+        }]
+
+    def _set_leverage(self, params: dict[str, Any]) -> dict[str, Any]:
+        leverage = int(params["leverage"])
+        if not 1 <= leverage <= 125:
+            return ERR_PARAM, f"Leverage {leverage} out of range"
+        self.leverage[params["symbol"]] = leverage
+        return {"symbol": params["symbol"], "marginCoin": "USDT", "longLeverage": str(leverage), "shortLeverage": str(leverage), "marginMode": "isolated"}
+
+    def _set_margin_mode(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {"symbol": params["symbol"], "marginCoin": "USDT", "marginMode": params.get("marginMode", "isolated")}
+
+    def _get_positions(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        rows = []
+        for position in self.positions.values():
+            mark = self._prices(position.symbol)[3]
+            margin = position.margin
+            rows.append({
+                "symbol": position.symbol,
+                "marginCoin": "USDT",
+                "holdSide": position.side,
+                "openDelegateSize": "0",
+                "marginSize": str(margin),
+                "available": str(position.size),
+                "locked": "0",
+                "total": str(position.size),
+                "leverage": str(position.leverage),
+                "achievedProfits": str(position.achieved_profits),
+                "openPriceAvg": str(position.entry_price),
+                "marginMode": "isolated",
+                "posMode": "one_way_mode",
+                "unrealizedPL": str(position.unrealized(mark)),
+                "liquidationPrice": str(position.liquidation_price(self.maintenance_margin_rate)),
+                "keepMarginRate": str(self.maintenance_margin_rate),
+                "markPrice": str(mark),
+                "marginRatio": str(self.maintenance_margin_rate * position.size * mark / max(margin + position.unrealized(mark), 1e-12)),
+                "cTime": str(position.c_time),
+                "uTime": str(position.u_time),
+            })
+        return rows
+
+    def _place_order(self, params: dict[str, Any]) -> Any:
+        symbol, side = params["symbol"], params["side"]
+        size = float(params["size"])
+        order_type = params.get("orderType", "market")
+        price = float(params.get("price") or 0)
+        reduce_only = params.get("reduceOnly") == "YES"
+        if side not in ("buy", "sell") or size <= 0 or (order_type == "limit" and price <= 0):
+            return ERR_PARAM, "Parameter verification failed"
+        if reduce_only and symbol not in self.positions:
+            return ERR_NO_POSITION, "No position to close"
+
+        reference = price or self._prices(symbol)[2]
+        required = self._required_margin(symbol, side, size, reference, reduce_only)
+        if required and required + size * reference * self.taker_fee > self.account()["available"]:
+            return ERR_BALANCE, "The order amount exceeds the balance"
+
+        order = self._new_order(symbol, side, order_type, size, price, reduce_only, params.get("force", "gtc"), params.get("clientOid", ""))
+        rejected = self._submit(order)
+        if rejected:
+            return rejected
+        return {"orderId": order.order_id, "clientOid": order.client_oid}
+
+    def _cancel_order(self, params: dict[str, Any]) -> Any:
+        order = self.open_orders.pop(params.get("orderId", ""), None)
+        if order is None:
+            return ERR_NO_ORDER, "Order does not exist"
+        order.state = "canceled"
+        order.u_time = self.now_ms()
+        self._dirty_orders[order.order_id] = order
+        return {"orderId": order.order_id, "clientOid": order.client_oid}
+
+    def _order_detail(self, params: dict[str, Any]) -> Any:
+        order = self.orders.get(params.get("orderId", ""))
+        if order is None:
+            return ERR_NO_ORDER, "Order does not exist"
+        return order.to_api()
+
+    def _orders_pending(self, params: dict[str, Any]) -> dict[str, Any]:
+        symbol = params.get("symbol")
+        orders = [o.to_api() for o in self.open_orders.values() if symbol is None or o.symbol == symbol]
+        return {"entrustedList": orders or None, "endId": orders[-1]["orderId"] if orders else None}
+
+    def _validate_trigger(self, symbol: str, plan_type: str, closes_long: bool, trigger: float, trigger_type: str) -> Any:
+        """Stop losses must sit on the losing side of the trigger price, take profits on the winning side."""
+        current = self._trigger_price(symbol, trigger_type)
+        if plan_type in ("pos_loss", "loss_plan") and (trigger >= current if closes_long else trigger <= current):
+            side = "below" if closes_long else "above"
+            return ERR_TRIGGER_PRICE, f"The stop loss price must be {side} the mark price: {current}"
+        if plan_type in ("pos_profit", "profit_plan") and (trigger <= current if closes_long else trigger >= current):
+            side = "above" if closes_long else "below"
+            return ERR_TRIGGER_PRICE, f"The take profit price must be {side} the mark price: {current}"
+        return None
+
+    def _place_tpsl_order(self, params: dict[str, Any]) -> Any:
+        symbol, plan_type = params["symbol"], params["planType"]
+        if plan_type not in TPSL_PLAN_TYPES:
+            return ERR_PARAM, f"Unsupported planType {plan_type}"
+        closes_long = params["holdSide"] in ("buy", "long")
+        position = self.positions.get(symbol)
+        if position is None or (position.side == "long") != closes_long:
+            return ERR_INSUFFICIENT_POSITION, "Insufficient position, can not set profit or stop loss"
+
+        size = None if plan_type in ("pos_loss", "pos_profit") else float(params["size"])
+        if size is not None and size > position.size + 1e-12:
+            return ERR_INSUFFICIENT_POSITION, "Insufficient position, can not set profit or stop loss"
+        trigger = float(params["triggerPrice"])
+        trigger_type = params.get("triggerType", "mark_price")
+        invalid = self._validate_trigger(symbol, plan_type, closes_long, trigger, trigger_type)
+        if invalid:
+            return invalid
+
+        if plan_type in ("pos_loss", "pos_profit"):
+            # One position TP and one position SL at a time: a new one replaces the old
+            for existing in [p for p in self.plan_orders.values() if p.symbol == symbol and p.plan_type == plan_type]:
+                existing.status = "cancelled"
+                del self.plan_orders[existing.order_id]
+                self._dirty_plans[existing.order_id] = existing
+        callback = float(params.get("rangeRate") or 0) / 100
+        return self._add_plan(symbol, plan_type, "sell" if closes_long else "buy", trigger, trigger_type, size, params, callback)
+
+    def _place_plan_order(self, params: dict[str, Any]) -> Any:
+        symbol, plan_type, side = params["symbol"], params.get("planType", "normal_plan"), params["side"]
+        if plan_type not in ("track_plan", "normal_plan"):
+            return ERR_PARAM, f"Unsupported planType {plan_type}"
+        size = float(params["size"])
+        trigger = float(params["triggerPrice"])
+        trigger_type = params.get("triggerType", "market_price")
+        if plan_type == "track_plan":
+            position = self.positions.get(symbol)
+            if position is None or (position.side == "long") != (side == "sell") or size > position.size + 1e-12:
+                return ERR_INSUFFICIENT_POSITION, "Insufficient position"
+            callback = float(params["callbackRatio"]) / 100
+            return self._add_plan(symbol, plan_type, side, trigger, trigger_type, size, params, callback)
+        plan = self._add_plan(symbol, plan_type, side, trigger, trigger_type, size, params, 0.0)
+        order = self.plan_orders[plan["orderId"]]
+        order.order_type = params.get("orderType", "market")
+        order.price = float(params.get("price") or 0)
+        order.fire_above = trigger >= self._trigger_price(symbol, trigger_type)
+        return plan
+
+    def _add_plan(
+        self, symbol: str, plan_type: str, side: str, trigger: float, trigger_type: str,
+        size: float | None, params: dict[str, Any], callback: float,
+    ) -> dict[str, str]:
+        order_id = str(next(self._ids))
+        client_oid = params.get("clientOid") or order_id
+        plan = self.plan_orders[order_id] = SimPlanOrder(
+            order_id, client_oid, symbol, plan_type, side, trigger, trigger_type, size, self.now_ms(), callback=callback,
+        )
+        self._dirty_plans[order_id] = plan
+        return {"orderId": order_id, "clientOid": client_oid}
+
+    def _cancel_plan_order(self, params: dict[str, Any]) -> Any:
+        ids = [params["orderId"]] if params.get("orderId") else [o["orderId"] for o in params.get("orderIdList") or []]
+        success, failure = [], []
+        for order_id in ids:
+            plan = self.plan_orders.pop(order_id, None)
+            if plan is None:
+                failure.append({"orderId": order_id, "errorMsg": "Order does not exist"})
+            else:
+                plan.status = "cancelled"
+                self._dirty_plans[order_id] = plan
+                success.append({"orderId": order_id, "clientOid": plan.client_oid})
+        if ids and not success:
+            return ERR_NO_ORDER, "Order does not exist"
+        return {"successList": success, "failureList": failure}
+
+    def _orders_plan_pending(self, params: dict[str, Any]) -> dict[str, Any]:
+        symbol, plan_type = params.get("symbol"), params.get("planType", "normal_plan")
+        kinds = TPSL_PLAN_TYPES if plan_type == "profit_loss" else (plan_type,)
+        orders = [
+            p.to_api()
+            for p in self.plan_orders.values()
+            if p.plan_type in kinds and (symbol is None or p.symbol == symbol)
+        ]
+        return {"entrustedList": orders or None, "endId": orders[-1]["orderId"] if orders else None}
+
+    # ---------------------------------------------------------------- server
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Serve REST and the public WebSocket over HTTP.
+
+        Returns:
+            Base URL for ``BitgetRestClient(base_url=...)``; the WebSocket URLs
+            are ``self.ws_url`` (public) and ``self.ws_private_url``
+        """
+        app = web.Application()
+        app.router.add_get(WS_PUBLIC_PATH, self._ws_handler)
+        app.router.add_get(WS_PRIVATE_PATH, self._ws_handler)
+        app.router.add_route("*", "/{tail:.*}", self._http_handler)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{port}"
+        self.ws_url = f"ws://{host}:{port}{WS_PUBLIC_PATH}"
+        self.ws_private_url = f"ws://{host}:{port}{WS_PRIVATE_PATH}"
+        logger.info(f"🧪 [EXCHANGE SIM] Listening on {self.base_url} (WebSocket {self.ws_url}, {self.ws_private_url})")
+        return self.base_url
+
+    async def stop(self) -> None:
+        for client in list(self._ws_clients):
+            client.sender.cancel()
+            await client.ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _http_handler(self, request: web.Request) -> web.Response:
+        body = await request.text()
+        params = orjson.loads(body) if body else dict(request.query)
+        status, payload = await self.handle(request.method, request.raw_path, params, dict(request.headers), body)
+        return web.Response(status=status, body=orjson.dumps(payload), content_type="application/json")
+
+    async def _ws_handler(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(max_msg_size=10 * 1024 * 1024)
+        await ws.prepare(request)
+        client = _WsClient(ws, self.ws_latency_sec)
+        private = request.path == WS_PRIVATE_PATH
+        self._ws_clients.add(client)
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                if message.data == "ping":
+                    client.send("pong")
+                    continue
+                try:
+                    request_data = orjson.loads(message.data)
+                except orjson.JSONDecodeError:
+                    client.send(orjson.dumps({"event": "error", "code": "30001", "msg": "Invalid request"}).decode())
+                    continue
+                self._ws_request(client, request_data, private)
+        finally:
+            for key in client.subscriptions:
+                self._subscribers.get(key, set()).discard(client)
+            self._ws_clients.discard(client)
+            client.sender.cancel()
+        return ws
+
+    def _ws_request(self, client: _WsClient, request: dict[str, Any], private: bool = False) -> None:
+        op = request.get("op")
+        if op == "login":
+            self._ws_login(client, (request.get("args") or [{}])[0], private)
+            return
+        for arg in request.get("args") or []:
+            key = (arg.get("channel", ""), arg.get("instId") or arg.get("coin", ""))
+            if (key[0] in PRIVATE_CHANNELS) != private or (private and not client.logged_in):
+                client.send(orjson.dumps({"event": "error", "arg": arg, "code": "30016", "msg": "Channel not available"}).decode())
+                continue
+            if op == "subscribe":
+                client.subscriptions.add(key)
+                self._subscribers.setdefault(key, set()).add(client)
+                client.send(orjson.dumps({"event": "subscribe", "arg": arg}).decode())
+                self._send_snapshot(client, *key)
+            elif op == "unsubscribe":
+                client.subscriptions.discard(key)
+                self._subscribers.get(key, set()).discard(client)
+                client.send(orjson.dumps({"event": "unsubscribe", "arg": arg}).decode())
+
+    def _ws_login(self, client: _WsClient, arg: dict[str, Any], private: bool) -> None:
+        """Private login: the signature covers timestamp + "GET" + "/user/verify"."""
+        timestamp = str(arg.get("timestamp", ""))
+        if private and self.api_secret is not None:
+            client.logged_in = arg.get("sign") == BitgetRestClient._sign_request(self, timestamp, "GET", "/user/verify")
+        else:
+            client.logged_in = private
+        if client.logged_in:
+            client.send(orjson.dumps({"event": "login", "code": 0}).decode())
+        else:
+            client.send(orjson.dumps({"event": "error", "code": "30005", "msg": "Login failed"}).decode())
+
+    def _private_data(self, channel: str) -> list[dict[str, Any]]:
+        """Current state of a private channel (subscribe snapshot)."""
+        if channel == "account":
+            return self._get_accounts({})
+        if channel == "positions":
+            return [{**row, "instId": row["symbol"]} for row in self._get_positions({})]
+        if channel == "orders":
+            return [o.to_push() for o in self.open_orders.values()]
+        return [p.to_push() for p in self.plan_orders.values()]
+
+    def _push_private(self, channel: str, data: list[dict[str, Any]], clients: Iterable[_WsClient]) -> None:
+        arg = {"instType": "USDT-FUTURES", "channel": channel}
+        arg["coin" if channel == "account" else "instId"] = "default"
+        text = orjson.dumps({"action": "snapshot", "arg": arg, "data": data, "ts": self.now_ms()}).decode()
+        for client in clients:
+            client.send(text)
+
+    def _publish_private(self) -> None:
+        """Push order, plan order, position and account changes to private subscribers."""
+        if not (self._dirty_orders or self._dirty_plans or self._positions_dirty):
+            return
+        orders, plans, positions_changed = self._dirty_orders, self._dirty_plans, self._positions_dirty
+        self._dirty_orders, self._dirty_plans, self._positions_dirty = {}, {}, False
+
+        # Order updates go last: once a fill is seen, balance and position are already current
+        clients = self._subscribers.get(("account", "default"))
+        if clients:
+            self._push_private("account", self._private_data("account"), clients)
+        clients = self._subscribers.get(("positions", "default"))
+        if positions_changed and clients:
+            self._push_private("positions", self._private_data("positions"), clients)
+        clients = self._subscribers.get(("orders-algo", "default"))
+        if plans and clients:
+            self._push_private("orders-algo", [p.to_push() for p in plans.values()], clients)
+        clients = self._subscribers.get(("orders", "default"))
+        if orders and clients:
+            self._push_private("orders", [o.to_push() for o in orders.values()], clients)
+
+    def _push(self, channel: str, symbol: str, action: str, data: list[dict[str, Any]], clients: Iterable[_WsClient]) -> None:
+        text = orjson.dumps({
+            "action": action,
+            "arg": {"instType": "USDT-FUTURES", "channel": channel, "instId": symbol},
+            "data": data,
+            "ts": self.now_ms(),
+        }).decode()
+        for client in clients:
+            client.send(text)
+
+    def _book_snapshot(self, symbol: str, depth: int) -> dict[str, Any] | None:
+        book = self.order_books.get(symbol)
+        if book is None or not book.synced:
+            return None
+        return {
+            "bids": [[str(p), str(s)] for p, s in book.levels("bid", depth)],
+            "asks": [[str(p), str(s)] for p, s in book.levels("ask", depth)],
+            "ts": str(book.timestamp or self.now_ms()),
+            "seq": book.seq,
+        }
+
+    @staticmethod
+    def _channel_depth(channel: str) -> int | None:
+        return int(channel[5:]) if channel[5:].isdigit() else None
+
+    def _send_snapshot(self, client: _WsClient, channel: str, symbol: str) -> None:
+        if channel in PRIVATE_CHANNELS:
+            self._push_private(channel, self._private_data(channel), (client,))
+        elif channel == "ticker" and symbol in self.tickers:
+            self._push(channel, symbol, "snapshot", [self._raw_ticker(symbol, "instId")], (client,))
+        elif channel.startswith("books"):
+            snapshot = self._book_snapshot(symbol, self._channel_depth(channel) or self.order_books.max_levels)
+            if snapshot is not None:
+                self._push(channel, symbol, "snapshot", [snapshot], (client,))
+
+    def _publish_ticker(self, symbol: str) -> None:
+        clients = self._subscribers.get(("ticker", symbol))
+        if clients:
+            self._push("ticker", symbol, "snapshot", [self._raw_ticker(symbol, "instId")], clients)
+
+    def _publish_book(self, symbol: str, action: str, data: dict[str, Any]) -> None:
+        for (channel, sub_symbol), clients in self._subscribers.items():
+            if sub_symbol != symbol or not clients or not channel.startswith("books"):
+                continue
+            depth = self._channel_depth(channel)
+            if depth is None:
+                # Full book channel: forward the push itself (levels as strings, like Bitget)
+                push = {
+                    "bids": [[str(p), str(s)] for p, s in data.get("bids") or []],
+                    "asks": [[str(p), str(s)] for p, s in data.get("asks") or []],
+                    "ts": str(data.get("ts") or self.now_ms()),
+                    "seq": data.get("seq", 0),
+                }
+                self._push(channel, symbol, action, [push], clients)
+            else:
+                self._push(channel, symbol, "snapshot", [self._book_snapshot(symbol, depth)], clients)
+
+
+class LocalRestClient(BitgetRestClient):
+    """
+    ``BitgetRestClient`` wired straight into an ``ExchangeSimulator``.
+
+    Only the transport is replaced: requests are still signed, rate limited,
+    retried and JSON-encoded, then handed to ``simulator.handle`` without a
+    socket in between.
+    """
+
+    def __init__(self, simulator: ExchangeSimulator, **kwargs: Any) -> None:
+        kwargs.setdefault("transport", "aiohttp")
+        api_secret = kwargs.pop("api_secret", None) or simulator.api_secret or "sim-secret"
+        super().__init__(
+            kwargs.pop("api_key", "sim-key"),
+            api_secret,
+            kwargs.pop("passphrase", "sim-pass"),
+            base_url="http://exchange-simulator",
+            **kwargs,
+        )
+        self.simulator = simulator
+
+    async def _send(self, method: str, url: str, headers: dict[str, str], body: str) -> tuple[int, str]:
+        parts = urlsplit(url)
+        request_path = parts.path + (f"?{parts.query}" if parts.query else "")
+        params = orjson.loads(body) if body else dict(parse_qsl(parts.query))
+        status, payload = await self.simulator.handle(method, request_path, params, headers, body)
+        return status, orjson.dumps(payload).decode()
+
+    async def close(self) -> None:
+        return None
@@ -0,0 +1,103 @@
+"""Columnar (symbols x features) store for cross-sectional ranking."""
+
+import numpy as np
+
+# Stable column order; index with FeatureMatrix.column_index or FeatureMatrix.column()
+FEATURE_COLUMNS: tuple[str, ...] = (
+    # Price / order book
+    "mid_price",
+    "spread_bps",
+    "ob_imbalance",
+    "volume_24h",
+    "funding_rate",
+    "volume_ratio",
+    # Multi-timeframe returns
+    "return_1s",
+    "return_3s",
+    "return_5s",
+    "return_10s",
+    "return_15s",
+    "return_30s",
+    "return_1min",
+    "return_3min",
+    "return_5min",
+    # Volatility
+    "volatility_30s",
+    "volatility_60s",
+    "volatility_5min",
+    # Advanced indicators
+    "rsi_15s",
+    "macd_histogram",
+    "bb_position",
+    "vwap_deviation",
+    "order_flow_imbalance",
+    "tick_momentum",
+    "composite_score",
+)
+
+
+class FeatureMatrix:
+    """
+    Symbols x features float64 matrix with stable row and column indices.
+
+    Each symbol keeps its row for its lifetime, so column views can be
+    combined element-wise without realignment. Features a symbol does not
+    have (e.g. ``return_5min`` before 5 minutes of history) are NaN. The full
+    feature dict of every row is kept alongside for consumers that still need
+    per-symbol lookups.
+    """
+
+    def __init__(self, columns: tuple[str, ...] = FEATURE_COLUMNS, capacity: int = 256) -> None:
+        """
+        Initialize feature matrix.
+
+        Args:
+            columns: Feature names, in column order
+            capacity: Initial number of rows (grows by doubling)
+        """
+        self.columns = columns
+        self.column_index: dict[str, int] = {name: i for i, name in enumerate(columns)}
+        self.symbols: list[str] = []
+        self.row_index: dict[str, int] = {}
+        self.features: dict[str, dict[str, float]] = {}
+        self._values = np.full((max(1, capacity), len(columns)), np.nan)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.row_index
+
+    @property
+    def values(self) -> np.ndarray:
+        """``(n_symbols, n_columns)`` view of the populated rows."""
+        return self._values[: len(self.symbols)]
+
+    def column(self, name: str) -> np.ndarray:
+        """View of one feature across all symbols (row order = ``symbols``)."""
+        return self._values[: len(self.symbols), self.column_index[name]]
+
+    def set_row(self, symbol: str, features: dict[str, float]) -> None:
+        """
+        Store the features of one symbol, adding a row if needed.
+
+        Args:
+            symbol: Trading symbol
+            features: Output of ``SymbolState.compute_features``
+        """
+        row = self.row_index.get(symbol)
+        if row is None:
+            row = len(self.symbols)
+            if row == len(self._values):
+                grown = np.full((2 * len(self._values), len(self.columns)), np.nan)
+                grown[:row] = self._values
+                self._values = grown
+            self.symbols.append(symbol)
+            self.row_index[symbol] = row
+
+        values = self._values[row]
+        for i, name in enumerate(self.columns):
+            value = features.get(name)
+            values[i] = np.nan if value is None else value
+
+        self.features[symbol] = features
@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 
 from src.bitget_trading.logger import get_logger
+from src.bitget_trading.order_book import OrderBook
 
 logger = get_logger()
 
@@ -97,8 +98,9 @@ class MicrostructureFeatures:
         self.depths_ask: Deque[float] = deque(maxlen=max_len)
         self.volumes: Deque[float] = deque(maxlen=max_len)
         
-        # Latest orderbook snapshot
+        # Latest orderbook snapshot (or live incremental book)
         self.last_orderbook: dict[str, any] | None = None
+        self.book: OrderBook | None = None
         self.last_ticker: dict[str, any] | None = None
 
     def update_ticker(self, ticker: dict[str, any]) -> None:
@@ -108,6 +110,11 @@ class MicrostructureFeatures:
     def update_orderbook(self, orderbook: dict[str, any]) -> None:
         """Update with new orderbook snapshot."""
         self.last_orderbook = orderbook
+        self.book = None
+
+    def update_book(self, book: OrderBook) -> None:
+        """Use a live incremental order book (depth queries run on its arrays)."""
+        self.book = book
 
     def compute_features(self) -> dict[str, float] | None:
         """
@@ -116,54 +123,74 @@ class MicrostructureFeatures:
         Returns:
             Feature dictionary or None if insufficient data
         """
-        if not self.last_orderbook or not self.last_ticker:
-            return None
-        
-        bids = self.last_orderbook["bids"]
-        asks = self.last_orderbook["asks"]
-        
-        if not bids or not asks:
+        if not self.last_ticker:
             return None
         
-        # Extract price and size arrays
-        bid_prices = np.array([b[0] for b in bids])
-        bid_sizes = np.array([b[1] for b in bids])
-        ask_prices = np.array([a[0] for a in asks])
-        ask_sizes = np.array([a[1] for a in asks])
+        if self.book is not None:
+            book = self.book
+            if not book.synced or book.mid <= 0:
+                return None
+            best_bid = book.best_bid
+            best_ask = book.best_ask
+            imb_1 = book.imbalance(levels=1)
+            imb_3 = book.imbalance(levels=3)
+            imb_5 = book.imbalance(levels=5)
+            total_bid_depth = book.depth("bid")
+            total_ask_depth = book.depth("ask")
+            depth_5bps_bid = book.depth_within_bps("bid", 5.0)
+            depth_10bps_bid = book.depth_within_bps("bid", 10.0)
+            depth_5bps_ask = book.depth_within_bps("ask", 5.0)
+            depth_10bps_ask = book.depth_within_bps("ask", 10.0)
+            timestamp = book.timestamp
+        else:
+            if not self.last_orderbook:
+                return None
+            
+            bids = self.last_orderbook["bids"]
+            asks = self.last_orderbook["asks"]
+            
+            if not bids or not asks:
+                return None
+            
+            # Extract price and size arrays
+            bid_prices = np.array([b[0] for b in bids])
+            bid_sizes = np.array([b[1] for b in bids])
+            ask_prices = np.array([a[0] for a in asks])
+            ask_sizes = np.array([a[1] for a in asks])
+            
+            best_bid = bid_prices[0]
+            best_ask = ask_prices[0]
+            mid = (best_bid + best_ask) / 2.0
+            
+            # Order book imbalance features
+            imb_1 = compute_order_book_imbalance(bid_sizes[:1], ask_sizes[:1])
+            imb_3 = compute_order_book_imbalance(bid_sizes[:3], ask_sizes[:3])
+            imb_5 = compute_order_book_imbalance(bid_sizes[:5], ask_sizes[:5])
+            
+            # Depth features
+            total_bid_depth = np.sum(bid_sizes)
+            total_ask_depth = np.sum(ask_sizes)
+            
+            # Depth within X bps
+            depth_5bps_bid = self._compute_depth_within_bps(bid_prices, bid_sizes, mid, 5.0, is_bid=True)
+            depth_10bps_bid = self._compute_depth_within_bps(bid_prices, bid_sizes, mid, 10.0, is_bid=True)
+            depth_5bps_ask = self._compute_depth_within_bps(ask_prices, ask_sizes, mid, 5.0, is_bid=False)
+            depth_10bps_ask = self._compute_depth_within_bps(ask_prices, ask_sizes, mid, 10.0, is_bid=False)
+            timestamp = self.last_orderbook["timestamp"]
         
         # Basic price features
-        best_bid = bid_prices[0]
-        best_ask = ask_prices[0]
         mid = (best_bid + best_ask) / 2.0
         spread = best_ask - best_bid
         spread_bps = (spread / mid) * 10000 if mid > 0 else 0
         
         # Store in rolling windows
-        timestamp = self.last_orderbook["timestamp"]
         self.timestamps.append(timestamp)
         self.mid_prices.append(mid)
         self.spreads.append(spread_bps)
-        
-        # Order book imbalance features
-        imb_1 = compute_order_book_imbalance(bid_sizes[:1], ask_sizes[:1])
-        imb_3 = compute_order_book_imbalance(bid_sizes[:3], ask_sizes[:3])
-        imb_5 = compute_order_book_imbalance(bid_sizes[:5], ask_sizes[:5])
-        
         self.imbalances.append(imb_5)
-        
-        # Depth features
-        total_bid_depth = np.sum(bid_sizes)
-        total_ask_depth = np.sum(ask_sizes)
-        
         self.depths_bid.append(total_bid_depth)
         self.depths_ask.append(total_ask_depth)
         
-        # Depth within X bps
-        depth_5bps_bid = self._compute_depth_within_bps(bid_prices, bid_sizes, mid, 5.0, is_bid=True)
-        depth_10bps_bid = self._compute_depth_within_bps(bid_prices, bid_sizes, mid, 10.0, is_bid=True)
-        depth_5bps_ask = self._compute_depth_within_bps(ask_prices, ask_sizes, mid, 5.0, is_bid=False)
-        depth_10bps_ask = self._compute_depth_within_bps(ask_prices, ask_sizes, mid, 10.0, is_bid=False)
-        
         # Price features (returns over multiple windows)
         features = {
             # Instantaneous
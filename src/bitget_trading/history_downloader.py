@@ -0,0 +1,228 @@
+"""Concurrent, incremental candle history downloader."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from src.bitget_trading.candle_store import COLUMNS, CandleStore
+from src.bitget_trading.logger import get_logger
+from src.bitget_trading.rate_limiter import PRIORITY_BULK
+
+logger = get_logger()
+
+TIMEFRAME_MS = {
+    "1m": 60_000,
+    "3m": 180_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "1H": 3_600_000,
+    "4H": 14_400_000,
+    "6H": 21_600_000,
+    "12H": 43_200_000,
+    "1D": 86_400_000,
+}
+MAX_CANDLES_PER_REQUEST = 200
+
+
+def missing_ranges(
+    timestamps: np.ndarray,
+    start_ms: int,
+    end_ms: int,
+    step_ms: int,
+    verified_start: int | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Bar ranges in [start_ms, end_ms] that are not stored yet.
+
+    Args:
+        timestamps: Stored bar open times (sorted)
+        start_ms: First bar wanted
+        end_ms: Last bar wanted (the forming bar)
+        step_ms: Bar length
+        verified_start: Earlier bars are known not to exist on the exchange
+
+    Returns:
+        Inclusive (first, last) bar times; the stored tail bar is always
+        included again because it may have been saved while still forming
+    """
+    if verified_start is not None:
+        start_ms = max(start_ms, verified_start)
+    stored = timestamps[(timestamps >= start_ms) & (timestamps <= end_ms)]
+    if not len(stored):
+        return [(start_ms, end_ms)] if start_ms <= end_ms else []
+
+    ranges = []
+    if stored[0] > start_ms:
+        ranges.append((start_ms, int(stored[0]) - step_ms))
+    gaps = np.flatnonzero(np.diff(stored) > step_ms)
+    for i in gaps:
+        ranges.append((int(stored[i]) + step_ms, int(stored[i + 1]) - step_ms))
+    ranges.append((int(stored[-1]), end_ms))
+    return ranges
+
+
+def split_windows(ranges: list[tuple[int, int]], step_ms: int, size: int = MAX_CANDLES_PER_REQUEST) -> list[tuple[int, int]]:
+    """Cut ranges into request windows of at most `size` bars."""
+    windows = []
+    for first, last in ranges:
+        while first <= last:
+            window_last = min(last, first + (size - 1) * step_ms)
+            windows.append((first, window_last))
+            first = window_last + step_ms
+    return windows
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of one symbol's download."""
+
+    symbol: str
+    timeframe: str
+    requests: int = 0
+    failed: int = 0
+    new_bars: int = 0
+    rows: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+class HistoryDownloader:
+    """
+    Bring stored candle series up to date with as few requests as possible.
+
+    The wanted range is diffed against what the ``CandleStore`` already holds:
+    only the head (older than stored), interior gaps and the tail from the last
+    stored bar onwards are requested. Those ranges are split into independent
+    200-bar windows that are fetched concurrently; the shared REST rate
+    limiter paces them at bulk priority. Results are merged into the store in
+    one write (duplicates resolved by timestamp).
+
+    After a download without failures, the first stored bar is remembered as
+    ``verified_start`` so symbols listed after the window start do not have
+    their (non-existent) older history re-requested on every run.
+    """
+
+    def __init__(self, rest_client: Any, store: CandleStore, concurrency: int = 16) -> None:
+        """
+        Initialize history downloader.
+
+        Args:
+            rest_client: BitgetRestClient
+            store: Candle store to update
+            concurrency: Max candle requests in flight (across all symbols)
+        """
+        self.rest_client = rest_client
+        self.store = store
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def _fetch_window(self, symbol: str, timeframe: str, first: int, last: int, live: bool) -> list[list]:
+        async with self._semaphore:
+            response = await self.rest_client.get_historical_candles(
+                symbol=symbol,
+                granularity=timeframe,
+                limit=MAX_CANDLES_PER_REQUEST,
+                start_time=first,
+                end_time=last,
+                history=not live,
+                priority=PRIORITY_BULK,
+            )
+        if response.get("code") != "00000":
+            raise RuntimeError(f"API error: {response.get('code')} {response.get('msg', '')}")
+        return [c for c in response.get("data") or [] if first <= int(c[0]) <= last]
+
+    async def download(
+        self,
+        symbol: str,
+        timeframe: str = "1m",
+        days: float = 30,
+        full: bool = False,
+        now_ms: int | None = None,
+    ) -> DownloadResult:
+        """
+        Download whatever is missing for the last `days` days.
+
+        Args:
+            symbol: Trading pair
+            timeframe: Candle timeframe
+            days: Lookback
+            full: Ignore stored bars and download the whole range again
+            now_ms: Current time (default: wall clock)
+
+        Returns:
+            DownloadResult
+        """
+        step = TIMEFRAME_MS[timeframe]
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+        end_ms = now_ms // step * step  # forming bar
+        start_ms = end_ms - int(days * 86_400_000) + step
+        result = DownloadResult(symbol, timeframe)
+
+        info = None if full else self.store.info(symbol, timeframe)
+        arrays = None if full else self.store.load_arrays(symbol, timeframe)
+        stored = np.array(arrays["timestamp"]) if arrays is not None else np.zeros(0, dtype=np.int64)
+        verified_start = info.get("verified_start") if info else None
+        ranges = missing_ranges(stored, start_ms, end_ms, step, verified_start)
+        windows = split_windows(ranges, step)
+        result.requests = len(windows)
+        if not windows:
+            result.rows = len(stored)
+            return result
+
+        outcomes = await asyncio.gather(
+            *(self._fetch_window(symbol, timeframe, first, last, live=last >= end_ms) for first, last in windows),
+            return_exceptions=True,
+        )
+
+        candles = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                result.failed += 1
+                result.errors.append(str(outcome))
+                continue
+            candles.extend(outcome)
+
+        if candles:
+            data = np.array([[float(v) for v in c[:6]] for c in candles])
+            new = {name: data[:, i] for i, name in enumerate(COLUMNS)}
+            new["timestamp"] = data[:, 0].astype(np.int64)
+            result.new_bars = int(len(np.setdiff1d(new["timestamp"], stored)))
+            result.rows = self.store.append(symbol, timeframe, new)
+        else:
+            result.rows = len(stored)
+
+        # Bars before the first one the exchange returned do not exist (newly listed symbol)
+        if not result.failed and result.rows:
+            first_stored = self.store.info(symbol, timeframe)["start"]
+            if first_stored > start_ms:
+                self.store.set_meta(symbol, timeframe, verified_start=first_stored)
+
+        if result.failed:
+            logger.warning(
+                f"⚠️ [HISTORY] {symbol} {timeframe}: {result.failed}/{result.requests} windows failed "
+                f"({result.errors[0]})"
+            )
+        return result
+
+    async def download_many(
+        self,
+        symbols: list[str],
+        timeframe: str = "1m",
+        days: float = 30,
+        full: bool = False,
+    ) -> dict[str, DownloadResult]:
+        """Download several symbols concurrently (sharing the request budget)."""
+        now_ms = int(time.time() * 1000)
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(self.download(symbol, timeframe, days, full=full, now_ms=now_ms) for symbol in symbols)
+        )
+        by_symbol = {r.symbol: r for r in results}
+        logger.info(
+            f"📥 [HISTORY] {len(symbols)} symbols {timeframe}/{days}d | "
+            f"{sum(r.requests for r in results)} requests, {sum(r.failed for r in results)} failed | "
+            f"{sum(r.new_bars for r in results)} new bars | {time.perf_counter() - started:.1f}s"
+        )
+        return by_symbol
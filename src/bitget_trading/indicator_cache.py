@@ -0,0 +1,209 @@
+"""Shared cache of indicator columns for backtest sweeps."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from src.bitget_trading.logger import get_logger
+
+logger = get_logger()
+
+Columns = dict[str, np.ndarray]
+
+FINGERPRINT_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+def fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of the OHLCV columns (any changed bar gives a new key)."""
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(str(len(df)).encode())
+    for name in FINGERPRINT_COLUMNS:
+        if name in df.columns:
+            digest.update(np.ascontiguousarray(df[name].to_numpy()).tobytes())
+    return digest.hexdigest()
+
+
+def params_key(params: dict[str, Any] | None) -> str:
+    if not params:
+        return "default"
+    return "-".join(f"{k}={v}" for k, v in sorted(params.items()))
+
+
+class IndicatorCache:
+    """
+    Indicator columns keyed by (symbol, timeframe, indicator, params, data fingerprint).
+
+    Lookups go memory -> disk -> compute. On disk every entry is a directory
+    of ``.npy`` columns under ``root``, loaded memory-mapped, so worker
+    processes of a sweep share one copy through the page cache and each
+    indicator series is computed once per data set, not once per strategy.
+    Up to ``max_versions`` fingerprints of the same series are kept on disk
+    (e.g. train and test windows of one symbol); beyond that the least
+    recently used ones are removed when a new one is written.
+
+    Writers race safely: an entry is built in a temp directory and renamed
+    into place; if another process got there first, its copy is used.
+    """
+
+    def __init__(
+        self,
+        root: str | None = "backtest_data/indicators",
+        max_memory_entries: int = 512,
+        max_versions: int = 8,
+    ) -> None:
+        """
+        Initialize indicator cache.
+
+        Args:
+            root: Directory for persisted entries (None = memory only)
+            max_memory_entries: In-process LRU size
+            max_versions: Data versions kept on disk per series
+        """
+        self.root = Path(root) if root is not None else None
+        self.max_memory_entries = max_memory_entries
+        self.max_versions = max_versions
+        self._memory: OrderedDict[str, Columns] = OrderedDict()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "computed": 0}
+
+    def for_frame(self, df: pd.DataFrame, symbol: str, timeframe: str = "") -> "FrameIndicators":
+        """Bind the cache to one OHLCV frame (fingerprint computed once)."""
+        return FrameIndicators(self, df, symbol, timeframe, fingerprint(df))
+
+    def _series_name(self, symbol: str, timeframe: str, indicator: str, params: dict[str, Any] | None) -> str:
+        return "_".join(part for part in (symbol, timeframe, indicator, params_key(params)) if part)
+
+    def get(
+        self,
+        symbol: str,
+        timeframe: str,
+        indicator: str,
+        params: dict[str, Any] | None,
+        data_fingerprint: str,
+        compute: Callable[[], Columns],
+    ) -> Columns:
+        """
+        Cached columns of one indicator, computing them on a miss.
+
+        Args:
+            symbol: Trading pair
+            timeframe: Candle timeframe (part of the key, may be "")
+            indicator: Indicator name
+            params: Indicator parameters
+            data_fingerprint: ``fingerprint()`` of the input frame
+            compute: Returns {column: array} for the whole series
+
+        Returns:
+            {column: array}; arrays from disk are read-only memory maps
+        """
+        series = self._series_name(symbol, timeframe, indicator, params)
+        key = f"{series}@{data_fingerprint}"
+
+        columns = self._memory.get(key)
+        if columns is not None:
+            self._memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return columns
+
+        columns = self._load(key)
+        if columns is not None:
+            self.stats["disk_hits"] += 1
+        else:
+            columns = {name: np.asarray(values) for name, values in compute().items()}
+            self.stats["computed"] += 1
+            if self.root is not None:
+                try:
+                    self._store(series, key, columns)
+                except OSError as e:
+                    logger.warning(f"⚠️ [INDICATOR CACHE] Could not persist {key}: {e}")
+
+        self._memory[key] = columns
+        if len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+        return columns
+
+    def _load(self, key: str) -> Columns | None:
+        if self.root is None:
+            return None
+        entry = self.root / key
+        try:
+            with open(entry / "columns.json", "r") as f:
+                names = json.load(f)
+            columns = {name: np.load(entry / f"{i}.npy", mmap_mode="r") for i, name in enumerate(names)}
+        except (FileNotFoundError, ValueError):
+            return None
+        try:
+            os.utime(entry)  # recently used: kept by eviction
+        except OSError:
+            pass
+        return columns
+
+    def _store(self, series: str, key: str, columns: Columns) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.root))
+        try:
+            for i, values in enumerate(columns.values()):
+                np.save(tmp_dir / f"{i}.npy", values)
+            # Written last: an entry without it is incomplete
+            with open(tmp_dir / "columns.json", "w") as f:
+                json.dump(list(columns), f)
+            os.rename(tmp_dir, self.root / key)
+        except OSError:
+            if (self.root / key).exists():
+                return  # another process wrote the same entry
+            raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        # Drop the least recently used data versions of this series beyond the limit
+        versions = []
+        for entry in self.root.glob(f"{series}@*"):
+            try:
+                versions.append((entry.stat().st_mtime_ns, entry))
+            except FileNotFoundError:
+                continue  # removed by another process
+        versions.sort(reverse=True)
+        for _, old in versions[self.max_versions:]:
+            if old.name != key:
+                shutil.rmtree(old, ignore_errors=True)
+
+
+class FrameIndicators:
+    """An ``IndicatorCache`` bound to one frame: ``get(indicator, params, compute)``."""
+
+    def __init__(self, cache: IndicatorCache | None, df: pd.DataFrame, symbol: str, timeframe: str, data_fingerprint: str) -> None:
+        self.cache = cache
+        self.df = df
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.fingerprint = data_fingerprint
+
+    def get(self, indicator: str, params: dict[str, Any] | None, compute: Callable[[pd.DataFrame], Columns]) -> Columns:
+        if self.cache is None:
+            return compute(self.df)
+        return self.cache.get(
+            self.symbol, self.timeframe, indicator, params, self.fingerprint, lambda: compute(self.df)
+        )
+
+
+def uncached(df: pd.DataFrame) -> FrameIndicators:
+    """Compute-through binding for callers without a cache."""
+    return FrameIndicators(None, df, "", "", "")
+
+
+_caches: dict[str, IndicatorCache] = {}
+
+
+def get_indicator_cache(root: str = "backtest_data/indicators") -> IndicatorCache:
+    """Process-wide cache per root (sweep workers reuse it across tasks)."""
+    cache = _caches.get(root)
+    if cache is None:
+        cache = _caches[root] = IndicatorCache(root)
+    return cache
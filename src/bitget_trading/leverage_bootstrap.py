@@ -0,0 +1,182 @@
+"""Concurrent leverage bootstrap for the trading universe."""
+
+import asyncio
+from typing import Any
+
+from .leverage_cache import LeverageCache
+from .logger import get_logger
+
+logger = get_logger()
+
+HOLD_SIDES = ("long", "short")
+# Bitget: requested leverage above the symbol's maximum
+NOT_SUPPORTED_CODES = ("40797", "40798")
+
+
+def is_leverage_not_supported(error: Any) -> bool:
+    """True if an API response/exception says the leverage can never be set."""
+    if isinstance(error, dict):
+        text = f"{error.get('code', '')} {error.get('msg', '')}"
+    else:
+        text = f"{error} {error!r}"
+    lowered = text.lower()
+    return (
+        any(code in text for code in NOT_SUPPORTED_CODES)
+        or "maximum settable leverage" in lowered
+        or "exceeded the maximum" in lowered
+        or "not supported" in lowered
+    )
+
+
+class LeverageBootstrap:
+    """
+    Bring every symbol of the universe to the desired leverage.
+
+    ``start`` diffs the desired leverage against what is already known in bulk
+    (leverage cache, open positions and the contract catalog's max leverage),
+    then issues only the missing ``set_leverage`` calls concurrently in the
+    background. The shared REST rate limiter paces them. Symbols are reported
+    ready as soon as both hold sides are settled, so trading can start on
+    configured symbols immediately.
+    """
+
+    def __init__(
+        self,
+        rest_client: Any,
+        leverage_cache: LeverageCache,
+        leverage: int,
+        concurrency: int = 8,
+    ) -> None:
+        """
+        Initialize leverage bootstrap.
+
+        Args:
+            rest_client: BitgetRestClient
+            leverage_cache: Persistent record of applied leverage
+            leverage: Desired leverage for every symbol
+            concurrency: Max set-leverage requests in flight
+        """
+        self.rest_client = rest_client
+        self.leverage_cache = leverage_cache
+        self.leverage = leverage
+        self.concurrency = concurrency
+
+        self._pending: dict[str, set[str]] = {}  # symbol -> hold sides still to set
+        self._task: asyncio.Task | None = None
+        self.stats = {"cached": 0, "from_positions": 0, "over_max": 0, "set": 0, "failed": 0, "errors": 0}
+
+    def is_ready(self, symbol: str) -> bool:
+        """True unless the symbol still has leverage calls outstanding."""
+        return symbol not in self._pending
+
+    @property
+    def pending_symbols(self) -> list[str]:
+        return list(self._pending)
+
+    async def _current_leverage(self) -> dict[tuple[str, str], int]:
+        """Leverage of open positions: one bulk request instead of one per symbol."""
+        try:
+            positions = await self.rest_client.get_all_positions()
+        except Exception as e:
+            logger.warning(f"⚠️ [LEVERAGE BOOTSTRAP] Could not fetch positions: {e}")
+            return {}
+        current = {}
+        for pos in positions:
+            try:
+                current[(pos["symbol"], pos["holdSide"])] = int(float(pos["leverage"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return current
+
+    async def plan(self, symbols: list[str]) -> dict[str, set[str]]:
+        """
+        Work out which (symbol, hold side) pairs need a set-leverage call.
+
+        Pairs already settled are recorded in the leverage cache.
+        """
+        current = await self._current_leverage()
+        catalog = getattr(self.rest_client, "contract_catalog", None)
+        pending: dict[str, set[str]] = {}
+
+        for symbol in symbols:
+            spec = catalog.get_cached(symbol) if catalog is not None else None
+            for hold_side in HOLD_SIDES:
+                if self.leverage_cache.is_set(symbol, self.leverage, hold_side):
+                    self.stats["cached"] += 1
+                elif current.get((symbol, hold_side)) == self.leverage:
+                    self.leverage_cache.mark_set(symbol, self.leverage, hold_side)
+                    self.stats["from_positions"] += 1
+                elif spec is not None and spec.max_leverage < self.leverage:
+                    # The exchange would reject it with 40797
+                    self.leverage_cache.mark_failed(symbol, self.leverage, hold_side, "40797")
+                    self.stats["over_max"] += 1
+                else:
+                    pending.setdefault(symbol, set()).add(hold_side)
+        return pending
+
+    async def start(self, symbols: list[str]) -> list[str]:
+        """
+        Diff the universe and start setting the missing leverage in the background.
+
+        Returns:
+            Symbols that are ready to trade right away
+        """
+        self._pending = await self.plan(symbols)
+        self.leverage_cache.flush()
+        ready = [s for s in symbols if s not in self._pending]
+        logger.info(
+            f"🔧 [LEVERAGE BOOTSTRAP] {len(ready)}/{len(symbols)} symbols ready | "
+            f"{sum(len(sides) for sides in self._pending.values())} set-leverage calls queued "
+            f"({self.concurrency} concurrent) | {self.stats}"
+        )
+        self._task = asyncio.create_task(self._run())
+        return ready
+
+    async def wait(self) -> dict[str, int]:
+        """Wait for the background calls to finish; returns the stats."""
+        if self._task is not None:
+            await self._task
+        return self.stats
+
+    async def _run(self) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        jobs = [(symbol, side) for symbol, sides in self._pending.items() for side in sorted(sides)]
+
+        async def set_one(symbol: str, hold_side: str) -> None:
+            async with semaphore:
+                await self._set(symbol, hold_side)
+            sides = self._pending.get(symbol)
+            if sides is not None:
+                sides.discard(hold_side)
+                if not sides:
+                    del self._pending[symbol]
+
+        try:
+            await asyncio.gather(*(set_one(symbol, side) for symbol, side in jobs))
+        finally:
+            self.leverage_cache.save()
+            logger.info(f"✅ [LEVERAGE BOOTSTRAP] Complete | {self.stats}")
+
+    async def _set(self, symbol: str, hold_side: str) -> None:
+        try:
+            response = await self.rest_client.set_leverage(
+                symbol=symbol, leverage=self.leverage, hold_side=hold_side
+            )
+        except Exception as e:
+            if is_leverage_not_supported(e):
+                self.leverage_cache.mark_failed(symbol, self.leverage, hold_side, "40797")
+                self.stats["failed"] += 1
+            else:
+                # Network/temporary error: not cached, retried on the next start
+                self.stats["errors"] += 1
+                logger.warning(f"⚠️ [LEVERAGE BOOTSTRAP] {symbol} {hold_side}: {e}")
+            return
+
+        if response.get("code") == "00000":
+            self.leverage_cache.mark_set(symbol, self.leverage, hold_side)
+            self.stats["set"] += 1
+        elif is_leverage_not_supported(response):
+            self.leverage_cache.mark_failed(symbol, self.leverage, hold_side, response.get("code"))
+            self.stats["failed"] += 1
+        else:
+            self.stats["errors"] += 1
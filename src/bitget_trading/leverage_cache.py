@@ -1,6 +1,7 @@
 """Leverage cache to avoid redundant API calls on startup."""
 
 import json
+import os
 import time
 from pathlib import Path
 from typing import Any
@@ -19,16 +20,25 @@ class LeverageCache:
     we've already set to avoid ~600 API calls on every startup.
     """
 
-    def __init__(self, cache_file: str = "leverage_cache.json", cache_expiry_hours: int = 24):
+    def __init__(
+        self,
+        cache_file: str = "leverage_cache.json",
+        cache_expiry_hours: int = 24,
+        flush_interval_sec: float = 1.0,
+    ):
         """
         Initialize leverage cache.
         
         Args:
             cache_file: Path to cache file
             cache_expiry_hours: How long to trust cache entries (default: 24 hours)
+            flush_interval_sec: Min time between disk writes for successful entries
         """
         self.cache_file = Path(cache_file)
         self.cache_expiry_seconds = cache_expiry_hours * 3600
+        self.flush_interval_sec = flush_interval_sec
+        self._last_save = 0.0
+        self._dirty = False
         self.cache: dict[str, dict[str, Any]] = self._load_cache()
     
     def _load_cache(self) -> dict[str, dict[str, Any]]:
@@ -48,10 +58,14 @@ class LeverageCache:
             return {}
     
     def _save_cache(self) -> None:
-        """Save cache to disk."""
+        """Save cache to disk (atomically: a crash never leaves a truncated file)."""
+        tmp_file = self.cache_file.with_suffix(self.cache_file.suffix + ".tmp")
         try:
-            with open(self.cache_file, "w") as f:
+            with open(tmp_file, "w") as f:
                 json.dump(self.cache, f, indent=2)
+            os.replace(tmp_file, self.cache_file)
+            self._last_save = time.monotonic()
+            self._dirty = False
         except Exception as e:
             logger.error(f"❌ [LEVERAGE CACHE] Failed to save cache: {e}")
     
@@ -117,8 +131,9 @@ class LeverageCache:
             "failed": False,  # Successfully set
         }
         
-        # Save to disk periodically (every 50 symbols)
-        if len(self.cache) % 50 == 0:
+        # Save as we go, but at most once per flush interval (call save()/flush() at the end)
+        self._dirty = True
+        if time.monotonic() - self._last_save >= self.flush_interval_sec:
             self._save_cache()
     
     def mark_failed(self, symbol: str, leverage: int, hold_side: str, error_code: str = None) -> None:
@@ -158,6 +173,11 @@ class LeverageCache:
             self.cache_file.unlink()
         logger.info("🗑️ [LEVERAGE CACHE] Cache cleared")
     
+    def flush(self) -> None:
+        """Write pending entries to disk, if any."""
+        if self._dirty:
+            self._save_cache()
+
     def save(self) -> None:
         """Explicitly save cache to disk."""
         self._save_cache()
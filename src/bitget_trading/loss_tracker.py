@@ -12,14 +12,16 @@ Tracks:
 Goal: Identify patterns in losing trades to improve strategy.
 """
 
-import json
 import time
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
+import pandas as pd
+
 from src.bitget_trading.logger import get_logger
+from src.bitget_trading.trade_journal import FsyncPolicy, TradeJournal, load_journal, sidecar_dtype
 
 logger = get_logger()
 
@@ -111,9 +113,22 @@ class LossTracker:
     - Optimal entry conditions
     """
     
-    def __init__(self, log_file: str = "trades_detailed.jsonl"):
-        """Initialize loss tracker."""
+    def __init__(
+        self,
+        log_file: str = "trades_detailed.jsonl",
+        fsync: FsyncPolicy = "batch",
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        Initialize loss tracker.
+        
+        Args:
+            log_file: Trade journal (JSONL, rotated by size and date)
+            fsync: Journal fsync policy ("never", "batch", "interval")
+            max_bytes: Journal size that triggers rotation
+        """
         self.log_file = Path(log_file)
+        self.journal = TradeJournal(self.log_file, sidecar=sidecar_dtype(TradeRecord), fsync=fsync, max_bytes=max_bytes)
         self.trades: list[TradeRecord] = []
         
         # Statistics
@@ -160,12 +175,8 @@ class LossTracker:
         else:
             self.win_by_grade[trade.entry_grade] = (wins, total + 1)
         
-        # Save to file (JSONL format - one trade per line)
-        try:
-            with open(self.log_file, "a") as f:
-                f.write(json.dumps(trade.to_dict()) + "\n")
-        except Exception as e:
-            logger.error(f"Failed to write trade log: {e}")
+        # Save to file (JSONL format - one trade per line, written in the background)
+        self.journal.write(trade.to_dict())
         
         # Log detailed trade info
         win_emoji = "✅" if trade.is_win else "❌"
@@ -185,6 +196,21 @@ class LossTracker:
         if trade.is_loss:
             self._analyze_loss(trade)
     
+    def close(self) -> None:
+        """Write queued trades and stop the journal writer."""
+        self.journal.close()
+    
+    @staticmethod
+    def load_history(log_file: str = "trades_detailed.jsonl", columns: list[str] | None = None) -> pd.DataFrame:
+        """
+        All journaled trades (every rotated segment) for analysis.
+        
+        Args:
+            log_file: Trade journal path
+            columns: Subset of TradeRecord fields (default: all numeric/string fields)
+        """
+        return load_journal(log_file, columns)
+    
     def _analyze_loss(self, trade: TradeRecord) -> None:
         """
         Detailed analysis of why a trade lost money.
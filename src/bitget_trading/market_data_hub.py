@@ -0,0 +1,289 @@
+"""Multiplexed multi-symbol WebSocket market-data hub for Bitget USDT-M futures."""
+
+import asyncio
+import time
+from typing import Any, Callable
+
+import orjson
+import websockets
+
+from src.bitget_trading.bitget_ws import parse_ticker
+from src.bitget_trading.logger import get_logger
+from src.bitget_trading.multi_symbol_state import MultiSymbolStateManager
+from src.bitget_trading.order_book import OrderBookEngine
+
+logger = get_logger()
+
+
+class MarketDataHub:
+    """
+    Streams ticker and order book channels for many symbols into the state manager.
+
+    Subscriptions are sharded over a small number of public connections so that
+    no connection exceeds ``max_channels_per_connection``. Each shard owns its
+    subscription list and replays it after every reconnect.
+
+    ``books*`` pushes (snapshots and, for ``books``, incremental updates) are
+    applied to an ``OrderBookEngine``; a book that fails its checksum is
+    resubscribed on its shard to get a fresh snapshot.
+    """
+
+    WS_URL = "wss://ws.bitget.com/v2/ws/public"
+    PING_INTERVAL = 20  # seconds (Bitget drops idle connections after 30s)
+    RECV_TIMEOUT = 30.0  # seconds without any frame before forcing a reconnect
+    SUBSCRIBE_BATCH_SIZE = 50  # args per subscribe request
+    RECONNECT_BASE_DELAY = 1.0  # seconds
+    RECONNECT_MAX_DELAY = 30.0  # seconds
+
+    def __init__(
+        self,
+        state_manager: MultiSymbolStateManager,
+        symbols: list[str],
+        product_type: str = "USDT-FUTURES",
+        channels: tuple[str, ...] = ("ticker", "books5"),
+        max_channels_per_connection: int = 100,
+        book_levels: int = 200,
+    ) -> None:
+        """
+        Initialize market-data hub.
+
+        Args:
+            state_manager: State manager that receives every update
+            symbols: Symbols to subscribe
+            product_type: Product type (default: "USDT-FUTURES")
+            channels: Public channels to subscribe per symbol
+            max_channels_per_connection: Subscription cap per connection
+            book_levels: Order book levels kept per side and symbol
+        """
+        self.state_manager = state_manager
+        self.symbols = list(dict.fromkeys(symbols))
+        self.product_type = product_type
+        self.channels = channels
+        self.max_channels_per_connection = max(1, max_channels_per_connection)
+
+        self.should_run: bool = False
+        self.shards: list[list[dict[str, str]]] = self._build_shards()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._connected: list[bool] = [False] * len(self.shards)
+        self._sockets: list[Any | None] = [None] * len(self.shards)
+        self._book_args: dict[str, tuple[int, dict[str, str]]] = {
+            arg["instId"]: (index, arg)
+            for index, args in enumerate(self.shards)
+            for arg in args
+            if arg["channel"].startswith("books")
+        }
+        self._resyncing: set[str] = set()
+
+        self.order_books = OrderBookEngine(max_levels=book_levels)
+
+        # Callbacks (symbol, channel) fired after the state manager is updated
+        self.on_update: Callable[[str, str], None] | None = None
+        # Raw pushes (symbol, channel, action, data) before parsing, e.g. for TickRecorder.record
+        self.on_payload: Callable[[str, str, str | None, list[dict[str, Any]]], None] | None = None
+
+        # Stats
+        self.messages_received: int = 0
+        self.reconnects: int = 0
+        self.last_message_time: float = 0.0
+        self.last_update_time: dict[str, float] = {}
+
+    def _build_shards(self) -> list[list[dict[str, str]]]:
+        """Split (symbol, channel) subscriptions into per-connection groups."""
+        args = [
+            {"instType": self.product_type, "channel": channel, "instId": symbol}
+            for symbol in self.symbols
+            for channel in self.channels
+        ]
+        size = self.max_channels_per_connection
+        return [args[i : i + size] for i in range(0, len(args), size)]
+
+    @property
+    def connected_shards(self) -> int:
+        """Number of shards with a live, subscribed connection."""
+        return sum(self._connected)
+
+    def is_live(self, max_silence_sec: float = 5.0) -> bool:
+        """Return True if every shard is connected and data arrived recently."""
+        if not self.shards or self.connected_shards < len(self.shards):
+            return False
+        return time.time() - self.last_message_time <= max_silence_sec
+
+    def get_staleness(self, symbol: str) -> float:
+        """Seconds since the last update for a symbol (inf if never updated)."""
+        last = self.last_update_time.get(symbol)
+        if last is None:
+            return float("inf")
+        return time.time() - last
+
+    async def start(self) -> None:
+        """Start one background task per shard."""
+        if self.should_run:
+            return
+
+        self.should_run = True
+        self._tasks = [
+            asyncio.create_task(self._run_shard(index, args))
+            for index, args in enumerate(self.shards)
+        ]
+
+        logger.info(
+            "market_data_hub_started",
+            symbols=len(self.symbols),
+            channels=list(self.channels),
+            connections=len(self.shards),
+        )
+
+    async def stop(self) -> None:
+        """Stop all shard tasks and close their connections."""
+        self.should_run = False
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        logger.info(
+            "market_data_hub_stopped",
+            messages_received=self.messages_received,
+            reconnects=self.reconnects,
+        )
+
+    async def _run_shard(self, index: int, args: list[dict[str, str]]) -> None:
+        """Keep one shard connected, resubscribing after every reconnect."""
+        delay = self.RECONNECT_BASE_DELAY
+
+        while self.should_run:
+            try:
+                async with websockets.connect(
+                    self.WS_URL,
+                    ping_interval=None,  # Bitget uses text ping/pong
+                    max_size=10 * 1024 * 1024,
+                ) as ws:
+                    await self._subscribe(ws, args)
+                    self._sockets[index] = ws
+                    self._connected[index] = True
+                    delay = self.RECONNECT_BASE_DELAY
+
+                    logger.info("market_data_shard_connected", shard=index, channels=len(args))
+
+                    ping_task = asyncio.create_task(self._ping_loop(ws))
+                    try:
+                        while self.should_run:
+                            message = await asyncio.wait_for(ws.recv(), timeout=self.RECV_TIMEOUT)
+                            self._handle_message(message)
+                    finally:
+                        ping_task.cancel()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("market_data_shard_disconnected", shard=index, error=str(e))
+            finally:
+                self._connected[index] = False
+                self._sockets[index] = None
+
+            if self.should_run:
+                self.reconnects += 1
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+
+    async def _subscribe(self, ws: Any, args: list[dict[str, str]]) -> None:
+        """Send subscribe requests for a shard in batches."""
+        for i in range(0, len(args), self.SUBSCRIBE_BATCH_SIZE):
+            request = {"op": "subscribe", "args": args[i : i + self.SUBSCRIBE_BATCH_SIZE]}
+            await ws.send(orjson.dumps(request).decode())
+
+    async def _resync_book(self, symbol: str) -> None:
+        """
+        Resubscribe a symbol's book channel so Bitget sends a new snapshot.
+
+        The symbol stays in ``_resyncing`` until that snapshot arrives, so
+        stale updates still in flight don't trigger further resubscribes.
+        """
+        try:
+            index, arg = self._book_args[symbol]
+            ws = self._sockets[index]
+            if ws is None:
+                return  # the reconnect resubscribes anyway
+            await ws.send(orjson.dumps({"op": "unsubscribe", "args": [arg]}).decode())
+            await ws.send(orjson.dumps({"op": "subscribe", "args": [arg]}).decode())
+            logger.info("order_book_resync", symbol=symbol, shard=index)
+        except Exception as e:
+            logger.warning("order_book_resync_failed", symbol=symbol, error=str(e))
+            self._resyncing.discard(symbol)  # retry on the next failed push
+
+    def _schedule_resyncs(self) -> None:
+        """Start a resync for every book that failed its checksum."""
+        for symbol in self.order_books.resync_needed - self._resyncing:
+            if symbol not in self._book_args:
+                continue
+            try:
+                asyncio.get_running_loop().create_task(self._resync_book(symbol))
+            except RuntimeError:
+                return  # no event loop (offline use)
+            self._resyncing.add(symbol)
+
+    async def _ping_loop(self, ws: Any) -> None:
+        """Periodic text ping for one connection."""
+        while True:
+            await asyncio.sleep(self.PING_INTERVAL)
+            await ws.send("ping")
+
+    def _handle_message(self, message: str | bytes) -> None:
+        """
+        Dispatch a raw WebSocket message into the state manager.
+
+        Args:
+            message: Raw message string
+        """
+        self.last_message_time = time.time()
+
+        if message == "pong":
+            return
+
+        try:
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            logger.debug("market_data_unparseable_message", message=str(message)[:200])
+            return
+
+        event = data.get("event")
+        if event == "error":
+            logger.error("market_data_subscription_error", code=data.get("code"), msg=data.get("msg"))
+            return
+        if event:
+            return
+
+        arg = data.get("arg")
+        payload = data.get("data")
+        if not arg or not payload:
+            return
+
+        symbol = arg.get("instId")
+        channel = arg.get("channel", "")
+        if not symbol:
+            return
+
+        if self.on_payload:
+            self.on_payload(symbol, channel, data.get("action"), payload)
+
+        if channel == "ticker":
+            self.state_manager.update_ticker(symbol, parse_ticker(payload[0]))
+        elif channel.startswith("books"):
+            action = data.get("action")
+            if action != "update":
+                self._resyncing.discard(symbol)  # resync answered
+            book = self.order_books.apply(symbol, action, payload[0])
+            if book is None:
+                if self.order_books.resync_needed:
+                    self._schedule_resyncs()
+                return
+            self.state_manager.update_book(symbol, book)
+        else:
+            return
+
+        self.messages_received += 1
+        self.last_update_time[symbol] = self.last_message_time
+
+        if self.on_update:
+            self.on_update(symbol, channel)
@@ -0,0 +1,573 @@
+"""Replay recorded ticks or cached candles through the live trading state under a simulated clock."""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+
+from src.bitget_trading.bitget_rest import BitgetRestClient
+from src.bitget_trading.candle_store import CandleStore
+from src.bitget_trading.contract_catalog import ContractCatalog
+from src.bitget_trading.event_scheduler import EventScheduler
+from src.bitget_trading.logger import get_logger
+from src.bitget_trading.multi_symbol_state import MultiSymbolStateManager
+from src.bitget_trading.order_book import OrderBookEngine
+from src.bitget_trading.position_manager import PositionManager
+from src.bitget_trading.tick_recorder import DAY_MS, TickReader
+
+logger = get_logger()
+
+# (ts_ms, symbol, channel, payload): payload is a ticker dict (parse_ticker format)
+# for "ticker" and an (action, books push) pair for "books"
+ReplayEvent = tuple[int, str, str, Any]
+
+GRANULARITY_MS = {
+    "1m": 60_000, "3m": 180_000, "5m": 300_000, "15m": 900_000, "30m": 1_800_000,
+    "1H": 3_600_000, "4H": 14_400_000, "6H": 21_600_000, "12H": 43_200_000, "1D": DAY_MS,
+}
+
+
+class ReplayClock:
+    """
+    Simulated wall/monotonic clock driven by replayed event timestamps.
+
+    ``install()`` swaps the ``time`` module and ``datetime`` class seen by the
+    given modules for clock-backed stand-ins, so unmodified code that calls
+    ``time.time()``, ``time.monotonic()`` or ``datetime.now()`` runs on
+    replay time. ``perf_counter`` and everything else stay real.
+    """
+
+    def __init__(self, start_ms: int) -> None:
+        self.now_ms = start_ms
+
+    def time(self) -> float:
+        return self.now_ms / 1000
+
+    def monotonic(self) -> float:
+        return self.now_ms / 1000
+
+    def advance_to(self, ts_ms: int) -> None:
+        """Move forward to ``ts_ms`` (the clock never goes back)."""
+        if ts_ms > self.now_ms:
+            self.now_ms = ts_ms
+
+    @contextmanager
+    def install(self, *modules: ModuleType) -> Iterator["ReplayClock"]:
+        """Run the given modules on this clock until the block exits."""
+        clock_time = _ClockTime(self)
+        clock_datetime = _clock_datetime(self)
+        patched = []
+        for module in modules:
+            if getattr(module, "time", None) is time:
+                patched.append((module, "time", time))
+                module.time = clock_time
+            if getattr(module, "datetime", None) is datetime:
+                patched.append((module, "datetime", datetime))
+                module.datetime = clock_datetime
+        try:
+            yield self
+        finally:
+            for module, name, original in reversed(patched):
+                setattr(module, name, original)
+
+
+class _ClockTime:
+    """``time`` module stand-in: time()/monotonic() from a ReplayClock, the rest real."""
+
+    def __init__(self, clock: ReplayClock) -> None:
+        self._clock = clock
+
+    def time(self) -> float:
+        return self._clock.time()
+
+    def monotonic(self) -> float:
+        return self._clock.monotonic()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(time, name)
+
+
+def _clock_datetime(clock: ReplayClock) -> type:
+    class ClockDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):  # type: ignore[override]
+            return datetime.fromtimestamp(clock.time(), tz)
+
+    return ClockDatetime
+
+
+def _tick_path(opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, n: int) -> np.ndarray:
+    """(bars, n) intra-bar prices: O, far extreme, near extreme, C (n=4); O, C (n=2); C (n=1)."""
+    if n == 1:
+        return closes[:, None]
+    if n == 2:
+        return np.column_stack((opens, closes))
+    if n == 4:
+        up = closes >= opens
+        return np.column_stack((opens, np.where(up, lows, highs), np.where(up, highs, lows), closes))
+    raise ValueError(f"ticks_per_bar must be 1, 2 or 4, got {n}")
+
+
+def candle_events(
+    store: CandleStore,
+    symbols: list[str],
+    start_ms: int,
+    end_ms: int,
+    ticks_per_bar: int = 4,
+    spread_bps: float = 2.0,
+    chunk_ms: int = 3_600_000,
+) -> Iterator[list[ReplayEvent]]:
+    """
+    Synthetic ticker stream from cached 1m candles.
+
+    Each bar becomes ``ticks_per_bar`` tickers spread evenly over its minute
+    (open, the extreme against the bar's direction, the other extreme,
+    close), so no price is seen before its bar has started. Bid/ask sit
+    ``spread_bps / 2`` around the price; ``volume_24h`` is the trailing
+    1440-bar volume.
+
+    Yields:
+        Events of consecutive ``chunk_ms`` windows, sorted by timestamp
+    """
+    half_spread = spread_bps / 2 / 10000
+    per_symbol: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    for symbol in symbols:
+        arrays = store.load_arrays(symbol, "1m", start_ms - DAY_MS, end_ms)
+        if arrays is None or not len(arrays["timestamp"]):
+            logger.warning(f"⚠️ [REPLAY] No 1m candles for {symbol} - skipped")
+            continue
+        volume = np.asarray(arrays["volume"], dtype=np.float64)
+        cum = np.concatenate(([0.0], np.cumsum(volume)))
+        window = np.minimum(np.arange(1, len(volume) + 1), 1440)
+        volume_24h = cum[1:] - cum[np.arange(1, len(volume) + 1) - window]
+
+        bars = np.asarray(arrays["timestamp"]) >= start_ms
+        prices = _tick_path(
+            np.asarray(arrays["open"])[bars], np.asarray(arrays["high"])[bars],
+            np.asarray(arrays["low"])[bars], np.asarray(arrays["close"])[bars], ticks_per_bar,
+        )
+        offsets = np.arange(ticks_per_bar, dtype=np.int64) * (60_000 // ticks_per_bar)
+        ts = (np.asarray(arrays["timestamp"])[bars][:, None] + offsets).ravel()
+        keep = ts <= end_ms
+        per_symbol[symbol] = (ts[keep], prices.ravel()[keep], np.repeat(volume_24h[bars], ticks_per_bar)[keep])
+
+    for chunk_start in range(start_ms, end_ms + 1, chunk_ms):
+        chunk_end = min(chunk_start + chunk_ms, end_ms + 1)
+        events: list[ReplayEvent] = []
+        for symbol, (ts, prices, volume_24h) in per_symbol.items():
+            lo, hi = np.searchsorted(ts, [chunk_start, chunk_end])
+            for t, price, volume in zip(ts[lo:hi].tolist(), prices[lo:hi].tolist(), volume_24h[lo:hi].tolist()):
+                events.append((t, symbol, "ticker", {
+                    "symbol": symbol,
+                    "last_price": price,
+                    "bid_price": price * (1 - half_spread),
+                    "ask_price": price * (1 + half_spread),
+                    "volume_24h": volume,
+                    "funding_rate": 0.0,
+                    "timestamp": t,
+                }))
+        events.sort(key=lambda event: event[0])
+        yield events
+
+
+def tick_events(
+    root: str,
+    symbols: list[str],
+    start_ms: int,
+    end_ms: int,
+    chunk_ms: int = 600_000,
+) -> Iterator[list[ReplayEvent]]:
+    """
+    Recorded ticker and book pushes from a ``TickRecorder`` archive.
+
+    Book rows are regrouped into the pushes they came from (same ts, seq and
+    snapshot flag) and replayed through an order book like the live feed.
+    Each day file is read once per symbol and stream (``TickReader``).
+
+    Yields:
+        Events of consecutive ``chunk_ms`` windows, sorted by timestamp
+    """
+    reader = TickReader(root)
+    for chunk_start in range(start_ms, end_ms + 1, chunk_ms):
+        chunk_end = min(chunk_start + chunk_ms, end_ms + 1) - 1
+        events: list[ReplayEvent] = []
+        for symbol in symbols:
+            for row in reader.read(symbol, "ticker", chunk_start, chunk_end).tolist():
+                ts, last, bid, ask, _, _, mark, index, funding, _, _, _, volume, quote_volume, open_interest = row
+                events.append((ts, symbol, "ticker", {
+                    "symbol": symbol,
+                    "last_price": last,
+                    "bid_price": bid,
+                    "ask_price": ask,
+                    "mark_price": mark,
+                    "index_price": index,
+                    "funding_rate": funding,
+                    "volume_24h": volume,
+                    "quote_volume_24h": quote_volume,
+                    "open_interest": open_interest,
+                    "timestamp": ts,
+                }))
+
+            book = reader.read(symbol, "book", chunk_start, chunk_end)
+            if not len(book):
+                continue
+            keys = np.column_stack((book["ts"], book["seq"], book["snapshot"]))
+            starts = np.flatnonzero(np.r_[True, (keys[1:] != keys[:-1]).any(axis=1)])
+            for lo, hi in zip(starts.tolist(), np.r_[starts[1:], len(book)].tolist()):
+                push = book[lo:hi]
+                bids = push[push["side"] > 0]
+                asks = push[push["side"] < 0]
+                ts = int(push["ts"][0])
+                events.append((ts, symbol, "books", (
+                    "snapshot" if push["snapshot"][0] else "update",
+                    {
+                        "bids": np.column_stack((bids["price"], bids["size"])).tolist(),
+                        "asks": np.column_stack((asks["price"], asks["size"])).tolist(),
+                        "ts": ts,
+                        "seq": int(push["seq"][0]),
+                    },
+                )))
+        events.sort(key=lambda event: event[0])
+        yield events
+
+
+class MarketReplay:
+    """
+    Feeds replay events into a ``MultiSymbolStateManager`` like ``MarketDataHub``.
+
+    Events are applied in timestamp order with the clock set to each event's
+    time; every ``step_ms`` of replay time the scheduler is woken so the
+    trading loop handles what arrived (cadence checks included). With a
+    ``speed`` the replay is paced to that multiple of real time and the loop
+    competes for the event loop as it would live; without one it runs as
+    fast as possible and waits for the loop to finish each step.
+
+    Exposes ``is_live``/``on_update`` so it can stand in for the trader's hub.
+    """
+
+    SETTLE_MAX_SPINS = 1000  # event-loop turns to wait for a step's decision
+
+    def __init__(
+        self,
+        state_manager: MultiSymbolStateManager,
+        events: Iterable[list[ReplayEvent]],
+        clock: ReplayClock,
+        scheduler: EventScheduler | None = None,
+        speed: float | None = None,
+        step_ms: int = 1000,
+        book_levels: int = 200,
+    ) -> None:
+        """
+        Initialize market replay.
+
+        Args:
+            state_manager: State manager that receives every update
+            events: Chunks of time-ordered events (``candle_events``/``tick_events``)
+            clock: Replay clock (advanced by the replay)
+            scheduler: Trading loop scheduler to wake after every step
+            speed: Replay seconds per wall second (None = as fast as possible)
+            step_ms: Replay time between scheduler wake-ups
+            book_levels: Order book levels kept per side and symbol
+        """
+        self.state_manager = state_manager
+        self.events = events
+        self.clock = clock
+        self.scheduler = scheduler
+        self.speed = speed
+        self.step_ms = step_ms
+        self.order_books = OrderBookEngine(max_levels=book_levels)
+
+        self.running: bool = False
+        self.shards: list[Any] = []  # hub interface
+        self.tickers: dict[str, dict[str, Any]] = {}  # latest ticker per symbol (for the stand-in exchange)
+        # Wall time (perf_counter) of each symbol's first update not yet decided on
+        self.delivered_at: dict[str, float] = {}
+
+        # Callbacks (symbol, channel) fired after the state manager is updated
+        self.on_update: Callable[[str, str], None] | None = None
+
+        # Stats
+        self.events_applied: int = 0
+        self.steps: int = 0
+        self.start_ms: int | None = None
+        self.wall_seconds: float = 0.0
+
+    def is_live(self, max_silence_sec: float = 5.0) -> bool:
+        return self.running
+
+    def get_staleness(self, symbol: str) -> float:
+        ticker = self.tickers.get(symbol)
+        return float("inf") if ticker is None else (self.clock.now_ms - ticker["timestamp"]) / 1000
+
+    @property
+    def replayed_seconds(self) -> float:
+        return 0.0 if self.start_ms is None else (self.clock.now_ms - self.start_ms) / 1000
+
+    async def run(self) -> None:
+        """Replay every event, then stop."""
+        self.running = True
+        started = time.perf_counter()
+        step_end: int | None = None
+        try:
+            for chunk in self.events:
+                for ts, symbol, channel, payload in chunk:
+                    if step_end is None:
+                        self.start_ms = ts
+                        self.clock.advance_to(ts)
+                        step_end = (ts // self.step_ms + 1) * self.step_ms
+                        started = time.perf_counter()
+                    while ts >= step_end:
+                        await self._end_step(step_end, started)
+                        step_end += self.step_ms
+                    self.clock.advance_to(ts)
+                    self._apply(symbol, channel, payload)
+            if step_end is not None:
+                await self._end_step(step_end, started)
+        finally:
+            self.running = False
+            self.wall_seconds = time.perf_counter() - started
+
+        logger.info(
+            f"⏩ [REPLAY] {self.events_applied:,} events, {self.replayed_seconds / 3600:.2f}h replayed "
+            f"in {self.wall_seconds:.1f}s ({self.replayed_seconds / max(self.wall_seconds, 1e-9):,.0f}x real time)"
+        )
+
+    def _apply(self, symbol: str, channel: str, payload: Any) -> None:
+        if channel == "ticker":
+            self.tickers[symbol] = payload
+            self.state_manager.update_ticker(symbol, payload)
+        else:
+            action, data = payload
+            book = self.order_books.apply(symbol, action, data)
+            if book is None:
+                return
+            self.state_manager.update_book(symbol, book)
+
+        self.events_applied += 1
+        self.delivered_at.setdefault(symbol, time.perf_counter())
+        if self.on_update:
+            self.on_update(symbol, channel)
+
+    async def _end_step(self, step_end: int, started: float) -> None:
+        """Advance to the step boundary and let the trading loop act on it."""
+        self.clock.advance_to(step_end)
+        self.steps += 1
+        scheduler = self.scheduler
+        if scheduler is not None:
+            scheduler.wake()
+
+        if self.speed:
+            due = started + (step_end - self.start_ms) / 1000 / self.speed
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            return
+
+        await asyncio.sleep(0)
+        if scheduler is not None:
+            for _ in range(self.SETTLE_MAX_SPINS):
+                if not scheduler.pending and not scheduler.busy:
+                    break
+                await asyncio.sleep(0)
+
+
+class ReplayExchange(BitgetRestClient):
+    """
+    In-process stand-in for the Bitget REST API during a replay (paper trading).
+
+    Every request goes through ``_request``, which answers market data from
+    the replay (tickers, funding, candles from a ``CandleStore`` up to the
+    replay time) and account/position queries from a paper account: cash
+    balance plus the trader's open positions, marked to the latest price.
+    Order endpoints are not simulated and return an error code.
+    """
+
+    def __init__(
+        self,
+        replay: MarketReplay,
+        candle_store: CandleStore | None = None,
+        position_manager: PositionManager | None = None,
+        initial_balance: float = 50.0,
+        contracts: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        Initialize replay exchange.
+
+        Args:
+            replay: Market replay supplying prices and the clock
+            candle_store: Candles served by the candle endpoints (closed bars only)
+            position_manager: Paper positions reported as exchange positions
+            initial_balance: Starting USDT balance
+            contracts: Raw contract list served by the contracts endpoint
+        """
+        super().__init__(
+            "replay", "replay", "replay",
+            transport="aiohttp",
+            contract_catalog=ContractCatalog(self._fetch_contracts, snapshot_path=None),
+        )
+        self.replay = replay
+        self.candle_store = candle_store
+        self.position_manager = position_manager
+        self.balance = initial_balance
+        self.contracts = contracts or []
+        self.requests: dict[str, int] = {}
+
+        self._routes: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "/api/v2/mix/market/ticker": self._ticker,
+            "/api/v2/mix/market/tickers": self._tickers,
+            "/api/v2/mix/market/current-fund-rate": self._funding_rate,
+            "/api/v2/mix/market/candles": self._candles,
+            "/api/v2/mix/market/history-candles": self._candles,
+            "/api/v2/mix/market/contracts": lambda params: self.contracts,
+            "/api/v2/mix/account/accounts": self._accounts,
+            "/api/v2/mix/position/all-position": self._positions,
+        }
+
+    def settle(self, pnl: float) -> None:
+        """Book realized PnL (net of fees) into the cash balance."""
+        self.balance += pnl
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> dict[str, Any]:
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        handler = self._routes.get(endpoint)
+        if handler is None:
+            return {"code": "40404", "msg": f"{method} {endpoint} is not simulated in replay", "data": None}
+        return {"code": "00000", "msg": "success", "requestTime": self.replay.clock.now_ms, "data": handler(params or {})}
+
+    async def close(self) -> None:
+        return None
+
+    def _raw_ticker(self, symbol: str, ticker: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "symbol": symbol,
+            "lastPr": str(ticker["last_price"]),
+            "bidPr": str(ticker["bid_price"]),
+            "askPr": str(ticker["ask_price"]),
+            "markPrice": str(ticker.get("mark_price") or ticker["last_price"]),
+            "fundingRate": str(ticker.get("funding_rate", 0.0)),
+            "baseVolume": str(ticker.get("volume_24h", 0.0)),
+            "quoteVolume": str(ticker.get("quote_volume_24h", 0.0)),
+            "ts": str(ticker["timestamp"]),
+        }
+
+    def _ticker(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        symbol = params.get("symbol", "")
+        ticker = self.replay.tickers.get(symbol)
+        return [self._raw_ticker(symbol, ticker)] if ticker else []
+
+    def _tickers(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        return [self._raw_ticker(symbol, ticker) for symbol, ticker in self.replay.tickers.items()]
+
+    def _funding_rate(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        symbol = params.get("symbol", "")
+        ticker = self.replay.tickers.get(symbol, {})
+        return [{"symbol": symbol, "fundingRate": str(ticker.get("funding_rate", 0.0))}]
+
+    def _candles(self, params: dict[str, Any]) -> list[list[str]]:
+        if self.candle_store is None:
+            return []
+        return closed_candles(self.candle_store, params, self.replay.clock.now_ms)
+
+    def _open_positions(self) -> list[tuple[Any, float]]:
+        if self.position_manager is None:
+            return []
+        positions = []
+        for symbol, position in self.position_manager.positions.items():
+            ticker = self.replay.tickers.get(symbol)
+            positions.append((position, ticker["last_price"] if ticker else position.entry_price))
+        return positions
+
+    def _accounts(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        margin = unrealized = 0.0
+        for position, mark in self._open_positions():
+            direction = 1 if position.side == "long" else -1
+            margin += position.size * position.entry_price / position.leverage
+            unrealized += (mark - position.entry_price) * position.size * direction
+        return [{
+            "marginCoin": "USDT",
+            "available": str(self.balance - margin),
+            "frozen": "0",
+            "locked": "0",
+            "equity": str(self.balance + unrealized),
+            "usdtEquity": str(self.balance + unrealized),
+            "unrealizedPL": str(unrealized),
+        }]
+
+    def _positions(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        rows = []
+        for position, mark in self._open_positions():
+            direction = 1 if position.side == "long" else -1
+            rows.append({
+                "symbol": position.symbol,
+                "marginCoin": "USDT",
+                "holdSide": position.side,
+                "total": str(position.size),
+                "available": str(position.size),
+                "openPriceAvg": str(position.entry_price),
+                "markPrice": str(mark),
+                "marginSize": str(position.size * position.entry_price / position.leverage),
+                "leverage": str(position.leverage),
+                "marginMode": "isolated",
+                # Isolated margin without maintenance margin: the whole margin is lost at 1/leverage
+                "liquidationPrice": str(position.entry_price * (1 - direction / position.leverage)),
+                "marginRatio": "0",
+                "unrealizedPL": str((mark - position.entry_price) * position.size * direction),
+            })
+        return rows
+
+
+def closed_candles(store: CandleStore, params: dict[str, Any], now_ms: int) -> list[list[str]]:
+    """
+    Answer a candles request from a ``CandleStore`` as of ``now_ms``.
+
+    Only bars closed by ``now_ms`` (or ``endTime``) are returned, oldest
+    first, as Bitget-style string rows; timeframes that are not stored are
+    resampled from 1m.
+    """
+    symbol = params.get("symbol", "")
+    granularity = params.get("granularity", "1m")
+    period = GRANULARITY_MS.get(granularity)
+    if period is None:
+        return []
+    limit = int(params.get("limit", 200))
+    end_ms = min(int(params.get("endTime", now_ms)), now_ms) - period
+    start_ms = int(params["startTime"]) if "startTime" in params else end_ms - (limit + 1) * period
+
+    if granularity in store.timeframes(symbol):
+        bars = store.load_arrays(symbol, granularity, start_ms, end_ms)
+    else:
+        minute = store.load_arrays(symbol, "1m", start_ms, end_ms + period - 60_000)
+        bars = None if minute is None else _resample(minute, period, end_ms)
+    if bars is None:
+        return []
+
+    rows = np.column_stack([bars[c] for c in ("timestamp", "open", "high", "low", "close", "volume")])[-limit:]
+    return [[str(int(row[0])), *(repr(float(v)) for v in row[1:])] for row in rows.tolist()]
+
+
+def _resample(minute: dict[str, np.ndarray], period_ms: int, end_ms: int) -> dict[str, np.ndarray]:
+    """Aggregate 1m bars into ``period_ms`` bars, keeping only bars that closed by ``end_ms``."""
+    ts = np.asarray(minute["timestamp"])
+    if not len(ts):
+        return {c: np.empty(0) for c in ("timestamp", "open", "high", "low", "close", "volume")}
+    buckets = ts // period_ms * period_ms
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    bars = {
+        "timestamp": buckets[starts],
+        "open": np.asarray(minute["open"])[starts],
+        "high": np.maximum.reduceat(np.asarray(minute["high"]), starts),
+        "low": np.minimum.reduceat(np.asarray(minute["low"]), starts),
+        "close": np.asarray(minute["close"])[np.r_[starts[1:], len(ts)] - 1],
+        "volume": np.add.reduceat(np.asarray(minute["volume"]), starts),
+    }
+    closed = bars["timestamp"] <= end_ms
+    return {name: values[closed] for name, values in bars.items()}
@@ -9,6 +9,10 @@ import numpy as np
 
 from src.bitget_trading.logger import get_logger
 from src.bitget_trading.advanced_indicators import AdvancedIndicators, compute_composite_score
+from src.bitget_trading.feature_matrix import FeatureMatrix
+from src.bitget_trading.order_book import OrderBook
+from src.bitget_trading.ring_buffer import PriceRingBuffer
+from src.bitget_trading.streaming_indicators import RollingWindowStats
 
 logger = get_logger()
 
@@ -29,6 +33,12 @@ class SymbolState:
     Maintains rolling statistics without batch training.
     """
 
+    # History windows are sample-indexed (1 sample = 1 second), so streaming
+    # ticks that arrive faster than 1Hz refresh prices without adding samples.
+    HISTORY_SAMPLE_INTERVAL_SEC = 1.0
+    CANDLE_PERIOD_MS = {"1m": 60_000, "5m": 300_000, "15m": 900_000}
+    BOOK_DEPTH_LEVELS = 5  # Levels behind total_*_depth / ob_imbalance (same as the books5 feed)
+
     def __init__(self, symbol: str, window_size: int = 200) -> None:
         """
         Initialize symbol state.
@@ -55,9 +65,15 @@ class SymbolState:
         self.total_bid_depth: float = 0.0
         self.total_ask_depth: float = 0.0
         self.ob_imbalance: float = 0.0
+        self.book: OrderBook | None = None  # Live incremental book (when streamed)
+        
+        # Price/volume/order-book history (1 hour at 1Hz), shared with AdvancedIndicators
+        self.history = PriceRingBuffer(capacity=3600)
         
-        # Price history for returns/volatility (extended for multi-timeframe)
-        self.price_history: Deque[tuple[float, float]] = deque(maxlen=3600)  # 1 hour at 1Hz
+        # Streaming statistics of 1-sample returns (volatility windows, updated in record_sample)
+        self.return_stats: dict[int, RollingWindowStats] = {
+            window: RollingWindowStats(window) for window in (30, 60, 300)
+        }
         
         # 🚀 MULTI-TIMEFRAME CANDLE DATA (for pro-style indicator analysis)
         # Store candles for 1min, 5min, 15min timeframes
@@ -65,8 +81,8 @@ class SymbolState:
         self.candles_5m: Deque[dict] = deque(maxlen=200)  # [timestamp, open, high, low, close, volume]
         self.candles_15m: Deque[dict] = deque(maxlen=200)  # [timestamp, open, high, low, close, volume]
         
-        # Volume history
-        self.volume_history: Deque[tuple[float, float]] = deque(maxlen=300)  # (timestamp, volume)
+        # Rolling volume mean (volume ratio)
+        self.volume_stats = RollingWindowStats(300)
         
         # Online trade statistics
         self.trades: Deque[Trade] = deque(maxlen=window_size)
@@ -82,10 +98,79 @@ class SymbolState:
         
         # Feature cache
         self.features: dict[str, float] = {}
+        self.last_history_sample_time: float = 0.0
         
-        # Advanced indicators
-        self.advanced_indicators = AdvancedIndicators()
+        # Advanced indicators (append to the shared history buffer)
+        self.advanced_indicators = AdvancedIndicators(self.history)
     
+    def to_snapshot(self) -> dict:
+        """
+        Picklable copy of all state except the history samples.
+
+        The samples are stored columnar by ``StateSnapshotStore``; streaming
+        indicator and statistics objects are kept as-is, so a restored state
+        continues exactly where this one stopped.
+        """
+        state = {k: v for k, v in self.__dict__.items() if k not in ("history", "advanced_indicators")}
+        state["advanced_indicators"] = {
+            k: v for k, v in self.advanced_indicators.__dict__.items() if k != "history"
+        }
+        return state
+
+    @classmethod
+    def from_snapshot(cls, state: dict, samples: np.ndarray) -> "SymbolState":
+        """
+        Rebuild a symbol state from ``to_snapshot`` output.
+
+        Args:
+            state: Snapshot dict
+            samples: ``(5, n)`` history samples, oldest first
+        """
+        restored = cls(state["symbol"], state["window_size"])
+        restored.__dict__.update({k: v for k, v in state.items() if k != "advanced_indicators"})
+        restored.advanced_indicators.__dict__.update(state["advanced_indicators"])
+        restored.history.load(samples)
+        return restored
+
+    def get_candles(self, timeframe: str) -> Deque[dict]:
+        """Candle buffer of a timeframe ("1m", "5m" or "15m")."""
+        return {"1m": self.candles_1m, "5m": self.candles_5m, "15m": self.candles_15m}[timeframe]
+
+    def backfill_candles(self, candles_1m: list[dict]) -> None:
+        """
+        Splice fresh 1m candles into all candle buffers.
+
+        Bars from the first fresh candle onward are replaced: 1m as-is, 5m and
+        15m re-aggregated from the 1m candles. Higher-timeframe buckets that
+        start before the first 1m candle are kept unchanged.
+
+        Args:
+            candles_1m: Consecutive 1m candles, oldest first
+        """
+        if not candles_1m:
+            return
+        first_ts = candles_1m[0]["timestamp"]
+
+        for timeframe, period_ms in self.CANDLE_PERIOD_MS.items():
+            start = -(-first_ts // period_ms) * period_ms  # first bucket fully covered
+            candles = self.get_candles(timeframe)
+            while candles and candles[-1]["timestamp"] >= start:
+                candles.pop()
+
+            bar: dict | None = None
+            for candle in candles_1m:
+                if candle["timestamp"] < start:
+                    continue
+                bucket = candle["timestamp"] // period_ms * period_ms
+                if bar is not None and bar["timestamp"] == bucket:
+                    bar["high"] = max(bar["high"], candle["high"])
+                    bar["low"] = min(bar["low"], candle["low"])
+                    bar["close"] = candle["close"]
+                    bar["volume"] += candle["volume"]
+                else:
+                    bar = {**candle, "timestamp": bucket}
+                    candles.append(bar)
+
     def add_candle(self, timeframe: str, candle_data: dict) -> None:
         """
         Add candle data for multi-timeframe analysis.
@@ -166,20 +251,52 @@ class SymbolState:
             self.mid_price = (self.bid_price + self.ask_price) / 2
             self.spread_bps = ((self.ask_price - self.bid_price) / self.mid_price) * 10000
         
-        # Update price history
+        # Update price history (at most once per sample interval)
         timestamp = time.time()
-        self.price_history.append((timestamp, self.mid_price))
+        if timestamp - self.last_history_sample_time < self.HISTORY_SAMPLE_INTERVAL_SEC:
+            return
+        self.last_history_sample_time = timestamp
+        self.record_sample(
+            timestamp,
+            self.mid_price if self.mid_price > 0 else self.last_price,
+            self.volume_24h,
+            bid_volume=self.total_bid_depth,
+            ask_volume=self.total_ask_depth,
+        )
+
+    def record_sample(
+        self,
+        timestamp: float,
+        price: float,
+        volume: float,
+        bid_volume: float = 0.0,
+        ask_volume: float = 0.0,
+    ) -> None:
+        """
+        Append one history sample and update all streaming statistics.
+        
+        Args:
+            timestamp: Sample time in seconds
+            price: Sample price
+            volume: Sample volume
+            bid_volume: Bid-side order book depth
+            ask_volume: Ask-side order book depth
+        """
+        if self.history:
+            prev_price = self.history.last_price
+            ret = (price - prev_price) / prev_price if prev_price > 0 else 0.0
+            for stats in self.return_stats.values():
+                stats.update(ret)
         
-        # Update volume history
-        self.volume_history.append((timestamp, self.volume_24h))
+        self.volume_stats.update(volume)
         
-        # Update advanced indicators
+        # Appends to self.history and advances the streaming indicators
         self.advanced_indicators.update(
-            price=self.mid_price if self.mid_price > 0 else self.last_price,
-            volume=self.volume_24h,
+            price=price,
+            volume=volume,
             timestamp=timestamp,
-            bid_volume=self.total_bid_depth,
-            ask_volume=self.total_ask_depth,
+            bid_volume=bid_volume,
+            ask_volume=ask_volume,
         )
 
     def update_orderbook(self, orderbook_data: dict) -> None:
@@ -198,6 +315,23 @@ class SymbolState:
         else:
             self.ob_imbalance = 0.0
 
+    def update_from_book(self, book: OrderBook) -> None:
+        """Update top of book, depth and imbalance from a live order book."""
+        self.book = book
+        
+        bid, ask = book.best_bid, book.best_ask
+        if bid > 0 and ask > 0:
+            self.bid_price = bid
+            self.ask_price = ask
+            self.mid_price = (bid + ask) / 2
+            self.spread_bps = ((ask - bid) / self.mid_price) * 10000
+        
+        self.bids = book.levels("bid", self.BOOK_DEPTH_LEVELS)
+        self.asks = book.levels("ask", self.BOOK_DEPTH_LEVELS)
+        self.total_bid_depth = book.depth("bid", self.BOOK_DEPTH_LEVELS)
+        self.total_ask_depth = book.depth("ask", self.BOOK_DEPTH_LEVELS)
+        self.ob_imbalance = book.imbalance(levels=self.BOOK_DEPTH_LEVELS)
+
     def add_trade(self, pnl: float, return_pct: float) -> None:
         """
         Add a completed trade to online statistics.
@@ -305,10 +439,16 @@ class SymbolState:
             "funding_rate": self.funding_rate,
         }
         
-        # Multi-timeframe returns and volatility
-        if len(self.price_history) >= 2:
-            prices = np.array([p for _, p in self.price_history])
-            times = np.array([t for t, _ in self.price_history])
+        # Depth near the touch (only with a live incremental book)
+        if self.book is not None and self.book.synced:
+            features["depth_10bps_bid"] = self.book.depth_within_bps("bid", 10.0)
+            features["depth_10bps_ask"] = self.book.depth_within_bps("ask", 10.0)
+            features["ob_imbalance_10bps"] = self.book.imbalance(bps=10.0)
+        
+        # Multi-timeframe returns and volatility (served from streaming state, no array rebuild)
+        n_prices = len(self.history)
+        if n_prices >= 2:
+            last_price = self.history.last_price
             
             # ULTRA-SHORT-TERM TIMEFRAMES (optimized for 10s-10min scalping)
             timeframes = {
@@ -324,26 +464,24 @@ class SymbolState:
             }
             
             for name, window in timeframes.items():
-                if len(prices) > window:
-                    ret = (prices[-1] - prices[-window]) / prices[-window]
-                    features[f"return_{name}"] = ret
+                if n_prices > window:
+                    past_price = self.history.price_at(-window)
+                    features[f"return_{name}"] = (last_price - past_price) / past_price
             
             # Multi-timeframe volatility
-            if len(prices) >= 30:
-                returns = np.diff(prices) / prices[:-1]
-                features["volatility_30s"] = np.std(returns[-30:])
-                features["volatility_60s"] = np.std(returns[-60:]) if len(returns) >= 60 else np.std(returns[-30:])
-                features["volatility_5min"] = np.std(returns[-300:]) if len(returns) >= 300 else features["volatility_60s"]
+            if n_prices >= 30:
+                vol_30 = self.return_stats[30]
+                vol_60 = self.return_stats[60]
+                vol_300 = self.return_stats[300]
+                features["volatility_30s"] = vol_30.std
+                features["volatility_60s"] = vol_60.std if len(vol_60) >= 60 else vol_30.std
+                features["volatility_5min"] = vol_300.std if len(vol_300) >= 300 else features["volatility_60s"]
         
         # Volume analysis
-        if len(self.volume_history) >= 2:
-            volumes = np.array([v for _, v in self.volume_history])
-            if len(volumes) >= 60:
-                avg_volume = np.mean(volumes[-300:]) if len(volumes) >= 300 else np.mean(volumes)
-                current_volume = volumes[-1]
-                features["volume_ratio"] = current_volume / (avg_volume + 1e-8)
-            else:
-                features["volume_ratio"] = 1.0
+        if len(self.volume_stats) >= 60:
+            avg_volume = self.volume_stats.mean
+            current_volume = self.volume_stats.values[-1]
+            features["volume_ratio"] = current_volume / (avg_volume + 1e-8)
         else:
             features["volume_ratio"] = 1.0
         
@@ -446,10 +584,15 @@ class MultiSymbolStateManager:
         self.symbols: dict[str, SymbolState] = {}
         self.total_selections: int = 0
 
+        # Columnar features for vectorized ranking, refreshed lazily per symbol
+        self.feature_matrix = FeatureMatrix()
+        self._stale_features: dict[str, None] = {}  # insertion-ordered set
+
     def add_symbol(self, symbol: str) -> None:
         """Add a symbol to track."""
         if symbol not in self.symbols:
             self.symbols[symbol] = SymbolState(symbol)
+            self._stale_features[symbol] = None
             logger.debug("symbol_added", symbol=symbol)
 
     def get_state(self, symbol: str) -> SymbolState | None:
@@ -462,6 +605,7 @@ class MultiSymbolStateManager:
             self.add_symbol(symbol)
         
         self.symbols[symbol].update_ticker(ticker_data)
+        self._stale_features[symbol] = None
 
     def update_orderbook(self, symbol: str, orderbook_data: dict) -> None:
         """Update order book for a symbol."""
@@ -469,12 +613,22 @@ class MultiSymbolStateManager:
             self.add_symbol(symbol)
         
         self.symbols[symbol].update_orderbook(orderbook_data)
+        self._stale_features[symbol] = None
+
+    def update_book(self, symbol: str, book: OrderBook) -> None:
+        """Update a symbol from its live order book."""
+        if symbol not in self.symbols:
+            self.add_symbol(symbol)
+        
+        self.symbols[symbol].update_from_book(book)
+        self._stale_features[symbol] = None
 
     def record_trade(self, symbol: str, pnl: float, return_pct: float) -> None:
         """Record a completed trade."""
         if symbol in self.symbols:
             self.symbols[symbol].add_trade(pnl, return_pct)
             self.total_selections += 1
+            self._stale_features[symbol] = None
 
     def add_price_point(
         self,
@@ -492,36 +646,51 @@ class MultiSymbolStateManager:
         # Convert ms timestamp (Bitget) to seconds float
         timestamp_sec = timestamp_ms / 1000 if timestamp_ms > 1e12 else timestamp_ms
 
-        state.price_history.append((timestamp_sec, price))
+        # Appends history and keeps advanced indicators warm with historical data
+        state.record_sample(timestamp_sec, price, volume)
 
         # Update last/ mid prices to ensure features have reasonable defaults
         state.last_price = price
         state.mid_price = price
         state.bid_price = price
         state.ask_price = price
-
-        # Maintain volume history (if provided)
-        state.volume_history.append((timestamp_sec, volume))
-
-        # Keep advanced indicators warm with historical data
-        try:
-            state.advanced_indicators.update(
-                price=price,
-                volume=volume,
-                timestamp=timestamp_sec,
-                bid_volume=0.0,
-                ask_volume=0.0,
-            )
-        except Exception as exc:
-            logger.debug("advanced_indicator_update_failed", symbol=symbol, error=str(exc))
+        self._stale_features[symbol] = None
  
     def get_all_features(self) -> dict[str, dict[str, float]]:
         """Get features for all symbols."""
-        return {
+        all_features = {
             symbol: state.compute_features()
             for symbol, state in self.symbols.items()
         }
 
+        for symbol, features in all_features.items():
+            self.feature_matrix.set_row(symbol, features)
+        self._stale_features.clear()
+
+        return all_features
+
+    def get_feature_matrix(self) -> FeatureMatrix:
+        """
+        Get the columnar feature matrix for all symbols.
+
+        Only symbols updated since the previous call are recomputed.
+
+        Returns:
+            Feature matrix (one row per tracked symbol)
+        """
+        for symbol in self._stale_features:
+            state = self.symbols.get(symbol)
+            if state:
+                self.feature_matrix.set_row(symbol, state.compute_features())
+        self._stale_features.clear()
+
+        return self.feature_matrix
+
+    def restore_symbol(self, state: SymbolState) -> None:
+        """Install a restored symbol state (replacing any existing one)."""
+        self.symbols[state.symbol] = state
+        self._stale_features[state.symbol] = None
+
     def get_active_symbols(self, min_price: float = 0.01) -> list[str]:
         """Get symbols with recent price data."""
         return [
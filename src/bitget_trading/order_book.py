@@ -0,0 +1,294 @@
+"""Incremental L2 order books for Bitget ``books*`` channels."""
+
+import zlib
+from typing import Any
+
+import numpy as np
+
+from src.bitget_trading.logger import get_logger
+
+logger = get_logger()
+
+CHECKSUM_LEVELS = 25  # Bitget checksums the top 25 levels per side
+
+
+def book_checksum(
+    bid_prices: np.ndarray, bid_sizes: np.ndarray, ask_prices: np.ndarray, ask_sizes: np.ndarray
+) -> int:
+    """
+    Bitget order book checksum (signed CRC32).
+
+    The top 25 levels are interleaved as ``bid:bidSize:ask:askSize:...`` using
+    the exchange's original strings; a side that runs out is skipped.
+
+    Args:
+        bid_prices, bid_sizes, ask_prices, ask_sizes: Raw level strings (bytes
+            arrays), best level first
+
+    Returns:
+        Checksum as a signed 32-bit integer
+    """
+    n_bids = min(len(bid_prices), CHECKSUM_LEVELS)
+    n_asks = min(len(ask_prices), CHECKSUM_LEVELS)
+    parts = []
+    for i in range(max(n_bids, n_asks)):
+        if i < n_bids:
+            parts += (bid_prices[i], bid_sizes[i])
+        if i < n_asks:
+            parts += (ask_prices[i], ask_sizes[i])
+    crc = zlib.crc32(b":".join(parts))
+    return crc - (1 << 32) if crc >= (1 << 31) else crc
+
+
+class _Side:
+    """
+    One side of a book as parallel arrays sorted best-first.
+
+    ``keys`` are ascending sort keys (price for asks, -price for bids), so
+    both sides share the same search and merge code. ``cum`` is the running
+    size total used for O(1) depth-by-levels and O(log n) depth-by-price.
+    """
+
+    __slots__ = ("sign", "keys", "sizes", "cum", "raw_prices", "raw_sizes")
+
+    def __init__(self, sign: float) -> None:
+        self.sign = sign
+        self.clear()
+
+    def clear(self) -> None:
+        self.keys = np.empty(0)
+        self.sizes = np.empty(0)
+        self.cum = np.empty(0)
+        self.raw_prices = np.empty(0, dtype="S1")
+        self.raw_sizes = np.empty(0, dtype="S1")
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @staticmethod
+    def _parse(levels: list[list[str]]) -> tuple[np.ndarray, np.ndarray]:
+        raw = np.array([level[:2] for level in levels], dtype="S").reshape(-1, 2)
+        return raw[:, 0], raw[:, 1]
+
+    def replace(self, levels: list[list[str]], max_levels: int) -> None:
+        raw_prices, raw_sizes = self._parse(levels)
+        keys = raw_prices.astype(np.float64) * self.sign
+        sizes = raw_sizes.astype(np.float64)
+        order = np.argsort(keys, kind="stable")
+        order = order[sizes[order] > 0][:max_levels]
+        self._set(keys[order], sizes[order], raw_prices[order], raw_sizes[order])
+
+    def merge(self, levels: list[list[str]], max_levels: int) -> None:
+        """Apply level changes (size 0 deletes a level; later entries win)."""
+        raw_prices, raw_sizes = self._parse(levels)
+        keys = np.concatenate((self.keys, raw_prices.astype(np.float64) * self.sign))
+        sizes = np.concatenate((self.sizes, raw_sizes.astype(np.float64)))
+        order = np.argsort(keys, kind="stable")  # existing level before its update
+        sorted_keys = keys[order]
+        last = np.empty(len(order), dtype=bool)
+        np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=last[:-1])
+        last[-1:] = True
+        order = order[last]
+        order = order[sizes[order] > 0][:max_levels]
+        self._set(
+            keys[order],
+            sizes[order],
+            np.concatenate((self.raw_prices, raw_prices))[order],
+            np.concatenate((self.raw_sizes, raw_sizes))[order],
+        )
+
+    def _set(self, keys: np.ndarray, sizes: np.ndarray, raw_prices: np.ndarray, raw_sizes: np.ndarray) -> None:
+        self.keys = keys
+        self.sizes = sizes
+        self.cum = np.cumsum(sizes)
+        self.raw_prices = raw_prices
+        self.raw_sizes = raw_sizes
+
+    def best(self) -> float:
+        return float(self.keys[0]) * self.sign if len(self.keys) else 0.0
+
+    def depth_levels(self, levels: int | None) -> float:
+        n = len(self.cum) if levels is None else min(levels, len(self.cum))
+        return float(self.cum[n - 1]) if n > 0 else 0.0
+
+    def depth_to_price(self, price: float) -> float:
+        """Size of all levels at or better than ``price``."""
+        n = int(np.searchsorted(self.keys, price * self.sign, side="right"))
+        return float(self.cum[n - 1]) if n > 0 else 0.0
+
+
+class OrderBook:
+    """
+    L2 book of one symbol, rebuilt from a snapshot and kept current by updates.
+
+    Levels live in compact sorted arrays (at most ``max_levels`` per side);
+    the original price/size strings are kept alongside for checksum checks.
+    Best bid/ask and depth over the top N levels are O(1), depth within a
+    price band is a binary search on the cumulative sizes.
+    """
+
+    def __init__(self, symbol: str, max_levels: int = 200) -> None:
+        """
+        Initialize order book.
+
+        Args:
+            symbol: Trading pair
+            max_levels: Levels kept per side (deeper levels are dropped; below
+                ``CHECKSUM_LEVELS`` the checksum can't be verified and is skipped)
+        """
+        self.symbol = symbol
+        self.max_levels = max_levels
+        self.verify_checksum = max_levels >= CHECKSUM_LEVELS
+        self.bids = _Side(-1.0)
+        self.asks = _Side(1.0)
+        self.timestamp: int = 0
+        self.seq: int = 0
+        self.synced: bool = False
+        self.needs_resync: bool = False  # checksum failed; waiting for a new snapshot
+
+    def reset(self) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        self.synced = False
+        self.seq = 0
+
+    def apply(self, action: str, data: dict[str, Any]) -> bool:
+        """
+        Apply one ``books*`` push.
+
+        Args:
+            action: "snapshot" or "update"
+            data: Entry of the push's ``data`` array
+
+        Returns:
+            True if the book changed and is consistent; False if the push was
+            ignored (stale, or an update before any snapshot) or the checksum
+            failed, in which case the book is reset and needs a new snapshot
+        """
+        seq = int(data.get("seq") or 0)
+        if action == "update":
+            if not self.synced or (seq and seq <= self.seq):
+                return False
+            if data.get("bids"):
+                self.bids.merge(data["bids"], self.max_levels)
+            if data.get("asks"):
+                self.asks.merge(data["asks"], self.max_levels)
+        else:
+            self.bids.replace(data.get("bids") or [], self.max_levels)
+            self.asks.replace(data.get("asks") or [], self.max_levels)
+
+        checksum = data.get("checksum")
+        if checksum and self.verify_checksum and int(checksum) != self.checksum():
+            logger.warning(f"⚠️ [ORDER BOOK] {self.symbol} checksum mismatch after {action} - resync")
+            self.reset()
+            self.needs_resync = True
+            return False
+
+        self.synced = True
+        self.needs_resync = False
+        self.seq = seq or self.seq
+        self.timestamp = int(data.get("ts") or self.timestamp)
+        return True
+
+    def checksum(self) -> int:
+        return book_checksum(self.bids.raw_prices, self.bids.raw_sizes, self.asks.raw_prices, self.asks.raw_sizes)
+
+    @property
+    def best_bid(self) -> float:
+        return self.bids.best()
+
+    @property
+    def best_ask(self) -> float:
+        return self.asks.best()
+
+    @property
+    def mid(self) -> float:
+        bid, ask = self.best_bid, self.best_ask
+        return (bid + ask) / 2 if bid > 0 and ask > 0 else 0.0
+
+    @property
+    def spread_bps(self) -> float:
+        mid = self.mid
+        return (self.best_ask - self.best_bid) / mid * 10000 if mid > 0 else 0.0
+
+    def depth(self, side: str, levels: int | None = None) -> float:
+        """Total size of the top ``levels`` levels of a side ("bid"/"ask"; None = all kept)."""
+        return (self.bids if side == "bid" else self.asks).depth_levels(levels)
+
+    def depth_within_bps(self, side: str, bps: float) -> float:
+        """Size resting within ``bps`` basis points of mid on one side."""
+        mid = self.mid
+        if mid <= 0:
+            return 0.0
+        if side == "bid":
+            return self.bids.depth_to_price(mid * (1 - bps / 10000))
+        return self.asks.depth_to_price(mid * (1 + bps / 10000))
+
+    def imbalance(self, levels: int | None = None, bps: float | None = None) -> float:
+        """
+        (bid depth - ask depth) / total over the top levels or a price band.
+
+        Args:
+            levels: Top levels per side (None = all kept levels)
+            bps: Band around mid instead of a level count
+        """
+        if bps is not None:
+            bid, ask = self.depth_within_bps("bid", bps), self.depth_within_bps("ask", bps)
+        else:
+            bid, ask = self.depth("bid", levels), self.depth("ask", levels)
+        total = bid + ask
+        return (bid - ask) / total if total > 0 else 0.0
+
+    def levels(self, side: str, n: int) -> list[list[float]]:
+        """Top ``n`` ``[price, size]`` levels of a side, best first."""
+        book_side = self.bids if side == "bid" else self.asks
+        prices = book_side.keys[:n] * book_side.sign
+        return np.column_stack((prices, book_side.sizes[:n])).tolist()
+
+
+class OrderBookEngine:
+    """
+    Order books of many symbols fed from raw ``books*`` pushes.
+
+    Symbols whose book failed its checksum are collected in ``resync_needed``
+    for the feed to resubscribe (Bitget then sends a fresh snapshot).
+    """
+
+    def __init__(self, max_levels: int = 200) -> None:
+        """
+        Initialize order book engine.
+
+        Args:
+            max_levels: Levels kept per side and symbol (bounds memory)
+        """
+        self.max_levels = max_levels
+        self.books: dict[str, OrderBook] = {}
+        self.resync_needed: set[str] = set()
+
+        # Stats
+        self.updates_applied: int = 0
+        self.checksum_failures: int = 0
+
+    def get(self, symbol: str) -> OrderBook | None:
+        return self.books.get(symbol)
+
+    def apply(self, symbol: str, action: str, data: dict[str, Any]) -> OrderBook | None:
+        """
+        Apply a push to a symbol's book.
+
+        Returns:
+            The book if it changed and is consistent, else None
+        """
+        book = self.books.get(symbol)
+        if book is None:
+            book = self.books[symbol] = OrderBook(symbol, self.max_levels)
+
+        if book.apply(action or "snapshot", data):
+            self.updates_applied += 1
+            self.resync_needed.discard(symbol)
+            return book
+
+        if book.needs_resync and symbol not in self.resync_needed:
+            self.checksum_failures += 1
+            self.resync_needed.add(symbol)
+        return None
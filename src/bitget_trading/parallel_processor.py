@@ -1,7 +1,12 @@
 """Parallel processing for fast multi-symbol feature computation."""
 
+import atexit
+import math
 import multiprocessing as mp
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+import signal
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
 from typing import Any, Callable
 
 import numpy as np
@@ -11,23 +16,315 @@ from src.bitget_trading.logger import get_logger
 logger = get_logger()
 
 
+def attach_shared_block(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach a worker to a block created by the parent.
+
+    Workers share the parent's resource tracker, which unlinks the block only
+    if the parent leaks it; the parent unlinks it via ``release_shared_block``.
+    """
+    return shared_memory.SharedMemory(name=name)
+
+
+def release_shared_block(shm: shared_memory.SharedMemory, unlink: bool = False) -> None:
+    """
+    Close a shared block, and unlink it if this process owns it.
+
+    Args:
+        shm: Block to release
+        unlink: Also remove the block (owner/parent side only)
+    """
+    try:
+        shm.close()
+    except BufferError:
+        pass  # a view is still referenced; closed when collected
+    if unlink:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedPriceStore:
+    """
+    Per-symbol price histories in one shared-memory block.
+
+    Layout: a ``(n_symbols, capacity)`` float64 price matrix followed by a
+    ``(n_symbols,)`` length vector. Row ``i`` holds the latest ``lengths[i]``
+    prices of symbol ``i``, oldest first. Worker processes attach by name and
+    read rows as zero-copy views, so prices are never pickled.
+    """
+
+    def __init__(self, symbols: list[str], capacity: int = 3600) -> None:
+        """
+        Create the shared block.
+
+        Args:
+            symbols: Symbols to allocate rows for (row order is fixed)
+            capacity: Maximum prices kept per symbol
+        """
+        self.symbols = list(symbols)
+        self.rows: dict[str, int] = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.capacity = capacity
+
+        n_rows = max(1, len(self.symbols))
+        self.shm = shared_memory.SharedMemory(create=True, size=n_rows * (capacity + 1) * 8)
+        self.prices, self.lengths = self._views(self.shm, n_rows, capacity)
+        self.lengths[:] = 0
+
+    @staticmethod
+    def _views(
+        shm: shared_memory.SharedMemory, n_rows: int, capacity: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Numpy views of the price matrix and length vector in a block."""
+        prices = np.ndarray((n_rows, capacity), dtype=np.float64, buffer=shm.buf)
+        lengths = np.ndarray(
+            (n_rows,), dtype=np.float64, buffer=shm.buf, offset=n_rows * capacity * 8
+        )
+        return prices, lengths
+
+    @property
+    def descriptor(self) -> tuple[str, int, int]:
+        """(name, n_rows, capacity) needed by workers to attach."""
+        return self.shm.name, max(1, len(self.symbols)), self.capacity
+
+    def publish(self, symbol: str, prices: np.ndarray) -> None:
+        """
+        Copy the latest prices of a symbol into its row.
+
+        Args:
+            symbol: Symbol (must be one of ``symbols``)
+            prices: Price history, oldest first
+        """
+        row = self.rows[symbol]
+        tail = prices[-self.capacity :]
+        self.prices[row, : len(tail)] = tail
+        self.lengths[row] = len(tail)
+
+    def close(self) -> None:
+        """Release and unlink the shared block."""
+        self.prices = self.lengths = None  # type: ignore[assignment]
+        release_shared_block(self.shm, unlink=True)
+
+
+# Worker-side state (one copy per worker process)
+_worker_block: tuple[str, shared_memory.SharedMemory, np.ndarray, np.ndarray] | None = None
+_worker_rows: dict[str, int] = {}
+
+
+def _register_worker(pids: Any) -> None:
+    """Pool initializer: report the worker's pid so the parent can terminate it."""
+    pids.put(os.getpid())
+
+
+def _warm_worker() -> int:
+    """No-op task used to spawn workers ahead of the first real batch."""
+    return mp.current_process().pid or 0
+
+
+def _attach_block(descriptor: tuple[str, int, int]) -> None:
+    """Attach (or re-attach after a republish) to the shared price block."""
+    global _worker_block
+
+    name, n_rows, capacity = descriptor
+    if _worker_block is not None and _worker_block[0] == name:
+        return
+
+    if _worker_block is not None:
+        release_shared_block(_worker_block[1])
+
+    shm = attach_shared_block(name)
+    prices, lengths = SharedPriceStore._views(shm, n_rows, capacity)
+    _worker_block = (name, shm, prices, lengths)
+
+
+def get_shared_prices(symbol: str) -> np.ndarray:
+    """
+    Price history of a symbol from the shared block (call inside a task function).
+
+    Args:
+        symbol: Symbol of the current task
+
+    Returns:
+        Read-only zero-copy view, oldest first (empty if not published)
+    """
+    row = _worker_rows.get(symbol)
+    if _worker_block is None or row is None:
+        return np.empty(0)
+
+    _, _, prices, lengths = _worker_block
+    view = prices[row, : int(lengths[row])]
+    view.flags.writeable = False
+    return view
+
+
+def _run_chunk(
+    func: Callable[[str], Any],
+    items: list[tuple[str, int]],
+    descriptor: tuple[str, int, int] | None,
+) -> list[tuple[str, Any, str | None]]:
+    """
+    Run ``func`` for every symbol of a chunk inside a worker.
+
+    Returns:
+        List of (symbol, result, error) - error is None on success
+    """
+    if descriptor is not None:
+        _attach_block(descriptor)
+    _worker_rows.clear()
+    _worker_rows.update((symbol, row) for symbol, row in items if row >= 0)
+
+    results = []
+    for symbol, _ in items:
+        try:
+            results.append((symbol, func(symbol), None))
+        except Exception as e:
+            results.append((symbol, None, str(e)))
+    return results
+
+
 class ParallelProcessor:
     """
     Parallel processor for computing features across multiple symbols.
-    
+
     Uses all available CPU cores to speed up computation by 8-10x.
+
+    The worker pool is created once and reused across calls. Symbols are
+    dispatched in chunks (one pickle of the task function per chunk), and
+    price histories published with ``publish_prices`` are read by workers
+    from shared memory via ``get_shared_prices``. Task functions must be
+    picklable (module-level functions or ``functools.partial`` of them).
     """
-    
-    def __init__(self, max_workers: int | None = None) -> None:
+
+    CHUNKS_PER_WORKER = 4  # Chunks queued per worker (load balancing vs. dispatch overhead)
+
+    def __init__(self, max_workers: int | None = None, price_capacity: int = 3600) -> None:
         """
         Initialize parallel processor.
-        
+
         Args:
             max_workers: Max number of worker processes (None = use all cores)
+            price_capacity: Prices kept per symbol in shared memory
         """
         self.max_workers = max_workers or mp.cpu_count()
+        self.price_capacity = price_capacity
+        self._executor: ProcessPoolExecutor | None = None
+        self._pid_queue: Any = None
+        self._worker_pids: set[int] = set()
+        self._store: SharedPriceStore | None = None
         logger.info(f"🚀 Parallel processor initialized with {self.max_workers} workers")
-    
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the long-lived pool, starting and warming it on first use."""
+        if self._executor is None:
+            self._pid_queue = mp.SimpleQueue()
+            self._worker_pids = set()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_register_worker, initargs=(self._pid_queue,)
+            )
+            # Spawn every worker now so the first batch doesn't pay for it
+            warmups = [self._executor.submit(_warm_worker) for _ in range(self.max_workers)]
+            for future in warmups:
+                future.result()
+            logger.info("parallel_pool_started", workers=self.max_workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker pool and release shared memory."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            self._pid_queue = None
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def publish_prices(self, price_histories: dict[str, np.ndarray]) -> None:
+        """
+        Publish price histories to shared memory for the next batches.
+
+        Call between batches: workers read the block without locking.
+
+        The block is reused while the symbol set is unchanged; otherwise a
+        new one is created and workers re-attach on their next chunk.
+
+        Args:
+            price_histories: {symbol: prices (oldest first)}
+        """
+        symbols = list(price_histories)
+        if self._store is None or self._store.symbols != symbols:
+            if self._store is not None:
+                self._store.close()
+            self._store = SharedPriceStore(symbols, self.price_capacity)
+
+        for symbol, prices in price_histories.items():
+            self._store.publish(symbol, prices)
+
+    def publish_states(self, state_manager: Any) -> None:
+        """
+        Publish the price history of every symbol in a state manager.
+
+        Args:
+            state_manager: MultiSymbolStateManager
+        """
+        self.publish_prices(
+            {symbol: state.history.prices() for symbol, state in state_manager.symbols.items()}
+        )
+
+    def map_symbols(
+        self,
+        symbols: list[str],
+        func: Callable[[str], Any],
+        timeout: float = 5.0,
+        chunk_size: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run ``func(symbol)`` for every symbol on the worker pool.
+
+        Args:
+            symbols: List of symbol names
+            func: Picklable function that takes a symbol
+            timeout: Deadline for the whole batch in seconds; chunks still
+                running then are dropped and the pool is recycled
+            chunk_size: Symbols per task (None = spread over CHUNKS_PER_WORKER per worker)
+
+        Returns:
+            Dict of {symbol: result} for symbols that succeeded
+        """
+        if chunk_size is None:
+            chunk_size = max(1, math.ceil(len(symbols) / (self.max_workers * self.CHUNKS_PER_WORKER)))
+
+        rows = self._store.rows if self._store is not None else {}
+        descriptor = self._store.descriptor if self._store is not None else None
+        items = [(symbol, rows.get(symbol, -1)) for symbol in symbols]
+
+        executor = self._get_executor()
+        chunks: dict[Future, list[tuple[str, int]]] = {}
+        for i in range(0, len(items), chunk_size):
+            chunk = items[i : i + chunk_size]
+            chunks[executor.submit(_run_chunk, func, chunk, descriptor)] = chunk
+
+        done, not_done = wait(chunks, timeout=timeout)
+        if not_done:
+            late = [symbol for future in not_done for symbol, _ in chunks[future]]
+            logger.warning(
+                f"⚠️ {len(not_done)} chunks missed the {timeout:.1f}s deadline "
+                f"({late[0]}..{late[-1]}, {len(late)} symbols) - recycling worker pool"
+            )
+            self._recycle_pool()
+
+        results: dict[str, Any] = {}
+        for future in chunks:
+            if future not in done:
+                continue
+            for symbol, result, error in future.result():
+                if error is not None:
+                    logger.warning(f"Failed to process {symbol}: {error}")
+                    continue
+                results[symbol] = result
+
+        return results
+
     def compute_features_parallel(
         self,
         symbols: list[str],
@@ -36,49 +333,34 @@ class ParallelProcessor:
     ) -> dict[str, dict[str, float]]:
         """
         Compute features for multiple symbols in parallel.
-        
+
         Args:
             symbols: List of symbol names
             compute_func: Function that takes symbol and returns features
-            timeout: Timeout per symbol in seconds
-        
+            timeout: Deadline for the whole batch in seconds
+
         Returns:
             Dict of {symbol: features}
         """
         if len(symbols) == 0:
             return {}
-        
+
         # For small number of symbols, just run sequentially (overhead not worth it)
         if len(symbols) < 4:
             return {symbol: compute_func(symbol) for symbol in symbols}
-        
-        results = {}
-        
+
         try:
-            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all tasks
-                future_to_symbol = {
-                    executor.submit(compute_func, symbol): symbol
-                    for symbol in symbols
-                }
-                
-                # Collect results as they complete
-                for future in as_completed(future_to_symbol, timeout=timeout * len(symbols)):
-                    symbol = future_to_symbol[future]
-                    try:
-                        features = future.result(timeout=timeout)
-                        results[symbol] = features
-                    except Exception as e:
-                        logger.warning(f"Failed to compute features for {symbol}: {e}")
-                        results[symbol] = {}
-        
+            computed = self.map_symbols(symbols, compute_func, timeout=timeout)
+            results = {symbol: computed.get(symbol, {}) for symbol in symbols}
+
         except Exception as e:
             logger.error(f"Parallel processing failed: {e}")
+            self._reset_broken_pool()
             # Fallback to sequential
             results = {symbol: compute_func(symbol) for symbol in symbols}
-        
+
         return results
-    
+
     def rank_symbols_parallel(
         self,
         symbols: list[str],
@@ -87,50 +369,73 @@ class ParallelProcessor:
     ) -> list[tuple[str, float, str]]:
         """
         Rank multiple symbols in parallel.
-        
+
         Args:
             symbols: List of symbol names
             rank_func: Function that takes symbol and returns (score, side)
-            timeout: Timeout per symbol in seconds
-        
+            timeout: Deadline for the whole batch in seconds
+
         Returns:
             List of (symbol, score, side) sorted by score (descending)
         """
         if len(symbols) == 0:
             return []
-        
+
         # For small number, run sequentially
         if len(symbols) < 4:
             results = [(symbol, *rank_func(symbol)) for symbol in symbols]
             return sorted(results, key=lambda x: x[1], reverse=True)
-        
-        results = []
-        
+
         try:
-            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_symbol = {
-                    executor.submit(rank_func, symbol): symbol
-                    for symbol in symbols
-                }
-                
-                for future in as_completed(future_to_symbol, timeout=timeout * len(symbols)):
-                    symbol = future_to_symbol[future]
-                    try:
-                        score, side = future.result(timeout=timeout)
-                        results.append((symbol, score, side))
-                    except Exception as e:
-                        logger.warning(f"Failed to rank {symbol}: {e}")
-        
+            ranked = self.map_symbols(symbols, rank_func, timeout=timeout)
+            results = [(symbol, score, side) for symbol, (score, side) in ranked.items()]
+
         except Exception as e:
             logger.error(f"Parallel ranking failed: {e}")
+            self._reset_broken_pool()
             # Fallback to sequential
             results = [(symbol, *rank_func(symbol)) for symbol in symbols]
-        
+
         # Sort by score (descending)
         results.sort(key=lambda x: x[1], reverse=True)
-        
+
         return results
 
+    def _recycle_pool(self) -> None:
+        """
+        Kill the pool so the next call starts a fresh one.
+
+        A chunk that is already running can't be cancelled, so its worker is
+        terminated rather than left busy for later batches. Workers are found
+        by the pids their initializer reported (the executor doesn't expose
+        its processes).
+        """
+        executor = self._executor
+        if executor is None:
+            return
+        self._executor = None
+        for pid in self._pool_pids():
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._pid_queue = None
+
+    def _pool_pids(self) -> set[int]:
+        """Pids of the workers the current pool has started (reported by their initializer)."""
+        if self._pid_queue is not None:
+            while not self._pid_queue.empty():
+                self._worker_pids.add(self._pid_queue.get())
+        return set(self._worker_pids)
+
+    def _reset_broken_pool(self) -> None:
+        """Drop a pool whose workers died so the next call starts a fresh one."""
+        executor = self._executor
+        if executor is not None and getattr(executor, "_broken", False):
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
 
 # Singleton instance
 _parallel_processor: ParallelProcessor | None = None
@@ -141,6 +446,7 @@ def get_parallel_processor() -> ParallelProcessor:
     global _parallel_processor
     if _parallel_processor is None:
         _parallel_processor = ParallelProcessor()
+        atexit.register(_parallel_processor.shutdown)
     return _parallel_processor
 
 
@@ -150,11 +456,11 @@ def compute_features_batch(
 ) -> dict[str, dict[str, float]]:
     """
     Convenience function to compute features for multiple symbols in parallel.
-    
+
     Args:
         symbols: List of symbol names
         compute_func: Function that takes symbol and returns features
-    
+
     Returns:
         Dict of {symbol: features}
     """
@@ -168,14 +474,13 @@ def rank_symbols_batch(
 ) -> list[tuple[str, float, str]]:
     """
     Convenience function to rank multiple symbols in parallel.
-    
+
     Args:
         symbols: List of symbol names
         rank_func: Function that takes symbol and returns (score, side)
-    
+
     Returns:
         List of (symbol, score, side) sorted by score
     """
     processor = get_parallel_processor()
     return processor.rank_symbols_parallel(symbols, rank_func)
-
@@ -1,6 +1,9 @@
 """Position management with persistence and trailing stops."""
 
+import asyncio
 import json
+import os
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
@@ -50,19 +53,38 @@ class Position:
 
 
 class PositionManager:
-    """Manage positions with persistence and trailing stops."""
+    """
+    Manage positions with persistence and trailing stops.
+    
+    Persistence is write-behind: price updates only mark positions dirty, and
+    ``run_persister`` writes the snapshot at most every ``flush_interval_ms``
+    (immediately after an open/close). Opens, closes and explicit
+    ``persist_position`` calls are also appended to a journal right away, so
+    a crash between snapshots loses at most trailing-level updates.
+    Without a running persister, writes happen inline (coalesced by time).
+    """
 
-    def __init__(self, save_path: str = "data/positions.json") -> None:
+    def __init__(self, save_path: str = "data/positions.json", flush_interval_ms: float = 250.0) -> None:
         """
         Initialize position manager.
         
         Args:
             save_path: Path to save positions
+            flush_interval_ms: Min time between snapshot writes for price-only changes
         """
         self.save_path = Path(save_path)
         self.save_path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal_path = self.save_path.with_suffix(".journal")
+        self.flush_interval_sec = flush_interval_ms / 1000
         self.positions: dict[str, Position] = {}
         
+        # Write-behind state
+        self._dirty = False
+        self._journal_seq = 0  # seq of the last journal record
+        self._last_flush = 0.0
+        self._flush_now = asyncio.Event()
+        self._persister: asyncio.Task | None = None
+        
         # Load existing positions on startup
         self.load_positions()
 
@@ -99,7 +121,7 @@ class PositionManager:
         )
         
         self.positions[symbol] = position
-        self.save_positions()
+        self.persist_position(symbol)
         
         logger.info(
             "position_added",
@@ -116,7 +138,8 @@ class PositionManager:
         """Remove a position."""
         position = self.positions.pop(symbol, None)
         if position:
-            self.save_positions()
+            self._append_journal("remove", symbol)
+            self._request_flush()
             logger.info("position_removed", symbol=symbol)
         return position
 
@@ -147,7 +170,10 @@ class PositionManager:
         # Track peak PnL
         position.peak_pnl_pct = max(position.peak_pnl_pct, pnl_pct * 100)
         
-        self.save_positions()
+        # Hot path: no disk I/O here, the persister writes it within flush_interval_ms
+        self._dirty = True
+        if not self._persister_running():
+            self._maybe_flush()
 
     def check_exit_conditions(
         self, symbol: str, current_price: float
@@ -330,44 +356,171 @@ class PositionManager:
                 f"Trailing={pos.trailing_stop_pct*100:.0f}% capital"
             )
 
+    def persist_position(self, symbol: str) -> None:
+        """
+        Persist a changed position right away (e.g. after storing order IDs in its metadata).
+        
+        The change is journaled immediately and the snapshot is rewritten soon.
+        """
+        if symbol in self.positions:
+            self._append_journal("upsert", symbol, asdict(self.positions[symbol]))
+        self._request_flush()
+
+    def _persister_running(self) -> bool:
+        return self._persister is not None and not self._persister.done()
+
+    def _request_flush(self) -> None:
+        self._dirty = True
+        if self._persister_running():
+            self._flush_now.set()
+        else:
+            self.save_positions()
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval_sec:
+            self.save_positions()
+
+    def _append_journal(self, op: str, symbol: str, position: dict | None = None) -> None:
+        """Append one record to the journal (compact JSON line)."""
+        self._journal_seq += 1
+        record = {"seq": self._journal_seq, "op": op, "symbol": symbol}
+        if position is not None:
+            record["position"] = position
+        try:
+            with open(self.journal_path, "a") as f:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        except Exception as e:
+            logger.error("journal_append_error", error=str(e))
+
+    def _serialize(self) -> tuple[int, str]:
+        """Snapshot of all positions (taken on the event loop, written elsewhere)."""
+        positions_data = {
+            symbol: asdict(position)
+            for symbol, position in self.positions.items()
+        }
+        self._dirty = False
+        seq = self._journal_seq
+        return seq, json.dumps({"journal_seq": seq, "positions": positions_data}, separators=(",", ":"))
+
+    def _write_snapshot(self, payload: str) -> None:
+        """Atomically replace the snapshot file."""
+        tmp_path = self.save_path.with_suffix(self.save_path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.save_path)
+
+    def _after_write(self, seq: int) -> None:
+        self._last_flush = time.monotonic()
+        # Journal records up to seq are in the snapshot; drop the journal if nothing newer arrived
+        if seq == self._journal_seq and self.journal_path.exists():
+            self.journal_path.unlink()
+        logger.debug("positions_saved", count=len(self.positions))
+
     def save_positions(self) -> None:
-        """Save positions to disk."""
+        """Save positions to disk now (atomic write, compact JSON)."""
         try:
-            positions_data = {
-                symbol: asdict(position)
-                for symbol, position in self.positions.items()
-            }
-            
-            with open(self.save_path, "w") as f:
-                json.dump(positions_data, f, indent=2)
-            
-            logger.debug("positions_saved", count=len(self.positions))
+            seq, payload = self._serialize()
+            self._write_snapshot(payload)
+            self._after_write(seq)
             
         except Exception as e:
+            self._dirty = True
             logger.error("save_positions_error", error=str(e))
 
+    async def run_persister(self) -> None:
+        """
+        Background writer: flush dirty positions every ``flush_interval_ms``,
+        or immediately when an open/close requested it. Runs until cancelled;
+        cancelling waits for an in-flight write and then flushes whatever is
+        still dirty, so it doubles as the shutdown save.
+        """
+        self._persister = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._flush_now.wait(), timeout=self.flush_interval_sec)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_now.clear()
+                if not self._dirty:
+                    continue
+                try:
+                    seq, payload = self._serialize()
+                    write = asyncio.ensure_future(asyncio.to_thread(self._write_snapshot, payload))
+                    try:
+                        await asyncio.shield(write)
+                    except asyncio.CancelledError:
+                        # The thread keeps running: let it land so the final flush below can't race it
+                        await asyncio.wait([write])
+                        self._dirty = True
+                        raise
+                    self._after_write(seq)
+                except Exception as e:
+                    self._dirty = True
+                    logger.error("save_positions_error", error=str(e))
+        finally:
+            self._persister = None
+            if self._dirty:
+                self.save_positions()
+
     def load_positions(self) -> None:
-        """Load positions from disk."""
-        if not self.save_path.exists():
+        """Load positions from disk (snapshot, then any newer journal records)."""
+        snapshot_seq = 0
+        if self.save_path.exists():
+            try:
+                with open(self.save_path, "r") as f:
+                    saved = json.load(f)
+                
+                # Legacy files are a plain {symbol: position} mapping
+                if "positions" in saved and "journal_seq" in saved:
+                    snapshot_seq = saved["journal_seq"]
+                    saved = saved["positions"]
+                for symbol, data in saved.items():
+                    position = Position(**data)
+                    self.positions[symbol] = position
+                
+            except Exception as e:
+                logger.error("load_positions_error", error=str(e))
+        
+        replayed = self._replay_journal(snapshot_seq)
+        if not self.positions and not replayed:
             logger.info("no_saved_positions_found")
             return
         
-        try:
-            with open(self.save_path, "r") as f:
-                positions_data = json.load(f)
-            
-            for symbol, data in positions_data.items():
-                position = Position(**data)
-                self.positions[symbol] = position
-            
-            logger.info(
-                "positions_loaded",
-                count=len(self.positions),
-                symbols=list(self.positions.keys()),
-            )
-            
-        except Exception as e:
-            logger.error("load_positions_error", error=str(e))
+        if replayed:
+            # Fold the replayed records into a fresh snapshot
+            self.save_positions()
+        
+        logger.info(
+            "positions_loaded",
+            count=len(self.positions),
+            symbols=list(self.positions.keys()),
+            journal_records_replayed=replayed,
+        )
+
+    def _replay_journal(self, snapshot_seq: int) -> int:
+        """Apply journal records newer than the snapshot; returns how many were applied."""
+        self._journal_seq = snapshot_seq
+        if not self.journal_path.exists():
+            return 0
+        
+        replayed = 0
+        with open(self.journal_path, "r") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from a crash mid-append
+                    break
+                self._journal_seq = max(self._journal_seq, record["seq"])
+                if record["seq"] <= snapshot_seq:
+                    continue
+                if record["op"] == "upsert":
+                    self.positions[record["symbol"]] = Position(**record["position"])
+                elif record["op"] == "remove":
+                    self.positions.pop(record["symbol"], None)
+                replayed += 1
+        return replayed
 
     def get_total_unrealized_pnl(self) -> float:
         """Get total unrealized PnL across all positions."""
@@ -0,0 +1,285 @@
+"""Client-side token-bucket rate limiting for Bitget REST endpoints."""
+
+import asyncio
+import heapq
+import itertools
+import time
+
+from .logger import get_logger
+
+logger = get_logger()
+
+# Priorities (lower = served first)
+PRIORITY_CRITICAL = 0  # Order placement/cancel, TP/SL and stop-loss verification
+PRIORITY_NORMAL = 1  # Live market data and account queries
+PRIORITY_BULK = 2  # History downloads and backtests
+
+# Endpoint group -> (requests per second, burst). Bitget documents 20 req/s per IP
+# for market data and 10 req/s per UID for order, plan order and account endpoints.
+DEFAULT_GROUP_LIMITS: dict[str, tuple[float, float]] = {
+    "market": (20.0, 20.0),
+    "trade": (10.0, 10.0),
+    "plan": (10.0, 10.0),
+    "account": (10.0, 10.0),
+}
+
+DEFAULT_GROUP_PRIORITY: dict[str, int] = {
+    "market": PRIORITY_NORMAL,
+    "trade": PRIORITY_CRITICAL,
+    "plan": PRIORITY_CRITICAL,
+    "account": PRIORITY_NORMAL,
+}
+
+
+def endpoint_group(endpoint: str) -> str:
+    """
+    Map a REST path to its rate-limit group.
+
+    Args:
+        endpoint: API path, e.g. "/api/v2/mix/order/place-order" (query string allowed)
+
+    Returns:
+        "market", "plan", "trade" or "account"
+    """
+    path = endpoint.split("?", 1)[0]
+    if "/market/" in path:
+        return "market"
+    if "/order/" in path:
+        return "plan" if ("plan" in path or "tpsl" in path) else "trade"
+    return "account"
+
+
+class TokenBucket:
+    """
+    Token bucket that grants tokens in priority order.
+
+    Waiters queue by (priority, arrival); only the head of the queue may take
+    tokens, so a backlog of bulk requests never delays a critical one by more
+    than the refill time of a single token. Bulk requests additionally leave
+    ``bulk_reserve`` of the burst untouched for everyone else.
+
+    After a 429 the bucket blocks for an exponential backoff and halves its
+    rate; every success afterwards restores 5% of the base rate (AIMD).
+    """
+
+    BACKOFF_BASE = 0.5  # seconds
+    BACKOFF_MAX = 30.0  # seconds
+    RECOVERY_STEP = 0.05  # fraction of the base rate restored per success
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        bulk_reserve: float = 0.25,
+        min_rate_fraction: float = 0.1,
+    ) -> None:
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Refill rate (tokens per second)
+            burst: Bucket capacity
+            bulk_reserve: Fraction of the capacity bulk requests must leave unused
+            min_rate_fraction: Floor of the adaptive rate (fraction of ``rate``)
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.bulk_reserve = bulk_reserve
+        self.min_rate = rate * min_rate_fraction
+
+        self.blocked_until: float = 0.0
+        self.consecutive_rate_limits: int = 0
+        self._updated = time.monotonic()
+        self._waiters: list[list] = []  # heap of [priority, seq, weight]
+        self._seq = itertools.count()
+        self._changed = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Stats
+        self.granted: int = 0
+        self.rate_limited: int = 0
+        self.total_wait_sec: float = 0.0
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _notify(self) -> None:
+        # Wake every waiter so the new queue head re-checks the bucket
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL, weight: float = 1.0) -> float:
+        """
+        Wait for ``weight`` tokens.
+
+        Args:
+            priority: PRIORITY_CRITICAL, PRIORITY_NORMAL or PRIORITY_BULK
+            weight: Tokens consumed by the request
+
+        Returns:
+            Seconds spent waiting
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Shared bucket used from a new event loop: old waiters/events are dead
+            self._loop = loop
+            self._waiters.clear()
+            self._changed = asyncio.Event()
+
+        start = time.monotonic()
+        entry = [priority, next(self._seq), weight]
+        heapq.heappush(self._waiters, entry)
+        reserve = self.capacity * self.bulk_reserve if priority >= PRIORITY_BULK else 0.0
+
+        try:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                delay: float | None = None
+                if self._waiters[0] is entry:
+                    delay = max(
+                        self.blocked_until - now,
+                        (weight + reserve - self.tokens) / self.rate,
+                    )
+                    if delay <= 0:
+                        heapq.heappop(self._waiters)
+                        self.tokens -= weight
+                        self.granted += 1
+                        waited = now - start
+                        self.total_wait_sec += waited
+                        self._notify()
+                        return waited
+
+                changed = self._changed
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            # Cancelled while queued: drop out of the queue
+            if any(waiter is entry for waiter in self._waiters):
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._notify()
+            raise
+
+    def record_rate_limited(self, retry_after: float | None = None) -> float:
+        """
+        React to a 429: block, halve the rate and drain the bucket.
+
+        Args:
+            retry_after: Server-provided backoff in seconds (if any)
+
+        Returns:
+            Backoff applied (seconds)
+        """
+        self.rate_limited += 1
+        self.consecutive_rate_limits += 1
+        backoff = retry_after if retry_after is not None else min(
+            self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** (self.consecutive_rate_limits - 1)
+        )
+
+        now = time.monotonic()
+        self._refill(now)
+        self.blocked_until = max(self.blocked_until, now + backoff)
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = 0.0
+        self._notify()
+        return backoff
+
+    def record_success(self) -> None:
+        """Additive recovery of the rate after a successful request."""
+        self.consecutive_rate_limits = 0
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * self.RECOVERY_STEP)
+
+
+class BitgetRateLimiter:
+    """Per-endpoint-group token buckets shared by every BitgetRestClient."""
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[float, float]] | None = None,
+        bulk_reserve: float = 0.25,
+    ) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            limits: Group -> (requests per second, burst); defaults to DEFAULT_GROUP_LIMITS
+            bulk_reserve: Fraction of each burst bulk requests must leave unused
+        """
+        limits = limits or DEFAULT_GROUP_LIMITS
+        self.buckets: dict[str, TokenBucket] = {
+            group: TokenBucket(rate, burst, bulk_reserve=bulk_reserve)
+            for group, (rate, burst) in limits.items()
+        }
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """Bucket governing an endpoint."""
+        group = endpoint_group(endpoint)
+        return self.buckets.get(group) or self.buckets["account"]
+
+    async def acquire(self, endpoint: str, priority: int | None = None, weight: float = 1.0) -> float:
+        """
+        Wait until a request to ``endpoint`` may be sent.
+
+        Args:
+            endpoint: API path
+            priority: Override of the group's default priority
+            weight: Tokens consumed by the request
+
+        Returns:
+            Seconds spent waiting
+        """
+        if priority is None:
+            priority = DEFAULT_GROUP_PRIORITY.get(endpoint_group(endpoint), PRIORITY_NORMAL)
+        return await self.bucket(endpoint).acquire(priority, weight)
+
+    def record_rate_limited(self, endpoint: str, retry_after: float | None = None) -> float:
+        """Report a 429 for ``endpoint``; returns the backoff applied."""
+        backoff = self.bucket(endpoint).record_rate_limited(retry_after)
+        logger.warning(
+            "rest_rate_limited",
+            group=endpoint_group(endpoint),
+            backoff_sec=round(backoff, 2),
+            rate=round(self.bucket(endpoint).rate, 2),
+        )
+        return backoff
+
+    def record_success(self, endpoint: str) -> None:
+        """Report a successful response for ``endpoint``."""
+        self.bucket(endpoint).record_success()
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        """Per-group counters and current adaptive rate."""
+        return {
+            group: {
+                "rate": bucket.rate,
+                "granted": bucket.granted,
+                "queued": bucket.queued,
+                "rate_limited": bucket.rate_limited,
+                "total_wait_sec": bucket.total_wait_sec,
+            }
+            for group, bucket in self.buckets.items()
+        }
+
+
+# Process-wide limiter: all clients share the same IP/UID limits
+_rate_limiter: BitgetRateLimiter | None = None
+
+
+def get_rate_limiter() -> BitgetRateLimiter:
+    """Get the shared rate limiter."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = BitgetRateLimiter()
+    return _rate_limiter
@@ -46,21 +46,21 @@ class RegimeDetector:
         self.volatility_threshold_high = volatility_threshold_high
         self.volatility_threshold_low = volatility_threshold_low
 
-    def calculate_adx(self, price_history: list[tuple[float, float]], period: int = 14) -> float:
+    def calculate_adx(self, prices: np.ndarray, period: int = 14) -> float:
         """
         Calculate ADX (Average Directional Index).
         
         Args:
-            price_history: List of (timestamp, price) tuples
+            prices: Price history, oldest first
             period: ADX period
         
         Returns:
             ADX value (0-100)
         """
-        if len(price_history) < period + 1:
+        if len(prices) < period + 1:
             return 0.0
         
-        prices = np.array([p for _, p in price_history[-period-1:]])
+        prices = prices[-period-1:]
         
         # Calculate directional movements
         high_low_diff = np.diff(prices)
@@ -84,7 +84,7 @@ class RegimeDetector:
 
     def detect_regime(
         self,
-        price_history: list[tuple[float, float]],
+        prices: np.ndarray,
         volatility: float,
         volume_ratio: float = 1.0,
     ) -> str:
@@ -92,18 +92,18 @@ class RegimeDetector:
         Detect current market regime.
         
         Args:
-            price_history: List of (timestamp, price) tuples
+            prices: Price history, oldest first
             volatility: Current volatility (%)
             volume_ratio: Current volume / average volume
         
         Returns:
             Regime type (TRENDING, RANGING, BREAKOUT, VOLATILE)
         """
-        if len(price_history) < 20:
+        if len(prices) < 20:
             return MarketRegime.RANGING  # Default to ranging
         
         # Calculate trend strength
-        adx = self.calculate_adx(price_history)
+        adx = self.calculate_adx(prices)
         
         # Check for breakout (high volume + volatility spike)
         if volume_ratio > 2.0 and volatility > self.volatility_threshold_high:
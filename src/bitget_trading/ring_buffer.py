@@ -0,0 +1,157 @@
+"""Preallocated numpy ring buffer for per-symbol tick history."""
+
+import numpy as np
+
+
+class PriceRingBuffer:
+    """
+    Fixed-capacity history of (timestamp, price, volume, bid_volume, ask_volume).
+
+    Every sample is written twice (at ``i`` and ``i + capacity``) into a
+    ``(5, 2 * capacity)`` float64 block, so the last ``n`` samples are always a
+    contiguous slice: all accessors return zero-copy views. Views alias the
+    buffer and are overwritten by later appends; copy them if they must
+    outlive the next update.
+    """
+
+    TIMESTAMP = 0
+    PRICE = 1
+    VOLUME = 2
+    BID_VOLUME = 3
+    ASK_VOLUME = 4
+    N_COLUMNS = 5
+
+    __slots__ = ("capacity", "_data", "_pos", "_size")
+
+    def __init__(self, capacity: int = 3600) -> None:
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Maximum number of samples kept (3600 = 1 hour at 1Hz)
+        """
+        self.capacity = capacity
+        self._data = np.zeros((self.N_COLUMNS, 2 * capacity), dtype=np.float64)
+        self._pos = 0  # next write slot in [0, capacity)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def append(
+        self,
+        timestamp: float,
+        price: float,
+        volume: float = 0.0,
+        bid_volume: float = 0.0,
+        ask_volume: float = 0.0,
+    ) -> None:
+        """Append one sample, overwriting the oldest once full."""
+        data = self._data
+        pos = self._pos
+        mirror = pos + self.capacity
+
+        data[0, pos] = data[0, mirror] = timestamp
+        data[1, pos] = data[1, mirror] = price
+        data[2, pos] = data[2, mirror] = volume
+        data[3, pos] = data[3, mirror] = bid_volume
+        data[4, pos] = data[4, mirror] = ask_volume
+
+        self._pos = pos + 1 if pos + 1 < self.capacity else 0
+        if self._size < self.capacity:
+            self._size += 1
+
+    def load(self, samples: np.ndarray) -> None:
+        """
+        Replace the contents with ``samples``.
+
+        Args:
+            samples: ``(5, n)`` array, oldest first; only the last ``capacity`` are kept
+        """
+        samples = samples[:, -self.capacity:] if samples.shape[1] else samples
+        n = samples.shape[1]
+        self._data[:, :n] = samples
+        self._data[:, self.capacity : self.capacity + n] = samples
+        self._pos = n % self.capacity
+        self._size = n
+
+    def clear(self) -> None:
+        """Drop all samples (storage stays allocated)."""
+        self._pos = 0
+        self._size = 0
+
+    def last(self, n: int | None = None) -> np.ndarray:
+        """
+        View of the last ``n`` samples (all when None) as a ``(5, n)`` array.
+
+        Args:
+            n: Number of most recent samples
+
+        Returns:
+            Zero-copy view, oldest sample first
+        """
+        n = self._size if n is None else max(0, min(n, self._size))
+        end = self._pos + self.capacity
+        return self._data[:, end - n : end]
+
+    def column(self, index: int, n: int | None = None) -> np.ndarray:
+        """Zero-copy view of one column for the last ``n`` samples."""
+        n = self._size if n is None else max(0, min(n, self._size))
+        end = self._pos + self.capacity
+        return self._data[index, end - n : end]
+
+    def timestamps(self, n: int | None = None) -> np.ndarray:
+        """Timestamps of the last ``n`` samples."""
+        return self.column(self.TIMESTAMP, n)
+
+    def prices(self, n: int | None = None) -> np.ndarray:
+        """Prices of the last ``n`` samples."""
+        return self.column(self.PRICE, n)
+
+    def volumes(self, n: int | None = None) -> np.ndarray:
+        """Volumes of the last ``n`` samples."""
+        return self.column(self.VOLUME, n)
+
+    def bid_volumes(self, n: int | None = None) -> np.ndarray:
+        """Bid-side volumes of the last ``n`` samples."""
+        return self.column(self.BID_VOLUME, n)
+
+    def ask_volumes(self, n: int | None = None) -> np.ndarray:
+        """Ask-side volumes of the last ``n`` samples."""
+        return self.column(self.ASK_VOLUME, n)
+
+    def price_at(self, index: int) -> float:
+        """
+        Price of a single sample by position (negative = from the end).
+
+        Args:
+            index: Sample index, e.g. -1 for the latest
+
+        Returns:
+            Price at that position
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("PriceRingBuffer index out of range")
+        return float(self._data[self.PRICE, self._pos + self.capacity - self._size + index])
+
+    @property
+    def last_price(self) -> float:
+        """Latest price (0.0 when empty)."""
+        return self.price_at(-1) if self._size else 0.0
+
+    @property
+    def last_timestamp(self) -> float:
+        """Latest timestamp (0.0 when empty)."""
+        if not self._size:
+            return 0.0
+        return float(self._data[self.TIMESTAMP, self._pos + self.capacity - 1])
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of preallocated storage."""
+        return self._data.nbytes
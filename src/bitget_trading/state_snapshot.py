@@ -0,0 +1,166 @@
+"""Binary warm-start snapshots of MultiSymbolStateManager."""
+
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from src.bitget_trading.logger import get_logger
+from src.bitget_trading.multi_symbol_state import MultiSymbolStateManager, SymbolState
+from src.bitget_trading.ring_buffer import PriceRingBuffer
+
+logger = get_logger()
+
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class StateSnapshot:
+    """Captured state, ready to be written from another thread."""
+
+    saved_at: float
+    symbols: list[str]
+    sizes: np.ndarray  # history samples per symbol
+    history: np.ndarray  # (n_symbols, 5, capacity) float64, samples left-aligned
+    states: bytes  # pickled SymbolState.to_snapshot() dicts
+
+
+class StateSnapshotStore:
+    """
+    Periodic snapshot of all per-symbol state for near-instant restarts.
+
+    Layout in ``directory``:
+      - ``history-<generation>.npy``: price/volume/order-book history of every
+        symbol as one float64 block, memory-mapped on load
+      - ``state.pkl``: everything else (candle buffers, streaming indicator
+        state, online trade stats) plus the generation of the history file
+
+    ``state.pkl`` is replaced last and atomically, so a crash mid-write leaves
+    the previous snapshot intact.
+    """
+
+    STATE_FILE = "state.pkl"
+
+    def __init__(self, directory: str) -> None:
+        """
+        Initialize snapshot store.
+
+        Args:
+            directory: Snapshot directory (created on first save)
+        """
+        self.directory = Path(directory)
+
+    def capture(self, manager: MultiSymbolStateManager) -> StateSnapshot:
+        """
+        Copy the current state (cheap enough to run on the event loop).
+
+        Args:
+            manager: State manager to capture
+        """
+        symbols = list(manager.symbols)
+        states = [manager.symbols[symbol] for symbol in symbols]
+        capacity = max((s.history.capacity for s in states), default=0)
+        history = np.zeros((len(states), PriceRingBuffer.N_COLUMNS, capacity), dtype=np.float64)
+        sizes = np.zeros(len(states), dtype=np.int64)
+        for i, state in enumerate(states):
+            samples = state.history.last()
+            sizes[i] = samples.shape[1]
+            history[i, :, : sizes[i]] = samples
+
+        return StateSnapshot(
+            saved_at=time.time(),
+            symbols=symbols,
+            sizes=sizes,
+            history=history,
+            states=pickle.dumps([state.to_snapshot() for state in states], protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
+    def write(self, snapshot: StateSnapshot) -> None:
+        """Write a captured snapshot to disk (safe to call from a worker thread)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        generation = f"{int(snapshot.saved_at * 1000)}"
+        history_file = self.directory / f"history-{generation}.npy"
+
+        tmp_file = history_file.with_suffix(".npy.tmp")
+        with open(tmp_file, "wb") as f:
+            np.save(f, snapshot.history)
+        os.replace(tmp_file, history_file)
+
+        meta = {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": snapshot.saved_at,
+            "history_file": history_file.name,
+            "symbols": snapshot.symbols,
+            "sizes": snapshot.sizes,
+            "states": snapshot.states,
+        }
+        state_file = self.directory / self.STATE_FILE
+        tmp_file = state_file.with_suffix(".pkl.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, state_file)
+
+        # Previous generations are unreferenced now
+        for old in self.directory.glob("history-*.npy"):
+            if old.name != history_file.name:
+                old.unlink(missing_ok=True)
+
+    def save(self, manager: MultiSymbolStateManager) -> None:
+        """Capture and write in one go (e.g. on shutdown)."""
+        snapshot = self.capture(manager)
+        self.write(snapshot)
+        logger.info(f"💾 [STATE SNAPSHOT] Saved {len(snapshot.symbols)} symbols to {self.directory}")
+
+    def load(
+        self,
+        manager: MultiSymbolStateManager,
+        max_age_sec: float | None = None,
+        symbols: list[str] | None = None,
+    ) -> float | None:
+        """
+        Restore symbol states from the latest snapshot.
+
+        Args:
+            manager: State manager to restore into
+            max_age_sec: Ignore snapshots older than this
+            symbols: Restore only these symbols (default: all)
+
+        Returns:
+            Snapshot time (epoch seconds), or None if nothing was restored
+        """
+        state_file = self.directory / self.STATE_FILE
+        if not state_file.exists():
+            return None
+
+        try:
+            with open(state_file, "rb") as f:
+                meta = pickle.load(f)
+            if meta.get("version") != SNAPSHOT_VERSION:
+                logger.warning(f"⚠️ [STATE SNAPSHOT] Unsupported version {meta.get('version')} - ignoring")
+                return None
+
+            age = time.time() - meta["saved_at"]
+            if max_age_sec is not None and age > max_age_sec:
+                logger.info(f"⏰ [STATE SNAPSHOT] Snapshot is {age:.0f}s old (max {max_age_sec:.0f}s) - ignoring")
+                return None
+
+            history = np.load(self.directory / meta["history_file"], mmap_mode="r")
+            states = pickle.loads(meta["states"])
+            wanted = set(symbols) if symbols is not None else None
+
+            restored = 0
+            for i, (symbol, state) in enumerate(zip(meta["symbols"], states)):
+                if wanted is not None and symbol not in wanted:
+                    continue
+                samples = np.array(history[i, :, : meta["sizes"][i]])
+                manager.restore_symbol(SymbolState.from_snapshot(state, samples))
+                restored += 1
+        except Exception as e:
+            logger.warning(f"⚠️ [STATE SNAPSHOT] Failed to load snapshot: {e}")
+            return None
+
+        logger.info(f"📂 [STATE SNAPSHOT] Restored {restored} symbols ({age:.0f}s old) from {self.directory}")
+        return meta["saved_at"] if restored else None
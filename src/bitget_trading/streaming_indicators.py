@@ -0,0 +1,260 @@
+"""O(1)-per-update streaming indicators for tick-level feature computation."""
+
+import math
+from collections import deque
+from typing import Deque
+
+
+class StreamingEMA:
+    """
+    Exponential moving average updated one value at a time.
+
+    Matches ``AdvancedIndicators._compute_ema``: the simple mean is returned
+    until ``period`` values have been seen, the EMA itself is seeded with the
+    first value.
+    """
+
+    __slots__ = ("period", "k", "count", "total", "ema")
+
+    def __init__(self, period: int) -> None:
+        """
+        Initialize EMA.
+
+        Args:
+            period: EMA period (k = 2 / (period + 1))
+        """
+        self.period = period
+        self.k = 2.0 / (period + 1)
+        self.count = 0
+        self.total = 0.0
+        self.ema = 0.0
+
+    def update(self, value: float) -> None:
+        """Add a value."""
+        if self.count == 0:
+            self.ema = value
+        else:
+            self.ema = value * self.k + self.ema * (1 - self.k)
+
+        if self.count < self.period:
+            self.total += value
+        self.count += 1
+
+    @property
+    def value(self) -> float:
+        """Current EMA (simple mean during warm-up)."""
+        if self.count == 0:
+            return 0.0
+        if self.count < self.period:
+            return self.total / self.count
+        return self.ema
+
+
+class StreamingRSI:
+    """
+    Wilder-smoothed RSI.
+
+    The first ``period`` gains/losses are averaged, afterwards
+    avg = (avg * (period - 1) + x) / period.
+    """
+
+    __slots__ = ("period", "count", "prev", "avg_gain", "avg_loss")
+
+    def __init__(self, period: int = 14) -> None:
+        """
+        Initialize RSI.
+
+        Args:
+            period: Lookback period
+        """
+        self.period = period
+        self.count = 0  # number of price deltas seen
+        self.prev: float | None = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+
+    def update(self, price: float) -> None:
+        """Add a price."""
+        if self.prev is None:
+            self.prev = price
+            return
+
+        delta = price - self.prev
+        self.prev = price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        self.count += 1
+        if self.count <= self.period:
+            # Seed with the simple average of the first `period` deltas
+            self.avg_gain += (gain - self.avg_gain) / self.count
+            self.avg_loss += (loss - self.avg_loss) / self.count
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+
+    @property
+    def value(self) -> float:
+        """Current RSI (0-100, 50 = neutral until warmed up)."""
+        if self.count < self.period:
+            return 50.0
+        if self.avg_loss == 0:
+            return 100.0 if self.avg_gain > 0 else 50.0
+
+        rs = self.avg_gain / self.avg_loss
+        return 100 - (100 / (1 + rs))
+
+
+class StreamingMACD:
+    """MACD line, signal line (EMA of the MACD line) and histogram."""
+
+    __slots__ = ("fast", "slow", "signal", "count")
+
+    def __init__(self, fast: int = 3, slow: int = 7, signal: int = 2) -> None:
+        """
+        Initialize MACD.
+
+        Args:
+            fast: Fast EMA period
+            slow: Slow EMA period
+            signal: Signal line period
+        """
+        self.fast = StreamingEMA(fast)
+        self.slow = StreamingEMA(slow)
+        self.signal = StreamingEMA(signal)
+        self.count = 0
+
+    def update(self, price: float) -> None:
+        """Add a price."""
+        self.fast.update(price)
+        self.slow.update(price)
+        self.signal.update(self.fast.value - self.slow.value)
+        self.count += 1
+
+    @property
+    def value(self) -> tuple[float, float, float]:
+        """(macd_line, signal_line, histogram), zeros until warmed up."""
+        if self.count < self.slow.period + self.signal.period:
+            return 0.0, 0.0, 0.0
+
+        macd_line = self.fast.value - self.slow.value
+        signal_line = self.signal.value
+        return macd_line, signal_line, macd_line - signal_line
+
+
+class RollingWindowStats:
+    """
+    Mean / population variance over the last ``window`` values (windowed Welford).
+
+    Until the window is full the statistics cover every value seen so far.
+    """
+
+    __slots__ = ("window", "values", "mean", "m2", "evictions")
+
+    def __init__(self, window: int) -> None:
+        """
+        Initialize rolling statistics.
+
+        Args:
+            window: Number of most recent values covered
+        """
+        self.window = window
+        self.values: Deque[float] = deque(maxlen=window)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.evictions = 0
+
+    def update(self, value: float) -> None:
+        """Add a value, evicting the oldest one once the window is full."""
+        if len(self.values) == self.window:
+            old = self.values[0]
+            n = self.window - 1
+            if n == 0:
+                self.mean = 0.0
+                self.m2 = 0.0
+            else:
+                delta = old - self.mean
+                self.mean -= delta / n
+                self.m2 -= delta * (old - self.mean)
+
+            self.evictions += 1
+
+        self.values.append(value)
+        n = len(self.values)
+        delta = value - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (value - self.mean)
+
+        # Recompute exactly once per window of evictions (amortized O(1)) to cancel drift
+        if self.evictions >= self.window:
+            self.evictions = 0
+            self.mean = math.fsum(self.values) / n
+            self.m2 = math.fsum((v - self.mean) ** 2 for v in self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def variance(self) -> float:
+        """Population variance (ddof=0, like ``np.std``)."""
+        if not self.values:
+            return 0.0
+        return max(self.m2, 0.0) / len(self.values)
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(self.variance)
+
+
+class RollingVWAP:
+    """Volume-weighted average price over the last ``window`` samples."""
+
+    __slots__ = ("window", "samples", "pv_sum", "v_sum", "last_price", "evictions")
+
+    def __init__(self, window: int = 300) -> None:
+        """
+        Initialize rolling VWAP.
+
+        Args:
+            window: Number of most recent samples covered
+        """
+        self.window = window
+        self.samples: Deque[tuple[float, float]] = deque(maxlen=window)
+        self.pv_sum = 0.0
+        self.v_sum = 0.0
+        self.last_price = 0.0
+        self.evictions = 0
+
+    def update(self, price: float, volume: float) -> None:
+        """Add a (price, volume) sample."""
+        if len(self.samples) == self.window:
+            old_price, old_volume = self.samples[0]
+            self.pv_sum -= old_price * old_volume
+            self.v_sum -= old_volume
+            self.evictions += 1
+
+        self.samples.append((price, volume))
+        self.pv_sum += price * volume
+        self.v_sum += volume
+        self.last_price = price
+
+        # Recompute exactly once per window of evictions (amortized O(1)) to cancel drift
+        if self.evictions >= self.window:
+            self.evictions = 0
+            self.pv_sum = math.fsum(p * v for p, v in self.samples)
+            self.v_sum = math.fsum(v for _, v in self.samples)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    @property
+    def value(self) -> tuple[float, float]:
+        """(vwap, deviation_pct of the last price from VWAP)."""
+        if len(self.samples) < 2:
+            return 0.0, 0.0
+        if self.v_sum <= 0:
+            return self.last_price, 0.0
+
+        vwap = self.pv_sum / self.v_sum
+        return vwap, (self.last_price - vwap) / vwap
@@ -0,0 +1,522 @@
+"""Append-only binary archive of WebSocket tickers, trades and book updates."""
+
+import asyncio
+import gzip
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.bitget_trading.logger import get_logger
+from src.bitget_trading.market_data_hub import MarketDataHub
+from src.bitget_trading.multi_symbol_state import MultiSymbolStateManager
+
+logger = get_logger()
+
+MAGIC = b"BGTICK1\n"
+DAY_MS = 86_400_000
+
+TICKER_DTYPE = np.dtype([
+    ("ts", "<i8"),
+    ("last", "<f8"),
+    ("bid", "<f8"),
+    ("ask", "<f8"),
+    ("bid_size", "<f8"),
+    ("ask_size", "<f8"),
+    ("mark", "<f8"),
+    ("index", "<f8"),
+    ("funding_rate", "<f8"),
+    ("open_24h", "<f8"),
+    ("high_24h", "<f8"),
+    ("low_24h", "<f8"),
+    ("volume_24h", "<f8"),
+    ("quote_volume_24h", "<f8"),
+    ("open_interest", "<f8"),
+])
+TRADE_DTYPE = np.dtype([("ts", "<i8"), ("trade_id", "<i8"), ("price", "<f8"), ("size", "<f8"), ("side", "i1")])
+# One row per level change; rows of one push share ts/seq, snapshot rows replace the book
+BOOK_DTYPE = np.dtype([
+    ("ts", "<i8"), ("seq", "<i8"), ("price", "<f8"), ("size", "<f8"), ("side", "i1"), ("snapshot", "?"),
+])
+
+STREAMS = {"ticker": TICKER_DTYPE, "trade": TRADE_DTYPE, "book": BOOK_DTYPE}
+
+_TICKER_FIELDS = (
+    "lastPr", "bidPr", "askPr", "bidSz", "askSz", "markPrice", "indexPrice", "fundingRate",
+    "open24h", "high24h", "low24h", "baseVolume", "quoteVolume", "holdingAmount",
+)
+
+
+def _day(ts_ms: int) -> str:
+    return datetime.fromtimestamp(ts_ms / 1000, timezone.utc).strftime("%Y%m%d")
+
+
+def _day_start_ms(day: str) -> int:
+    return int(datetime.strptime(day, "%Y%m%d").replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def _header(dtype: np.dtype) -> bytes:
+    descr = json.dumps(dtype.descr).encode()
+    return MAGIC + len(descr).to_bytes(4, "little") + descr
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class TickRecorder:
+    """
+    Records raw ``ticker``, ``trade`` and ``books*`` pushes into binary files.
+
+    Layout: ``{root}/{YYYYMMDD}/{symbol}.{stream}.bin`` (UTC day of the
+    exchange timestamp), each a short header (magic + dtype description)
+    followed by fixed-width rows (``TICKER_DTYPE``, ``TRADE_DTYPE``,
+    ``BOOK_DTYPE``), so an open day maps straight into a numpy array. Next to
+    every file, ``.idx`` holds ``(row, ts)`` int64 pairs for every
+    ``index_every``-th row, which lets readers find a time window without
+    scanning the rows.
+
+    ``record()`` only parses the push into buffered tuples; ``flush()`` (run
+    off the event loop by ``run()``) appends them. Files are opened per flush,
+    so hundreds of symbols never hold hundreds of descriptors. Once a day is
+    more than ``close_grace_ms`` in the past its ``.bin`` files are gzipped
+    (readers decompress them transparently; the index stays valid).
+    """
+
+    def __init__(
+        self,
+        root: str = "data/ticks",
+        index_every: int = 1024,
+        compress_closed: bool = True,
+        close_grace_ms: int = 300_000,
+    ) -> None:
+        """
+        Initialize tick recorder.
+
+        Args:
+            root: Archive directory
+            index_every: Rows between index entries
+            compress_closed: Gzip a day's files once it is closed
+            close_grace_ms: How long after midnight late pushes are still accepted
+        """
+        self.root = Path(root)
+        self.index_every = index_every
+        self.compress_closed = compress_closed
+        self.close_grace_ms = close_grace_ms
+
+        self._buffers: dict[tuple[str, str], list[tuple]] = {}
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._rows: dict[Path, int] = {}  # rows already in each open file
+        self._closed_days: set[str] = set()
+        self._compress_after_ms = 0
+
+        # Stats
+        self.records: int = 0
+        self.rows_written: int = 0
+        self.bytes_written: int = 0
+        self.late_rows_dropped: int = 0
+
+    def path(self, day: str, symbol: str, stream: str) -> Path:
+        return self.root / day / f"{symbol}.{stream}.bin"
+
+    def record(self, symbol: str, channel: str, action: str | None, payload: list[dict[str, Any]]) -> None:
+        """
+        Buffer one push (signature of ``MarketDataHub.on_payload``).
+
+        Args:
+            symbol: Trading pair
+            channel: "ticker", "trade" or a ``books*`` channel
+            action: Push action ("snapshot"/"update")
+            payload: The push's ``data`` array
+        """
+        if channel == "ticker":
+            stream = "ticker"
+            rows = [
+                (int(t.get("ts") or 0), *(_float(t.get(f)) for f in _TICKER_FIELDS)) for t in payload
+            ]
+        elif channel == "trade":
+            if action == "snapshot":
+                return  # recent-trade history replayed on (re)subscribe
+            stream = "trade"
+            rows = [
+                (
+                    int(t.get("ts") or 0),
+                    int(t.get("tradeId") or 0),
+                    _float(t.get("price")),
+                    _float(t.get("size")),
+                    1 if t.get("side") == "buy" else -1,
+                )
+                for t in payload
+            ]
+        elif channel.startswith("books"):
+            stream = "book"
+            snapshot = action != "update"
+            rows = []
+            for book in payload:
+                ts, seq = int(book.get("ts") or 0), int(book.get("seq") or 0)
+                rows += [(ts, seq, _float(p), _float(s), 1, snapshot) for p, s, *_ in book.get("bids") or []]
+                rows += [(ts, seq, _float(p), _float(s), -1, snapshot) for p, s, *_ in book.get("asks") or []]
+        else:
+            return
+
+        with self._buffer_lock:
+            self._buffers.setdefault((symbol, stream), []).extend(rows)
+        self.records += 1
+
+    def flush(self) -> int:
+        """
+        Append buffered rows to their day files and compress closed days.
+
+        Returns:
+            Rows written
+        """
+        with self._buffer_lock:
+            buffers, self._buffers = self._buffers, {}
+
+        written = 0
+        with self._flush_lock:
+            for (symbol, stream), rows in buffers.items():
+                if rows:
+                    written += self._append(symbol, stream, np.array(rows, dtype=STREAMS[stream]))
+            if self.compress_closed:
+                self.compress_closed_days()
+        return written
+
+    async def run(self, flush_interval_s: float = 2.0) -> None:
+        """Flush periodically until cancelled (then flush once more)."""
+        try:
+            while True:
+                await asyncio.sleep(flush_interval_s)
+                await asyncio.to_thread(self.flush)
+        finally:
+            await asyncio.to_thread(self.flush)
+
+    def close(self) -> None:
+        """Write everything still buffered."""
+        self.flush()
+        logger.info(
+            f"💾 [TICK RECORDER] {self.records:,} pushes, {self.rows_written:,} rows, "
+            f"{self.bytes_written / 1024 / 1024:.1f} MB in {self.root}"
+        )
+
+    def _append(self, symbol: str, stream: str, rows: np.ndarray) -> int:
+        """Append rows to the files of the days they fall on."""
+        days = (rows["ts"] // DAY_MS).astype(np.int64)
+        written = 0
+        for day_index in np.unique(days):
+            day = _day(int(day_index) * DAY_MS)
+            day_rows = rows[days == day_index]
+            path = self.path(day, symbol, stream)
+            if day in self._closed_days or path.with_suffix(".bin.gz").exists():
+                self.late_rows_dropped += len(day_rows)
+                continue
+            written += self._write_rows(path, day_rows)
+        return written
+
+    def _write_rows(self, path: Path, rows: np.ndarray) -> int:
+        n_before = self._rows.get(path)
+        if n_before is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            n_before = _row_count(path, rows.dtype) if path.exists() else 0
+
+        with open(path, "ab") as f:
+            if n_before == 0:
+                f.truncate(0)
+                f.write(_header(rows.dtype))
+            else:
+                f.truncate(_data_offset(rows.dtype) + n_before * rows.dtype.itemsize)  # drop a torn row
+            f.write(rows.tobytes())
+
+        # Index entries for every index_every-th row
+        first = -(-n_before // self.index_every) * self.index_every
+        marks = np.arange(first, n_before + len(rows), self.index_every, dtype=np.int64)
+        if len(marks):
+            entries = np.column_stack((marks, rows["ts"][marks - n_before])).astype("<i8")
+            with open(path.with_suffix(".idx"), "ab") as f:
+                f.write(entries.tobytes())
+
+        self._rows[path] = n_before + len(rows)
+        self.rows_written += len(rows)
+        self.bytes_written += rows.nbytes
+        return len(rows)
+
+    def compress_closed_days(self, now_ms: int | None = None) -> None:
+        """Gzip every day that ended more than ``close_grace_ms`` ago."""
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+        if now_ms < self._compress_after_ms or not self.root.exists():
+            return
+        self._compress_after_ms = (now_ms - self.close_grace_ms) // DAY_MS * DAY_MS + DAY_MS + self.close_grace_ms
+
+        for day_dir in sorted(p for p in self.root.iterdir() if p.is_dir() and p.name.isdigit()):
+            day = day_dir.name
+            if day in self._closed_days or _day_start_ms(day) + DAY_MS + self.close_grace_ms > now_ms:
+                continue
+            for path in sorted(day_dir.glob("*.bin")):
+                compress_file(path)
+                self._rows.pop(path, None)
+            self._closed_days.add(day)
+            logger.info(f"🗜️ [TICK RECORDER] Closed and compressed {day_dir}")
+
+
+def compress_file(path: Path) -> Path:
+    """Gzip a closed ``.bin`` file (atomic replace) and remove the original."""
+    target = path.with_suffix(".bin.gz")
+    tmp = target.with_suffix(".gz.tmp")
+    with open(path, "rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+        while chunk := src.read(1 << 20):
+            dst.write(chunk)
+    os.replace(tmp, target)
+    path.unlink()
+    return target
+
+
+def _data_offset(dtype: np.dtype) -> int:
+    return len(_header(dtype))
+
+
+def _row_count(path: Path, dtype: np.dtype) -> int:
+    return max(0, (path.stat().st_size - _data_offset(dtype)) // dtype.itemsize)
+
+
+def _read_rows(path: Path) -> np.ndarray | None:
+    """Rows of a day file: memory-mapped when open, decompressed when gzipped."""
+    if path.exists():
+        with open(path, "rb") as f:
+            head = f.read(len(MAGIC) + 4)
+            if head[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a tick file")
+            descr = f.read(int.from_bytes(head[len(MAGIC):], "little"))
+        dtype = np.dtype([tuple(field) for field in json.loads(descr)])
+        offset = len(MAGIC) + 4 + len(descr)
+        rows = (path.stat().st_size - offset) // dtype.itemsize
+        if rows <= 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(rows,))
+
+    gz_path = path.with_suffix(".bin.gz")
+    if not gz_path.exists():
+        return None
+    data = gzip.decompress(gz_path.read_bytes())
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"{gz_path} is not a tick file")
+    descr_len = int.from_bytes(data[len(MAGIC) : len(MAGIC) + 4], "little")
+    offset = len(MAGIC) + 4 + descr_len
+    dtype = np.dtype([tuple(field) for field in json.loads(data[len(MAGIC) + 4 : offset])])
+    rows = (len(data) - offset) // dtype.itemsize
+    return np.frombuffer(data, dtype=dtype, count=rows, offset=offset)
+
+
+def _window(path: Path, rows: np.ndarray, start_ms: int | None, end_ms: int | None) -> np.ndarray:
+    """Rows within [start_ms, end_ms], narrowed by the sparse index first."""
+    lo, hi = 0, len(rows)
+    index_path = path.with_suffix(".idx")
+    if index_path.exists() and (start_ms is not None or end_ms is not None):
+        index = np.fromfile(index_path, dtype="<i8").reshape(-1, 2)
+        index = index[index[:, 0] < len(rows)]
+        if start_ms is not None:
+            i = int(np.searchsorted(index[:, 1], start_ms, side="left"))
+            lo = int(index[i - 1, 0]) if i > 0 else 0
+        if end_ms is not None:
+            i = int(np.searchsorted(index[:, 1], end_ms, side="right"))
+            hi = int(index[i, 0]) if i < len(index) else len(rows)
+    part = rows[lo:hi]
+    ts = part["ts"]
+    first = 0 if start_ms is None else int(np.searchsorted(ts, start_ms, side="left"))
+    last = len(part) if end_ms is None else int(np.searchsorted(ts, end_ms, side="right"))
+    return part[first:last]
+
+
+def list_days(root: str | Path) -> list[str]:
+    """Recorded days (``YYYYMMDD``), oldest first."""
+    root = Path(root)
+    if not root.exists():
+        return []
+    return sorted(p.name for p in root.iterdir() if p.is_dir() and p.name.isdigit())
+
+
+def list_symbols(root: str | Path, stream: str = "ticker") -> list[str]:
+    """Symbols with at least one file of a stream."""
+    suffixes = (f".{stream}.bin", f".{stream}.bin.gz")
+    symbols = set()
+    for day in list_days(root):
+        for path in (Path(root) / day).iterdir():
+            for suffix in suffixes:
+                if path.name.endswith(suffix):
+                    symbols.add(path.name[: -len(suffix)])
+    return sorted(symbols)
+
+
+def read_ticks(
+    root: str | Path,
+    symbol: str,
+    stream: str,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+) -> np.ndarray:
+    """
+    Recorded rows of one symbol/stream, oldest day first.
+
+    Args:
+        root: Archive directory
+        symbol: Trading pair
+        stream: "ticker", "trade" or "book"
+        start_ms: First timestamp to include (default: everything)
+        end_ms: Last timestamp to include (default: everything)
+
+    Returns:
+        Structured array (a read-only memory map when a single open day is read)
+    """
+    root = Path(root)
+    parts = []
+    for day in list_days(root):
+        day_start = _day_start_ms(day)
+        if (start_ms is not None and day_start + DAY_MS <= start_ms) or (end_ms is not None and day_start > end_ms):
+            continue
+        path = root / day / f"{symbol}.{stream}.bin"
+        rows = _read_rows(path)
+        if rows is not None and len(rows):
+            parts.append(_window(path, rows, start_ms, end_ms))
+    if not parts:
+        return np.empty(0, dtype=STREAMS[stream])
+    return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+
+
+class TickReader:
+    """
+    Sequential window reads over an archive for replay.
+
+    Keeps the current day of every symbol/stream loaded (memory-mapped when
+    open, decompressed once when gzipped), so consecutive windows are
+    sliced by binary search instead of re-reading the day file each time.
+    Windows must move forward in time; older days are dropped as soon as a
+    later one is loaded.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.days = set(list_days(self.root))
+        self._loaded: dict[tuple[str, str], tuple[str, np.ndarray]] = {}  # (symbol, stream) -> (day, rows)
+
+    def _day_rows(self, symbol: str, stream: str, day: str) -> np.ndarray:
+        loaded = self._loaded.get((symbol, stream))
+        if loaded is None or loaded[0] != day:
+            rows = _read_rows(self.root / day / f"{symbol}.{stream}.bin") if day in self.days else None
+            loaded = (day, rows if rows is not None else np.empty(0, dtype=STREAMS[stream]))
+            self._loaded[(symbol, stream)] = loaded
+        return loaded[1]
+
+    def read(self, symbol: str, stream: str, start_ms: int, end_ms: int) -> np.ndarray:
+        """Rows of one symbol/stream within [start_ms, end_ms] (same as ``read_ticks``)."""
+        parts = []
+        for day_start in range(start_ms // DAY_MS * DAY_MS, end_ms + 1, DAY_MS):
+            rows = self._day_rows(symbol, stream, _day(day_start))
+            if not len(rows):
+                continue
+            ts = rows["ts"]
+            lo = int(np.searchsorted(ts, start_ms, side="left"))
+            hi = int(np.searchsorted(ts, end_ms, side="right"))
+            if hi > lo:
+                parts.append(rows[lo:hi])
+        if not parts:
+            return np.empty(0, dtype=STREAMS[stream])
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+def ticker_snapshots(
+    root: str | Path,
+    symbols: list[str] | None = None,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+    interval_ms: int = 60_000,
+) -> pd.DataFrame:
+    """
+    Last ticker of every symbol in each interval (the old collectors' CSV rows).
+
+    Returns:
+        DataFrame with timestamp, snapshot, symbol, prices, 24h stats,
+        spread_pct, return_pct and volatility_pct
+    """
+    frames = []
+    for symbol in symbols if symbols is not None else list_symbols(root, "ticker"):
+        rows = read_ticks(root, symbol, "ticker", start_ms, end_ms)
+        if not len(rows):
+            continue
+        bucket = rows["ts"] // interval_ms
+        last = np.append(bucket[1:] != bucket[:-1], True)
+        frames.append(pd.DataFrame({name: np.array(rows[name][last]) for name in TICKER_DTYPE.names}).assign(
+            symbol=symbol, bucket=bucket[last]
+        ))
+    if not frames:
+        return pd.DataFrame()
+
+    df = pd.concat(frames, ignore_index=True)
+    df["snapshot"] = (df["bucket"] - df["bucket"].min()).astype(int)
+    df["timestamp"] = pd.to_datetime(df["bucket"] * interval_ms, unit="ms").dt.strftime("%Y-%m-%dT%H:%M:%S")
+    df = df.rename(columns={
+        "last": "last_price", "bid": "bid_price", "ask": "ask_price", "open_24h": "open_price",
+        "high_24h": "high_price", "low_24h": "low_price",
+    })
+    df["spread_pct"] = np.where(df["bid_price"] > 0, (df["ask_price"] - df["bid_price"]) / df["bid_price"] * 100, 0.0)
+    df["return_pct"] = np.where(df["open_price"] > 0, (df["last_price"] - df["open_price"]) / df["open_price"] * 100, 0.0)
+    df["volatility_pct"] = np.where(df["low_price"] > 0, (df["high_price"] - df["low_price"]) / df["low_price"] * 100, 0.0)
+    columns = [
+        "timestamp", "snapshot", "symbol", "last_price", "bid_price", "ask_price", "open_price", "high_price",
+        "low_price", "volume_24h", "quote_volume_24h", "funding_rate", "open_interest", "spread_pct",
+        "return_pct", "volatility_pct",
+    ]
+    return df.sort_values(["snapshot", "symbol"], kind="stable")[columns].reset_index(drop=True)
+
+
+async def record_market_data(
+    symbols: list[str],
+    duration_s: float,
+    root: str = "data/ticks",
+    channels: tuple[str, ...] = ("ticker", "trade", "books"),
+    max_channels_per_connection: int = 100,
+    flush_interval_s: float = 2.0,
+) -> TickRecorder:
+    """
+    Stream symbols over the market-data hub into a tick archive.
+
+    Args:
+        symbols: Symbols to record
+        duration_s: Seconds to record (<= 0 = until cancelled)
+        root: Archive directory
+        channels: Public channels per symbol
+        max_channels_per_connection: Subscription cap per connection
+        flush_interval_s: Seconds between disk flushes
+
+    Returns:
+        The (closed) recorder, for its stats
+    """
+    recorder = TickRecorder(root)
+    hub = MarketDataHub(
+        MultiSymbolStateManager(),
+        symbols,
+        channels=channels,
+        max_channels_per_connection=max_channels_per_connection,
+    )
+    hub.on_payload = recorder.record
+    flusher = asyncio.create_task(recorder.run(flush_interval_s))
+    await hub.start()
+    try:
+        if duration_s > 0:
+            await asyncio.sleep(duration_s)
+        else:
+            await asyncio.Event().wait()
+    finally:
+        await hub.stop()
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+        recorder.close()
+    return recorder
@@ -0,0 +1,374 @@
+"""Buffered append-only journal for trade records."""
+
+import atexit
+import collections
+import json
+import os
+import queue
+import re
+import threading
+import time
+import typing
+from dataclasses import fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Literal
+
+import numpy as np
+import pandas as pd
+
+from src.bitget_trading.logger import get_logger
+
+logger = get_logger()
+
+FsyncPolicy = Literal["never", "batch", "interval"]
+
+SIDECAR_MAGIC = b"BGJRNL1\n"
+_STOP = object()
+
+
+def sidecar_dtype(record_type: type, str_width: int = 24) -> np.dtype:
+    """
+    Fixed-width row layout of the analytics sidecar for a record dataclass.
+
+    Numeric and bool fields (optional or not) are kept; str and Literal fields
+    become ``str_width``-byte UTF-8 columns; anything else (dicts) is left to
+    the main journal.
+    """
+    layout = []
+    for f in fields(record_type):
+        kind = f.type
+        args = [a for a in typing.get_args(kind) if a is not type(None)]
+        if typing.get_origin(kind) is typing.Union and len(args) == 1:
+            kind = args[0]
+        if kind is bool:
+            layout.append((f.name, "?"))
+        elif kind is int:
+            layout.append((f.name, "<i8"))
+        elif kind is float:
+            layout.append((f.name, "<f8"))
+        elif kind is str or typing.get_origin(kind) is Literal:
+            layout.append((f.name, f"S{str_width}"))
+    return np.dtype(layout)
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(path.name + ".bin")
+
+
+def _sidecar_header(dtype: np.dtype) -> bytes:
+    descr = json.dumps(dtype.descr).encode()
+    return SIDECAR_MAGIC + len(descr).to_bytes(4, "little") + descr
+
+
+def _read_sidecar(path: Path) -> np.ndarray | None:
+    """Rows of a sidecar file (a torn trailing row is ignored)."""
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(SIDECAR_MAGIC)) != SIDECAR_MAGIC:
+                return None
+            descr_len = int.from_bytes(f.read(4), "little")
+            dtype = np.dtype([tuple(field) for field in json.loads(f.read(descr_len))])
+            offset = f.tell()
+            rows = (os.fstat(f.fileno()).st_size - offset) // dtype.itemsize
+            return np.fromfile(f, dtype=dtype, count=rows)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def segments(path: str | Path) -> list[Path]:
+    """Rotated segments of a journal, oldest first, then the active file."""
+    path = Path(path)
+    pattern = re.compile(rf"^{re.escape(path.stem)}\.(\d{{8}})\.(\d+){re.escape(path.suffix)}$")
+    rotated = []
+    for candidate in path.parent.glob(f"{path.stem}.*{path.suffix}"):
+        match = pattern.match(candidate.name)
+        if match:
+            rotated.append((match.group(1), int(match.group(2)), candidate))
+    return [p for _, _, p in sorted(rotated)] + ([path] if path.exists() else [])
+
+
+def iter_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Every JSON record of a journal, across rotated segments."""
+    for segment in segments(path):
+        with open(segment, "r") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn last line
+
+
+def load_journal(path: str | Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Sidecar columns of a journal as a DataFrame (all segments, oldest first).
+
+    Args:
+        path: Active journal file
+        columns: Subset of columns (default: all)
+    """
+    parts = [rows for rows in (_read_sidecar(_sidecar_path(s)) for s in segments(path)) if rows is not None]
+    if not parts:
+        return pd.DataFrame(columns=columns or [])
+
+    frames = []
+    for rows in parts:
+        names = [n for n in rows.dtype.names if columns is None or n in columns]
+        frame = {}
+        for name in names:
+            values = rows[name]
+            if values.dtype.kind == "S":
+                values = np.char.decode(values, "utf-8", errors="ignore")
+            frame[name] = values
+        frames.append(pd.DataFrame(frame))
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+
+def json_line(record: Any) -> str:
+    return json.dumps(record, default=str) + "\n"
+
+
+class TradeJournal:
+    """
+    Append-only record journal written by a background thread.
+
+    ``write()`` only enqueues the record, so trade bookkeeping on the event
+    loop never waits for the disk. A writer thread drains the queue in
+    batches and appends them to the journal file (JSON lines unless another
+    ``encode`` is given) and, optionally, to a fixed-width binary sidecar
+    (``<file>.bin``) holding the numeric and short string columns, which
+    ``load_journal`` reads with one ``np.fromfile`` per segment.
+
+    The active file keeps its configured name. When it exceeds ``max_bytes``
+    or the UTC date changes it is renamed to ``<stem>.<YYYYMMDD>.<n><suffix>``
+    together with its sidecar, and a new segment is started.
+
+    fsync policy: "never" leaves it to the OS, "batch" fsyncs after every
+    written batch, "interval" at most every ``fsync_interval_s`` seconds.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        encode: Callable[[Any], str] = json_line,
+        header: str | None = None,
+        sidecar: np.dtype | None = None,
+        fsync: FsyncPolicy = "batch",
+        fsync_interval_s: float = 5.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        rotate_daily: bool = True,
+        max_batch: int = 512,
+    ) -> None:
+        """
+        Initialize trade journal (files are opened by the writer on first write).
+
+        Args:
+            path: Active journal file
+            encode: Record -> text (one line)
+            header: Written at the top of every new segment (e.g. CSV header)
+            sidecar: Row layout of the analytics sidecar (None = no sidecar);
+                records must then be dicts
+            fsync: "never", "batch" or "interval"
+            fsync_interval_s: Max seconds between fsyncs ("interval")
+            max_bytes: Rotate when the active file would exceed this (0 = never)
+            rotate_daily: Rotate when the UTC date changes
+            max_batch: Max records written per batch
+        """
+        if fsync not in ("never", "batch", "interval"):
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.path = Path(path)
+        self.encode = encode
+        self.header = header
+        self.sidecar = sidecar
+        self.fsync = fsync
+        self.fsync_interval_s = fsync_interval_s
+        self.max_bytes = max_bytes
+        self.rotate_daily = rotate_daily
+        self.max_batch = max_batch
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._pending: collections.deque = collections.deque()  # queued, not yet written (same order)
+        self._pending_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._file = None
+        self._sidecar_file = None
+        self._size = 0
+        self._segment_date = ""
+        self._last_fsync = 0.0
+        self.records_written = 0
+        self.write_errors = 0
+
+    def write(self, record: Any) -> None:
+        """Queue a record (never blocks on I/O)."""
+        if self._thread is None:
+            self._start()
+        with self._pending_lock:
+            self._pending.append(record)
+            self._queue.put(record)
+
+    def flush(self, timeout: float | None = 10.0) -> bool:
+        """
+        Wait until everything queued so far is written.
+
+        Returns:
+            True if flushed within the timeout
+        """
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def read_all(self) -> list[Any]:
+        """
+        Every record of a JSON journal: the written segments plus the records
+        still queued, without waiting for the writer to drain the queue.
+        """
+        with self._io_lock:  # at most one batch write in progress
+            records = list(iter_records(self.path))
+            with self._pending_lock:
+                records.extend(self._pending)
+        return records
+
+    def close(self) -> None:
+        """Write what is queued, stop the writer and close the files."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"journal-{self.path.name}", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch, markers = [], []
+            item = self._queue.get()
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                with self._io_lock:
+                    try:
+                        self._write_batch(batch)
+                        self.records_written += len(batch)
+                    except Exception as e:
+                        self.write_errors += 1
+                        logger.error(f"❌ [JOURNAL] Failed to write {len(batch)} records to {self.path}: {e}")
+                    finally:
+                        with self._pending_lock:
+                            for _ in batch:
+                                self._pending.popleft()
+            for marker in markers:
+                marker.set()
+        self._close_files()
+
+    def _write_batch(self, batch: list[Any]) -> None:
+        text = "".join(self.encode(record) for record in batch).encode()
+        today = datetime.now(timezone.utc).strftime("%Y%m%d")
+        if self._file is None:
+            self._open(today)
+        if self._size and (
+            (self.rotate_daily and today != self._segment_date)
+            or (self.max_bytes and self._size + len(text) > self.max_bytes)
+        ):
+            self._rotate()
+            self._open(today)
+
+        self._file.write(text)
+        self._file.flush()
+        self._size += len(text)
+        if self._sidecar_file is not None:
+            self._sidecar_file.write(self._sidecar_rows(batch).tobytes())
+            self._sidecar_file.flush()
+
+        now = time.monotonic()
+        if self.fsync == "batch" or (self.fsync == "interval" and now - self._last_fsync >= self.fsync_interval_s):
+            os.fsync(self._file.fileno())
+            if self._sidecar_file is not None:
+                os.fsync(self._sidecar_file.fileno())
+            self._last_fsync = now
+
+    def _sidecar_rows(self, batch: list[dict[str, Any]]) -> np.ndarray:
+        rows = np.zeros(len(batch), dtype=self.sidecar)
+        for name in self.sidecar.names:
+            kind = self.sidecar[name]
+            values = [record.get(name) for record in batch]
+            if kind.kind == "S":
+                rows[name] = [v.encode()[: kind.itemsize] if isinstance(v, str) else b"" for v in values]
+            elif kind.kind == "f":
+                rows[name] = [np.nan if v is None else v for v in values]
+            else:
+                rows[name] = [v or 0 for v in values]
+        return rows
+
+    def _open(self, today: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+        self._segment_date = (
+            datetime.fromtimestamp(self.path.stat().st_mtime, timezone.utc).strftime("%Y%m%d") if self._size else today
+        )
+        if not self._size and self.header:
+            header = self.header.encode()
+            self._file.write(header)
+            self._size = len(header)
+        if self.sidecar is not None:
+            self._open_sidecar()
+
+    def _open_sidecar(self) -> None:
+        path = _sidecar_path(self.path)
+        header = _sidecar_header(self.sidecar)
+        existing = _read_sidecar(path)
+        if existing is not None and existing.dtype != self.sidecar:
+            os.replace(path, path.with_name(path.name + ".old"))  # layout changed
+            existing = None
+        self._sidecar_file = open(path, "ab")
+        if existing is None:
+            self._sidecar_file.truncate(0)
+            self._sidecar_file.write(header)
+        else:
+            self._sidecar_file.truncate(len(header) + len(existing) * self.sidecar.itemsize)
+
+    def _rotate(self) -> None:
+        self._close_files()
+        n = 1
+        while True:
+            target = self.path.with_name(f"{self.path.stem}.{self._segment_date}.{n}{self.path.suffix}")
+            if not target.exists():
+                break
+            n += 1
+        if _sidecar_path(self.path).exists():
+            os.replace(_sidecar_path(self.path), _sidecar_path(target))
+        os.replace(self.path, target)
+        logger.info(f"🗂️ [JOURNAL] Rotated {self.path.name} -> {target.name}")
+
+    def _close_files(self) -> None:
+        for handle in (self._file, self._sidecar_file):
+            if handle is not None:
+                handle.flush()
+                if self.fsync != "never":
+                    os.fsync(handle.fileno())
+                handle.close()
+        self._file = self._sidecar_file = None
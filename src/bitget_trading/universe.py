@@ -5,6 +5,7 @@ from typing import Any
 import requests
 import urllib3
 
+from src.bitget_trading.contract_catalog import ContractCatalog
 from src.bitget_trading.logger import get_logger
 
 # Disable SSL warnings
@@ -26,6 +27,7 @@ class UniverseManager:
         self,
         min_volume_24h: float = 1_000_000,  # Min $1M daily volume
         max_spread_bps: float = 50.0,  # Max 50 bps spread
+        contract_catalog: ContractCatalog | None = None,
     ) -> None:
         """
         Initialize universe manager.
@@ -33,68 +35,71 @@ class UniverseManager:
         Args:
             min_volume_24h: Minimum 24h volume in USDT
             max_spread_bps: Maximum allowed spread in basis points
+            contract_catalog: Shared contract specs (e.g. ``BitgetRestClient.contract_catalog``);
+                a memory-only catalog using the public endpoint is created if omitted
         """
         self.min_volume_24h = min_volume_24h
         self.max_spread_bps = max_spread_bps
         self.symbols: list[str] = []
-        self.contract_info: dict[str, dict[str, Any]] = {}
+        self.contract_catalog = contract_catalog or ContractCatalog(self._fetch_contracts, snapshot_path=None)
+
+    @property
+    def contract_info(self) -> dict[str, dict[str, Any]]:
+        """Contract info of every cached symbol (legacy dict layout)."""
+        return {symbol: spec.as_info() for symbol, spec in self.contract_catalog.specs().items()}
+
+    def get_contract_info(self, symbol: str) -> dict[str, Any] | None:
+        """
+        Contract info of one symbol from the catalog, without any I/O.
+        
+        Returns:
+            Dict with price_place, volume_place, min_trade_num, max_leverage, ...
+            or None if the symbol is not in the catalog
+        """
+        spec = self.contract_catalog.get_cached(symbol)
+        return spec.as_info() if spec is not None else None
+
+    async def _fetch_contracts(self, product_type: str) -> list[dict[str, Any]]:
+        """Download the contract list from the public endpoint."""
+        endpoint = f"{self.BASE_URL}/api/v2/mix/market/contracts"
+        params = {"productType": product_type}
+
+        # Use requests with SSL verification disabled (wrapped in asyncio.to_thread)
+        response = await asyncio.to_thread(
+            requests.get,
+            endpoint,
+            params=params,
+            verify=False,
+            timeout=(10, 30)
+        )
+        if response.status_code != 200:
+            raise Exception(f"Failed to fetch contracts: {response.status_code}")
+
+        data = response.json()
+        if data.get("code") != "00000":
+            raise Exception(f"API error: {data.get('code')} - {data.get('msg')}")
+        return data.get("data", [])
 
     async def fetch_all_contracts(self) -> list[str]:
         """
         Fetch all USDT-M futures contracts from Bitget.
         
+        Uses the contract catalog, so the list is only downloaded when the
+        catalog is empty or older than its TTL.
+        
         Returns:
             List of symbol names
         """
-        endpoint = f"{self.BASE_URL}/api/v2/mix/market/contracts"
-        params = {"productType": "USDT-FUTURES"}
-
         try:
-            # Use requests with SSL verification disabled (wrapped in asyncio.to_thread)
-            response = await asyncio.to_thread(
-                requests.get,
-                endpoint,
-                params=params,
-                verify=False,
-                timeout=(10, 30)
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Failed to fetch contracts: {response.status_code}")
-                return []
-            
-            data = response.json()
-
-            if data.get("code") != "00000":
-                logger.error("api_error", code=data.get("code"), msg=data.get("msg"))
-                return []
-
-            contracts = data.get("data", [])
-
-            # Store contract info
-            for contract in contracts:
-                symbol = contract.get("symbol")
-                if symbol:
-                    self.contract_info[symbol] = {
-                        "base_coin": contract.get("baseCoin"),
-                        "quote_coin": contract.get("quoteCoin"),
-                        "size_multiplier": float(contract.get("sizeMultiplier", 1)),
-                        "min_trade_num": float(contract.get("minTradeNum", 0)),
-                        "price_place": int(contract.get("pricePlace", 2)),
-                        "volume_place": int(contract.get("volumePlace", 4)),
-                        "max_leverage": int(contract.get("maxLeverage", 125)),
-                        "status": contract.get("symbolStatus"),
-                    }
+            await self.contract_catalog.ensure_loaded()
+            specs = self.contract_catalog.specs()
 
             # Filter to active contracts only
-            self.symbols = [
-                s for s, info in self.contract_info.items()
-                if info.get("status") == "normal"
-            ]
+            self.symbols = [s for s, spec in specs.items() if spec.is_active]
 
             logger.info(
-                "contracts_fetched",
-                total_contracts=len(contracts),
+                "contracts_loaded",
+                total_contracts=len(specs),
                 active_symbols=len(self.symbols),
             )
 
@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+Parallel strategy x symbol backtest sweep.
+
+Usage:
+    python sweep_runner.py --out backtest_results/sweep_1H \\
+        [--strategies "strategies/strategy_*.json" ...] [--symbols BTCUSDT ETHUSDT ...] \\
+        [--timeframe 1H] [--days 30] [--engine single|multi] [--workers N] [--batch-size 8] [--resume]
+
+Candles of every symbol are packed into one shared-memory block once; worker
+processes attach to it at start-up together with the strategy set, so a task
+is just (symbol, strategy batch) indices. Indicator columns are shared through
+the on-disk IndicatorCache (memory-mapped, computed once per symbol and data
+version). Idle workers pull the next task from the pool's shared queue, so
+long and short backtests balance across cores.
+
+Every finished task is appended to a columnar results directory straight
+away; ``--resume`` skips the (strategy, symbol) pairs already stored there,
+and refuses to continue if a symbol's candles changed since (row count or
+first/last bar).
+Load the results with ``load_results(path)``.
+"""
+
+import argparse
+import glob
+import hashlib
+import itertools
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, fields
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from backtest_engine import BacktestEngine
+from backtest_engine_multi import MultiPositionBacktestEngine
+from metrics_calculator import MetricsCalculator, PerformanceMetrics
+from src.bitget_trading.candle_store import COLUMNS, open_candle_store
+from src.bitget_trading.indicator_cache import get_indicator_cache
+from src.bitget_trading.parallel_processor import attach_shared_block, release_shared_block
+
+ENGINES = ("single", "multi")
+MIN_BARS = 50  # shorter series are not backtested
+KEY_COLUMNS = [("strategy", np.dtype("<i4")), ("symbol", np.dtype("<i4"))]
+METRIC_COLUMNS = [
+    (f.name, np.dtype("<i8") if f.type is int else np.dtype("<f8"))
+    for f in fields(PerformanceMetrics)
+    if f.name not in ("strategy_id", "strategy_name", "symbol")
+]
+
+
+def strategy_key(strategy: dict[str, Any]) -> str:
+    """Content hash of a strategy (an edited strategy file is a new strategy)."""
+    return hashlib.blake2b(json.dumps(strategy, sort_keys=True).encode(), digest_size=8).hexdigest()
+
+
+class SweepResults:
+    """
+    Columnar, append-only results of a sweep.
+
+    A directory holding ``manifest.json`` (settings, strategy and symbol
+    tables, column dtypes) and one raw little-endian file per column. Rows
+    are appended to every column file as tasks finish. On open, the files
+    are cut back to the shortest column, so a row torn by a crash is dropped
+    and its backtest runs again on resume.
+    """
+
+    VERSION = 1
+    COLUMNS = KEY_COLUMNS + METRIC_COLUMNS
+
+    def __init__(self, path: str, settings: dict[str, Any], resume: bool = False) -> None:
+        """
+        Open (or create) a results directory.
+
+        Args:
+            path: Results directory
+            settings: Sweep settings (timeframe, engine, initial capital); must
+                match the stored ones when resuming
+            resume: Keep stored rows (otherwise existing rows are an error)
+
+        Raises:
+            FileExistsError: Rows exist and resume is False
+            ValueError: Stored settings differ from ``settings``
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.path / "manifest.json"
+
+        manifest = None
+        if manifest_path.exists():
+            with open(manifest_path, "r") as f:
+                manifest = json.load(f)
+        self.rows = self._consistent_rows() if manifest is not None else 0
+
+        if manifest is not None and self.rows and not resume:
+            raise FileExistsError(f"{self.path} already holds {self.rows} results (resume or pick another path)")
+        if manifest is not None and resume:
+            if manifest["settings"] != settings:
+                raise ValueError(f"{self.path} was swept with {manifest['settings']}, not {settings}")
+            self.manifest = manifest
+        else:
+            self.rows = 0
+            self.manifest = {
+                "version": self.VERSION,
+                "settings": settings,
+                "columns": [[name, dtype.str] for name, dtype in self.COLUMNS],
+                "strategies": [],
+                "symbols": [],
+            }
+            self._save_manifest()
+
+        self._files = {}
+        for name, dtype in self.COLUMNS:
+            self._files[name] = open(self._column_path(name), "ab")
+            self._files[name].truncate(self.rows * dtype.itemsize)
+
+    def _column_path(self, name: str) -> Path:
+        return self.path / f"{name}.col"
+
+    def _consistent_rows(self) -> int:
+        rows = []
+        for name, dtype in self.COLUMNS:
+            column = self._column_path(name)
+            rows.append(column.stat().st_size // dtype.itemsize if column.exists() else 0)
+        return min(rows)
+
+    def _save_manifest(self) -> None:
+        tmp = self.path / "manifest.json.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp, self.path / "manifest.json")
+
+    def register(
+        self,
+        strategies: list[dict[str, Any]],
+        symbols: list[str],
+        data: list[dict[str, int]] | None = None,
+    ) -> tuple[list[int], list[int]]:
+        """
+        Table indices of strategies and symbols, adding new ones.
+
+        With ``data`` (``data_fingerprint`` of each symbol's frame), a symbol
+        already swept on different data is an error, so a resumed sweep never
+        mixes results from an older and a newer data set.
+
+        Returns:
+            (strategy indices, symbol indices) in argument order
+
+        Raises:
+            ValueError: A symbol's data differs from the data it was swept on
+        """
+        strategy_index = {entry["key"]: i for i, entry in enumerate(self.manifest["strategies"])}
+        symbol_index = {symbol: i for i, symbol in enumerate(self.manifest["symbols"])}
+
+        strategy_ids = []
+        for strategy in strategies:
+            key = strategy_key(strategy)
+            if key not in strategy_index:
+                strategy_index[key] = len(self.manifest["strategies"])
+                self.manifest["strategies"].append({"key": key, "id": strategy["id"], "name": strategy["name"]})
+            strategy_ids.append(strategy_index[key])
+
+        fingerprints = self.manifest.setdefault("data", {})
+        for symbol, fingerprint in zip(symbols, data or []):
+            stored = fingerprints.get(symbol)
+            if stored is not None and stored != fingerprint:
+                raise ValueError(f"{self.path} swept {symbol} on {stored}, not {fingerprint} (data changed)")
+            fingerprints[symbol] = fingerprint
+
+        symbol_ids = []
+        for symbol in symbols:
+            if symbol not in symbol_index:
+                symbol_index[symbol] = len(self.manifest["symbols"])
+                self.manifest["symbols"].append(symbol)
+            symbol_ids.append(symbol_index[symbol])
+
+        self._save_manifest()
+        return strategy_ids, symbol_ids
+
+    def completed(self) -> set[tuple[int, int]]:
+        """(strategy index, symbol index) pairs already stored."""
+        if not self.rows:
+            return set()
+        keys = [np.fromfile(self._column_path(name), dtype=dtype, count=self.rows) for name, dtype in KEY_COLUMNS]
+        return set(zip(keys[0].tolist(), keys[1].tolist()))
+
+    def append(self, rows: list[tuple[int, int, dict[str, Any]]]) -> None:
+        """Append (strategy index, symbol index, metrics) rows."""
+        if not rows:
+            return
+        values = {
+            "strategy": [row[0] for row in rows],
+            "symbol": [row[1] for row in rows],
+            **{name: [row[2][name] for row in rows] for name, _ in METRIC_COLUMNS},
+        }
+        for name, dtype in self.COLUMNS:
+            handle = self._files[name]
+            handle.write(np.asarray(values[name], dtype=dtype).tobytes())
+            handle.flush()
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        for handle in self._files.values():
+            handle.close()
+        self._files = {}
+
+
+def data_fingerprint(df: pd.DataFrame) -> dict[str, int]:
+    """Row count and first/last timestamp of a frame (changes whenever bars are added)."""
+    timestamps = df["timestamp"].to_numpy().astype(np.int64)
+    return {"rows": len(df), "start": int(timestamps[0]), "end": int(timestamps[-1])}
+
+
+def load_results(path: str) -> pd.DataFrame:
+    """
+    Read a sweep results directory.
+
+    Returns:
+        One row per backtest: strategy_id, strategy_name, symbol and the
+        PerformanceMetrics fields
+    """
+    path = Path(path)
+    with open(path / "manifest.json", "r") as f:
+        manifest = json.load(f)
+
+    columns = {}
+    for name, dtype in manifest["columns"]:
+        column = path / f"{name}.col"
+        columns[name] = np.fromfile(column, dtype=np.dtype(dtype)) if column.exists() else np.zeros(0, dtype=dtype)
+    rows = min(len(values) for values in columns.values())
+
+    strategies = manifest["strategies"]
+    strategy_idx = columns.pop("strategy")[:rows]
+    symbol_idx = columns.pop("symbol")[:rows]
+    frame = {
+        "strategy_id": np.array([strategies[i]["id"] for i in strategy_idx], dtype=np.int64),
+        "strategy_name": [strategies[i]["name"] for i in strategy_idx],
+        "symbol": [manifest["symbols"][i] for i in symbol_idx],
+    }
+    frame.update({name: values[:rows] for name, values in columns.items()})
+    return pd.DataFrame(frame)
+
+
+class SharedCandles:
+    """
+    OHLCV of many symbols in one shared-memory block.
+
+    Layout: an int64 timestamp vector of all symbols back to back, followed
+    by a ``(5, total_rows)`` float64 matrix of open/high/low/close/volume.
+    Symbol ``i`` occupies rows ``offsets[i]:offsets[i + 1]``.
+    """
+
+    def __init__(self, frames: dict[str, pd.DataFrame]) -> None:
+        self.symbols = list(frames)
+        self.offsets = [0, *itertools.accumulate(len(df) for df in frames.values())]
+        self.total = max(1, self.offsets[-1])
+        self.shm = shared_memory.SharedMemory(create=True, size=self.total * 8 * len(COLUMNS))
+        timestamps, values = self._views(self.shm, self.total)
+        for i, df in enumerate(frames.values()):
+            start, end = self.offsets[i], self.offsets[i + 1]
+            timestamps[start:end] = df["timestamp"].to_numpy(dtype=np.int64)
+            for row, name in enumerate(COLUMNS[1:]):
+                values[row, start:end] = df[name].to_numpy(dtype=np.float64)
+
+    @staticmethod
+    def _views(shm: shared_memory.SharedMemory, total: int) -> tuple[np.ndarray, np.ndarray]:
+        timestamps = np.ndarray((total,), dtype=np.int64, buffer=shm.buf)
+        values = np.ndarray((len(COLUMNS) - 1, total), dtype=np.float64, buffer=shm.buf, offset=total * 8)
+        return timestamps, values
+
+    @property
+    def descriptor(self) -> tuple[str, int, list[str], list[int]]:
+        """(name, total_rows, symbols, offsets) needed by workers to attach."""
+        return self.shm.name, self.total, self.symbols, self.offsets
+
+    def close(self) -> None:
+        """Release and unlink the shared block."""
+        release_shared_block(self.shm, unlink=True)
+
+
+# Worker-side state (one copy per worker process)
+_worker: dict[str, Any] = {}
+WORKER_FRAMES = 4  # symbol frames (with their indicator binding) kept per worker
+
+
+def _init_worker(
+    descriptor: tuple[str, int, list[str], list[int]],
+    strategies: dict[int, dict[str, Any]],
+    settings: dict[str, Any],
+    indicator_root: str | None,
+) -> None:
+    """Attach to the candle block and keep the strategy set (pool initializer)."""
+    name, total, symbols, offsets = descriptor
+    shm = attach_shared_block(name)
+    timestamps, values = SharedCandles._views(shm, total)
+    _worker.clear()
+    _worker.update(
+        shm=shm,
+        timestamps=timestamps,
+        values=values,
+        symbols=symbols,
+        offsets=offsets,
+        strategies=strategies,
+        settings=settings,
+        cache=get_indicator_cache(indicator_root) if indicator_root else None,
+        frames=OrderedDict(),
+    )
+
+
+def _release_worker() -> None:
+    """Drop the worker state of an in-process run."""
+    shm = _worker.get("shm")
+    _worker.clear()
+    if shm is not None:
+        release_shared_block(shm)
+
+
+def _frame(slot: int) -> tuple[pd.DataFrame, Any]:
+    """Zero-copy frame of a symbol's candles plus its indicator binding."""
+    frames = _worker["frames"]
+    if slot in frames:
+        frames.move_to_end(slot)
+        return frames[slot]
+
+    start, end = _worker["offsets"][slot], _worker["offsets"][slot + 1]
+    columns = {"timestamp": _worker["timestamps"][start:end]}
+    columns.update((name, _worker["values"][row, start:end]) for row, name in enumerate(COLUMNS[1:]))
+    df = pd.DataFrame(columns, copy=False)
+
+    symbol = _worker["symbols"][slot]
+    cache = _worker["cache"]
+    indicators = cache.for_frame(df, symbol, _worker["settings"]["timeframe"]) if cache is not None else None
+    frames[slot] = (df, indicators)
+    if len(frames) > WORKER_FRAMES:
+        frames.popitem(last=False)
+    return frames[slot]
+
+
+def _run_task(
+    symbol_idx: int, slot: int, strategy_idxs: list[int]
+) -> tuple[list[tuple[int, int, dict[str, Any]]], list[tuple[int, str]]]:
+    """
+    Backtest a batch of strategies on one symbol inside a worker.
+
+    Returns:
+        (rows, errors): rows are (strategy index, symbol index, metrics),
+        errors are (strategy index, message)
+    """
+    df, indicators = _frame(slot)
+    symbol = _worker["symbols"][slot]
+    settings = _worker["settings"]
+
+    rows, errors = [], []
+    for strategy_idx in strategy_idxs:
+        strategy = _worker["strategies"][strategy_idx]
+        try:
+            if settings["engine"] == "multi":
+                engine = MultiPositionBacktestEngine(strategy)
+                result = engine.run_backtest_vectorized(df, symbol, settings["initial_capital"], indicators=indicators)
+            else:
+                engine = BacktestEngine(strategy)
+                result = engine.run_backtest(df, symbol, settings["initial_capital"], indicators=indicators)
+            metrics = MetricsCalculator.calculate_all_metrics(result)
+            rows.append((strategy_idx, symbol_idx, {name: getattr(metrics, name) for name, _ in METRIC_COLUMNS}))
+        except Exception as e:
+            errors.append((strategy_idx, str(e)))
+    return rows, errors
+
+
+@dataclass
+class SweepSummary:
+    """Outcome of one ``run_sweep`` call."""
+
+    path: str
+    backtests: int = 0  # run and stored by this call
+    skipped: int = 0  # already stored (resume)
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def backtests_per_second(self) -> float:
+        return self.backtests / self.seconds if self.seconds > 0 else 0.0
+
+
+def run_sweep(
+    strategies: list[dict[str, Any]],
+    frames: dict[str, pd.DataFrame],
+    out: str,
+    timeframe: str = "1H",
+    engine: str = "single",
+    workers: int | None = None,
+    batch_size: int = 8,
+    initial_capital: float = 50.0,
+    resume: bool = False,
+    indicator_root: str | None = "backtest_data/indicators",
+    verbose: bool = True,
+) -> SweepSummary:
+    """
+    Backtest every strategy on every symbol.
+
+    Args:
+        strategies: Strategy dicts (need "id" and "name")
+        frames: {symbol: OHLCV DataFrame}
+        out: Results directory
+        timeframe: Candle timeframe of ``frames`` (recorded in the results)
+        engine: "single" (BacktestEngine) or "multi" (MultiPositionBacktestEngine)
+        workers: Worker processes (None = all cores, 1 = run in this process)
+        batch_size: Strategies per task
+        initial_capital: Starting capital per backtest
+        resume: Continue an interrupted sweep in ``out``
+        indicator_root: IndicatorCache directory (None = no indicator cache)
+        verbose: Print progress
+
+    Returns:
+        SweepSummary
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r} (expected one of {ENGINES})")
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    usable = {symbol: df for symbol, df in frames.items() if df is not None and len(df) >= MIN_BARS}
+    for symbol in frames.keys() - usable.keys():
+        print(f"⚠️ Skipping {symbol}: fewer than {MIN_BARS} candles")
+
+    settings = {"timeframe": timeframe, "engine": engine, "initial_capital": initial_capital}
+    results = SweepResults(out, settings, resume=resume)
+    summary = SweepSummary(str(results.path))
+    candles = None
+    try:
+        strategy_ids, symbol_ids = results.register(
+            strategies, list(usable), [data_fingerprint(df) for df in usable.values()]
+        )
+        done = results.completed()
+
+        # Longest series first, then round-robin over symbols so concurrent
+        # tasks mostly work on different symbols (indicators computed once)
+        symbols = list(usable)
+        unique_strategies = list(dict.fromkeys(strategy_ids))
+        per_symbol = []
+        for slot in sorted(range(len(symbols)), key=lambda slot: -len(usable[symbols[slot]])):
+            pending = [s for s in unique_strategies if (s, symbol_ids[slot]) not in done]
+            summary.skipped += len(unique_strategies) - len(pending)
+            per_symbol.append(
+                [(symbol_ids[slot], slot, pending[i : i + batch_size]) for i in range(0, len(pending), batch_size)]
+            )
+        tasks = [task for batch in itertools.zip_longest(*per_symbol) for task in batch if task is not None]
+        total = sum(len(task[2]) for task in tasks)
+
+        if verbose:
+            print(
+                f"🔥 Sweep: {len(unique_strategies)} strategies x {len(usable)} symbols | "
+                f"{total} backtests to run, {summary.skipped} already done | {min(workers, max(1, len(tasks)))} workers"
+            )
+        if not tasks:
+            return summary
+
+        candles = SharedCandles(usable)
+        worker_strategies = dict(zip(strategy_ids, strategies))
+        initargs = (candles.descriptor, worker_strategies, settings, indicator_root)
+
+        report_every = max(1, total // 20)
+        next_report = [report_every]
+
+        def collect(rows: list, errors: list) -> None:
+            results.append(rows)
+            summary.backtests += len(rows)
+            summary.failed += len(errors)
+            for strategy_idx, message in errors:
+                print(f"❌ Error backtesting strategy {results.manifest['strategies'][strategy_idx]['id']}: {message}")
+            done_now = summary.backtests + summary.failed
+            if verbose and done_now >= next_report[0]:
+                next_report[0] = done_now + report_every
+                print(f"   {done_now}/{total} backtests | {summary.backtests / (time.perf_counter() - started):.1f}/s")
+
+        if workers <= 1 or len(tasks) == 1:
+            _init_worker(*initargs)
+            try:
+                for task in tasks:
+                    collect(*_run_task(*task))
+            finally:
+                _release_worker()
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(tasks)), initializer=_init_worker, initargs=initargs
+            ) as executor:
+                # A few tasks queued per worker: idle workers take the next one
+                queue = iter(tasks)
+                in_flight = {executor.submit(_run_task, *task) for task in itertools.islice(queue, workers * 4)}
+                try:
+                    while in_flight:
+                        finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            collect(*future.result())
+                            for task in itertools.islice(queue, 1):
+                                in_flight.add(executor.submit(_run_task, *task))
+                except BaseException:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+    finally:
+        results.close()
+        if candles is not None:
+            candles.close()
+        summary.seconds = time.perf_counter() - started
+
+    if verbose:
+        print(
+            f"✅ Sweep done: {summary.backtests} backtests in {summary.seconds:.1f}s "
+            f"({summary.backtests_per_second:.1f}/s), {summary.failed} failed -> {summary.path}"
+        )
+    return summary
+
+
+def load_strategies(patterns: list[str]) -> list[dict[str, Any]]:
+    """Strategy dicts from JSON files matching glob patterns (in file order)."""
+    paths = sorted({path for pattern in patterns for path in glob.glob(pattern)})
+    strategies = []
+    for path in paths:
+        with open(path, "r") as f:
+            strategy = json.load(f)
+        if isinstance(strategy, dict) and "id" in strategy:
+            strategies.append(strategy)
+    return strategies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Parallel strategy x symbol backtest sweep")
+    parser.add_argument("--out", required=True, help="Results directory")
+    parser.add_argument("--strategies", nargs="+", default=["strategies/strategy_*.json"], help="Strategy JSON globs")
+    parser.add_argument("--symbols", nargs="+", help="Symbols (default: every stored symbol of the timeframe)")
+    parser.add_argument("--timeframe", default="1H")
+    parser.add_argument("--data-dir", default="backtest_data", help="Candle store directory")
+    parser.add_argument("--days", type=float, default=30, help="Days of history per symbol (latest stored bars)")
+    parser.add_argument("--engine", choices=ENGINES, default="single")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--batch-size", type=int, default=8, help="Strategies per task")
+    parser.add_argument("--capital", type=float, default=50.0, help="Initial capital per backtest")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted sweep in --out")
+    args = parser.parse_args()
+
+    strategies = load_strategies(args.strategies)
+    store = open_candle_store(args.data_dir)
+    symbols = args.symbols or store.symbols(args.timeframe)
+    frames = {symbol: store.load_recent(symbol, args.timeframe, args.days) for symbol in symbols}
+
+    print("=" * 80)
+    print("🎯 BACKTEST SWEEP")
+    print("=" * 80)
+    summary = run_sweep(
+        strategies,
+        frames,
+        args.out,
+        timeframe=args.timeframe,
+        engine=args.engine,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        initial_capital=args.capital,
+        resume=args.resume,
+        indicator_root=os.path.join(args.data_dir, "indicators"),
+    )
+
+    results = load_results(summary.path)
+    if not results.empty:
+        best = results.sort_values("total_roi_pct", ascending=False).head(10)
+        print("\n🏆 Top 10 (strategy, symbol) by ROI:")
+        for _, row in best.iterrows():
+            print(
+                f"   #{row['strategy_id']:<4} {row['strategy_name'][:40]:<40} {row['symbol']:<14} "
+                f"ROI {row['total_roi_pct']:8.2f}% | WR {row['win_rate_pct']:5.1f}% | {row['total_trades']} trades"
+            )
+
+
+if __name__ == "__main__":
+    main()
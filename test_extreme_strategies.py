@@ -18,6 +18,7 @@ import pandas as pd
 
 from backtest_engine_multi import MultiPositionBacktestEngine
 from metrics_calculator import MetricsCalculator
+from src.bitget_trading.indicator_cache import get_indicator_cache
 
 
 class ExtremeStrategiesTester:
@@ -80,8 +81,8 @@ class ExtremeStrategiesTester:
     ) -> Dict:
         """Run backtest for one strategy on one symbol."""
         try:
-            engine = MultiPositionBacktestEngine(strategy)
-            result = engine.run_backtest(df, symbol, initial_capital=50.0)
+            engine = MultiPositionBacktestEngine(strategy, indicator_cache=get_indicator_cache())
+            result = engine.run_backtest(df, symbol, initial_capital=50.0, vectorized=True)
             
             metrics = MetricsCalculator.calculate_all_metrics(result)
             
@@ -18,6 +18,7 @@ from datetime import datetime
 from backtest_engine import BacktestEngine
 from metrics_calculator import MetricsCalculator
 from data_fetcher import HistoricalDataFetcher
+from src.bitget_trading.indicator_cache import get_indicator_cache
 import pandas as pd
 
 
@@ -87,7 +88,7 @@ class LeverageStrategyTester:
         df = data_dict[symbol]
         
         try:
-            engine = BacktestEngine(strategy)
+            engine = BacktestEngine(strategy, indicator_cache=get_indicator_cache())
             result = engine.run_backtest(df, symbol, initial_capital=50.0)
             
             # Calculate metrics
@@ -0,0 +1,48 @@
+"""Synthetic strategies and candles shared by the tests."""
+
+import numpy as np
+import pandas as pd
+
+
+def make_strategy(strategy_id: int, **overrides) -> dict:
+    strategy = {
+        "id": strategy_id,
+        "name": f"strategy_{strategy_id}",
+        "entry_threshold": 1.0,
+        "stop_loss_pct": 0.5,
+        "take_profit_pct": 0.8,
+        "trailing_callback": 0.01,
+        "volume_ratio": 1.5,
+        "confluence_required": 2,
+        "position_size_pct": 0.1,
+        "leverage": 25,
+        "max_positions": 5,
+    }
+    strategy.update(overrides)
+    return strategy
+
+
+def make_candles(seed: int, n: int, start_ms: int = 1_700_000_000_000, interval_ms: int = 60_000) -> pd.DataFrame:
+    """Random-walk OHLCV bars (int ms timestamps) with alternating trends so both long and short signals fire."""
+    rng = np.random.default_rng(seed)
+    drift = np.repeat(rng.choice([-0.002, 0.0, 0.002], n // 50 + 1), 50)[:n]
+    close = 10 * np.exp(np.cumsum(drift + rng.normal(0, 0.004, n)))
+    spread = np.abs(rng.normal(0, 0.002, n)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": start_ms + interval_ms * np.arange(n, dtype=np.int64),
+            "open": np.r_[close[0], close[:-1]],
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.lognormal(8, 1, n),
+        }
+    )
+
+
+def bitget_rows(df: pd.DataFrame) -> list[list[str]]:
+    """Bars in the REST candles layout: [ts, open, high, low, close, volume, quote volume] strings."""
+    return [
+        [str(int(row.timestamp)), str(row.open), str(row.high), str(row.low), str(row.close), str(row.volume), "0"]
+        for row in df.itertuples(index=False)
+    ]
@@ -0,0 +1,96 @@
+import asyncio
+
+import orjson
+
+from bitget_trading.account_stream import AccountStream
+from bitget_trading.bitget_rest import BitgetRestClient
+from bitget_trading.exchange_simulator import ExchangeSimulator
+from bitget_trading.rate_limiter import BitgetRateLimiter
+
+START = 1_767_225_600_000  # 2026-01-01 00:00 UTC
+TICKER = {"symbol": "AAAUSDT", "last_price": 100.0, "bid_price": 99.95, "ask_price": 100.05, "mark_price": 100.0}
+
+
+def push(channel: str, data: list[dict]) -> bytes:
+    return orjson.dumps({"action": "snapshot", "arg": {"instType": "USDT-FUTURES", "channel": channel}, "data": data})
+
+
+def test_pushes_fold_into_mirror():
+    stream = AccountStream(BitgetRestClient("key", "secret", "pass", transport="aiohttp", rate_limiter=BitgetRateLimiter()))
+    stream.connected = True
+
+    stream._handle_message(push("positions", [
+        {"instId": "AAAUSDT", "holdSide": "long", "total": "2", "openPriceAvg": "100"},
+        {"instId": "BBBUSDT", "holdSide": "short", "total": "0"},
+    ]))
+    stream._handle_message(push("account", [{"marginCoin": "USDT", "available": "80", "equity": "101"}]))
+    assert stream.synced and stream.available == 80.0 and stream.equity == 101.0
+    assert stream.get_positions("AAAUSDT")[0]["symbol"] == "AAAUSDT" and stream.get_position("BBBUSDT") is None
+
+    stream._handle_message(push("orders", [{"instId": "AAAUSDT", "orderId": "1", "status": "live"}]))
+    assert stream.get_order("1")["status"] == "live" and "1" in stream.open_orders
+    stream._handle_message(push("orders", [{"instId": "AAAUSDT", "orderId": "1", "status": "filled"}]))
+    assert "1" not in stream.open_orders and stream.get_order("1")["status"] == "filled"
+
+    stream._handle_message(push("orders-algo", [{"instId": "AAAUSDT", "orderId": "7", "planType": "pos_loss", "status": "live"}]))
+    assert [o["orderId"] for o in stream.get_plan_orders("AAAUSDT", ("pos_loss",))] == ["7"]
+    stream._handle_message(push("orders-algo", [{"instId": "AAAUSDT", "orderId": "7", "planType": "pos_loss", "status": "executed"}]))
+    stream._handle_message(push("positions", []))
+    assert not stream.plan_orders and not stream.positions
+
+    stream.connected = False
+    assert not stream.synced
+
+
+async def test_mirror_follows_simulated_exchange():
+    sim = ExchangeSimulator(initial_balance=1000.0, default_leverage=10, rate_limits=None, api_secret="secret")
+    sim.apply_event(START, "AAAUSDT", "ticker", dict(TICKER))
+    await sim.start()
+    client = BitgetRestClient("key", "secret", "pass", transport="aiohttp", base_url=sim.base_url, rate_limiter=BitgetRateLimiter())
+    stream = AccountStream(client)
+    stream.WS_URL = sim.ws_private_url
+    try:
+        await stream.start()
+        for _ in range(200):
+            if stream.synced:
+                break
+            await asyncio.sleep(0.01)
+        assert stream.synced and stream.available == 1000.0 and not stream.positions
+
+        response = await client.place_order("AAAUSDT", "buy", 2.0)
+        assert await stream.wait_for_fill("AAAUSDT", response["data"]["orderId"], timeout=2.0)
+        position = stream.get_position("AAAUSDT")
+        assert position["holdSide"] == "long" and float(position["total"]) == 2.0
+        assert stream.available == sim.account()["available"]
+
+        await client._request("POST", "/api/v2/mix/order/place-tpsl-order", data={
+            "symbol": "AAAUSDT", "planType": "pos_loss", "holdSide": "buy", "triggerPrice": "95", "triggerType": "mark_price",
+        })
+        await stream._wait(lambda: bool(stream.plan_orders), 2.0)
+        assert [o["planType"] for o in stream.get_plan_orders("AAAUSDT")] == ["pos_loss"]
+
+        # Exchange-side stop closes the position: the mirror sees it without any REST call
+        requests_before = sum(sim.requests.values())
+        sim.apply_event(START + 1000, "AAAUSDT", "ticker", {**TICKER, "last_price": 94.0, "mark_price": 94.0})
+        await stream._wait(lambda: not stream.positions and not stream.plan_orders, 2.0)
+        assert not stream.positions and not stream.plan_orders
+        assert sum(sim.requests.values()) == requests_before
+    finally:
+        await stream.stop()
+        await client.close()
+        await sim.stop()
+
+
+async def test_bad_signature_never_syncs():
+    sim = ExchangeSimulator(rate_limits=None, api_secret="secret")
+    await sim.start()
+    stream = AccountStream(BitgetRestClient("key", "wrong", "pass", transport="aiohttp", rate_limiter=BitgetRateLimiter()))
+    stream.WS_URL = sim.ws_private_url
+    stream.RECONNECT_BASE_DELAY = 0.05
+    try:
+        await stream.start()
+        await asyncio.sleep(0.3)
+        assert not stream.synced and stream.reconnects >= 1
+    finally:
+        await stream.stop()
+        await sim.stop()
@@ -0,0 +1,92 @@
+import pytest
+
+from backtest_engine_multi import MultiPositionBacktestEngine
+from backtest_helpers import make_candles, make_strategy
+
+
+def assert_same_result(expected, actual):
+    assert actual.trades == expected.trades
+    assert actual.equity_curve == expected.equity_curve
+    assert actual.final_capital == expected.final_capital
+    assert actual.max_concurrent_positions == expected.max_concurrent_positions
+    assert actual.correlation_violations == expected.correlation_violations
+    assert actual.total_slippage_cost == expected.total_slippage_cost
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_momentum_strategy_parity(seed):
+    df = make_candles(seed, 1500)
+    strategy = make_strategy(7)
+
+    expected = MultiPositionBacktestEngine(strategy).run_backtest(df, "TESTUSDT")
+    actual = MultiPositionBacktestEngine(strategy).run_backtest(df, "TESTUSDT", vectorized=True)
+
+    assert len(expected.trades) > 5
+    assert_same_result(expected, actual)
+
+
+@pytest.mark.parametrize("seed", [4, 5])
+def test_holy_grail_adx_parity(seed):
+    df = make_candles(seed, 300)
+    strategy = make_strategy(46, entry_threshold=0.8, confluence_required=3)
+
+    expected = MultiPositionBacktestEngine(strategy).run_backtest(df, "TESTUSDT")
+    actual = MultiPositionBacktestEngine(strategy).run_backtest_vectorized(df, "TESTUSDT")
+
+    assert len(expected.trades) > 0
+    assert_same_result(expected, actual)
+
+
+def test_signals_match_per_bar():
+    df = make_candles(6, 300)
+    for strategy in (make_strategy(7), make_strategy(46, entry_threshold=0.8)):
+        engine = MultiPositionBacktestEngine(strategy)
+        directions, scores = engine.calculate_signals(df)
+
+        for idx in range(len(df)):
+            direction, score = engine.calculate_signal(df, idx)
+            assert directions[idx] == {"long": 1, "short": -1, "neutral": 0}[direction]
+            if direction != "neutral":
+                assert scores[idx] == score
+
+
+def test_custom_signal_override_runs_per_bar():
+    df = make_candles(7, 300)
+    strategy = make_strategy(7)
+
+    def contrarian(engine):
+        builtin = type(engine).calculate_signal.__get__(engine)
+
+        def signal(df, idx):
+            direction, score = builtin(df, idx)
+            return {"long": "short", "short": "long"}.get(direction, direction), score
+
+        return signal
+
+    results = []
+    for vectorized in (False, True):
+        engine = MultiPositionBacktestEngine(strategy)
+        engine.calculate_signal = contrarian(engine)
+        results.append(engine.run_backtest(df, "TESTUSDT", vectorized=vectorized))
+
+    assert len(results[0].trades) > 0
+    assert_same_result(results[0], results[1])
+    # The override is honoured: the built-in signals trade differently
+    builtin = MultiPositionBacktestEngine(strategy).run_backtest(df, "TESTUSDT", vectorized=True)
+    assert builtin.trades != results[0].trades
+
+
+class ContrarianEngine(MultiPositionBacktestEngine):
+    def calculate_signal(self, df, idx):
+        direction, score = super().calculate_signal(df, idx)
+        return {"long": "short", "short": "long"}.get(direction, direction), score
+
+
+def test_subclass_signal_override_runs_per_bar():
+    df = make_candles(8, 300)
+    strategy = make_strategy(7)
+
+    per_bar = ContrarianEngine(strategy).run_backtest(df, "TESTUSDT")
+    assert ContrarianEngine(strategy).has_custom_signal()
+    assert_same_result(per_bar, ContrarianEngine(strategy).run_backtest(df, "TESTUSDT", vectorized=True))
+    assert not MultiPositionBacktestEngine(strategy).has_custom_signal()
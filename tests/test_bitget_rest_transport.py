@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bitget_trading.bitget_rest import BitgetRestClient
+from bitget_trading.rate_limiter import BitgetRateLimiter
+
+
+@pytest.fixture
+async def stub_server():
+    seen = []
+    failures = {"remaining": 0}
+
+    async def handler(request: web.Request) -> web.Response:
+        seen.append({
+            "method": request.method,
+            "path_qs": request.path_qs,
+            "body": await request.text(),
+            "headers": dict(request.headers),
+        })
+        if failures["remaining"] > 0:
+            failures["remaining"] -= 1
+            return web.Response(status=503, text="busy")
+        return web.json_response({"code": "00000", "data": {"echo": request.path_qs}})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield server, seen, failures
+    await server.close()
+
+
+def make_client(server: TestServer, transport: str) -> BitgetRestClient:
+    return BitgetRestClient(
+        "key", "secret", "phrase",
+        transport=transport, pool_size=10, pool_per_host=4, keepalive_sec=5.0,
+        base_url=str(server.make_url("")).rstrip("/"), rate_limiter=BitgetRateLimiter(),
+    )
+
+
+@pytest.mark.parametrize("transport", ["requests", "aiohttp"])
+async def test_transports_sign_and_parse_identically(stub_server, transport):
+    server, seen, _ = stub_server
+    client = make_client(server, transport)
+    try:
+        response = await client._request(
+            "POST", "/api/v2/mix/order/place-order",
+            params={"symbol": "BTCUSDT"}, data={"size": "1"},
+        )
+    finally:
+        await client.close()
+
+    assert response == {"code": "00000", "data": {"echo": "/api/v2/mix/order/place-order?symbol=BTCUSDT"}}
+    request = seen[-1]
+    assert request["body"] == '{"size":"1"}'
+    headers = request["headers"]
+    assert headers["ACCESS-KEY"] == "key"
+    assert headers["ACCESS-PASSPHRASE"] == "phrase"
+    assert headers["ACCESS-SIGN"] == client._sign_request(
+        headers["ACCESS-TIMESTAMP"], "POST", request["path_qs"], request["body"]
+    )
+
+
+async def test_aiohttp_transport_retries_server_errors(stub_server):
+    server, seen, failures = stub_server
+    failures["remaining"] = 1
+    client = make_client(server, "aiohttp")
+    try:
+        response = await client._request("GET", "/api/v2/mix/market/ticker", params={"symbol": "ETHUSDT"})
+    finally:
+        await client.close()
+
+    assert response["code"] == "00000"
+    assert len(seen) == 2
+
+
+async def test_aiohttp_transport_reuses_pooled_connections(stub_server):
+    server, _, _ = stub_server
+    client = make_client(server, "aiohttp")
+    try:
+        await asyncio.gather(*(
+            client._request("GET", "/api/v2/mix/market/ticker", params={"i": str(i)}) for i in range(20)
+        ))
+        connector = client._http_session.connector
+        # Never more than pool_per_host sockets to the stub host
+        assert len(connector._conns) <= 1
+        assert sum(len(conns) for conns in connector._conns.values()) <= 4
+    finally:
+        await client.close()
+
+
+def test_unknown_transport_rejected():
+    with pytest.raises(ValueError):
+        BitgetRestClient("key", "secret", "phrase", transport="curl", pool_size=1, pool_per_host=1, keepalive_sec=1.0)
+
+
+async def test_rate_limited_response_is_retried_with_fresh_signature(stub_server):
+    server, seen, failures = stub_server
+    client = make_client(server, "aiohttp")
+    calls = []
+    original_send = client._send
+
+    async def send(method, url, headers, body):
+        calls.append(headers["ACCESS-TIMESTAMP"])
+        if len(calls) == 1:
+            return 429, '{"code":"429","msg":"Too Many Requests"}'
+        return await original_send(method, url, headers, body)
+
+    client._send = send
+    try:
+        response = await client._request("GET", "/api/v2/mix/market/ticker", params={"symbol": "BTCUSDT"})
+    finally:
+        await client.close()
+
+    assert response["code"] == "00000"
+    assert len(calls) == 2
+    bucket = client.rate_limiter.bucket("/api/v2/mix/market/ticker")
+    assert bucket.rate_limited == 1
+    assert bucket.consecutive_rate_limits == 0
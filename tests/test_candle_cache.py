@@ -0,0 +1,86 @@
+import pandas as pd
+
+from backtest_helpers import bitget_rows, make_candles
+from institutional_candle_cache import OHLCV_AGG, OHLCV_COLUMNS, CandleCache, candles_to_frame
+from institutional_indicators import InstitutionalIndicators
+
+
+START_MS = 1_735_689_600_000  # 2025-01-01 00:00 UTC
+
+
+def full_resample(bars: pd.DataFrame) -> pd.DataFrame:
+    return bars[OHLCV_COLUMNS].resample("15min").agg(OHLCV_AGG).dropna()
+
+
+def test_candles_to_frame_sorts_and_dedupes():
+    rows = bitget_rows(make_candles(0, 5, start_ms=START_MS, interval_ms=300_000))
+    df = candles_to_frame(list(reversed(rows)) + [rows[-1]])
+
+    assert list(df.index) == sorted(df.index)
+    assert len(df) == 5
+    assert df["close"].dtype == float
+
+
+def test_delta_updates_match_full_rebuild():
+    rows = bitget_rows(make_candles(1, 700, start_ms=START_MS, interval_ms=300_000))
+    cache = CandleCache(InstitutionalIndicators({}), max_bars=2000)
+    cache.seed("BTCUSDT", candles_to_frame(rows[:600]))
+
+    # In-progress bar re-fetched unchanged: nothing to do
+    assert cache.update("BTCUSDT", candles_to_frame(rows[599:600])) == 0
+
+    # Revised last bar plus new bars, delivered one page at a time
+    revised = list(rows[599])
+    revised[4] = str(float(revised[4]) * 1.01)
+    assert cache.update("BTCUSDT", candles_to_frame([revised] + rows[600:650])) == 51
+    assert cache.update("BTCUSDT", candles_to_frame(rows[649:700])) == 50
+
+    expected = candles_to_frame(rows[:599] + [revised] + rows[600:])
+    pd.testing.assert_frame_equal(cache.bars("BTCUSDT"), expected)
+    pd.testing.assert_frame_equal(cache._bars_htf["BTCUSDT"], full_resample(expected), check_freq=False)
+
+    df_5m, df_15m = cache.indicator_frames("BTCUSDT")
+    indicators = InstitutionalIndicators({})
+    pd.testing.assert_frame_equal(df_5m, indicators.calculate_all_indicators(expected, timeframe="5m"))
+    pd.testing.assert_frame_equal(
+        df_15m, indicators.calculate_all_indicators(full_resample(expected), timeframe="15m"), check_freq=False
+    )
+
+
+def test_indicator_frames_reused_until_bars_change():
+    rows = bitget_rows(make_candles(2, 400, start_ms=START_MS, interval_ms=300_000))
+    cache = CandleCache(InstitutionalIndicators({}))
+    cache.seed("ETHUSDT", candles_to_frame(rows[:399]))
+
+    first = cache.indicator_frames("ETHUSDT")
+    assert cache.indicator_frames("ETHUSDT") is first
+
+    cache.update("ETHUSDT", candles_to_frame(rows[399:]))
+    assert cache.indicator_frames("ETHUSDT") is not first
+    assert cache.last_bar("ETHUSDT")["close"] == float(rows[-1][4])
+
+
+def test_trim_keeps_window_and_rebuilds_resample():
+    rows = bitget_rows(make_candles(3, 140, start_ms=START_MS, interval_ms=300_000))
+    cache = CandleCache(InstitutionalIndicators({}), max_bars=100, trim_slack=20)
+    cache.seed("SOLUSDT", candles_to_frame(rows[:100]))
+
+    cache.update("SOLUSDT", candles_to_frame(rows[100:115]))
+    assert len(cache.bars("SOLUSDT")) == 115
+
+    cache.update("SOLUSDT", candles_to_frame(rows[115:140]))
+    bars = cache.bars("SOLUSDT")
+    assert len(bars) == 100
+    pd.testing.assert_frame_equal(bars, candles_to_frame(rows[40:140]))
+    pd.testing.assert_frame_equal(cache._bars_htf["SOLUSDT"], full_resample(bars), check_freq=False)
+
+
+def test_ws_candles_ignored_until_seeded():
+    cache = CandleCache(InstitutionalIndicators({}))
+    rows = bitget_rows(make_candles(0, 3, start_ms=START_MS, interval_ms=300_000))
+
+    assert cache.apply_ws_candles("XRPUSDT", rows) == 0
+    assert "XRPUSDT" not in cache
+
+    cache.seed("XRPUSDT", candles_to_frame(rows[:2]))
+    assert cache.apply_ws_candles("XRPUSDT", rows[2:]) == 1
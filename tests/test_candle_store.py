@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+
+from backtest_helpers import make_candles
+from bitget_trading.candle_store import CandleStore, open_candle_store
+
+START_MS = 1_735_689_600_000
+
+
+def test_round_trip_and_window(tmp_path):
+    store = CandleStore(str(tmp_path))
+    df = make_candles(0, 500, start_ms=START_MS)
+    assert store.write("BTCUSDT", "1m", df.sample(frac=1, random_state=1)) == 500
+
+    pd.testing.assert_frame_equal(store.load_frame("BTCUSDT", "1m"), df)
+    window = store.load_arrays("BTCUSDT", "1m", start_ms=START_MS + 60_000 * 10, end_ms=START_MS + 60_000 * 19)
+    assert len(window["close"]) == 10 and window["timestamp"][0] == START_MS + 600_000
+    with pytest.raises(ValueError):
+        window["close"][0] = 1.0  # read-only mapping
+
+    info = store.info("BTCUSDT", "1m")
+    assert info["rows"] == 500 and info["start"] == START_MS and info["end"] == int(df["timestamp"].iloc[-1])
+    assert store.load_frame("ETHUSDT", "1m").empty
+
+    # Fixed trailing window however far the series has grown
+    recent = store.load_recent("BTCUSDT", "1m", days=60 / 1440)
+    assert recent["timestamp"].tolist() == df["timestamp"].iloc[-61:].tolist()
+    assert store.load_recent("ETHUSDT", "1m", days=30).empty
+
+
+def test_append_in_place_replaces_forming_bar(tmp_path):
+    store = CandleStore(str(tmp_path))
+    df = make_candles(0, 300, start_ms=START_MS)
+    store.write("BTCUSDT", "1m", df.iloc[:200])
+    inode = store.path("BTCUSDT", "1m").stat().st_ino
+    reader = CandleStore(str(tmp_path))
+    assert len(reader.load_arrays("BTCUSDT", "1m")["close"]) == 200
+
+    # Overlaps the last stored bar (e.g. it was still forming)
+    update = df.iloc[199:].copy()
+    update.loc[199, "close"] = 123.0
+    assert store.append("BTCUSDT", "1m", update) == 300
+    assert store.path("BTCUSDT", "1m").stat().st_ino == inode  # no rewrite
+
+    loaded = reader.load_frame("BTCUSDT", "1m")  # other handle sees the new bars
+    assert len(loaded) == 300 and loaded["close"].iloc[199] == 123.0
+    assert CandleStore(str(tmp_path)).info("BTCUSDT", "1m")["rows"] == 300
+
+
+def test_append_rewrites_when_needed(tmp_path):
+    store = CandleStore(str(tmp_path))
+    df = make_candles(0, 3000, start_ms=START_MS)
+    store.write("BTCUSDT", "1m", df.iloc[1000:1100])
+
+    store.append("BTCUSDT", "1m", df.iloc[:1000])  # older history
+    store.append("BTCUSDT", "1m", df.iloc[1100:])  # beyond spare capacity
+    pd.testing.assert_frame_equal(store.load_frame("BTCUSDT", "1m"), df)
+
+
+def test_legacy_pickles_imported_once(tmp_path):
+    make_candles(0, 100, start_ms=START_MS).to_pickle(tmp_path / "BTCUSDT_1m_30d.pkl")
+    make_candles(0, 100, start_ms=START_MS + 6_000_000).to_pickle(tmp_path / "BTCUSDT_1m_200.pkl")
+    make_candles(0, 50, start_ms=START_MS).to_pickle(tmp_path / "ETHUSDT_1H_30d.pkl")
+    (tmp_path / "notes.pkl").write_bytes(b"")
+
+    store = open_candle_store(str(tmp_path))
+    assert store.symbols("1m") == ["BTCUSDT"] and store.symbols("1H") == ["ETHUSDT"]
+    assert store.info("BTCUSDT", "1m")["rows"] == 200  # merged
+    assert store.import_pickles() == 0
+    assert CandleStore(str(tmp_path)).load_many(["BTCUSDT", "SOLUSDT"], "1m").keys() == {"BTCUSDT"}
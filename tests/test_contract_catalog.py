@@ -0,0 +1,127 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from bitget_trading.bitget_rest import BitgetRestClient
+from bitget_trading.contract_catalog import ContractCatalog, ContractSpec
+
+CONTRACTS = [
+    {
+        "symbol": "BTCUSDT", "baseCoin": "BTC", "quoteCoin": "USDT", "pricePlace": "1",
+        "priceEndStep": "1", "volumePlace": "4", "sizeMultiplier": "0.0001",
+        "minTradeNum": "0.0001", "maxLeverage": "125", "symbolStatus": "normal",
+    },
+    {
+        "symbol": "DOGEUSDT", "baseCoin": "DOGE", "quoteCoin": "USDT", "pricePlace": "5",
+        "priceEndStep": "5", "volumePlace": "0", "sizeMultiplier": "1",
+        "minTradeNum": "10", "maxLeverage": "75", "symbolStatus": "normal",
+    },
+]
+
+
+class FakeFetcher:
+    def __init__(self, contracts=CONTRACTS, delay=0.0):
+        self.contracts = list(contracts)
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, product_type):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.contracts
+
+
+def test_spec_accessors_and_rounding():
+    btc, doge = (ContractSpec.from_api(c) for c in CONTRACTS)
+
+    assert btc.max_leverage == 125 and btc.price_place == 1 and btc.min_trade_num == 0.0001
+    assert btc.tick_size == pytest.approx(0.1)
+    assert btc.round_price(65000.04) == 65000.0
+    assert btc.round_size(0.123456) == 0.1234
+    assert doge.tick_size == pytest.approx(0.00005)
+    assert doge.round_price(0.123474) == 0.12345
+    assert doge.round_size(99.9) == 99.0
+    assert doge.as_info()["price_place"] == 5
+
+
+async def test_one_bulk_fetch_serves_all_lookups(tmp_path):
+    fetcher = FakeFetcher(delay=0.01)
+    catalog = ContractCatalog(fetcher, snapshot_path=str(tmp_path / "contracts.json"))
+
+    specs = await asyncio.gather(*(catalog.get(s) for s in ["BTCUSDT", "DOGEUSDT"] * 50))
+
+    assert fetcher.calls == 1
+    assert specs[0].symbol == "BTCUSDT" and specs[1].max_leverage == 75
+
+
+async def test_snapshot_gives_instant_startup(tmp_path):
+    path = str(tmp_path / "contracts.json")
+    await ContractCatalog(FakeFetcher(), snapshot_path=path).refresh()
+    assert "BTCUSDT" in json.dumps(json.load(open(path)))
+
+    fetcher = FakeFetcher()
+    restarted = ContractCatalog(fetcher, snapshot_path=path)
+    assert restarted.get_cached("DOGEUSDT").min_trade_num == 10
+    assert (await restarted.get("BTCUSDT")).max_leverage == 125
+    assert fetcher.calls == 0
+
+
+async def test_stale_catalog_served_while_refreshing(tmp_path):
+    fetcher = FakeFetcher()
+    catalog = ContractCatalog(fetcher, snapshot_path=None, ttl_sec=60)
+    await catalog.refresh()
+    catalog._fetched_at["usdt-futures"] = time.time() - 120
+    fetcher.contracts[1] = {**CONTRACTS[1], "maxLeverage": "50"}
+
+    assert (await catalog.get("DOGEUSDT")).max_leverage == 75  # stale, no wait
+    await asyncio.sleep(0)
+    await catalog._refreshing["usdt-futures"]
+    assert catalog.get_cached("DOGEUSDT").max_leverage == 50
+    assert fetcher.calls == 2
+
+
+async def test_unknown_symbol_refetches_once_listed(tmp_path):
+    fetcher = FakeFetcher(contracts=CONTRACTS[:1])
+    catalog = ContractCatalog(fetcher, snapshot_path=None, miss_refresh_sec=30)
+    await catalog.refresh()
+
+    assert await catalog.get("DOGEUSDT") is None
+    assert fetcher.calls == 1  # catalog is fresh: no refetch per miss
+
+    catalog._fetched_at["usdt-futures"] -= 60
+    fetcher.contracts = CONTRACTS
+    assert (await catalog.get("DOGEUSDT")).symbol == "DOGEUSDT"
+    assert fetcher.calls == 2
+
+
+async def test_failed_fetch_keeps_previous_catalog():
+    fetcher = FakeFetcher()
+    catalog = ContractCatalog(fetcher, snapshot_path=None)
+    await catalog.refresh()
+
+    fetcher.contracts = []
+    assert await catalog.refresh() is False
+    assert catalog.get_cached("BTCUSDT") is not None
+
+
+async def test_rest_tpsl_orders_use_contract_rounding(tmp_path):
+    catalog = ContractCatalog(FakeFetcher(), snapshot_path=str(tmp_path / "contracts.json"))
+    client = BitgetRestClient("key", "secret", "phrase", contract_catalog=catalog)
+    sent = []
+
+    async def request(method, endpoint, data=None, **kwargs):
+        sent.append(data)
+        return {"code": "00000", "data": {"orderId": str(len(sent))}}
+
+    async def no_price(symbol):
+        return None
+
+    client._request = request
+    client._get_current_market_price = no_price
+    await client.place_tpsl_order("DOGEUSDT", "long", 99.9, stop_loss_price=0.123474, take_profit_price=0.15003)
+
+    sl, tp = sent
+    assert sl["triggerPrice"] == "0.12345"  # 0.00005 tick, not 5 decimals
+    assert tp["triggerPrice"] == "0.15005" and tp["size"] == "99.0"
@@ -0,0 +1,64 @@
+import asyncio
+
+from bitget_trading.event_scheduler import EventScheduler
+
+
+async def test_batch_coalesces_repeated_updates():
+    scheduler = EventScheduler(rank_min_interval_sec=0.0, rank_max_interval_sec=60.0)
+    scheduler.mark_dirty("BTCUSDT")
+    scheduler.mark_dirty("BTCUSDT")
+    scheduler.mark_dirty("ETHUSDT")
+
+    batch = await asyncio.wait_for(scheduler.next_batch(), timeout=1.0)
+
+    assert batch.symbols == {"BTCUSDT", "ETHUSDT"}
+    assert batch.rank_due is True
+    assert batch.full_check is False
+    assert scheduler.events_coalesced == 1
+    assert scheduler.pending == 0
+
+
+async def test_idle_wakes_on_cadence_with_full_check():
+    scheduler = EventScheduler(rank_min_interval_sec=0.0, rank_max_interval_sec=0.05)
+
+    batch = await asyncio.wait_for(scheduler.next_batch(), timeout=1.0)
+
+    assert batch.symbols == set()
+    assert batch.full_check is True
+    assert batch.rank_due is True
+
+
+async def test_wakes_immediately_on_data():
+    scheduler = EventScheduler(rank_min_interval_sec=0.0, rank_max_interval_sec=60.0)
+    waiter = asyncio.create_task(scheduler.next_batch())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    scheduler.mark_dirty("SOLUSDT")
+    batch = await asyncio.wait_for(waiter, timeout=1.0)
+    assert batch.symbols == {"SOLUSDT"}
+
+    scheduler.record_decision(batch)
+    assert scheduler.get_latency_stats()["max_ms"] < 1000
+
+
+async def test_ranking_respects_min_interval():
+    scheduler = EventScheduler(rank_min_interval_sec=60.0, rank_max_interval_sec=120.0)
+    scheduler.mark_dirty("BTCUSDT")
+
+    batch = await asyncio.wait_for(scheduler.next_batch(), timeout=1.0)
+
+    assert batch.symbols == {"BTCUSDT"}
+    assert batch.rank_due is False
+
+
+async def test_overflow_degrades_to_full_check():
+    scheduler = EventScheduler(rank_max_interval_sec=60.0, max_pending=2)
+    for symbol in ("A", "B", "C"):
+        scheduler.mark_dirty(symbol)
+
+    batch = await asyncio.wait_for(scheduler.next_batch(), timeout=1.0)
+
+    assert scheduler.overflows == 1
+    assert batch.full_check is True
+    assert batch.symbols == {"A", "B"}
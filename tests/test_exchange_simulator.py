@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from bitget_trading.bitget_rest import BitgetRestClient
+from bitget_trading.exchange_simulator import ExchangeSimulator, LocalRestClient
+from bitget_trading.market_data_hub import MarketDataHub
+from bitget_trading.multi_symbol_state import MultiSymbolStateManager
+from bitget_trading.rate_limiter import BitgetRateLimiter
+
+START = 1_767_225_600_000  # 2026-01-01 00:00 UTC
+
+
+def ticker(price: float, mark: float | None = None) -> dict:
+    return {
+        "symbol": "AAAUSDT",
+        "last_price": price,
+        "bid_price": price - 0.05,
+        "ask_price": price + 0.05,
+        "mark_price": mark or price,
+        "volume_24h": 1000.0,
+        "timestamp": START,
+    }
+
+
+def make_simulator(**kwargs) -> ExchangeSimulator:
+    sim = ExchangeSimulator(initial_balance=1000.0, default_leverage=10, rate_limits=None, **kwargs)
+    sim.apply_event(START, "AAAUSDT", "ticker", ticker(100.0))
+    return sim
+
+
+async def test_market_order_fills_and_shows_in_account():
+    sim = make_simulator()
+    client = LocalRestClient(sim, rate_limiter=BitgetRateLimiter())
+
+    response = await client.place_order("AAAUSDT", "buy", 2.0)
+    order = (await client.get_order("AAAUSDT", response["data"]["orderId"]))["data"]
+    assert order["state"] == "filled" and float(order["priceAvg"]) == 100.05
+
+    position = (await client.get_positions("AAAUSDT"))[0]
+    assert position["holdSide"] == "long" and float(position["total"]) == 2.0
+    account = (await client.get_account_balance())["data"][0]
+    fee = 2.0 * 100.05 * 0.0006
+    assert float(account["available"]) == pytest.approx(1000.0 - fee - 2.0 * 100.05 / 10)
+
+    # Resting limit order fills as maker once the market trades through it
+    limit = await client.place_order("AAAUSDT", "sell", 2.0, "limit", price=101.0, reduce_only=True, force="post_only")
+    assert sim.open_orders and sim.positions
+    sim.apply_event(START + 1000, "AAAUSDT", "ticker", ticker(101.5))
+    assert sim.orders[limit["data"]["orderId"]].state == "filled" and not sim.positions
+    assert sim.balance == pytest.approx(1000.0 - fee + 2.0 * (101.0 - 100.05) - 2.0 * 101.0 * 0.0002)
+
+
+async def test_tpsl_triggers_and_rejects_wrong_side():
+    sim = make_simulator()
+    await sim.handle("POST", "/api/v2/mix/order/place-order", {"symbol": "AAAUSDT", "side": "buy", "orderType": "market", "size": "1"})
+    tpsl = {"symbol": "AAAUSDT", "holdSide": "buy", "triggerType": "mark_price"}
+
+    status, response = await sim.handle("POST", "/api/v2/mix/order/place-tpsl-order", {**tpsl, "planType": "pos_loss", "triggerPrice": "101"})
+    assert status == 400 and response["code"] == "40832" and "mark price: 100.0" in response["msg"]
+
+    await sim.handle("POST", "/api/v2/mix/order/place-tpsl-order", {**tpsl, "planType": "pos_loss", "triggerPrice": "98"})
+    await sim.handle("POST", "/api/v2/mix/order/place-tpsl-order", {**tpsl, "planType": "profit_plan", "triggerPrice": "110", "size": "1"})
+    _, pending = await sim.handle("GET", "/api/v2/mix/order/orders-plan-pending", {"symbol": "AAAUSDT", "planType": "profit_loss"})
+    assert sorted(p["planType"] for p in pending["data"]["entrustedList"]) == ["pos_loss", "profit_plan"]
+
+    sim.apply_event(START + 1000, "AAAUSDT", "ticker", ticker(98.5, mark=99.0))
+    assert sim.positions  # last price alone does not trigger a mark-price stop
+    sim.apply_event(START + 2000, "AAAUSDT", "ticker", ticker(97.9))
+    assert not sim.positions and not sim.plan_orders  # the stop closed it and the TP went with it
+
+    status, response = await sim.handle("POST", "/api/v2/mix/order/place-tpsl-order", {**tpsl, "planType": "pos_loss", "triggerPrice": "90"})
+    assert response["code"] == "43023"
+
+
+async def test_rate_limits_and_injected_429s():
+    sim = ExchangeSimulator(rate_limits={"market": (1.0, 3.0)})
+    sim.apply_event(START, "AAAUSDT", "ticker", ticker(100.0))
+    statuses = [(await sim.handle("GET", "/api/v2/mix/market/ticker", {"symbol": "AAAUSDT"}))[0] for _ in range(5)]
+    assert statuses == [200, 200, 200, 429, 429] and sim.rate_limited == 2
+    # Other groups have their own budget
+    assert (await sim.handle("GET", "/api/v2/mix/account/accounts", {}))[0] == 200
+
+    flaky = make_simulator(reject_rate=0.5, seed=1)
+    statuses = [(await flaky.handle("GET", "/api/v2/mix/market/tickers", {}))[0] for _ in range(200)]
+    assert 60 < statuses.count(429) < 140
+
+
+async def test_http_server_checks_signatures_and_feeds_hub():
+    sim = make_simulator(api_secret="secret")
+    await sim.start()
+    client = BitgetRestClient("key", "secret", "pass", transport="aiohttp", base_url=sim.base_url, rate_limiter=BitgetRateLimiter())
+    state_manager = MultiSymbolStateManager()
+    hub = MarketDataHub(state_manager, ["AAAUSDT"], channels=("ticker",))
+    hub.WS_URL = sim.ws_url
+    try:
+        assert float((await client.get_ticker("AAAUSDT"))["data"][0]["lastPr"]) == 100.0
+        status, response = await sim.handle(
+            "GET", "/api/v2/mix/market/tickers", {}, {"ACCESS-TIMESTAMP": "1", "ACCESS-SIGN": "forged"}
+        )
+        assert status == 400 and response["code"] == "40009"
+
+        await hub.start()
+        for _ in range(200):
+            state = state_manager.get_state("AAAUSDT")
+            if state is not None and state.last_price == 100.0:
+                break
+            await asyncio.sleep(0.01)
+        sim.apply_event(START + 1000, "AAAUSDT", "ticker", ticker(105.0))
+        for _ in range(200):
+            if state_manager.get_state("AAAUSDT").last_price == 105.0:
+                break
+            await asyncio.sleep(0.01)
+        assert state_manager.get_state("AAAUSDT").last_price == 105.0
+    finally:
+        await hub.stop()
+        await client.close()
+        await sim.stop()
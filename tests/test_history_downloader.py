@@ -0,0 +1,96 @@
+import asyncio
+
+import numpy as np
+
+from bitget_trading.candle_store import CandleStore
+from bitget_trading.history_downloader import HistoryDownloader, missing_ranges, split_windows
+
+MINUTE = 60_000
+NOW_MS = 1_735_689_600_000 + 30 * 59_000  # mid-bar
+
+
+class FakeExchange:
+    def __init__(self, listed_at=0, delay=0.001, fail_after=None):
+        self.listed_at = listed_at
+        self.delay = delay
+        self.fail_after = fail_after
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_historical_candles(self, symbol, granularity, limit, start_time, end_time, history, priority):
+        self.calls.append((start_time, end_time, history))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        if self.fail_after is not None and start_time >= self.fail_after:
+            return {"code": "429", "msg": "Too Many Requests"}
+        first = max(start_time, self.listed_at)
+        times = range(first // MINUTE * MINUTE, end_time + 1, MINUTE)
+        # Newest `limit` bars, newest first like the exchange, plus a duplicate
+        data = [[str(t), "1", "2", "0.5", str(t / 1e12), "10", "10"] for t in reversed(list(times)[-limit:])]
+        return {"code": "00000", "data": data + data[:1]}
+
+
+def test_missing_ranges_and_windows():
+    stored = np.array([0, 1, 2, 5, 6], dtype=np.int64) * MINUTE
+    ranges = missing_ranges(stored, -2 * MINUTE, 9 * MINUTE, MINUTE)
+    assert ranges == [(-2 * MINUTE, -MINUTE), (3 * MINUTE, 4 * MINUTE), (6 * MINUTE, 9 * MINUTE)]
+    assert missing_ranges(stored, 0, 6 * MINUTE, MINUTE, verified_start=5 * MINUTE) == [(6 * MINUTE, 6 * MINUTE)]
+    assert split_windows([(0, 449 * MINUTE)], MINUTE) == [
+        (0, 199 * MINUTE), (200 * MINUTE, 399 * MINUTE), (400 * MINUTE, 449 * MINUTE),
+    ]
+
+
+async def test_first_download_is_concurrent_then_incremental(tmp_path):
+    store = CandleStore(str(tmp_path))
+    exchange = FakeExchange()
+    downloader = HistoryDownloader(exchange, store, concurrency=8)
+
+    result = await downloader.download("BTCUSDT", "1m", days=2, now_ms=NOW_MS)
+    assert result.requests == len(exchange.calls) == 15  # 2880 bars / 200
+    assert exchange.max_in_flight == 8
+    assert result.rows == result.new_bars == 2880 and result.failed == 0
+    assert [history for _, _, history in exchange.calls].count(False) == 1  # only the live window
+
+    timestamps = store.load_arrays("BTCUSDT", "1m")["timestamp"]
+    assert np.all(np.diff(timestamps) == MINUTE) and timestamps[-1] == NOW_MS // MINUTE * MINUTE
+
+    # Five minutes later: one request from the last stored bar
+    exchange.calls.clear()
+    result = await downloader.download("BTCUSDT", "1m", days=2, now_ms=NOW_MS + 5 * MINUTE)
+    assert len(exchange.calls) == 1 and result.new_bars == 5
+    assert exchange.calls[0][0] == timestamps[-1]
+
+
+async def test_gaps_backfilled_and_listing_date_remembered(tmp_path):
+    store = CandleStore(str(tmp_path))
+    listed_at = NOW_MS - 600 * MINUTE
+    exchange = FakeExchange(listed_at=listed_at)
+    downloader = HistoryDownloader(exchange, store)
+    await downloader.download("NEWUSDT", "1m", days=1, now_ms=NOW_MS)
+
+    # Punch a hole into the stored series
+    frame = store.load_frame("NEWUSDT", "1m")
+    store.write("NEWUSDT", "1m", frame.drop(index=range(100, 130)))
+
+    exchange.calls.clear()
+    result = await downloader.download("NEWUSDT", "1m", days=1, now_ms=NOW_MS)
+    assert len(exchange.calls) == 2  # the gap and the tail; nothing before the listing
+    assert result.new_bars == 30
+    assert store.info("NEWUSDT", "1m")["verified_start"] == listed_at // MINUTE * MINUTE
+
+
+async def test_failed_windows_keep_what_arrived(tmp_path):
+    store = CandleStore(str(tmp_path))
+    exchange = FakeExchange(fail_after=NOW_MS - 100 * MINUTE)
+    result = await HistoryDownloader(exchange, store).download("BTCUSDT", "1m", days=1, now_ms=NOW_MS)
+
+    assert result.failed == 1 and result.rows == 1400
+    assert "verified_start" not in store.info("BTCUSDT", "1m")
+
+    exchange.fail_after = None
+    exchange.calls.clear()
+    result = await HistoryDownloader(exchange, store).download("BTCUSDT", "1m", days=1, now_ms=NOW_MS)
+    assert len(exchange.calls) == 1 and result.rows == 1440
@@ -0,0 +1,110 @@
+import pandas as pd
+
+from backtest_engine import BacktestEngine
+from backtest_engine_multi import MultiPositionBacktestEngine
+from backtest_helpers import make_candles, make_strategy
+from bitget_trading.indicator_cache import IndicatorCache, params_key
+
+
+def test_engine_signals_match_per_bar():
+    df = make_candles(1, 400)
+    engine = BacktestEngine(make_strategy(7))
+    directions, scores = engine.calculate_signals(df)
+
+    for idx in range(len(df)):
+        direction, score = engine.calculate_signal(df, idx)
+        assert directions[idx] == {"long": 1, "short": -1, "neutral": 0}[direction]
+        if direction != "neutral":
+            assert scores[idx] == score
+
+
+
+def test_engine_custom_signal_override_is_honoured(tmp_path):
+    df = make_candles(3, 600)
+    strategy = make_strategy(7)
+    cache = IndicatorCache(str(tmp_path))
+
+    # An override returning the built-in signals reproduces the precomputed run
+    engine = BacktestEngine(strategy, indicator_cache=cache)
+    engine.calculate_signal = type(engine).calculate_signal.__get__(engine)
+    per_bar = engine.run_backtest(df, "TESTUSDT")
+    builtin = BacktestEngine(strategy).run_backtest(df, "TESTUSDT")
+    assert len(builtin.trades) > 0
+    assert per_bar.trades == builtin.trades and per_bar.final_capital == builtin.final_capital
+    assert cache.stats["computed"] == 0
+
+    def contrarian(df, idx):
+        direction, score = BacktestEngine.calculate_signal(engine, df, idx)
+        return {"long": "short", "short": "long"}.get(direction, direction), score
+
+    engine.calculate_signal = contrarian
+    assert engine.run_backtest(df, "TESTUSDT").trades != builtin.trades
+
+    class ContrarianEngine(BacktestEngine):
+        def calculate_signal(self, df, idx):
+            return contrarian(df, idx)
+
+    subclassed = ContrarianEngine(strategy, indicator_cache=cache).run_backtest(df, "TESTUSDT")
+    assert subclassed.trades == engine.run_backtest(df, "TESTUSDT").trades != builtin.trades
+
+
+def test_sweep_computes_each_indicator_once(tmp_path):
+    df = make_candles(2, 1000)
+    cache = IndicatorCache(str(tmp_path))
+    strategies = [make_strategy(i, volume_ratio=1 + i / 10, confluence_required=2 + i % 2) for i in range(10)]
+
+    for strategy in strategies:
+        cached = BacktestEngine(strategy, indicator_cache=cache).run_backtest(df, "TESTUSDT")
+        plain = BacktestEngine(strategy).run_backtest(df, "TESTUSDT")
+        assert cached.trades == plain.trades and cached.final_capital == plain.final_capital
+    assert cache.stats["computed"] == 1 and cache.stats["memory_hits"] == 9
+
+    # Another process: served from disk, memory-mapped
+    other = IndicatorCache(str(tmp_path))
+    engine = MultiPositionBacktestEngine(strategies[0], indicator_cache=other)
+    expected = MultiPositionBacktestEngine(strategies[0]).run_backtest_vectorized(df, "TESTUSDT")
+    assert engine.run_backtest_vectorized(df, "TESTUSDT").trades == expected.trades
+    assert other.stats == {"memory_hits": 0, "disk_hits": 1, "computed": 0}
+
+
+def test_changed_data_gets_new_entry(tmp_path):
+    df = make_candles(3, 300)
+    cache = IndicatorCache(str(tmp_path))
+    engine = MultiPositionBacktestEngine(make_strategy(46, entry_threshold=0.8), indicator_cache=cache)
+    engine.run_backtest_vectorized(df, "TESTUSDT")
+    assert len(list(tmp_path.glob("TESTUSDT_holy_grail_adx_*@*"))) == 1
+
+    updated = pd.concat([df, make_candles(4, 1).assign(timestamp=df["timestamp"].iloc[-1] + 60_000)], ignore_index=True)
+    engine.run_backtest_vectorized(updated, "TESTUSDT")
+    assert cache.stats["computed"] == 2
+    assert len(list(tmp_path.glob("TESTUSDT_holy_grail_adx_*@*"))) == 2
+
+
+def test_alternating_windows_do_not_evict_each_other(tmp_path):
+    df = make_candles(5, 600)
+    windows = [df.iloc[:300], df.iloc[300:], df.iloc[100:400]]
+    strategy = make_strategy(46, entry_threshold=0.8)
+    pattern = "TESTUSDT_holy_grail_adx_*@*"
+
+    # Train/test windows of one symbol: each process computes each window once
+    for _ in range(3):
+        cache = IndicatorCache(str(tmp_path), max_versions=2)
+        for window in windows[:2]:
+            MultiPositionBacktestEngine(strategy, indicator_cache=cache).run_backtest_vectorized(window, "TESTUSDT")
+    assert cache.stats["computed"] == 0 and cache.stats["disk_hits"] == 2
+    assert len(list(tmp_path.glob(pattern))) == 2
+
+    # A third window evicts the least recently used one
+    cache = IndicatorCache(str(tmp_path), max_versions=2)
+    for window in (windows[1], windows[2]):
+        MultiPositionBacktestEngine(strategy, indicator_cache=cache).run_backtest_vectorized(window, "TESTUSDT")
+    assert len(list(tmp_path.glob(pattern))) == 2
+    cache = IndicatorCache(str(tmp_path), max_versions=2)
+    MultiPositionBacktestEngine(strategy, indicator_cache=cache).run_backtest_vectorized(windows[1], "TESTUSDT")
+    MultiPositionBacktestEngine(strategy, indicator_cache=cache).run_backtest_vectorized(windows[0], "TESTUSDT")
+    assert cache.stats == {"memory_hits": 0, "disk_hits": 1, "computed": 1}
+
+
+def test_params_key_is_unambiguous():
+    assert params_key({"a1": 2}) != params_key({"a": 12})
+    assert params_key({"window": 21}) == "window=21"
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest_helpers import make_candles
+from ml_feature_engineering import _ewm_series, calculate_all_features, calculate_latest_features, get_feature_list
+
+
+@pytest.mark.parametrize("n", [1, 63, 64, 65, 3000])
+def test_ewm_series_matches_pandas(n):
+    x = make_candles(n, n)["close"].to_numpy()
+    for span in (2, 9, 12, 26):
+        expected = pd.Series(x).ewm(span=span).mean().to_numpy()
+        np.testing.assert_allclose(_ewm_series(x, span), expected, rtol=1e-12)
+
+
+def latest_from(df: pd.DataFrame):
+    return calculate_latest_features(
+        df["open"].to_numpy(),
+        df["high"].to_numpy(),
+        df["low"].to_numpy(),
+        df["close"].to_numpy(),
+        df["volume"].to_numpy(),
+        index_value=df.index[-1],
+    )
+
+
+@pytest.mark.parametrize("seed,n", [(0, 200), (1, 200), (2, 500), (3, 1500)])
+def test_latest_features_match_full_pipeline(seed, n):
+    df = make_candles(seed, n, interval_ms=300_000)
+    expected = calculate_all_features(df.copy()).iloc[-1]
+
+    latest = latest_from(df)
+
+    assert latest is not None
+    assert set(latest) == set(get_feature_list())
+    for name in get_feature_list():
+        assert latest[name] == pytest.approx(expected[name], rel=1e-9, abs=1e-9), name
+
+
+def test_latest_features_time_features_follow_index():
+    df = make_candles(4, 250, interval_ms=300_000)
+    df.index = pd.to_datetime(df["timestamp"], unit="ms")
+
+    expected = calculate_all_features(df.copy()).iloc[-1]
+    latest = latest_from(df)
+
+    for name in ("hour", "day_of_week", "hour_sin", "hour_cos"):
+        assert latest[name] == pytest.approx(expected[name])
+
+
+def test_latest_features_none_when_last_row_is_dropped():
+    df = make_candles(5, 250, interval_ms=300_000)
+    assert latest_from(df.iloc[:199]) is None
+
+    # Flat volume window -> 0/0 volume ratio on the last row
+    df.loc[df.index[-20:], "volume"] = 0.0
+    assert latest_from(df) is None
+
+
+class FakeBooster:
+    """Stand-in for lgb.Booster: P(long) is a fixed function of one feature."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, X, num_iteration=None):
+        self.calls += 1
+        return 1.0 / (1.0 + np.exp(-X[:, 0] * 200.0))
+
+
+def test_predict_batch_matches_predict():
+    pytest.importorskip("lightgbm")
+    from lightgbm_live_predictor import LightGBMLivePredictor
+
+    predictor = LightGBMLivePredictor()
+    booster = FakeBooster()
+    histories = {}
+    for i in range(6):
+        symbol = f"SYM{i}USDT"
+        predictor.models[symbol] = booster
+        predictor.features[symbol] = ["return_5", "rsi_14", "macd_hist"]
+        predictor.loaded_symbols.add(symbol)
+        histories[symbol] = make_candles(10 + i, 200, interval_ms=300_000).to_dict("records")
+
+    batch = predictor.predict_batch(histories, confidence_threshold=0.55)
+
+    # One shared model and schema -> a single predict call
+    assert booster.calls == 1
+    for symbol, candles in histories.items():
+        direction, confidence, probability = predictor.predict(
+            symbol, pd.DataFrame(candles), confidence_threshold=0.55
+        )
+        assert batch.get(symbol)[0] == direction
+        assert batch.get(symbol)[1] == pytest.approx(confidence, rel=1e-9)
+        assert batch.get(symbol)[2] == pytest.approx(probability, rel=1e-9)
+
+    # Unchanged histories reuse the cached feature rows
+    again = predictor.predict_batch(histories, confidence_threshold=0.55)
+    assert list(again.direction) == list(batch.direction)
@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+from bitget_trading.contract_catalog import ContractCatalog
+from bitget_trading.leverage_bootstrap import LeverageBootstrap, is_leverage_not_supported
+from bitget_trading.leverage_cache import LeverageCache
+
+CONTRACTS = [
+    {"symbol": "BTCUSDT", "maxLeverage": "125", "symbolStatus": "normal"},
+    {"symbol": "ETHUSDT", "maxLeverage": "100", "symbolStatus": "normal"},
+    {"symbol": "LOWUSDT", "maxLeverage": "10", "symbolStatus": "normal"},
+    {"symbol": "NEWUSDT", "maxLeverage": "50", "symbolStatus": "normal"},
+]
+
+
+class FakeClient:
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.contract_catalog = ContractCatalog(self._contracts, snapshot_path=None)
+
+    async def _contracts(self, product_type):
+        return CONTRACTS
+
+    async def get_all_positions(self):
+        return [{"symbol": "ETHUSDT", "holdSide": "long", "leverage": "25"}]
+
+    async def set_leverage(self, symbol, leverage, hold_side):
+        self.calls.append((symbol, hold_side))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        if symbol == "NEWUSDT" and hold_side == "short":
+            raise Exception('API error: 400 - {"code":"40797","msg":"Exceeded the maximum settable leverage"}')
+        return {"code": "00000"}
+
+
+async def test_only_missing_pairs_are_set_concurrently(tmp_path):
+    cache_file = tmp_path / "leverage_cache.json"
+    cache = LeverageCache(str(cache_file))
+    cache.mark_set("BTCUSDT", 25, "long")
+    client = FakeClient()
+    await client.contract_catalog.refresh()
+    bootstrap = LeverageBootstrap(client, cache, leverage=25, concurrency=3)
+
+    ready = await bootstrap.start(["BTCUSDT", "ETHUSDT", "LOWUSDT", "NEWUSDT"])
+
+    # LOWUSDT can never be set to 25x: settled without a request
+    assert ready == ["LOWUSDT"]
+    assert not bootstrap.is_ready("BTCUSDT")
+
+    stats = await bootstrap.wait()
+    assert sorted(client.calls) == [
+        ("BTCUSDT", "short"), ("ETHUSDT", "short"), ("NEWUSDT", "long"), ("NEWUSDT", "short"),
+    ]
+    assert client.max_in_flight == 3
+    assert all(bootstrap.is_ready(s) for s in ["BTCUSDT", "ETHUSDT", "NEWUSDT"])
+    assert stats["cached"] == 1 and stats["from_positions"] == 1 and stats["over_max"] == 2
+    assert stats["set"] == 3 and stats["failed"] == 1
+
+    on_disk = json.loads(cache_file.read_text())
+    assert on_disk["NEWUSDT_short"]["failed"] is True
+    assert on_disk["ETHUSDT_long"]["leverage"] == 25
+    assert len(on_disk) == 8
+
+
+async def test_second_start_sends_nothing(tmp_path):
+    cache_file = tmp_path / "leverage_cache.json"
+    client = FakeClient(delay=0)
+    await client.contract_catalog.refresh()
+    first = LeverageBootstrap(client, LeverageCache(str(cache_file)), leverage=25)
+    await first.start(["BTCUSDT", "NEWUSDT"])
+    await first.wait()
+    calls = len(client.calls)
+
+    second = LeverageBootstrap(client, LeverageCache(str(cache_file)), leverage=25)
+    assert await second.start(["BTCUSDT", "NEWUSDT"]) == ["BTCUSDT", "NEWUSDT"]
+    await second.wait()
+    assert len(client.calls) == calls
+
+
+def test_not_supported_classification():
+    assert is_leverage_not_supported({"code": "40797", "msg": ""})
+    assert is_leverage_not_supported(Exception("Exceeded the maximum settable leverage"))
+    assert not is_leverage_not_supported(TimeoutError("read timeout"))
+    assert not is_leverage_not_supported({"code": "40001", "msg": "signature error"})
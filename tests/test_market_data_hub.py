@@ -0,0 +1,96 @@
+import asyncio
+
+import orjson
+import pytest
+
+from bitget_trading.market_data_hub import MarketDataHub
+from bitget_trading.multi_symbol_state import MultiSymbolStateManager
+
+
+@pytest.fixture
+def hub():
+    manager = MultiSymbolStateManager()
+    return MarketDataHub(
+        state_manager=manager,
+        symbols=[f"SYM{i}USDT" for i in range(120)],
+        max_channels_per_connection=100,
+    )
+
+
+def test_shards_respect_channel_limit(hub):
+    # 120 symbols x 2 channels = 240 subscriptions -> 3 connections
+    assert len(hub.shards) == 3
+    assert all(len(shard) <= 100 for shard in hub.shards)
+    assert sum(len(shard) for shard in hub.shards) == 240
+
+
+def test_ticker_message_updates_state(hub):
+    updates = []
+    hub.on_update = lambda symbol, channel: updates.append((symbol, channel))
+
+    message = orjson.dumps({
+        "action": "snapshot",
+        "arg": {"instType": "USDT-FUTURES", "channel": "ticker", "instId": "SYM1USDT"},
+        "data": [{"instId": "SYM1USDT", "lastPr": "100.5", "bidPr": "100.4", "askPr": "100.6",
+                  "baseVolume": "1234", "fundingRate": "0.0001", "ts": "1700000000000"}],
+    })
+    hub._handle_message(message)
+
+    state = hub.state_manager.get_state("SYM1USDT")
+    assert state.last_price == 100.5
+    assert state.mid_price == pytest.approx(100.5)
+    assert updates == [("SYM1USDT", "ticker")]
+    assert hub.get_staleness("SYM1USDT") < 1.0
+    assert hub.get_staleness("SYM2USDT") == float("inf")
+
+
+def test_books_message_updates_orderbook(hub):
+    message = orjson.dumps({
+        "action": "snapshot",
+        "arg": {"instType": "USDT-FUTURES", "channel": "books5", "instId": "SYM2USDT"},
+        "data": [{"bids": [["99.9", "3"], ["99.8", "1"]], "asks": [["100.1", "1"]], "ts": "1700000000000"}],
+    })
+    hub._handle_message(message)
+
+    state = hub.state_manager.get_state("SYM2USDT")
+    assert state.total_bid_depth == 4.0
+    assert state.total_ask_depth == 1.0
+    assert state.ob_imbalance == pytest.approx(0.6)
+
+
+def test_control_messages_are_ignored(hub):
+    hub._handle_message("pong")
+    hub._handle_message(orjson.dumps({"event": "subscribe", "arg": {"channel": "ticker"}}))
+    assert hub.messages_received == 0
+    assert not hub.is_live()
+
+
+async def test_resync_waits_for_snapshot():
+    sent = []
+
+    class FakeSocket:
+        async def send(self, message):
+            sent.append(orjson.loads(message)["op"])
+
+    hub = MarketDataHub(MultiSymbolStateManager(), ["SYM1USDT"], channels=("books",))
+    hub._sockets[0] = FakeSocket()
+
+    def push(action, data):
+        hub._handle_message(orjson.dumps({
+            "action": action,
+            "arg": {"instType": "USDT-FUTURES", "channel": "books", "instId": "SYM1USDT"},
+            "data": [data],
+        }))
+
+    push("snapshot", {"bids": [["99.9", "3"]], "asks": [["100.1", "1"]], "seq": 1})
+    push("update", {"bids": [["99.9", "2"]], "seq": 2, "checksum": 12345})
+    await asyncio.sleep(0)
+    assert sent == ["unsubscribe", "subscribe"] and hub._resyncing == {"SYM1USDT"}
+
+    # Updates still in flight before the new snapshot don't resubscribe again
+    push("update", {"bids": [["99.8", "1"]], "seq": 3})
+    await asyncio.sleep(0)
+    assert sent == ["unsubscribe", "subscribe"]
+
+    push("snapshot", {"bids": [["99.9", "2"]], "asks": [["100.1", "1"]], "seq": 4})
+    assert not hub._resyncing and not hub.order_books.resync_needed
@@ -0,0 +1,131 @@
+import time
+import types
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from backtest_helpers import make_candles
+from bitget_trading import event_scheduler, tick_recorder
+from bitget_trading.candle_store import CandleStore
+from bitget_trading.event_scheduler import EventScheduler
+from bitget_trading.market_replay import MarketReplay, ReplayClock, ReplayExchange, candle_events, tick_events
+from bitget_trading.multi_symbol_state import MultiSymbolStateManager
+from bitget_trading.position_manager import PositionManager
+from bitget_trading.tick_recorder import DAY_MS, TickRecorder, read_ticks
+
+START = 1_767_225_600_000  # 2026-01-01 00:00 UTC
+
+
+def make_store(tmp_path, symbols=("AAAUSDT", "BBBUSDT"), bars=120) -> CandleStore:
+    """Bars from an hour before START on; bar 60 opens the replay window."""
+    store = CandleStore(str(tmp_path / "candles"))
+    for i, symbol in enumerate(symbols):
+        store.write(symbol, "1m", make_candles(i, bars, start_ms=START - 60 * 60_000))
+    return store
+
+
+def test_clock_install_patches_and_restores():
+    module = types.ModuleType("clocked")
+    module.time = time
+    module.datetime = datetime
+    clock = ReplayClock(START)
+
+    with clock.install(module):
+        assert module.time.time() == START / 1000
+        clock.advance_to(START + 5_000)
+        assert module.time.monotonic() == START / 1000 + 5
+        assert module.datetime.now().timestamp() == START / 1000 + 5
+        assert module.time.perf_counter() > 0  # everything else is real
+        clock.advance_to(START)  # never goes back
+        assert module.time.time() == START / 1000 + 5
+
+    assert module.time is time and module.datetime is datetime
+
+
+def test_candle_events_are_ordered_and_causal(tmp_path):
+    store = make_store(tmp_path)
+    chunks = list(candle_events(store, ["AAAUSDT", "BBBUSDT"], START, START + 10 * 60_000 - 1, chunk_ms=300_000))
+    events = [event for chunk in chunks for event in chunk]
+
+    assert len(chunks) == 2 and len(events) == 2 * 10 * 4
+    timestamps = [ts for ts, _, _, _ in events]
+    assert timestamps == sorted(timestamps)
+
+    bars = store.load_frame("AAAUSDT", "1m")
+    bar = bars.iloc[60]
+    first_bar = [e for e in events if e[1] == "AAAUSDT"][:4]
+    assert [ts - START for ts, _, _, _ in first_bar] == [0, 15_000, 30_000, 45_000]
+    # Open, the extreme against the bar's direction, the other extreme, close
+    extremes = [bar["low"], bar["high"]] if bar["close"] >= bar["open"] else [bar["high"], bar["low"]]
+    assert [e[3]["last_price"] for e in first_bar] == [bar["open"], *extremes, bar["close"]]
+    assert first_bar[0][3]["bid_price"] < bar["open"] < first_bar[0][3]["ask_price"]
+    # The hour before the window plus this bar
+    assert first_bar[0][3]["volume_24h"] == pytest.approx(bars["volume"].iloc[:61].sum())
+
+
+async def test_replay_drives_state_and_exchange(tmp_path):
+    store = make_store(tmp_path)
+    clock = ReplayClock(START)
+    state_manager = MultiSymbolStateManager()
+    positions = PositionManager(save_path=str(tmp_path / "positions.json"))
+
+    with clock.install(event_scheduler):
+        scheduler = EventScheduler(rank_min_interval_sec=1.0, rank_max_interval_sec=30.0)
+        events = candle_events(store, ["AAAUSDT", "BBBUSDT"], START, START + 30 * 60_000 - 1)
+        replay = MarketReplay(state_manager, events, clock, scheduler=scheduler)
+        seen = []
+        replay.on_update = lambda symbol, channel: (seen.append(symbol), scheduler.mark_dirty(symbol, channel))
+        exchange = ReplayExchange(replay, store, positions, initial_balance=50.0)
+        await replay.run()
+
+    aaa, bbb = store.load_frame("AAAUSDT", "1m"), store.load_frame("BBBUSDT", "1m")
+    assert replay.events_applied == len(seen) == 2 * 30 * 4
+    assert clock.now_ms >= START + 29 * 60_000 + 45_000
+    last_close = aaa["close"].iloc[89]  # close of the last replayed bar
+    assert state_manager.get_state("AAAUSDT").last_price == last_close
+
+    ticker = (await exchange.get_ticker("BBBUSDT"))["data"][0]
+    assert float(ticker["lastPr"]) == pytest.approx(bbb["close"].iloc[89])
+
+    # Only bars closed by the replay clock; 5m is resampled from 1m
+    candles = (await exchange.get_historical_candles("AAAUSDT", "1m", 200))["data"]
+    assert int(candles[-1][0]) + 60_000 <= clock.now_ms and len(candles) == 89
+    five = (await exchange.get_historical_candles("AAAUSDT", "5m", 3))["data"]
+    assert [int(c[0]) for c in five] == [START + m * 60_000 for m in (10, 15, 20)]
+    assert float(five[-1][1]) == pytest.approx(aaa["open"].iloc[80])
+    assert float(five[-1][4]) == pytest.approx(aaa["close"].iloc[84])
+    assert float(five[-1][5]) == pytest.approx(aaa["volume"].iloc[80:85].sum())
+
+    entry = last_close - 0.5
+    positions.add_position("AAAUSDT", "long", entry, 1.0, entry / 25, leverage=25)
+    account = (await exchange.get_account_balance())["data"][0]
+    assert float(account["unrealizedPL"]) == pytest.approx(0.5)
+    assert float(account["available"]) == pytest.approx(50.0 - entry / 25)
+    position = (await exchange._request("GET", "/api/v2/mix/position/all-position"))["data"][0]
+    assert float(position["liquidationPrice"]) == pytest.approx(entry * (1 - 1 / 25))
+    assert (await exchange._request("POST", "/api/v2/mix/order/place-order"))["code"] != "00000"
+
+
+def test_tick_events_decompress_each_day_once(tmp_path, monkeypatch):
+    recorder = TickRecorder(str(tmp_path), compress_closed=False)
+    timestamps = START + DAY_MS - 3_600_000 + 5_000 * np.arange(1440)  # 2h across midnight
+    for i, ts in enumerate(timestamps.tolist()):
+        for symbol in ("AAAUSDT", "BBBUSDT"):
+            recorder.record(symbol, "ticker", "snapshot", [{"instId": symbol, "ts": str(ts), "lastPr": str(100 + i)}])
+            recorder.record(symbol, "books", "update", [{"ts": str(ts), "seq": i, "bids": [["99", "1"]], "asks": []}])
+    recorder.close()
+    recorder.compress_closed_days(now_ms=START + 2 * DAY_MS)
+
+    decompressions = []
+    decompress = tick_recorder.gzip.decompress
+    monkeypatch.setattr(tick_recorder.gzip, "decompress", lambda data: decompressions.append(1) or decompress(data))
+    chunks = list(tick_events(str(tmp_path), ["AAAUSDT", "BBBUSDT"], int(timestamps[0]), int(timestamps[-1]),
+                              chunk_ms=60_000))
+
+    assert len(chunks) == 120
+    assert len(decompressions) == 4  # ticker and book of both symbols on the closed day
+    events = [event for chunk in chunks for event in chunk]
+    assert len(events) == 2 * 2 * len(timestamps)
+    aaa = [e[3]["last_price"] for e in events if e[1] == "AAAUSDT" and e[2] == "ticker"]
+    assert aaa == read_ticks(tmp_path, "AAAUSDT", "ticker")["last"].tolist()
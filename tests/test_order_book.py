@@ -0,0 +1,154 @@
+import time
+
+import numpy as np
+import orjson
+import pytest
+
+from bitget_trading.bitget_ws import BitgetWebSocketClient
+from bitget_trading.config import TradingConfig
+from bitget_trading.features import MicrostructureFeatures
+from bitget_trading.order_book import OrderBook, OrderBookEngine, book_checksum
+
+
+def levels(prices, sizes):
+    return [[f"{p:.1f}", f"{s:g}"] for p, s in zip(prices, sizes)]
+
+
+def checksum_of(bids, asks):
+    raw = lambda side, i: np.array([level[i] for level in side], dtype="S")
+    return book_checksum(raw(bids, 0), raw(bids, 1), raw(asks, 0), raw(asks, 1))
+
+
+def test_snapshot_and_updates_track_reference_book():
+    rng = np.random.default_rng(0)
+    ref = {"bid": {}, "ask": {}}
+    book = OrderBook("BTCUSDT", max_levels=1000)
+
+    snap_bids = levels(np.arange(999.0, 969.0, -1), rng.integers(1, 9, 30))
+    snap_asks = levels(np.arange(1001.0, 1031.0), rng.integers(1, 9, 30))
+    for side, lv in (("bid", snap_bids), ("ask", snap_asks)):
+        ref[side] = {p: s for p, s in lv}
+    assert book.apply("snapshot", {"bids": snap_bids, "asks": snap_asks, "seq": 1, "ts": "1",
+                                   "checksum": checksum_of(snap_bids, snap_asks)})
+
+    for seq in range(2, 200):
+        update = {"seq": seq, "ts": str(seq)}
+        for side, base, step in (("bid", 999.0, -1), ("ask", 1001.0, 1)):
+            prices = base + step * rng.integers(0, 40, 4)
+            sizes = rng.integers(0, 9, 4)  # 0 deletes
+            update[side + "s"] = levels(prices, sizes)
+            for p, s in update[side + "s"]:
+                if s == "0":
+                    ref[side].pop(p, None)
+                else:
+                    ref[side][p] = s
+        expected_bids = sorted(ref["bid"].items(), key=lambda kv: -float(kv[0]))
+        expected_asks = sorted(ref["ask"].items(), key=lambda kv: float(kv[0]))
+        update["checksum"] = checksum_of(expected_bids, expected_asks)
+        assert book.apply("update", update)
+
+    assert book.levels("bid", 3) == [[float(p), float(s)] for p, s in expected_bids[:3]]
+    assert book.best_ask == float(expected_asks[0][0])
+    assert book.depth("ask") == sum(float(s) for _, s in expected_asks)
+    assert not book.apply("update", {"seq": 5, "bids": [["999.0", "100"]]})  # stale
+
+
+def test_checksum_mismatch_requests_resync():
+    engine = OrderBookEngine()
+    bids, asks = [["99.9", "3"], ["99.8", "1"]], [["100.1", "1"]]
+    assert engine.apply("ETHUSDT", "snapshot", {"bids": bids, "asks": asks, "seq": 1,
+                                                "checksum": checksum_of(bids, asks)})
+    assert engine.apply("ETHUSDT", "update", {"bids": [["99.9", "2"]], "seq": 2, "checksum": 12345}) is None
+    assert engine.resync_needed == {"ETHUSDT"} and engine.checksum_failures == 1
+    assert not engine.get("ETHUSDT").synced
+    assert engine.apply("ETHUSDT", "update", {"bids": [["99.9", "2"]], "seq": 3}) is None  # waits for snapshot
+
+    assert engine.apply("ETHUSDT", "snapshot", {"bids": bids, "asks": asks, "seq": 4})
+    assert engine.resync_needed == set()
+
+
+def test_truncated_book_skips_checksum():
+    bids = levels(100.0 - np.arange(30) * 0.1, np.ones(30))
+    asks = levels(100.1 + np.arange(30) * 0.1, np.ones(30))
+    checksum = checksum_of(bids, asks)
+
+    book = OrderBook("BTCUSDT", max_levels=10)  # can never reproduce a 25-level checksum
+    assert book.apply("snapshot", {"bids": bids, "asks": asks, "seq": 1, "checksum": checksum})
+    assert book.synced and len(book.bids) == 10
+
+    with pytest.raises(ValueError, match="ORDER_BOOK_MAX_LEVELS"):
+        TradingConfig(WS_BOOK_CHANNEL="books", ORDER_BOOK_MAX_LEVELS=10)
+    assert TradingConfig(WS_BOOK_CHANNEL="books15", ORDER_BOOK_MAX_LEVELS=10).order_book_max_levels == 10
+
+
+def test_book_features_match_snapshot_features():
+    rng = np.random.default_rng(1)
+    sizes = rng.uniform(1, 50, (2, 39)).round(1)
+    bids = [[f"{100.0 - 0.01 * i - 0.005:.3f}", f"{s:g}"] for i, s in enumerate(sizes[0], 1)]
+    asks = [[f"{100.0 + 0.01 * i + 0.005:.3f}", f"{s:g}"] for i, s in enumerate(sizes[1], 1)]
+    ticker = {"last_price": 100.0, "volume_24h": 1.0}
+
+    from_dict = MicrostructureFeatures()
+    from_dict.update_ticker(ticker)
+    from_dict.update_orderbook({"bids": [[float(p), float(s)] for p, s in bids],
+                                "asks": [[float(p), float(s)] for p, s in asks], "timestamp": 1})
+
+    book = OrderBook("X")
+    book.apply("snapshot", {"bids": bids, "asks": asks, "ts": "1"})
+    from_book = MicrostructureFeatures()
+    from_book.update_ticker(ticker)
+    from_book.update_book(book)
+
+    expected, actual = from_dict.compute_features(), from_book.compute_features()
+    assert expected.keys() == actual.keys()
+    for key, value in expected.items():
+        assert actual[key] == pytest.approx(value), key
+
+
+
+async def test_ws_client_feeds_live_book_into_features():
+    client = BitgetWebSocketClient("BTCUSDT")
+    features = MicrostructureFeatures()
+    features.update_ticker({"last_price": 100.0, "volume_24h": 1.0})
+    client.on_book = features.update_book
+
+    def push(action, bids, asks, ts):
+        data = {"bids": bids, "asks": asks, "ts": str(ts)}
+        return orjson.dumps({"action": action, "arg": {"channel": "books"}, "data": [data]}).decode()
+
+    await client._handle_message(push("snapshot", [["99.9", "2"], ["99.8", "3"]], [["100.1", "1"], ["100.2", "4"]], 1))
+    await client._handle_message(push("update", [["99.95", "5"], ["99.8", "0"]], [], 2))
+
+    assert features.book is client.order_books.get("BTCUSDT")
+    result = features.compute_features()
+    assert result["best_bid"] == 99.95 and result["best_ask"] == 100.1
+    assert result["depth_total_bid"] == 7.0
+
+def test_engine_sustains_many_symbols():
+    rng = np.random.default_rng(2)
+    engine = OrderBookEngine(max_levels=200)
+    symbols = [f"S{i}USDT" for i in range(300)]
+    for symbol in symbols:
+        engine.apply(symbol, "snapshot", {
+            "bids": levels(np.arange(999.0, 799.0, -1), rng.integers(1, 9, 200)),
+            "asks": levels(np.arange(1001.0, 1201.0), rng.integers(1, 9, 200)),
+            "seq": 1,
+        })
+    messages = [
+        orjson.loads(orjson.dumps({
+            "seq": seq,
+            "bids": levels(999.0 - rng.integers(0, 250, 5), rng.integers(0, 9, 5)),
+            "asks": levels(1001.0 + rng.integers(0, 250, 5), rng.integers(0, 9, 5)),
+        }))
+        for seq in range(2, 12)
+    ]
+
+    started = time.perf_counter()
+    for message in messages:
+        for symbol in symbols:
+            book = engine.apply(symbol, "update", message)
+            book.imbalance(bps=10.0)
+    rate = len(messages) * len(symbols) / (time.perf_counter() - started)
+
+    assert rate > 2000  # updates/s on one core
+    assert all(len(b.bids) <= 200 and len(b.asks) <= 200 for b in engine.books.values())
@@ -0,0 +1,91 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from bitget_trading.parallel_processor import ParallelProcessor, get_shared_prices
+
+
+def last_price(symbol: str) -> float:
+    prices = get_shared_prices(symbol)
+    if symbol == "FAILUSDT":
+        raise ValueError("boom")
+    return float(prices[-1]) if len(prices) else -1.0
+
+
+@pytest.fixture
+def processor():
+    processor = ParallelProcessor(max_workers=2, price_capacity=100)
+    yield processor
+    processor.shutdown()
+
+
+def test_workers_read_published_prices(processor):
+    histories = {f"S{i}": np.arange(i, i + 150, dtype=float) for i in range(10)}
+    processor.publish_prices(histories)
+
+    results = processor.map_symbols(list(histories) + ["MISSING"], last_price, chunk_size=3)
+
+    assert results == {**{s: float(p[-1]) for s, p in histories.items()}, "MISSING": -1.0}
+    assert processor._store.lengths[0] == 100  # truncated to capacity
+
+
+def test_pool_is_reused_and_republish_is_visible(processor):
+    processor.publish_prices({f"S{i}": np.array([1.0]) for i in range(5)})
+    first = processor.compute_features_parallel([f"S{i}" for i in range(5)], last_price)
+    executor = processor._executor
+
+    processor.publish_prices({f"S{i}": np.array([2.0]) for i in range(5)})
+    second = processor.compute_features_parallel([f"S{i}" for i in range(5)], last_price)
+
+    assert set(first.values()) == {1.0}
+    assert set(second.values()) == {2.0}
+    assert processor._executor is executor
+
+
+def test_task_errors_are_isolated(processor):
+    processor.publish_prices({"A": np.array([1.0]), "FAILUSDT": np.array([1.0])})
+
+    ranked = processor.map_symbols(["A", "FAILUSDT", "B", "C"], last_price, chunk_size=4)
+
+    assert ranked == {"A": 1.0, "B": -1.0, "C": -1.0}
+
+
+def slow_last_price(symbol: str) -> float:
+    if symbol == "SLOWUSDT":
+        time.sleep(60)
+    return last_price(symbol)
+
+
+def process_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_deadline_covers_whole_batch_and_recycles_pool(processor):
+    symbols = [f"S{i}" for i in range(6)] + ["SLOWUSDT"]
+    processor.publish_prices({symbol: np.array([1.0]) for symbol in symbols})
+    processor.map_symbols(symbols[:2], last_price)
+    executor = processor._executor
+    pids = processor._pool_pids()
+    assert len(pids) == 2
+
+    start = time.monotonic()
+    results = processor.map_symbols(symbols, slow_last_price, timeout=1.0, chunk_size=1)
+
+    assert time.monotonic() - start < 5.0
+    assert results == {symbol: 1.0 for symbol in symbols[:6]}
+    assert processor._executor is None
+    for pid in pids:  # the stuck worker is killed, not left running
+        deadline = time.monotonic() + 5.0
+        while process_exists(pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not process_exists(pid)
+
+    # The next batch runs on a fresh pool
+    assert processor.map_symbols(symbols[:6], last_price) == {symbol: 1.0 for symbol in symbols[:6]}
+    assert processor._executor is not executor
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import threading
+
+from bitget_trading.position_manager import PositionManager
+
+
+def open_btc(manager: PositionManager) -> None:
+    manager.add_position("BTCUSDT", "long", 30000.0, 0.01, 50.0, 50)
+
+
+async def test_price_updates_are_coalesced(tmp_path):
+    manager = PositionManager(save_path=str(tmp_path / "positions.json"), flush_interval_ms=20)
+    persister = asyncio.create_task(manager.run_persister())
+    await asyncio.sleep(0)
+    writes = []
+    write_snapshot = manager._write_snapshot
+    manager._write_snapshot = lambda payload: (writes.append(payload), write_snapshot(payload))
+
+    open_btc(manager)
+    await asyncio.sleep(0.01)
+    assert len(writes) == 1  # open is flushed immediately
+
+    for i in range(1000):
+        manager.update_position_price("BTCUSDT", 30000.0 + i)
+    assert len(writes) == 1  # no I/O on the hot path
+    await asyncio.sleep(0.05)
+    assert len(writes) == 2
+
+    saved = json.loads((tmp_path / "positions.json").read_text())
+    assert saved["positions"]["BTCUSDT"]["highest_price"] == 30999.0
+    assert not manager.journal_path.exists()
+
+    persister.cancel()
+    await asyncio.gather(persister, return_exceptions=True)
+
+
+async def test_cancel_during_write_flushes_latest_state(tmp_path):
+    manager = PositionManager(save_path=str(tmp_path / "positions.json"), flush_interval_ms=1000)
+    persister = asyncio.create_task(manager.run_persister())
+    await asyncio.sleep(0)
+    writing, release = threading.Event(), threading.Event()
+    active, overlaps = [], []
+    write_snapshot = manager._write_snapshot
+
+    def slow_write(payload: str) -> None:
+        if active:
+            overlaps.append(payload)
+        active.append(payload)
+        writing.set()
+        release.wait(5)
+        write_snapshot(payload)
+        active.pop()
+
+    manager._write_snapshot = slow_write
+    open_btc(manager)
+    await asyncio.to_thread(writing.wait, 5)  # persister is inside its threaded write
+    manager.update_position_price("BTCUSDT", 31000.0)
+
+    persister.cancel()
+    await asyncio.sleep(0.05)
+    assert not persister.done()  # waits for the in-flight write
+    release.set()
+    await asyncio.gather(persister, return_exceptions=True)
+
+    assert not overlaps
+    saved = json.loads((tmp_path / "positions.json").read_text())
+    assert saved["positions"]["BTCUSDT"]["highest_price"] == 31000.0
+
+
+async def test_journal_replayed_after_crash(tmp_path):
+    path = str(tmp_path / "positions.json")
+    manager = PositionManager(save_path=path)
+    open_btc(manager)
+    manager.add_position("ETHUSDT", "short", 2000.0, 0.1, 50.0, 50)
+
+    # Persister running but the process dies before it gets to write
+    manager._persister = asyncio.create_task(asyncio.sleep(10))
+    manager.get_position("BTCUSDT").metadata["stop_loss_order_id"] = "123"
+    manager.persist_position("BTCUSDT")
+    manager.remove_position("ETHUSDT")
+    manager.add_position("SOLUSDT", "long", 150.0, 1.0, 50.0, 50)
+    with open(manager.journal_path, "a") as f:
+        f.write('{"seq": 99, "op": "rem')  # torn append
+    manager._persister.cancel()
+
+    restored = PositionManager(save_path=path)
+    assert set(restored.positions) == {"BTCUSDT", "SOLUSDT"}
+    assert restored.get_position("BTCUSDT").metadata["stop_loss_order_id"] == "123"
+    assert not restored.journal_path.exists()  # folded into the snapshot
+
+
+async def test_journal_records_in_snapshot_are_skipped(tmp_path):
+    path = tmp_path / "positions.json"
+    manager = PositionManager(save_path=str(path))
+    open_btc(manager)
+    manager._persister = asyncio.create_task(asyncio.sleep(10))  # journal kept, no inline write
+    manager.remove_position("BTCUSDT")
+    journal = manager.journal_path.read_text()
+
+    # Snapshot already contains the removal, stale journal left behind
+    manager._persister.cancel()
+    manager._persister = None
+    manager.save_positions()
+    manager.journal_path.write_text(journal)
+
+    assert PositionManager(save_path=str(path)).positions == {}
+
+
+def test_legacy_snapshot_format_loads(tmp_path):
+    path = tmp_path / "positions.json"
+    manager = PositionManager(save_path=str(path))
+    open_btc(manager)
+    legacy = json.loads(path.read_text())["positions"]
+    path.write_text(json.dumps(legacy, indent=2))
+
+    assert PositionManager(save_path=str(path)).get_position("BTCUSDT").entry_price == 30000.0
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from bitget_trading.rate_limiter import (
+    PRIORITY_BULK,
+    PRIORITY_CRITICAL,
+    PRIORITY_NORMAL,
+    BitgetRateLimiter,
+    TokenBucket,
+    endpoint_group,
+)
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "group"),
+    [
+        ("/api/v2/mix/market/ticker?symbol=BTCUSDT", "market"),
+        ("/api/v2/mix/market/history-candles", "market"),
+        ("/api/v2/mix/order/place-order", "trade"),
+        ("/api/v2/mix/order/cancel-order", "trade"),
+        ("/api/v2/mix/order/place-tpsl-order", "plan"),
+        ("/api/v2/mix/order/orders-plan-pending", "plan"),
+        ("/api/v2/mix/account/accounts", "account"),
+        ("/api/v2/mix/position/all-position", "account"),
+    ],
+)
+def test_endpoint_group(endpoint, group):
+    assert endpoint_group(endpoint) == group
+
+
+async def test_critical_request_jumps_queued_bulk():
+    bucket = TokenBucket(rate=50.0, burst=1.0, bulk_reserve=0.0)
+    await bucket.acquire(PRIORITY_NORMAL)  # empty the bucket
+    order = []
+
+    async def request(name, priority):
+        await bucket.acquire(priority)
+        order.append(name)
+
+    bulk = [asyncio.create_task(request(f"bulk{i}", PRIORITY_BULK)) for i in range(3)]
+    await asyncio.sleep(0)
+    critical = asyncio.create_task(request("critical", PRIORITY_CRITICAL))
+    await asyncio.gather(critical, *bulk)
+
+    assert order[0] == "critical"
+    assert order[1:] == ["bulk0", "bulk1", "bulk2"]
+
+
+async def test_bulk_leaves_reserve_for_other_traffic():
+    bucket = TokenBucket(rate=1.0, burst=4.0, bulk_reserve=0.5)
+    await bucket.acquire(PRIORITY_BULK)
+    await bucket.acquire(PRIORITY_BULK)
+
+    # Only the reserve is left: bulk has to wait, normal traffic does not
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(bucket.acquire(PRIORITY_BULK), timeout=0.05)
+    assert await bucket.acquire(PRIORITY_NORMAL) < 0.01
+    assert bucket.queued == 0
+
+
+async def test_rate_limit_backs_off_and_recovers():
+    limiter = BitgetRateLimiter({"market": (20.0, 20.0), "account": (10.0, 10.0)})
+    endpoint = "/api/v2/mix/market/ticker"
+    bucket = limiter.bucket(endpoint)
+
+    assert limiter.record_rate_limited(endpoint) == pytest.approx(0.5)
+    assert limiter.record_rate_limited(endpoint, retry_after=0.1) == pytest.approx(0.1)
+    assert bucket.rate == pytest.approx(5.0)
+    assert bucket.tokens == 0.0
+
+    waited = await limiter.acquire(endpoint)
+    assert waited >= 0.4  # the exponential backoff still applies
+
+    for _ in range(40):
+        limiter.record_success(endpoint)
+    assert bucket.rate == pytest.approx(20.0)
+    assert bucket.consecutive_rate_limits == 0
+    assert limiter.get_stats()["market"]["rate_limited"] == 2
+
+
+async def test_cancelled_waiter_leaves_queue():
+    bucket = TokenBucket(rate=0.5, burst=1.0, bulk_reserve=0.0)
+    await bucket.acquire()
+
+    waiter = asyncio.create_task(bucket.acquire(PRIORITY_BULK))
+    await asyncio.sleep(0.01)
+    assert bucket.queued == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert bucket.queued == 0
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from bitget_trading.multi_symbol_state import SymbolState
+from bitget_trading.ring_buffer import PriceRingBuffer
+
+
+def test_views_are_contiguous_and_ordered_after_wrap():
+    buffer = PriceRingBuffer(capacity=5)
+    for i in range(12):
+        buffer.append(float(i), 100.0 + i, volume=float(i))
+
+    assert len(buffer) == 5
+    assert buffer.prices().tolist() == [107.0, 108.0, 109.0, 110.0, 111.0]
+    assert buffer.prices(3).tolist() == [109.0, 110.0, 111.0]
+    assert buffer.prices(3).flags["C_CONTIGUOUS"]
+    assert buffer.prices(3).base is not None  # view, not a copy
+    assert buffer.last(2).shape == (PriceRingBuffer.N_COLUMNS, 2)
+    assert buffer.last_timestamp == 11.0
+
+
+def test_price_at_indexes_from_both_ends():
+    buffer = PriceRingBuffer(capacity=4)
+    for i in range(6):
+        buffer.append(float(i), float(i))
+
+    assert buffer.price_at(0) == 2.0
+    assert buffer.price_at(-1) == 5.0
+    assert buffer.price_at(-4) == 2.0
+    with pytest.raises(IndexError):
+        buffer.price_at(-5)
+
+
+def test_partial_fill_and_oversized_requests():
+    buffer = PriceRingBuffer(capacity=10)
+    assert buffer.last_price == 0.0
+    assert len(buffer.prices(5)) == 0
+
+    buffer.append(1.0, 50.0)
+    buffer.append(2.0, 51.0)
+    assert buffer.prices(100).tolist() == [50.0, 51.0]
+
+
+def test_symbol_state_shares_buffer_with_indicators():
+    state = SymbolState("BTCUSDT")
+    assert state.advanced_indicators.history is state.history
+
+    for i, price in enumerate(np.linspace(100, 101, 50)):
+        state.record_sample(float(i), price, 10.0, bid_volume=3.0, ask_volume=1.0)
+
+    assert len(state.history) == 50
+    assert state.history.bid_volumes(1)[0] == 3.0
+    assert state.advanced_indicators.compute_order_flow_imbalance() == pytest.approx(0.5)
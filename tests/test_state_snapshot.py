@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from backtest_helpers import make_candles
+from bitget_trading.multi_symbol_state import MultiSymbolStateManager, SymbolState
+from bitget_trading.ring_buffer import PriceRingBuffer
+from bitget_trading.state_snapshot import StateSnapshotStore
+
+START_SEC = 1_735_689_600.0
+
+
+def fill(manager: MultiSymbolStateManager, symbol: str, n: int, seed: int, start: float = START_SEC) -> None:
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n)))
+    for i, price in enumerate(prices):
+        manager.add_price_point(symbol, float(price), (start + i) * 1000, float(rng.lognormal(5, 1)))
+
+
+def test_ring_buffer_load_matches_appends():
+    samples = np.random.default_rng(0).normal(size=(5, 50))
+    appended = PriceRingBuffer(capacity=32)
+    for column in samples.T:
+        appended.append(*column)
+
+    loaded = PriceRingBuffer(capacity=32)
+    loaded.load(samples)
+    np.testing.assert_array_equal(loaded.last(), appended.last())
+
+    loaded.append(*samples[:, 0])
+    appended.append(*samples[:, 0])
+    np.testing.assert_array_equal(loaded.last(), appended.last())
+    assert loaded.last_timestamp == appended.last_timestamp
+
+
+def test_snapshot_round_trip_continues_identically(tmp_path):
+    original = MultiSymbolStateManager()
+    fill(original, "BTCUSDT", 4000, seed=1)
+    fill(original, "ETHUSDT", 500, seed=2)
+    original.record_trade("BTCUSDT", pnl=1.5, return_pct=0.02)
+    original.record_trade("BTCUSDT", pnl=-0.5, return_pct=-0.01)
+    original.get_state("ETHUSDT").add_candle("5m", {"timestamp": 1, "close": 2.0})
+
+    store = StateSnapshotStore(str(tmp_path))
+    store.save(original)
+
+    restored = MultiSymbolStateManager()
+    assert store.load(restored) is not None
+    assert set(restored.symbols) == {"BTCUSDT", "ETHUSDT"}
+    assert len(restored.get_state("BTCUSDT").history) == 3600
+    assert restored.get_state("ETHUSDT").candles_5m[-1]["close"] == 2.0
+    assert restored.get_state("BTCUSDT").n_wins == 1
+
+    # Streaming indicators carry on from the same state
+    fill(original, "BTCUSDT", 120, seed=3, start=START_SEC + 4000)
+    fill(restored, "BTCUSDT", 120, seed=3, start=START_SEC + 4000)
+    assert restored.get_state("BTCUSDT").compute_features() == pytest.approx(
+        original.get_state("BTCUSDT").compute_features()
+    )
+
+
+def test_snapshot_load_filters_and_expires(tmp_path):
+    manager = MultiSymbolStateManager()
+    fill(manager, "BTCUSDT", 10, seed=1)
+    fill(manager, "ETHUSDT", 10, seed=2)
+    store = StateSnapshotStore(str(tmp_path))
+    store.save(manager)
+    store.save(manager)
+    assert len(list(tmp_path.glob("history-*.npy"))) == 1
+
+    subset = MultiSymbolStateManager()
+    assert store.load(subset, symbols=["ETHUSDT"]) is not None
+    assert list(subset.symbols) == ["ETHUSDT"]
+
+    assert store.load(MultiSymbolStateManager(), max_age_sec=-1) is None
+    assert StateSnapshotStore(str(tmp_path / "missing")).load(MultiSymbolStateManager()) is None
+
+
+def test_backfill_candles_reaggregates_higher_timeframes():
+    start_ms = 1_735_689_600_000
+    candles = make_candles(0, 120, start_ms=start_ms).to_dict("records")
+    full = SymbolState("BTCUSDT")
+    full.backfill_candles(candles)
+    assert len(full.candles_1m) == 120 and len(full.candles_5m) == 24 and len(full.candles_15m) == 8
+    bar = full.candles_5m[1]
+    assert bar["timestamp"] == start_ms + 300_000
+    assert bar["open"] == candles[5]["open"] and bar["close"] == candles[9]["close"]
+    assert bar["volume"] == pytest.approx(sum(c["volume"] for c in candles[5:10]))
+
+    # Snapshot taken mid-bucket, then back-filled with candles from the snapshot's 15m bucket on
+    partial = SymbolState("BTCUSDT")
+    partial.backfill_candles(candles[:52])
+    partial.backfill_candles(candles[45:])
+    for timeframe in ("1m", "5m", "15m"):
+        assert list(partial.get_candles(timeframe)) == list(full.get_candles(timeframe))
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from bitget_trading.advanced_indicators import AdvancedIndicators
+from bitget_trading.multi_symbol_state import SymbolState
+from bitget_trading.streaming_indicators import (
+    RollingVWAP,
+    RollingWindowStats,
+    StreamingEMA,
+    StreamingRSI,
+)
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(7)
+    return 100 * np.exp(np.cumsum(rng.normal(0, 0.001, 2000)))
+
+
+def wilder_rsi(prices, period):
+    deltas = np.diff(prices)
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+    avg_gain, avg_loss = gains[:period].mean(), losses[:period].mean()
+    for g, l in zip(gains[period:], losses[period:]):
+        avg_gain = (avg_gain * (period - 1) + g) / period
+        avg_loss = (avg_loss * (period - 1) + l) / period
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def test_ema_matches_batch(prices):
+    indicators = AdvancedIndicators()
+    ema = StreamingEMA(10)
+    for p in prices:
+        ema.update(p)
+    assert ema.value == pytest.approx(indicators._compute_ema(prices, 10), rel=1e-12)
+
+
+@pytest.mark.parametrize("period", [2, 5, 14, 30])
+def test_rsi_matches_wilder(prices, period):
+    rsi = StreamingRSI(period)
+    for p in prices:
+        rsi.update(p)
+    assert rsi.value == pytest.approx(wilder_rsi(prices, period), rel=1e-9)
+
+
+def test_rolling_stats_match_numpy(prices):
+    stats = RollingWindowStats(20)
+    for p in prices:
+        stats.update(p)
+    assert stats.mean == pytest.approx(np.mean(prices[-20:]), rel=1e-12)
+    assert stats.std == pytest.approx(np.std(prices[-20:]), rel=1e-6)
+
+
+def test_rolling_vwap_matches_numpy(prices):
+    volumes = np.linspace(1, 50, len(prices))
+    vwap = RollingVWAP(300)
+    for p, v in zip(prices, volumes):
+        vwap.update(p, v)
+    expected = np.sum(prices[-300:] * volumes[-300:]) / np.sum(volumes[-300:])
+    value, deviation = vwap.value
+    assert value == pytest.approx(expected, rel=1e-12)
+    assert deviation == pytest.approx((prices[-1] - expected) / expected, rel=1e-9)
+
+
+def test_lazy_periods_are_seeded_from_history(prices):
+    indicators = AdvancedIndicators()
+    for i, p in enumerate(prices):
+        indicators.update(price=p, volume=1.0, timestamp=float(i))
+    assert indicators.compute_rsi(period=21) == pytest.approx(wilder_rsi(prices, 21), rel=1e-9)
+    upper, middle, lower = indicators.compute_bollinger_bands(period=50)
+    assert middle == pytest.approx(np.mean(prices[-50:]), rel=1e-12)
+
+
+def test_symbol_state_volatility_matches_batch(prices):
+    state = SymbolState("BTCUSDT")
+    for i, p in enumerate(prices):
+        state.record_sample(float(i), p, 1.0 + i % 7)
+        state.mid_price = p
+
+    features = state.compute_features()
+    returns = np.diff(prices) / prices[:-1]
+    assert features["volatility_30s"] == pytest.approx(np.std(returns[-30:]), rel=1e-6)
+    assert features["volatility_5min"] == pytest.approx(np.std(returns[-300:]), rel=1e-6)
+    assert features["return_1min"] == pytest.approx((prices[-1] - prices[-60]) / prices[-60])
+    volumes = np.array([1.0 + i % 7 for i in range(len(prices))])
+    assert features["volume_ratio"] == pytest.approx(volumes[-1] / np.mean(volumes[-300:]), rel=1e-6)
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from backtest_engine import BacktestEngine
+from backtest_helpers import make_candles, make_strategy
+from metrics_calculator import MetricsCalculator
+from sweep_runner import SweepResults, load_results, run_sweep
+
+
+def make_sweep():
+    strategies = [make_strategy(i, volume_ratio=1 + i / 10, confluence_required=2 + i % 2) for i in range(6)]
+    frames = {f"T{i}USDT": make_candles(10 + i, 300 + 100 * i) for i in range(3)}
+    frames["SHORTUSDT"] = make_candles(20, 20)  # too short to backtest
+    return strategies, frames
+
+
+def test_parallel_sweep_matches_serial_backtests(tmp_path):
+    strategies, frames = make_sweep()
+    summary = run_sweep(
+        strategies, frames, str(tmp_path / "sweep"), workers=2, batch_size=4,
+        indicator_root=str(tmp_path / "indicators"), verbose=False,
+    )
+    assert summary.backtests == 18 and summary.failed == 0
+
+    results = load_results(summary.path).set_index(["strategy_id", "symbol"]).sort_index()
+    assert len(results) == 18 and "SHORTUSDT" not in set(results.index.get_level_values(1))
+    for strategy in strategies:
+        for symbol in ("T0USDT", "T1USDT", "T2USDT"):
+            metrics = MetricsCalculator.calculate_all_metrics(BacktestEngine(strategy).run_backtest(frames[symbol], symbol))
+            row = results.loc[(strategy["id"], symbol)]
+            assert row["total_trades"] == metrics.total_trades
+            assert row["final_capital"] == metrics.final_capital
+            assert row["sharpe_ratio"] == metrics.sharpe_ratio
+
+
+def test_interrupted_sweep_resumes(tmp_path):
+    strategies, frames = make_sweep()
+    out = str(tmp_path / "sweep")
+    run_sweep(strategies[:4], frames, out, workers=1, indicator_root=None, verbose=False)
+
+    # Crash mid-append: one column got a partial row
+    with open(os.path.join(out, "total_roi_pct.col"), "ab") as f:
+        f.write(b"\x00" * 5)
+
+    with pytest.raises(FileExistsError):
+        run_sweep(strategies, frames, out, workers=1, indicator_root=None, verbose=False)
+    with pytest.raises(ValueError):
+        run_sweep(strategies, frames, out, engine="multi", resume=True, workers=1, indicator_root=None, verbose=False)
+
+    summary = run_sweep(strategies, frames, out, resume=True, workers=1, indicator_root=None, verbose=False)
+    assert summary.skipped == 12 and summary.backtests == 6
+
+    results = load_results(out)
+    assert len(results) == 18
+    assert not results.duplicated(["strategy_id", "symbol"]).any()
+    assert SweepResults(out, {"timeframe": "1H", "engine": "single", "initial_capital": 50.0}, resume=True).rows == 18
+
+    # The store grew since: resuming would mix results of two data sets
+    grown = dict(frames, T1USDT=make_candles(11, 450))
+    with pytest.raises(ValueError):
+        run_sweep(strategies, grown, out, resume=True, workers=1, indicator_root=None, verbose=False)
@@ -0,0 +1,85 @@
+import csv
+import io
+from pathlib import Path
+
+import numpy as np
+import orjson
+
+from bitget_trading.market_data_hub import MarketDataHub
+from bitget_trading.multi_symbol_state import MultiSymbolStateManager
+from bitget_trading.tick_recorder import DAY_MS, TickRecorder, read_ticks, ticker_snapshots
+
+DAY0 = 1_767_225_600_000  # 2026-01-01 00:00 UTC
+
+
+def ticker(ts: int, price: float) -> dict:
+    return {"instId": "BTCUSDT", "ts": str(ts), "lastPr": str(price), "bidPr": str(price - 0.5),
+            "askPr": str(price + 0.5), "bidSz": "3", "askSz": "2", "fundingRate": "0.0001",
+            "open24h": "100", "high24h": "120", "low24h": "90", "baseVolume": "1000", "quoteVolume": "100000"}
+
+
+def test_pushes_round_trip_across_days(tmp_path):
+    recorder = TickRecorder(str(tmp_path), index_every=64, compress_closed=False)
+    timestamps = DAY0 + DAY_MS - 50_000 + 100 * np.arange(1000)  # crosses midnight
+    for i, ts in enumerate(timestamps):
+        recorder.record("BTCUSDT", "ticker", "snapshot", [ticker(int(ts), 100 + i / 100)])
+        recorder.record("BTCUSDT", "trade", "update", [{"ts": str(ts), "tradeId": str(i), "price": "100",
+                                                        "size": "0.5", "side": "buy" if i % 2 else "sell"}])
+        recorder.record("BTCUSDT", "books", "update", [{"ts": str(ts), "seq": i, "bids": [["99.5", "1"]],
+                                                        "asks": [["100.5", "0"], ["100.6", "2"]]}])
+        if i % 300 == 0:
+            recorder.flush()
+    recorder.record("BTCUSDT", "trade", "snapshot", [{"ts": str(DAY0), "tradeId": "1", "price": "1", "size": "1"}])
+    recorder.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["20260101", "20260102"]
+    ticks = read_ticks(tmp_path, "BTCUSDT", "ticker")
+    assert list(ticks["ts"]) == list(timestamps)
+    assert ticks["last"][-1] == 100 + 999 / 100 and ticks["bid_size"][0] == 3
+    trades = read_ticks(tmp_path, "BTCUSDT", "trade")
+    assert list(trades["trade_id"]) == list(range(1000)) and trades["side"][:2].tolist() == [-1, 1]
+    book = read_ticks(tmp_path, "BTCUSDT", "book")
+    assert len(book) == 3000 and book["side"][:3].tolist() == [1, -1, -1] and not book["snapshot"].any()
+
+    window = read_ticks(tmp_path, "BTCUSDT", "ticker", int(timestamps[400]), int(timestamps[700]))
+    assert list(window["ts"]) == list(timestamps[400:701])
+
+    # Close the first day: compressed files read back the same
+    recorder.compress_closed_days(now_ms=DAY0 + 2 * DAY_MS)
+    assert not list((tmp_path / "20260101").glob("*.bin"))
+    assert list(read_ticks(tmp_path, "BTCUSDT", "ticker", int(timestamps[400]), int(timestamps[700]))["ts"]) == list(
+        timestamps[400:701]
+    )
+
+    # A fraction of the CSV the old collectors wrote
+    csv_text = io.StringIO()
+    ticker_snapshots(tmp_path, ["BTCUSDT"], interval_ms=1).to_csv(csv_text, index=False)
+    binary_bytes = sum(p.stat().st_size for p in Path(tmp_path).rglob("BTCUSDT.ticker.bin*"))
+    assert binary_bytes < len(csv_text.getvalue()) / 2
+
+
+def test_snapshot_export_matches_collector_csv_columns(tmp_path):
+    recorder = TickRecorder(str(tmp_path), compress_closed=False)
+    for i in range(180):
+        recorder.record("BTCUSDT", "ticker", None, [ticker(DAY0 + 1000 * i, 100 + i)])
+    recorder.close()
+
+    df = ticker_snapshots(tmp_path)
+    assert list(df["snapshot"]) == [0, 1, 2]
+    assert list(df["last_price"]) == [159, 219, 279]  # last tick of each minute
+    row = next(csv.DictReader(io.StringIO(df.to_csv(index=False))))
+    assert {"timestamp", "snapshot", "symbol", "spread_pct", "return_pct", "volatility_pct",
+            "volume_24h", "quote_volume_24h"} <= set(row)
+
+
+def test_hub_forwards_raw_pushes(tmp_path):
+    hub = MarketDataHub(MultiSymbolStateManager(), ["BTCUSDT"], channels=("ticker", "trade"))
+    recorder = TickRecorder(str(tmp_path), compress_closed=False)
+    hub.on_payload = recorder.record
+    hub._handle_message(orjson.dumps({"arg": {"channel": "ticker", "instId": "BTCUSDT"}, "data": [ticker(DAY0, 100)]}))
+    hub._handle_message(orjson.dumps({"action": "update", "arg": {"channel": "trade", "instId": "BTCUSDT"},
+                                      "data": [{"ts": str(DAY0), "tradeId": "7", "price": "100", "size": "1",
+                                                "side": "buy"}]}))
+    recorder.close()
+    assert len(read_ticks(tmp_path, "BTCUSDT", "ticker")) == 1
+    assert read_ticks(tmp_path, "BTCUSDT", "trade")["trade_id"].tolist() == [7]
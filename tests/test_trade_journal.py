@@ -0,0 +1,87 @@
+import json
+import os
+import threading
+import time
+
+from bitget_trading.loss_tracker import LossTracker, TradeRecord
+from bitget_trading.trade_journal import TradeJournal, iter_records, load_journal, segments, sidecar_dtype
+
+
+def make_trade(i: int, net_pnl: float) -> TradeRecord:
+    return TradeRecord(
+        trade_id=f"t{i}", symbol="BTCUSDT", entry_time="2026-01-01T00:00:00", entry_price=100.0,
+        entry_side="long", position_size_usd=10.0, leverage=25, entry_score=1.2, entry_grade="A",
+        entry_confluence=3.0, entry_volume_ratio=1.5, entry_market_structure="uptrend", entry_near_sr=True,
+        entry_rr_ratio=2.5, exit_time="2026-01-01T00:05:00", exit_price=101.0, exit_reason="take_profit",
+        time_in_trade_seconds=300.0, pnl_usd=net_pnl + 0.1, pnl_pct_capital=net_pnl / 10, pnl_pct_price=1.0,
+        fees_paid=0.1, slippage_cost=0.0, net_pnl=net_pnl, exit_market_structure="uptrend", peak_pnl=1.0,
+        drawdown_from_peak=0.0, is_win=net_pnl > 0, is_loss=net_pnl <= 0, stopped_out=False, took_profit=True,
+    )
+
+
+def test_record_trade_does_not_touch_disk(tmp_path, monkeypatch):
+    tracker = LossTracker(str(tmp_path / "trades.jsonl"))
+    gate = threading.Event()
+    original = tracker.journal._write_batch
+    monkeypatch.setattr(tracker.journal, "_write_batch", lambda batch: (gate.wait(), original(batch)))
+
+    started = time.perf_counter()
+    for i in range(200):
+        tracker.record_trade(make_trade(i, net_pnl=1.0 if i % 2 else -1.0))
+    assert time.perf_counter() - started < 1.0  # writer is blocked, recording is not
+    assert tracker.total_trades == 200
+
+    gate.set()
+    tracker.close()
+    lines = (tmp_path / "trades.jsonl").read_text().splitlines()
+    assert [json.loads(line)["trade_id"] for line in lines] == [f"t{i}" for i in range(200)]
+    assert tracker.journal.records_written == 200
+
+
+def test_rotation_and_sidecar_history(tmp_path):
+    path = tmp_path / "trades.jsonl"
+    journal = TradeJournal(path, sidecar=sidecar_dtype(TradeRecord), fsync="never", max_bytes=20_000)
+    for i in range(100):
+        journal.write(make_trade(i, net_pnl=i - 50.0).to_dict())
+        if i % 10 == 9:
+            journal.flush()
+    journal.close()
+
+    assert len(segments(path)) > 2
+    assert all(os.path.getsize(p) <= 20_000 for p in segments(path))
+    assert [r["trade_id"] for r in iter_records(path)] == [f"t{i}" for i in range(100)]
+
+    history = LossTracker.load_history(str(path), columns=["trade_id", "net_pnl", "is_win", "exit_reason"])
+    assert list(history["trade_id"]) == [f"t{i}" for i in range(100)]
+    assert history["net_pnl"].sum() == sum(i - 50.0 for i in range(100))
+    assert history["is_win"].sum() == 49 and set(history["exit_reason"]) == {"take_profit"}
+
+
+def test_torn_sidecar_row_dropped_on_reopen(tmp_path):
+    path = tmp_path / "trades.jsonl"
+    journal = TradeJournal(path, sidecar=sidecar_dtype(TradeRecord))
+    journal.write(make_trade(0, 1.0).to_dict())
+    journal.close()
+    with open(tmp_path / "trades.jsonl.bin", "ab") as f:
+        f.write(b"\x01\x02\x03")  # crash mid-row
+
+    journal = TradeJournal(path, sidecar=sidecar_dtype(TradeRecord))
+    journal.write(make_trade(1, 2.0).to_dict())
+    journal.close()
+    assert list(load_journal(path)["net_pnl"]) == [1.0, 2.0]
+
+
+def test_read_all_does_not_wait_for_the_queue(tmp_path, monkeypatch):
+    journal = TradeJournal(tmp_path / "trades.jsonl", fsync="never", max_batch=1)
+    original = journal._write_batch
+    monkeypatch.setattr(journal, "_write_batch", lambda batch: (time.sleep(0.1), original(batch)))
+    for i in range(20):
+        journal.write(make_trade(i, net_pnl=1.0).to_dict())
+    time.sleep(0.15)  # a batch or two written, the rest still queued
+
+    started = time.perf_counter()
+    records = journal.read_all()
+    assert time.perf_counter() - started < 0.5  # at most one batch write, not the 2 s backlog
+    assert [r["trade_id"] for r in records] == [f"t{i}" for i in range(20)]
+    assert 0 < journal.records_written < 20
+    journal.close()
@@ -5,12 +5,15 @@ Tracks every trade with full details for later analysis
 
 import json
 import csv
+import io
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 import logging
 
+from src.bitget_trading.trade_journal import FsyncPolicy, TradeJournal, sidecar_dtype
+
 logger = logging.getLogger(__name__)
 
 
@@ -161,6 +164,13 @@ class TradeRecord:
         ]
 
 
+def csv_line(row: List) -> str:
+    """One CSV line (same quoting as csv.writer)"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(row)
+    return buffer.getvalue()
+
+
 class TradeTracker:
     """Track all trades for analysis"""
     
@@ -178,7 +188,20 @@ class TradeTracker:
         "bucket", "sweep_level", "metadata",
     ]
     
-    def __init__(self, data_dir: str = "trades_data"):
+    def __init__(
+        self,
+        data_dir: str = "trades_data",
+        fsync: FsyncPolicy = "batch",
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        Initialize trade tracker.
+        
+        Args:
+            data_dir: Directory for the trade files
+            fsync: Journal fsync policy ("never", "batch", "interval")
+            max_bytes: File size that triggers rotation
+        """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         
@@ -187,10 +210,13 @@ class TradeTracker:
         self.json_file = self.data_dir / f"trades_{timestamp}.jsonl"
         self.csv_file = self.data_dir / f"trades_{timestamp}.csv"
         
-        # Initialize CSV file
-        with open(self.csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(self.CSV_HEADER)
+        # Written by background threads: closing a trade never waits for the disk
+        self.json_journal = TradeJournal(
+            self.json_file, sidecar=sidecar_dtype(TradeRecord), fsync=fsync, max_bytes=max_bytes
+        )
+        self.csv_journal = TradeJournal(
+            self.csv_file, encode=csv_line, header=csv_line(self.CSV_HEADER), fsync=fsync, max_bytes=max_bytes
+        )
         
         # Active trades (by trade_id)
         self.active_trades: Dict[str, TradeRecord] = {}
@@ -373,7 +399,8 @@ class TradeTracker:
 
         # ROE = Return on Equity = (Net Profit / Capital Invested) * 100
         # This gives the actual percentage return on the capital invested
-        pnl_pct_capital = (net_pnl / trade.capital) * 100 if trade.capital > 0 else 0
+        capital = trade.entry_notional / trade.leverage if trade.leverage else trade.entry_notional
+        pnl_pct_capital = (net_pnl / capital) * 100 if capital > 0 else 0
         
         # Drawdown from peak
         drawdown = 0.0
@@ -416,28 +443,19 @@ class TradeTracker:
         )
     
     def _save_trade(self, trade: TradeRecord):
-        """Save trade to JSONL and CSV"""
-        try:
-            # Save to JSONL
-            with open(self.json_file, 'a') as f:
-                f.write(json.dumps(trade.to_dict()) + '\n')
-            
-            # Save to CSV
-            with open(self.csv_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(trade.to_csv_row())
-        except Exception as e:
-            logger.error(f"❌ Failed to save trade {trade.trade_id}: {e}")
+        """Queue trade for JSONL and CSV (written in the background)"""
+        self.json_journal.write(trade.to_dict())
+        self.csv_journal.write(trade.to_csv_row())
+    
+    def close(self):
+        """Write queued trades and stop the journal writers"""
+        self.json_journal.close()
+        self.csv_journal.close()
     
     def get_summary(self) -> Dict:
         """Get summary statistics"""
-        # Read all trades from JSONL
-        trades = []
-        if self.json_file.exists():
-            with open(self.json_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        trades.append(json.loads(line))
+        # Written trades (every rotated segment) plus those still queued
+        trades = self.json_journal.read_all()
         
         if not trades:
             return {"total_trades": 0}
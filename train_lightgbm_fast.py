@@ -10,11 +10,11 @@ Optimizations:
 
 import pandas as pd
 import numpy as np
-import pickle
 import lightgbm as lgb
 from pathlib import Path
 from typing import List, Tuple
 from ml_feature_engineering import calculate_all_features, get_feature_list
+from src.bitget_trading.candle_store import CandleStore, open_candle_store
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, roc_auc_score, classification_report
 import json
@@ -29,12 +29,10 @@ print(f"🚀 Using {N_JOBS} CPU cores for maximum speed!")
 
 def load_single_token_data(args):
     """Load and process data for a single token (for parallel processing)."""
-    cache_file, cache_dir = args
+    symbol, timeframe, cache_dir = args
     try:
-        symbol = cache_file.stem.split('_')[0]
-        
-        with open(cache_file, 'rb') as f:
-            df = pickle.load(f)
+        # Memory-mapped: workers share the page cache instead of unpickling copies
+        df = CandleStore(str(cache_dir)).load_recent(symbol, timeframe, days=30)
         
         if len(df) < 50:
             return None
@@ -52,12 +50,15 @@ def load_all_token_data_parallel(cache_dir: Path = Path("backtest_data")) -> pd.
     print("📊 LOADING DATA FROM ALL 338 TOKENS (PARALLEL)")
     print("="*80)
     
-    # Find all cache files
-    cache_files = list(cache_dir.glob("*_1m_30d.pkl"))
+    # Find all cached series
+    store = open_candle_store(str(cache_dir))
+    timeframe = "1m"
+    cache_files = store.symbols(timeframe)
     
     if not cache_files:
         # Try alternative format
-        cache_files = list(cache_dir.glob("*_1H_30d.pkl"))
+        timeframe = "1H"
+        cache_files = store.symbols(timeframe)
     
     if not cache_files:
         raise ValueError("No cache files found! Run data fetcher first.")
@@ -67,7 +68,7 @@ def load_all_token_data_parallel(cache_dir: Path = Path("backtest_data")) -> pd.
     
     # Load in parallel
     all_data = []
-    args_list = [(cf, cache_dir) for cf in cache_files]
+    args_list = [(symbol, timeframe, cache_dir) for symbol in cache_files]
     
     with ProcessPoolExecutor(max_workers=N_JOBS) as executor:
         futures = {executor.submit(load_single_token_data, args): args[0] for args in args_list}
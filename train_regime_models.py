@@ -19,6 +19,7 @@ import json
 from datetime import datetime
 from sklearn.metrics import roc_auc_score, accuracy_score, classification_report
 from train_lightgbm_1m import LightGBM1mTrainer
+from src.bitget_trading.candle_store import open_candle_store
 
 
 class RegimeModelsTrainer:
@@ -222,7 +223,8 @@ class RegimeModelsTrainer:
         print()
         
         # Load and process data (same as base trainer)
-        cache_files = list(self.cache_dir.glob("*_1m_200.pkl")) + list(self.cache_dir.glob("*_1m_*.pkl"))
+        store = open_candle_store(str(self.cache_dir))
+        cache_files = store.symbols("1m")
         
         if not cache_files:
             print("❌ No 1m cached data found!")
@@ -231,12 +233,12 @@ class RegimeModelsTrainer:
         print(f"📂 Loading data from {len(cache_files[:338])} tokens...")
         
         all_data = []
-        for idx, cache_file in enumerate(cache_files[:338], 1):
+        for idx, symbol in enumerate(cache_files[:338], 1):
             if idx % 50 == 0:
                 print(f"   Progress: {idx}/{min(len(cache_files), 338)} tokens...")
             
             try:
-                df = pd.read_pickle(cache_file)
+                df = store.load_frame(symbol, "1m")
                 if len(df) > 30:
                     all_data.append(df)
             except Exception:
@@ -23,6 +23,7 @@ from ml_feature_engineering import (
     calculate_atr, calculate_adx, calculate_mfi, calculate_obv,
     calculate_ema, calculate_sma, calculate_cci, calculate_roc
 )
+from src.bitget_trading.candle_store import open_candle_store
 
 # Try to import optuna for hyperparameter optimization
 try:
@@ -240,16 +241,17 @@ class UltraLightGBMTrainer:
         
         # Load ALL cached data
         all_data = []
-        cache_files = list(self.cache_dir.glob("*_1H_30d.pkl")) + list(self.cache_dir.glob("*_1H.pkl"))
+        store = open_candle_store(str(self.cache_dir))
+        cache_files = store.symbols("1H")
         
         print(f"📂 Loading data from {len(cache_files[:max_tokens])} tokens...")
         
-        for idx, cache_file in enumerate(cache_files[:max_tokens], 1):
+        for idx, symbol in enumerate(cache_files[:max_tokens], 1):
             if idx % 50 == 0:
                 print(f"   Progress: {idx}/{min(len(cache_files), max_tokens)} tokens...")
             
             try:
-                df = pd.read_pickle(cache_file)
+                df = store.load_frame(symbol, "1H")
                 if len(df) > 100:  # Need enough data
                     all_data.append(df)
             except Exception as e: